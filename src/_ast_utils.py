@@ -1,16 +1,307 @@
-"""Shared AST utilities for Awake analysis modules."""
+"""Shared AST utilities for Awake analysis modules.
+
+Every analyzer reads and parses the same ``src/`` files.  Rather than each
+module calling ``read_text`` + ``ast.parse`` privately, they all go through a
+process-wide :class:`SourceStore` that hands out the source text, its split
+lines and the parsed ``ast.Module`` once per run.
+
+Entries are keyed by ``(path, mtime_ns, size)`` with the SHA-256 content
+digest as a tie-breaker: a file whose stat signature changed but whose bytes
+did not (``touch``, checkout of an identical blob) reuses its parsed tree.
+Files modified within :data:`_RACY_WINDOW_NS` of being loaded are always
+re-hashed, since a same-size rewrite inside one filesystem timestamp tick
+would otherwise be indistinguishable from the cached version.
+
+Parsed trees are shared between callers and must be treated as read-only.
+
+Single-pass traversal
+---------------------
+Analyzers that inspect the tree subclass :class:`AstPass` and declare
+``visit_<NodeType>`` / ``leave_<NodeType>`` handlers.  :func:`walk_tree` feeds
+any number of passes from one depth-first traversal, and
+:func:`pass_result` runs every pass registered with :func:`register_pass` the
+first time any of them is requested for a file, memoising the finished pass
+objects on the :class:`ParsedSource`.  A full ``awake audit`` therefore walks
+each tree once, no matter how many analyzers consume it.
+"""
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
+
+
+#: Files whose mtime is this close to the load time are re-hashed on lookup.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class ParsedSource:
+    """Immutable snapshot of one source file: text, lines and AST."""
+
+    path: str
+    digest: str
+    text: str
+    lines: tuple[str, ...]
+    tree: Optional[ast.Module]
+    syntax_error: Optional[SyntaxError] = None
+    #: Finished :class:`AstPass` objects by registered name (see pass_result).
+    passes: dict = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """True when the file parsed without a syntax error."""
+        return self.tree is not None
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    loaded_ns: int
+    parsed: ParsedSource
+
+    def is_fresh(self, st: os.stat_result) -> bool:
+        """True if *st* matches this entry and is outside the racy window."""
+        return (
+            self.mtime_ns == st.st_mtime_ns
+            and self.size == st.st_size
+            and st.st_mtime_ns < self.loaded_ns - _RACY_WINDOW_NS
+        )
+
+
+class SourceStore:
+    """Thread-safe cache of :class:`ParsedSource` objects keyed by file path."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Path) -> Optional[ParsedSource]:
+        """Return the parsed snapshot of *path*, or ``None`` if it is unreadable."""
+        key = str(Path(path).resolve())
+        try:
+            st = Path(key).stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh(st):
+            self.hits += 1
+            return entry.parsed
+
+        try:
+            data = Path(key).read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+
+        if entry is not None and entry.parsed.digest == digest:
+            parsed = entry.parsed
+            self.hits += 1
+        else:
+            parsed = _parse_bytes(key, data, digest)
+            self.misses += 1
+
+        with self._lock:
+            self._entries[key] = _Entry(
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
+                loaded_ns=time.time_ns(),
+                parsed=parsed,
+            )
+        return parsed
+
+    def digest(self, path: Path) -> Optional[str]:
+        """Return the SHA-256 digest of *path* without parsing it.
+
+        Reuses the cached digest when the stat signature is fresh; otherwise
+        hashes the bytes on disk.  Returns ``None`` if the file is unreadable.
+        """
+        key = str(Path(path).resolve())
+        try:
+            st = Path(key).stat()
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh(st):
+            return entry.parsed.digest
+        try:
+            return hashlib.sha256(Path(key).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _parse_bytes(path: str, data: bytes, digest: str) -> ParsedSource:
+    """Decode *data* and parse it into a :class:`ParsedSource`."""
+    text = data.decode("utf-8", errors="replace")
+    # Match Path.read_text(): universal newlines before splitting/parsing.
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    tree: Optional[ast.Module] = None
+    error: Optional[SyntaxError] = None
+    try:
+        tree = ast.parse(text, filename=path)
+    except SyntaxError as exc:
+        error = exc
+    except ValueError as exc:  # null bytes in source
+        error = SyntaxError(str(exc))
+    return ParsedSource(
+        path=path,
+        digest=digest,
+        text=text,
+        lines=tuple(text.splitlines()),
+        tree=tree,
+        syntax_error=error,
+    )
+
+
+#: Process-wide store shared by every analyzer.
+_STORE = SourceStore()
+
+
+def get_source_store() -> SourceStore:
+    """Return the process-wide :class:`SourceStore`."""
+    return _STORE
+
+
+def load_source(py_file: Path) -> Optional[ParsedSource]:
+    """Return the cached :class:`ParsedSource` for *py_file* (``None`` on OSError)."""
+    return _STORE.load(py_file)
+
+
+def read_source(py_file: Path) -> Optional[str]:
+    """Return the text of *py_file* via the shared store, or ``None`` on OSError."""
+    parsed = _STORE.load(py_file)
+    return parsed.text if parsed is not None else None
 
 
 def parse_file(py_file: Path) -> Optional[ast.Module]:
     """Parse *py_file* and return its AST, or ``None`` on syntax error."""
-    try:
-        source = py_file.read_text(encoding="utf-8", errors="replace")
-        return ast.parse(source, filename=str(py_file))
-    except SyntaxError:
-        return None
+    parsed = _STORE.load(py_file)
+    return parsed.tree if parsed is not None else None
+
+
+def file_digest(py_file: Path) -> Optional[str]:
+    """Return the content digest of *py_file* without parsing it."""
+    return _STORE.digest(py_file)
+
+
+def clear_source_cache() -> None:
+    """Forget every cached source file (mainly for tests and long-lived servers)."""
+    _STORE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Single-pass multi-analyzer traversal
+# ---------------------------------------------------------------------------
+
+
+class AstPass:
+    """Base class for analyzers driven by :func:`walk_tree`.
+
+    Subclasses define ``visit_<NodeType>(node)`` handlers, called when the
+    traversal enters a node, and optionally ``leave_<NodeType>(node)``
+    handlers, called after all of the node's children have been visited.
+    Unlike :class:`ast.NodeVisitor`, handlers never recurse themselves: the
+    engine visits every node exactly once, depth-first in field order, so
+    several passes can share one traversal.  Passes that need to skip a
+    subtree track their own scope with paired visit/leave handlers.
+    """
+
+    def visit(self, tree: ast.AST) -> None:
+        """Run this pass on its own over *tree*."""
+        walk_tree(tree, [self])
+
+
+_DISPATCH_CACHE: dict[type, tuple[dict[str, str], dict[str, str]]] = {}
+
+
+def _handlers(cls: type) -> tuple[dict[str, str], dict[str, str]]:
+    """Return ``({NodeType: visit_method}, {NodeType: leave_method})`` for *cls*."""
+    tables = _DISPATCH_CACHE.get(cls)
+    if tables is None:
+        enter = {n[6:]: n for n in dir(cls) if n.startswith("visit_")}
+        leave = {n[6:]: n for n in dir(cls) if n.startswith("leave_")}
+        tables = _DISPATCH_CACHE[cls] = (enter, leave)
+    return tables
+
+
+def walk_tree(tree: ast.AST, passes: Iterable[AstPass]) -> None:
+    """Traverse *tree* once, dispatching each node to every interested pass."""
+    enter: dict[str, list[Callable]] = {}
+    leave: dict[str, list[Callable]] = {}
+    for p in passes:
+        on_enter, on_leave = _handlers(type(p))
+        for node_type, method in on_enter.items():
+            enter.setdefault(node_type, []).append(getattr(p, method))
+        for node_type, method in on_leave.items():
+            leave.setdefault(node_type, []).append(getattr(p, method))
+
+    iter_children = ast.iter_child_nodes
+    no_handlers: list[Callable] = []
+
+    def _walk(node: ast.AST) -> None:
+        name = node.__class__.__name__
+        for fn in enter.get(name, no_handlers):
+            fn(node)
+        for child in iter_children(node):
+            _walk(child)
+        for fn in leave.get(name, no_handlers):
+            fn(node)
+
+    _walk(tree)
+
+
+#: Registered pass factories, by name.  See :func:`register_pass`.
+_PASS_REGISTRY: dict[str, Callable[[], AstPass]] = {}
+
+
+def register_pass(name: str, factory: Callable[[], AstPass]) -> None:
+    """Register zero-argument *factory* so :func:`pass_result` can run it as *name*.
+
+    Analyzer modules call this at import time.  Every registered pass rides
+    along on the first traversal of each file, so import the analyzers you are
+    about to use before requesting results to get a single walk per file.
+    """
+    _PASS_REGISTRY[name] = factory
+
+
+def pass_result(parsed: ParsedSource, name: str) -> AstPass:
+    """Return the finished pass *name* for *parsed*, walking the tree if needed.
+
+    All registered passes not yet computed for this file run together in one
+    traversal; the finished pass objects are memoised on *parsed* and must be
+    treated as read-only by callers.
+    """
+    done = parsed.passes
+    if name not in done:
+        if parsed.tree is None:
+            raise ValueError(f"{parsed.path} has no AST: {parsed.syntax_error}")
+        pending = [n for n in list(_PASS_REGISTRY) if n not in done]
+        if name not in pending:
+            raise KeyError(f"no AST pass registered as {name!r}")
+        passes = [_PASS_REGISTRY[n]() for n in pending]
+        walk_tree(parsed.tree, passes)
+        for n, p in zip(pending, passes):
+            done[n] = p
+    return done[name]
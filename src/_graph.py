@@ -0,0 +1,449 @@
+"""Directed graph core shared by Awake's dependency analyzers.
+
+``coupling``, ``dep_graph``, ``module_graph`` and ``arch_generator`` all need
+the same ``src/`` import graph.  :func:`build_import_graph` builds it once
+per run from the per-file ``import`` statements (memoised by the shared
+:class:`~src._ast_utils.SourceStore` and, optionally, the on-disk analysis
+cache), and :class:`Graph` provides the algorithms on top of it.
+
+Nodes are stored once in sorted order and edges as CSR adjacency arrays: an
+``array('l')`` of per-node offsets into one ``array('l')`` of successor ids,
+with the reverse arrays built on first use.  Every traversal is iterative, so
+deep or dense graphs never hit the recursion limit.
+
+Algorithms
+----------
+- :meth:`Graph.strongly_connected_components` — Tarjan, ``O(V + E)``
+- :meth:`Graph.condensation` — the DAG of those components
+- :meth:`Graph.topological_layers` — layer 0 depends on nothing
+- :meth:`Graph.find_cycles` — Johnson's elementary-cycle enumeration,
+  run per component and stopped after *limit* cycles, since a dense
+  component can hold exponentially many;
+  :meth:`Graph.find_cycles_bounded` also says whether any were cut off
+"""
+
+from __future__ import annotations
+
+import ast
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src._ast_utils import AstPass, register_pass
+
+
+#: Default cap on the number of cycles :meth:`Graph.find_cycles` enumerates.
+DEFAULT_CYCLE_LIMIT = 100
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Condensation:
+    """Strongly connected components and the DAG between them.
+
+    ``components`` is ordered dependencies-first: every component's
+    successors appear before it.
+    """
+
+    components: list[list[str]]
+    component_of: dict[str, int]
+    successors: list[list[int]]
+
+
+class Graph:
+    """Immutable directed graph over string node names."""
+
+    __slots__ = ("nodes", "index", "_offsets", "_targets", "_reverse")
+
+    def __init__(self, nodes: Iterable[str], edges: Iterable[tuple[str, str]] = ()) -> None:
+        self.nodes: tuple[str, ...] = tuple(sorted(set(nodes)))
+        self.index: dict[str, int] = {name: i for i, name in enumerate(self.nodes)}
+        adjacency: list[set[int]] = [set() for _ in self.nodes]
+        for src, dst in edges:
+            if src in self.index and dst in self.index:
+                adjacency[self.index[src]].add(self.index[dst])
+        self._offsets, self._targets = _csr(adjacency)
+        self._reverse: Optional[tuple[array, array]] = None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index
+
+    def __repr__(self) -> str:
+        return f"Graph(nodes={len(self)}, edges={self.edge_count})"
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct edges."""
+        return len(self._targets)
+
+    def _succ(self, i: int) -> array:
+        return self._targets[self._offsets[i]:self._offsets[i + 1]]
+
+    def _pred(self, i: int) -> array:
+        if self._reverse is None:
+            adjacency: list[set[int]] = [set() for _ in self.nodes]
+            for v in range(len(self.nodes)):
+                for w in self._succ(v):
+                    adjacency[w].add(v)
+            self._reverse = _csr(adjacency)
+        offsets, targets = self._reverse
+        return targets[offsets[i]:offsets[i + 1]]
+
+    def successors(self, name: str) -> list[str]:
+        """Nodes *name* has an edge to, in sorted order."""
+        return [self.nodes[w] for w in self._succ(self.index[name])]
+
+    def predecessors(self, name: str) -> list[str]:
+        """Nodes with an edge to *name*, in sorted order."""
+        return [self.nodes[v] for v in self._pred(self.index[name])]
+
+    def out_degree(self, name: str) -> int:
+        """Number of successors of *name*."""
+        i = self.index[name]
+        return self._offsets[i + 1] - self._offsets[i]
+
+    def in_degree(self, name: str) -> int:
+        """Number of predecessors of *name*."""
+        return len(self._pred(self.index[name]))
+
+    def edges(self) -> Iterator[tuple[str, str]]:
+        """Yield every ``(source, target)`` edge, sorted."""
+        for v, name in enumerate(self.nodes):
+            for w in self._succ(v):
+                yield name, self.nodes[w]
+
+    def subgraph(self, names: Iterable[str]) -> "Graph":
+        """Return the graph induced by *names* (unknown names are ignored)."""
+        keep = {n for n in names if n in self.index}
+        return Graph(keep, ((a, b) for a, b in self.edges() if a in keep and b in keep))
+
+    # ------------------------------------------------------------------
+    # Components
+    # ------------------------------------------------------------------
+
+    def _tarjan(self, allowed: Optional[set[int]] = None) -> list[list[int]]:
+        """Iterative Tarjan over *allowed* node ids (all nodes if ``None``)."""
+        n = len(self.nodes)
+        index_of = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+        roots = range(n) if allowed is None else sorted(allowed)
+        for root in roots:
+            if index_of[root] != -1:
+                continue
+            index_of[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+            while work:
+                v, i = work[-1]
+                succ = self._succ(v)
+                while i < len(succ):
+                    w = succ[i]
+                    i += 1
+                    if allowed is not None and w not in allowed:
+                        continue
+                    if index_of[w] == -1:
+                        work[-1] = (v, i)
+                        index_of[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                        break
+                    if on_stack[w] and index_of[w] < low[v]:
+                        low[v] = index_of[w]
+                else:
+                    work.pop()
+                    if work and low[v] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[v]
+                    if low[v] == index_of[v]:
+                        component = []
+                        while True:
+                            w = stack.pop()
+                            on_stack[w] = False
+                            component.append(w)
+                            if w == v:
+                                break
+                        components.append(sorted(component))
+        return components
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """Return every strongly connected component, dependencies first."""
+        return [[self.nodes[i] for i in c] for c in self._tarjan()]
+
+    def condensation(self) -> Condensation:
+        """Collapse each strongly connected component into one DAG node."""
+        components = self._tarjan()
+        component_of = [0] * len(self.nodes)
+        for c, members in enumerate(components):
+            for v in members:
+                component_of[v] = c
+        successors: list[list[int]] = []
+        for c, members in enumerate(components):
+            succ = {component_of[w] for v in members for w in self._succ(v)}
+            succ.discard(c)
+            successors.append(sorted(succ))
+        return Condensation(
+            components=[[self.nodes[i] for i in c] for c in components],
+            component_of={self.nodes[v]: component_of[v] for v in range(len(self.nodes))},
+            successors=successors,
+        )
+
+    def topological_layers(self) -> list[list[str]]:
+        """Group nodes into layers: each node's successors sit in lower layers.
+
+        Layer 0 holds the nodes with no successors; members of one cycle
+        share a layer.
+        """
+        dag = self.condensation()
+        depth: list[int] = []
+        for succ in dag.successors:  # dependencies-first, so successors are done
+            depth.append(1 + max((depth[s] for s in succ), default=-1))
+        layers: list[list[str]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for c, members in enumerate(dag.components):
+            layers[depth[c]].extend(members)
+        return [sorted(layer) for layer in layers]
+
+    # ------------------------------------------------------------------
+    # Cycles
+    # ------------------------------------------------------------------
+
+    def find_cycles(self, limit: Optional[int] = DEFAULT_CYCLE_LIMIT) -> list[list[str]]:
+        """Enumerate elementary cycles, at most *limit* of them (``None`` = all).
+
+        Each cycle starts at its smallest node and repeats it at the end,
+        e.g. ``["a", "b", "a"]``; a self-loop is ``["a", "a"]``.  Only
+        components that contain a cycle are searched, and each cycle is found
+        exactly once, so no deduplication is needed.
+        """
+        cycles: list[list[int]] = []
+        pending = [c for c in self._tarjan() if self._is_cyclic(c)]
+        pending.reverse()
+        while pending and (limit is None or len(cycles) < limit):
+            component = pending.pop()
+            start, allowed = component[0], set(component)
+            self._circuits(start, allowed, cycles, limit)
+            allowed.discard(start)
+            sub = [c for c in self._tarjan(allowed) if self._is_cyclic(c)]
+            pending.extend(reversed(sub))
+        return [[self.nodes[i] for i in c] for c in cycles]
+
+    def find_cycles_bounded(
+        self, limit: Optional[int] = DEFAULT_CYCLE_LIMIT,
+    ) -> tuple[list[list[str]], bool]:
+        """Like :meth:`find_cycles`, but also report whether cycles were left out.
+
+        Returns ``(cycles, truncated)``; *truncated* is true only when the
+        enumeration found more than *limit* cycles, so a graph with exactly
+        *limit* of them is reported complete.
+        """
+        if limit is None:
+            return self.find_cycles(None), False
+        cycles = self.find_cycles(limit + 1)
+        return cycles[:limit], len(cycles) > limit
+
+    def _is_cyclic(self, component: list[int]) -> bool:
+        return len(component) > 1 or component[0] in self._succ(component[0])
+
+    def _circuits(self, start: int, allowed: set[int], out: list[list[int]],
+                  limit: Optional[int]) -> None:
+        """Johnson's circuit search for cycles through *start* within *allowed*."""
+        def succ(v: int) -> list[int]:
+            """Successors of *v* inside the component being searched"""
+            return [w for w in self._succ(v) if w in allowed]
+
+        blocked = {start}
+        blockers: dict[int, set[int]] = {}
+        closed: set[int] = set()
+        path = [start]
+        stack = [(start, succ(start)[::-1])]
+        while stack:
+            v, nbrs = stack[-1]
+            if nbrs:
+                w = nbrs.pop()
+                if w == start:
+                    out.append(path + [start])
+                    if limit is not None and len(out) >= limit:
+                        return
+                    closed.update(path)
+                elif w not in blocked:
+                    path.append(w)
+                    stack.append((w, succ(w)[::-1]))
+                    closed.discard(w)
+                    blocked.add(w)
+                    continue
+            if not nbrs:
+                if v in closed:
+                    _unblock(v, blocked, blockers)
+                else:
+                    for w in succ(v):
+                        blockers.setdefault(w, set()).add(v)
+                stack.pop()
+                path.pop()
+
+
+def _unblock(node: int, blocked: set[int], blockers: dict[int, set[int]]) -> None:
+    todo = {node}
+    while todo:
+        v = todo.pop()
+        if v in blocked:
+            blocked.discard(v)
+            todo.update(blockers.pop(v, ()))
+
+
+def _csr(adjacency: list[set[int]]) -> tuple[array, array]:
+    offsets = array("l", [0])
+    targets = array("l")
+    for succ in adjacency:
+        targets.extend(sorted(succ))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+# ---------------------------------------------------------------------------
+# Import graph
+# ---------------------------------------------------------------------------
+
+
+class _ImportCollector(AstPass):
+    """Collect all module names referenced in ``import`` / ``from … import`` statements.
+
+    Only top-level module names are stored (e.g. ``from src.health import X``
+    yields ``"src.health"`` and ``import os.path`` yields ``"os.path"``).
+    """
+
+    def __init__(self) -> None:
+        self.imports: list[str] = []
+
+    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
+        """Record each name from a bare ``import`` statement."""
+        for alias in node.names:
+            self.imports.append(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
+        """Record the module name from a ``from … import`` statement."""
+        if node.module:
+            self.imports.append(node.module)
+
+
+register_pass("imports", _ImportCollector)
+
+
+#: Bump whenever the per-file import payload changes so stale cache entries are ignored.
+_CACHE_VERSION = "1"
+
+
+def _collect_imports(py_file: Path, cache=None) -> Optional[list[str]]:
+    """Return every module name imported by *py_file*, or ``None`` on syntax error.
+
+    With *cache* the list is read from and written to the on-disk analysis
+    cache keyed by the file's content digest.
+    """
+    from src._ast_utils import load_source, pass_result
+
+    digest = cache.digest(py_file) if cache is not None else None
+    if digest is not None:
+        payload = cache.get(digest)
+        if payload is not None:
+            return payload["imports"]
+
+    parsed = load_source(py_file)
+    imports: Optional[list[str]] = None
+    if parsed is not None and parsed.tree is not None:
+        imports = list(pass_result(parsed, "imports").imports)
+    if digest is not None:
+        cache.put(digest, {"imports": imports})
+    return imports
+
+
+class ImportGraph(Graph):
+    """Intra-project import graph; ``paths`` maps each module key to its file.
+
+    Keys are dotted paths relative to ``src/`` (``"health"``,
+    ``"commands.analysis"``); an edge ``a → b`` means *a* imports *b*.
+    """
+
+    __slots__ = ("paths",)
+
+    def __init__(self, paths: dict[str, Path], edges: Iterable[tuple[str, str]] = ()) -> None:
+        super().__init__(paths, edges)
+        self.paths = dict(sorted(paths.items()))
+
+    def top_level(self) -> Graph:
+        """The subgraph of modules directly inside ``src/`` (no sub-packages)."""
+        return self.subgraph(n for n in self.nodes if "." not in n)
+
+
+def build_import_graph(
+    repo_path: Path,
+    *,
+    cache: bool = False,
+    incremental: bool = False,
+) -> ImportGraph:
+    """Build the import graph of every ``src/**/*.py`` module under *repo_path*.
+
+    An import counts as an edge when its dotted name, or its longest
+    matching prefix, names another module as ``src.<key>``, ``<key>`` or
+    (when unambiguous) the module's bare file stem.  Self-imports are
+    dropped.  ``__init__`` and other dunder files are not nodes.
+
+    With ``cache=True`` per-file import lists are reused from
+    ``<repo_path>/.awake/cache`` while the file content is unchanged;
+    ``incremental=True`` re-parses only files git reports changed since the
+    last incremental run (see :mod:`src.incremental`).
+    """
+    repo_path = Path(repo_path)
+    src_dir = repo_path / "src"
+    if not src_dir.exists():
+        return ImportGraph({})
+
+    py_files = [f for f in sorted(src_dir.rglob("*.py")) if not f.name.startswith("__")]
+    paths: dict[str, Path] = {}
+    # Every recognised import spelling → module key:
+    #   "health", "src.health", "commands.analysis", "src.commands.analysis"
+    #   plus the bare stem ("analysis") when it is unambiguous.
+    import_to_key: dict[str, str] = {}
+    by_stem: dict[str, list[str]] = {}
+    for py_file in py_files:
+        key = ".".join(py_file.relative_to(src_dir).with_suffix("").parts)
+        paths[key] = py_file
+        import_to_key[key] = key
+        import_to_key[f"src.{key}"] = key
+        by_stem.setdefault(key.rpartition(".")[2], []).append(key)
+    for stem, keys in by_stem.items():
+        if len(keys) == 1:
+            import_to_key.setdefault(stem, keys[0])
+
+    store = None
+    if cache or incremental:
+        from src.analysis_cache import open_cache
+        store = open_cache(repo_path, "imports", _CACHE_VERSION, incremental=incremental)
+
+    edges: list[tuple[str, str]] = []
+    for key, py_file in paths.items():
+        for imp in _collect_imports(py_file, cache=store) or ():
+            # Longest matching prefix: "src.health.X" → "src.health".
+            parts = imp.split(".")
+            for length in range(len(parts), 0, -1):
+                target = import_to_key.get(".".join(parts[:length]))
+                if target is not None:
+                    if target != key:
+                        edges.append((key, target))
+                    break
+
+    if incremental:
+        store.record_run(py_files)
+    return ImportGraph(paths, edges)
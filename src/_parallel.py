@@ -0,0 +1,68 @@
+"""Process-pool fan-out for per-file analysis.
+
+``ast.parse`` and tree walks are CPU-bound and hold the GIL, so analyzers that
+loop over hundreds of files scale with cores only across processes.
+:func:`map_files` is a drop-in, order-preserving replacement for ``map`` that
+switches to a :class:`~concurrent.futures.ProcessPoolExecutor` when more than
+one job is requested.
+
+Results come back in input order regardless of which worker finished first,
+so callers that merge them sequentially produce byte-identical output to the
+serial path.  Worker functions and their arguments must be picklable
+(module-level functions, dataclasses, paths).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Optional
+
+
+#: Aim for this many chunks per worker so stragglers even out.
+_CHUNKS_PER_WORKER = 4
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Normalise a ``--jobs`` value: ``None``/1 → serial, ``0`` or less → all CPUs."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def map_files(
+    fn: Callable[..., Any],
+    *iterables: Iterable[Any],
+    jobs: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+) -> list[Any]:
+    """Apply *fn* across *iterables* like ``map``, optionally in worker processes.
+
+    Args:
+        fn: Picklable module-level function called once per item.
+        iterables: Argument sequences, zipped together as for ``map``.
+        jobs: Worker count (see :func:`resolve_jobs`).  ``1`` runs in-process.
+        chunksize: Items per task sent to a worker.  Defaults to an even split
+            into ``jobs * 4`` batches.
+
+    Returns:
+        Results in the same order as the inputs.  If the pool cannot be
+        started (e.g. a sandbox forbids ``fork``) the work falls back to the
+        serial path.
+    """
+    args = list(zip(*iterables))
+    workers = min(resolve_jobs(jobs), len(args))
+    if workers <= 1:
+        return [fn(*a) for a in args]
+
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(args) / (workers * _CHUNKS_PER_WORKER)))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, *zip(*args), chunksize=chunksize))
+    except (OSError, BrokenProcessPool):
+        return [fn(*a) for a in args]
@@ -0,0 +1,124 @@
+"""Persistent per-file analysis cache for Awake.
+
+Stores the per-file results of the analyzers (health, complexity, security,
+dead-code and coupling) under ``<repo>/.awake/cache`` so that re-running a
+command on an unchanged tree does no parsing at all, and a one-file edit costs
+one file's worth of work.
+
+Layout
+------
+    .awake/cache/<analyzer>-v<version>/<digest[:2]>/<digest>.json
+
+Entries are keyed by the SHA-256 digest of the file's bytes (see
+:func:`src._ast_utils.file_digest`) and namespaced by the analyzer name and
+its cache version.  Bumping an analyzer's ``_CACHE_VERSION`` constant orphans
+its old entries; ``awake`` never reads them again.
+
+Payloads must be JSON-serialisable and must not contain the file's path, since
+identical files at different paths share one entry.
+
+Public API
+----------
+- ``CACHE_DIR``                      — repo-relative cache root
+- ``AnalysisCache``                  — one analyzer's cache namespace
+- ``open_cache(repo, analyzer, version, enabled, incremental)``
+  → ``AnalysisCache | None``
+- ``clear_analysis_cache(repo)``     → number of entries removed
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+#: Cache root, relative to the repository root.
+CACHE_DIR = Path(".awake") / "cache"
+
+
+class AnalysisCache:
+    """Content-addressed JSON store for one analyzer's per-file results."""
+
+    def __init__(self, repo_path: Path, analyzer: str, version: str) -> None:
+        self.analyzer = analyzer
+        self.version = version
+        self.directory = Path(repo_path) / CACHE_DIR / f"{analyzer}-v{version}"
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, path: Path) -> Optional[str]:
+        """Return the content digest used to key *path*'s entry."""
+        from src._ast_utils import file_digest
+        return file_digest(path)
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def get(self, digest: Optional[str]) -> Optional[Any]:
+        """Return the cached payload for *digest*, or ``None`` on a miss."""
+        if not digest:
+            self.misses += 1
+            return None
+        try:
+            payload = json.loads(self._entry_path(digest).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload
+
+    def put(self, digest: Optional[str], payload: Any) -> None:
+        """Store *payload* for *digest*.  Write failures are silently ignored.
+
+        Writes go to a temporary file that is atomically renamed into place so
+        concurrent ``awake`` processes never observe a half-written entry.
+        """
+        if not digest:
+            return
+        path = self._entry_path(digest)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(payload, fh, separators=(",", ":"))
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            pass
+
+
+def open_cache(
+    repo_path: Path,
+    analyzer: str,
+    version: str,
+    enabled: bool = True,
+    incremental: bool = False,
+) -> Optional[AnalysisCache]:
+    """Return the cache namespace for *analyzer*, or ``None`` when disabled.
+
+    With *incremental* the namespace is an
+    :class:`~src.incremental.IncrementalCache`, which is always enabled.
+    """
+    if incremental:
+        from src.incremental import IncrementalCache
+        return IncrementalCache(repo_path, analyzer, version)
+    if not enabled:
+        return None
+    return AnalysisCache(repo_path, analyzer, version)
+
+
+def clear_analysis_cache(repo_path: Path) -> int:
+    """Delete every cached entry under *repo_path* and return how many existed."""
+    root = Path(repo_path) / CACHE_DIR
+    if not root.exists():
+        return 0
+    count = sum(1 for _ in root.rglob("*.json"))
+    shutil.rmtree(root, ignore_errors=True)
+    return count
@@ -0,0 +1,230 @@
+"""Shared, lazily computed analysis results for Awake's aggregators.
+
+``audit``, ``badges``, ``dashboard``, ``status`` and ``predict`` each need
+overlapping subsets of the same base analyses (health, security, dead code,
+coverage map, ...).  Instead of each one calling the analyzers itself, they
+take an :class:`AnalysisContext` and read its properties: every report is
+computed on first access and memoised, so aggregators that share a context
+compute each analysis at most once between them.  The ``health``,
+``security`` and ``deadcode`` commands read their reports from the same
+context when dispatched in-process, so the API server's routes share them
+with the aggregators; a one-shot CLI run uses a fresh context.
+
+Failures are memoised too: a report that raised is re-raised on every later
+access rather than recomputed, and each aggregator keeps its own fallback.
+
+:func:`shared_context` returns one process-wide context per repository.  The
+context is replaced whenever :func:`src.api_cache.repo_fingerprint` or the
+``tests/`` tree changes, so long-lived processes (the API server) never
+serve stale reports.  Each time it hands out an existing context it discards
+that context's memoised failures, so a transient error lasts for one caller
+rather than until the source next changes.
+
+Public API
+----------
+- ``AnalysisContext(repo_path, *, cache=False, jobs=1)``
+  (``discard_failures()`` forgets reports that raised)
+- ``shared_context(repo_path, *, cache=False, jobs=1)`` → ``AnalysisContext``
+- ``clear_shared_contexts()``
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+
+class AnalysisContext:
+    """Memoised analysis reports for one repository.
+
+    Parameters
+    ----------
+    repo_path:
+        Repository root.
+    cache:
+        Forwarded to analyzers that support the on-disk analysis cache.
+    jobs:
+        Forwarded to analyzers that fan out over worker processes.
+    """
+
+    def __init__(self, repo_path: Path, *, cache: bool = False, jobs: int = 1) -> None:
+        self.repo_path = Path(repo_path)
+        self.cache = cache
+        self.jobs = jobs
+        self._lock = threading.Lock()
+        self._report_locks: dict[str, threading.Lock] = {}
+        self._results: dict[str, tuple[bool, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"AnalysisContext({str(self.repo_path)!r}, computed={self.computed})"
+
+    @property
+    def log_path(self) -> Path:
+        """Path of the repository's ``AWAKE_LOG.md``."""
+        return self.repo_path / "AWAKE_LOG.md"
+
+    @property
+    def computed(self) -> list[str]:
+        """Names of the reports computed so far, in computation order."""
+        with self._lock:
+            return list(self._results)
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        # One lock per report: concurrent readers of the same report wait for
+        # a single computation, while different reports compute in parallel.
+        with self._lock:
+            report_lock = self._report_locks.setdefault(name, threading.Lock())
+        with report_lock:
+            with self._lock:
+                done = name in self._results
+            if not done:
+                try:
+                    result = (True, factory())
+                except Exception as exc:
+                    result = (False, exc)
+                with self._lock:
+                    self._results[name] = result
+            with self._lock:
+                ok, value = self._results[name]
+        if not ok:
+            raise value
+        return value
+
+    def discard_failures(self) -> None:
+        """Forget every report that raised, so its next access computes it again."""
+        with self._lock:
+            for name in [n for n, (ok, _) in self._results.items() if not ok]:
+                del self._results[name]
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    @property
+    def health(self):
+        """:class:`src.health.HealthReport` for ``src/``."""
+        from src.health import generate_health_report
+        return self._get("health", lambda: generate_health_report(
+            repo_path=self.repo_path, cache=self.cache, jobs=self.jobs,
+        ))
+
+    @property
+    def complexity(self):
+        """:class:`src.complexity.ComplexityReport` for ``src/``."""
+        from src.complexity import analyze_complexity
+        return self._get("complexity", lambda: analyze_complexity(
+            self.repo_path, cache=self.cache, jobs=self.jobs,
+        ))
+
+    @property
+    def import_graph(self):
+        """:class:`src._graph.ImportGraph` of ``src/``, shared by the graph analyzers."""
+        from src._graph import build_import_graph
+        return self._get("import_graph", lambda: build_import_graph(
+            self.repo_path, cache=self.cache,
+        ))
+
+    @property
+    def coupling(self):
+        """:class:`src.coupling.CouplingReport` for ``src/``."""
+        from src.coupling import analyze_coupling
+        return self._get("coupling", lambda: analyze_coupling(
+            self.repo_path, graph=self.import_graph,
+        ))
+
+    @property
+    def security(self):
+        """:class:`src.security.SecurityReport` for ``src/``."""
+        from src.security import audit_security
+        return self._get("security", lambda: audit_security(
+            repo_path=self.repo_path, cache=self.cache, jobs=self.jobs,
+        ))
+
+    @property
+    def dead_code(self):
+        """:class:`src.dead_code.DeadCodeReport` for ``src/``."""
+        from src.dead_code import find_dead_code
+        return self._get("dead_code", lambda: find_dead_code(
+            repo_path=self.repo_path, cache=self.cache, jobs=self.jobs,
+        ))
+
+    @property
+    def coverage_map(self):
+        """:class:`src.coverage_map.CoverageMapReport` for ``src/`` vs ``tests/``."""
+        from src.coverage_map import build_coverage_map
+        return self._get("coverage_map", lambda: build_coverage_map(repo_path=self.repo_path))
+
+    @property
+    def refactor_candidates(self):
+        """Flat list of :class:`src.refactor.RefactorSuggestion` objects."""
+        from src.refactor import find_refactor_candidates
+        return self._get("refactor_candidates", lambda: find_refactor_candidates(
+            repo_path=self.repo_path, jobs=self.jobs,
+        ))
+
+    @property
+    def maturity(self):
+        """:class:`src.maturity.MaturityReport` for ``src/``."""
+        from src.maturity import assess_maturity
+        return self._get("maturity", lambda: assess_maturity(self.repo_path))
+
+    @property
+    def git_stats(self):
+        """:class:`src.gitstats.GitStatsReport` for the repository."""
+        from src.gitstats import compute_git_stats
+        return self._get("git_stats", lambda: compute_git_stats(self.repo_path))
+
+    @property
+    def repo_stats(self):
+        """:class:`src.stats.RepoStats` (git counts plus parsed log sessions)."""
+        from src.stats import compute_stats
+        return self._get("repo_stats", lambda: compute_stats(
+            repo_path=self.repo_path, log_path=self.log_path,
+        ))
+
+    @property
+    def session_index(self):
+        """:class:`src.session_index.SessionIndex` of ``AWAKE_LOG.md``."""
+        from src.session_index import load_session_index
+        return self._get("session_index", lambda: load_session_index(self.log_path))
+
+    @property
+    def sessions(self) -> list[dict]:
+        """Per-session summaries from :func:`src.stats.parse_awake_log`."""
+        from src.stats import parse_awake_log
+        return self._get("sessions", lambda: parse_awake_log(self.log_path))
+
+
+# ---------------------------------------------------------------------------
+# Process-wide contexts
+# ---------------------------------------------------------------------------
+
+_SHARED_LOCK = threading.Lock()
+_SHARED: dict[tuple, tuple[tuple, AnalysisContext]] = {}
+
+
+def _fingerprint(repo: Path) -> tuple:
+    from src.api_cache import repo_fingerprint, src_fingerprint
+    return repo_fingerprint(repo), src_fingerprint(repo / "tests")
+
+
+def shared_context(repo_path: Path, *, cache: bool = False, jobs: int = 1) -> AnalysisContext:
+    """Return the process-wide context for *repo_path*, fresh if the repo changed."""
+    repo = Path(repo_path).resolve()
+    key = (str(repo), cache, jobs)
+    fp = _fingerprint(repo)
+    with _SHARED_LOCK:
+        entry = _SHARED.get(key)
+        if entry is None or entry[0] != fp:
+            entry = (fp, AnalysisContext(repo, cache=cache, jobs=jobs))
+            _SHARED[key] = entry
+        else:
+            entry[1].discard_failures()
+        return entry[1]
+
+
+def clear_shared_contexts() -> None:
+    """Drop every process-wide context (tests and long-running hosts)."""
+    with _SHARED_LOCK:
+        _SHARED.clear()
@@ -0,0 +1,170 @@
+"""Result cache for the Awake API server.
+
+Every dashboard refresh used to recompute every report.  :class:`ResultCache`
+keeps each command route's JSON body until either its TTL expires or the
+repository changes underneath it, as detected by :func:`repo_fingerprint`:
+
+- the ``HEAD`` commit sha,
+- a fingerprint of the ``src/`` tree (path, mtime and size of every ``.py``),
+- the mtime of ``AWAKE_LOG.md``.
+
+The fingerprint itself is memoised for :data:`FINGERPRINT_TTL` seconds so a
+burst of dashboard queries stats the tree once.
+
+:func:`etag_for` derives a strong ETag from a response body; the server
+answers ``If-None-Match`` revalidations that :func:`etag_matches` accepts
+with ``304 Not Modified``.
+
+Public API
+----------
+- ``DEFAULT_TTL`` / ``FINGERPRINT_TTL``
+- ``repo_fingerprint(repo)``  → hashable snapshot of the inputs above
+- ``src_fingerprint(src_dir)`` → digest of the ``.py`` files under it
+- ``etag_for(body)``          → quoted ETag string
+- ``etag_matches(header, etag)`` → ``If-None-Match`` weak comparison
+- ``ResultCache``             — thread-safe per-route body cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Hashable, Optional
+
+
+#: Seconds a cached route body stays valid even if nothing changed.
+DEFAULT_TTL = 300.0
+
+#: Seconds a computed repository fingerprint is reused.
+FINGERPRINT_TTL = 1.0
+
+
+def _git_head(repo: Path) -> str:
+    """Return the ``HEAD`` sha of *repo*, or ``''`` outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=str(repo),
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def src_fingerprint(src_dir: Path) -> str:
+    """Hash the path, mtime and size of every ``.py`` file under *src_dir*."""
+    h = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(src_dir):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def repo_fingerprint(repo: Path) -> tuple[str, str, int]:
+    """Return ``(head_sha, src_tree_digest, awake_log_mtime_ns)`` for *repo*."""
+    repo = Path(repo)
+    try:
+        log_mtime = (repo / "AWAKE_LOG.md").stat().st_mtime_ns
+    except OSError:
+        log_mtime = 0
+    return _git_head(repo), src_fingerprint(repo / "src"), log_mtime
+
+
+def etag_for(body: str) -> str:
+    """Return a strong, quoted ETag for a response *body*."""
+    return '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """True if an ``If-None-Match`` *header* value matches *etag*.
+
+    The header is a comma-separated list of entity tags, or ``*``.  As
+    RFC 9110 requires for ``If-None-Match``, tags are compared weakly: a
+    ``W/`` prefix is ignored on both sides.
+    """
+    if not header:
+        return False
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+class ResultCache:
+    """Thread-safe cache of route bodies, invalidated by TTL or repo changes.
+
+    Parameters
+    ----------
+    ttl:
+        Maximum age in seconds of a cached body.  ``0`` disables caching.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[tuple, float, str]] = {}
+        self._fingerprints: dict[str, tuple[float, tuple]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, repo: Path) -> tuple:
+        """Return :func:`repo_fingerprint` for *repo*, memoised briefly."""
+        key = str(repo)
+        now = time.monotonic()
+        with self._lock:
+            memo = self._fingerprints.get(key)
+        if memo is not None and now - memo[0] < FINGERPRINT_TTL:
+            return memo[1]
+        fp = repo_fingerprint(Path(repo))
+        with self._lock:
+            self._fingerprints[key] = (now, fp)
+        return fp
+
+    def get(self, key: Hashable, fingerprint: tuple) -> Optional[str]:
+        """Return the body cached for *key* if still valid, else ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry[0] == fingerprint
+                and time.monotonic() - entry[1] < self.ttl
+            ):
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, fingerprint: tuple, body: str) -> None:
+        """Store *body* for *key*, computed against *fingerprint*."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (fingerprint, time.monotonic(), body)
+
+    def clear(self) -> None:
+        """Drop every cached body and fingerprint."""
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
@@ -9,7 +9,8 @@ Generated sections
 2. Module inventory — each src/ file with its docstring summary, public API
    (classes, functions), and line count
 3. Dependency graph — which modules import which (rendered as a Markdown table
-   and a simple ASCII adjacency list)
+   and a simple ASCII adjacency list), from the shared import graph
+   (:mod:`src._graph`), plus its topological layers and import cycles
 4. Data-flow overview — dataclasses defined and where they are consumed
 5. Design principles — copied from constants in this module so humans can
    update them without touching the generator
@@ -26,6 +27,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source
+
 
 # ---------------------------------------------------------------------------
 # Design principles (human-editable constants)
@@ -143,11 +146,10 @@ def _top_level_imports(tree: ast.Module) -> list[str]:
 
 def _parse_module(path: Path, repo_root: Path) -> Optional[ModuleInfo]:
     """Parse a Python file into a ModuleInfo object."""
-    try:
-        source = path.read_text(encoding="utf-8", errors="replace")
-        tree = ast.parse(source, filename=str(path))
-    except (OSError, SyntaxError):
+    parsed = load_source(path)
+    if parsed is None or parsed.tree is None:
         return None
+    tree = parsed.tree
 
     rel = str(path.relative_to(repo_root))
     name = path.stem
@@ -155,7 +157,7 @@ def _parse_module(path: Path, repo_root: Path) -> Optional[ModuleInfo]:
         path=rel,
         name=name,
         docstring=_first_docstring(tree),
-        lines=len(source.splitlines()),
+        lines=len(parsed.lines),
         imports=_top_level_imports(tree),
     )
 
@@ -272,20 +274,48 @@ def _render_module_section(info: ModuleInfo) -> str:
     return "\n".join(lines)
 
 
-def _render_dep_graph(modules: list[ModuleInfo]) -> str:
-    """Render a dependency graph showing which src modules import each other."""
+def _render_dep_graph(modules: list[ModuleInfo], graph=None) -> str:
+    """Render a dependency graph showing which src modules import each other.
+
+    With *graph* (a :class:`src._graph.Graph` of module names) edges come
+    from the shared import graph; otherwise from each module's ``imports``.
+    """
     src_names = {m.name for m in modules}
     lines = [
         "| Module | Imports from src/ |",
         "|--------|-------------------|",
     ]
     for m in sorted(modules, key=lambda x: x.name):
-        cross_imports = sorted(imp for imp in m.imports if imp in src_names and imp != m.name)
+        if graph is not None:
+            cross_imports = graph.successors(m.name) if m.name in graph else []
+        else:
+            cross_imports = sorted(imp for imp in m.imports if imp in src_names and imp != m.name)
         dep_str = ", ".join(f"`{d}`" for d in cross_imports) if cross_imports else "*(standalone)*"
         lines.append(f"| `{m.name}` | {dep_str} |")
     return "\n".join(lines)
 
 
+def _render_dependency_layers(graph) -> str:
+    """Render the topological layers of *graph*: layer 0 imports no other src module."""
+    layers = graph.topological_layers()
+    if not layers:
+        return "*No modules found.*"
+    lines = [
+        "| Layer | Modules |",
+        "|-------|---------|",
+    ]
+    for depth, names in enumerate(layers):
+        lines.append(f"| {depth} | {', '.join(f'`{n}`' for n in names)} |")
+    cyclic = [c for c in graph.strongly_connected_components() if len(c) > 1]
+    if cyclic:
+        lines.append("")
+        lines.append("Import cycles (each group shares one layer):")
+        lines.append("")
+        for component in cyclic:
+            lines.append(f"- {', '.join(f'`{n}`' for n in component)}")
+    return "\n".join(lines)
+
+
 def _render_dataclass_inventory(modules: list[ModuleInfo]) -> str:
     """List all dataclasses and their home modules."""
     lines = [
@@ -325,6 +355,9 @@ def generate_architecture_doc(repo_path: Optional[Path] = None) -> str:
             if info:
                 modules.append(info)
 
+    from src._graph import build_import_graph
+    graph = build_import_graph(root).top_level().subgraph(m.name for m in modules)
+
     total_lines = sum(m.lines for m in modules)
     total_classes = sum(len(m.classes) for m in modules)
     total_functions = sum(len(m.functions) for m in modules)
@@ -357,7 +390,11 @@ def generate_architecture_doc(repo_path: Optional[Path] = None) -> str:
         parts.append(_render_module_section(m))
 
     parts.append("## Internal Dependency Graph\n")
-    parts.append(_render_dep_graph(modules))
+    parts.append(_render_dep_graph(modules, graph))
+    parts.append("")
+
+    parts.append("## Dependency Layers\n")
+    parts.append(_render_dependency_layers(graph))
     parts.append("")
 
     parts.append("## Dataclass Inventory\n")
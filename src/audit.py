@@ -217,18 +217,38 @@ def _complexity_to_score(avg_cc: float) -> float:
 # Main audit function
 # ---------------------------------------------------------------------------
 
-def run_audit(repo_path: Path) -> AuditReport:
-    """Run the comprehensive audit and return an AuditReport."""
+def _register_ast_passes() -> None:
+    """Import the AST-based analyzers so their passes share one walk per file.
+
+    Each analyzer registers its :class:`~src._ast_utils.AstPass` at import
+    time; importing them all before the first file is analysed means the first
+    traversal of every tree feeds all of them.
+    """
+    import importlib
+
+    for name in ("health", "security", "dead_code", "complexity", "coupling"):
+        importlib.import_module(f"src.{name}")
+
+
+def run_audit(repo_path: Path, context=None) -> AuditReport:
+    """Run the comprehensive audit and return an AuditReport.
+
+    *context* is an optional :class:`src.analysis_context.AnalysisContext`;
+    pass one shared with other aggregators to reuse its reports.
+    """
     import datetime
 
+    from src.analysis_context import AnalysisContext
+
+    ctx = context if context is not None else AnalysisContext(repo_path)
+    _register_ast_passes()
     sections: list[AuditSection] = []
 
     # ------------------------------------------------------------------
     # 1. Health (25 %)
     # ------------------------------------------------------------------
     try:
-        from src.health import generate_health_report
-        health = generate_health_report(repo_path=repo_path)
+        health = ctx.health
         h_score = float(health.overall_health_score)
         h_status = _score_to_status(h_score, warn_threshold=70, fail_threshold=50)
         sections.append(AuditSection(
@@ -257,8 +277,7 @@ def run_audit(repo_path: Path) -> AuditReport:
     # 2. Security (25 %)
     # ------------------------------------------------------------------
     try:
-        from src.security import audit_security
-        sec = audit_security(repo_path=repo_path)
+        sec = ctx.security
         s_score = _security_grade_to_score(sec.grade)
         s_status = _score_to_status(s_score, warn_threshold=68, fail_threshold=50)
         high_count = sum(1 for f in sec.findings if f.severity == "HIGH")
@@ -288,8 +307,7 @@ def run_audit(repo_path: Path) -> AuditReport:
     # 3. Dead Code (20 %)
     # ------------------------------------------------------------------
     try:
-        from src.dead_code import find_dead_code
-        dc = find_dead_code(repo_path=repo_path)
+        dc = ctx.dead_code
         high_dead = len(dc.high_confidence)
         total_mods = len(list((repo_path / "src").glob("*.py"))) if (repo_path / "src").exists() else 1
         dc_score = _dead_code_to_score(high_dead, total_mods)
@@ -319,8 +337,7 @@ def run_audit(repo_path: Path) -> AuditReport:
     # 4. Test Coverage (20 %)
     # ------------------------------------------------------------------
     try:
-        from src.coverage_map import build_coverage_map
-        cov = build_coverage_map(repo_path=repo_path)
+        cov = ctx.coverage_map
         cov_score = _coverage_avg_to_score(cov.avg_score)
         cov_status = _score_to_status(cov_score, warn_threshold=60, fail_threshold=40)
         no_tests = len(cov.modules_without_tests)
@@ -350,8 +367,7 @@ def run_audit(repo_path: Path) -> AuditReport:
     # 5. Complexity (10 %)
     # ------------------------------------------------------------------
     try:
-        from src.refactor import find_refactor_candidates
-        candidates = find_refactor_candidates(repo_path=repo_path)
+        candidates = ctx.refactor_candidates
         # Estimate average CC from candidates that have cc_score
         cc_values = [c.complexity_score for c in candidates if hasattr(c, "complexity_score") and c.complexity_score]
         avg_cc = sum(cc_values) / len(cc_values) if cc_values else 5.0
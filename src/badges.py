@@ -112,20 +112,16 @@ def _get_test_count(repo_path: Path) -> int:
     return count
 
 
-def _get_health_score(repo_path: Path) -> Optional[float]:
+def _get_health_score(context) -> Optional[float]:
     try:
-        from src.health import analyze_health
-        report = analyze_health(repo_path / "src")
-        return report.average_score
+        return float(context.health.overall_health_score)
     except Exception:
         return None
 
 
-def _get_security_grade(repo_path: Path) -> Optional[str]:
+def _get_security_grade(context) -> Optional[str]:
     try:
-        from src.security import audit_security
-        report = audit_security(repo_path / "src")
-        return report.grade
+        return context.security.grade
     except Exception:
         return None
 
@@ -136,11 +132,9 @@ def _get_module_count(repo_path: Path) -> int:
     return len([f for f in src_dir.glob("*.py") if not f.name.startswith("_")])
 
 
-def _get_maturity_avg(repo_path: Path) -> Optional[float]:
+def _get_maturity_avg(context) -> Optional[float]:
     try:
-        from src.maturity import assess_maturity
-        report = assess_maturity(repo_path=repo_path)
-        return report.avg_score
+        return context.maturity.avg_score
     except Exception:
         return None
 
@@ -153,10 +147,16 @@ def _get_pr_count(repo_path: Path) -> int:
     return max(int(p) for p in prs) if prs else 0
 
 
-def generate_badges(repo_path: Optional[Path] = None) -> BadgeBlock:
-    """Collect metrics and build a BadgeBlock."""
+def generate_badges(repo_path: Optional[Path] = None, context=None) -> BadgeBlock:
+    """Collect metrics and build a BadgeBlock.
+
+    Health, security and maturity come from *context* (an
+    :class:`src.analysis_context.AnalysisContext`) when one is given.
+    """
     import datetime
+    from src.analysis_context import AnalysisContext
     repo = repo_path or Path(__file__).resolve().parent.parent
+    ctx = context if context is not None else AnalysisContext(repo)
     badges: list[Badge] = []
 
     sessions = _get_session_count(repo)
@@ -177,17 +177,17 @@ def generate_badges(repo_path: Optional[Path] = None) -> BadgeBlock:
         badges.append(Badge(label="modules", message=str(module_count), color="informational",
                             alt="Module Count"))
 
-    health = _get_health_score(repo)
+    health = _get_health_score(ctx)
     if health is not None:
         badges.append(Badge(label="health", message=f"{health:.0f}%2F100",
                             color=_score_color(health), alt="Health Score"))
 
-    sec_grade = _get_security_grade(repo)
+    sec_grade = _get_security_grade(ctx)
     if sec_grade:
         badges.append(Badge(label="security", message=sec_grade,
                             color=_grade_color(sec_grade), alt="Security Grade"))
 
-    maturity = _get_maturity_avg(repo)
+    maturity = _get_maturity_avg(ctx)
     if maturity is not None:
         badges.append(Badge(label="maturity", message=f"{maturity:.0f}%2F100",
                             color=_score_color(maturity), alt="Avg Maturity"))
@@ -1,25 +1,44 @@
 """Performance benchmark suite for Awake modules.
 
-Times every analysis module, detects regressions against a stored baseline,
-and outputs a ranked table.  The baseline is persisted in
-``docs/benchmark_history.json`` so regressions are tracked across sessions.
+Times every registered analysis runner, detects regressions against a rolling
+baseline, and outputs a ranked table.  History is persisted in the
+``benchmark_runs`` tables of ``docs/metrics.db`` (see ``src/metrics_store.py``)
+so regressions are tracked across sessions; a legacy
+``docs/benchmark_history.json`` is imported on first use.
+
+Each runner is executed ``warmup`` times untimed, then ``repeat`` times timed;
+results report the min, median and p95 of the timed runs, plus peak Python
+heap allocation from one extra run under :mod:`tracemalloc`.  A result is a
+regression when its median exceeds the median of the last few recorded runs
+by more than ``REGRESSION_SIGMAS`` robust standard deviations (and by at least
+``MIN_REGRESSION_PCT`` percent).
 
 Usage
 -----
     from src.benchmark import run_benchmarks, save_benchmark_report
-    report = run_benchmarks(repo_path=Path("."))
+    report = run_benchmarks(repo_path=Path("."), warmup=1, repeat=5)
     print(report.to_markdown())
     save_benchmark_report(report, Path("docs/benchmark_report.md"))
 """
 
 from __future__ import annotations
 
-import ast
+import functools
 import json
+import math
+import statistics
 import time
+import tracemalloc
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+
+# Regression detection against the rolling baseline
+BASELINE_WINDOW = 5        # Recorded runs that form the baseline
+REGRESSION_SIGMAS = 3.0    # Robust standard deviations above the baseline median
+MIN_REGRESSION_PCT = 5.0   # Never flag changes smaller than this
+LEGACY_REGRESSION_PCT = 20.0  # Threshold when the baseline has no spread estimate
 
 
 # ---------------------------------------------------------------------------
@@ -32,10 +51,15 @@ class BenchmarkResult:
     """Timing result for a single module analysis."""
 
     module: str
-    elapsed_ms: float
+    elapsed_ms: float  # Median of the timed runs
     status: str  # "ok" | "error" | "skipped"
     error: Optional[str] = None
-    baseline_ms: Optional[float] = None
+    baseline_ms: Optional[float] = None  # Median of the rolling baseline
+    baseline_spread_ms: Optional[float] = None  # Robust std-dev of the baseline
+    min_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    runs: int = 1
+    peak_kb: Optional[float] = None
 
     @property
     def regression(self) -> Optional[float]:
@@ -44,13 +68,30 @@ class BenchmarkResult:
             return None
         return ((self.elapsed_ms - self.baseline_ms) / self.baseline_ms) * 100.0
 
+    @property
+    def is_regression(self) -> bool:
+        """Whether the slowdown vs baseline exceeds the statistical threshold.
+
+        With a spread estimate the median must exceed the baseline by
+        ``REGRESSION_SIGMAS`` spreads and ``MIN_REGRESSION_PCT`` percent;
+        without one (fewer than three recorded runs) a flat
+        ``LEGACY_REGRESSION_PCT`` applies.
+        """
+        r = self.regression
+        if r is None:
+            return False
+        if self.baseline_spread_ms is None:
+            return r > LEGACY_REGRESSION_PCT
+        excess = self.elapsed_ms - self.baseline_ms
+        return r > MIN_REGRESSION_PCT and excess > REGRESSION_SIGMAS * self.baseline_spread_ms
+
     @property
     def regression_label(self) -> str:
         """Human-readable regression string, e.g. ``"\u25b2 +35%  \u26a0"`` or ``"—"``."""
         r = self.regression
         if r is None:
             return "\u2014"
-        if r > 20:
+        if self.is_regression:
             return f"\u25b2 +{r:.0f}%  \u26a0"
         if r < -10:
             return f"\u25bc {r:.0f}%"
@@ -77,8 +118,8 @@ class BenchmarkReport:
 
     @property
     def regressions(self) -> list[BenchmarkResult]:
-        """Return all results where timing regressed more than 20% vs baseline."""
-        return [r for r in self.results if r.regression is not None and r.regression > 20]
+        """Return all results flagged by :attr:`BenchmarkResult.is_regression`."""
+        return [r for r in self.results if r.is_regression]
 
     @property
     def fastest(self) -> Optional[BenchmarkResult]:
@@ -115,14 +156,20 @@ class BenchmarkReport:
             lines.append(f"*Recorded: {self.timestamp}*\n")
 
         lines += [
-            "| Module | Time (ms) | vs Baseline | Status |",
-            "|--------|----------:|-------------|--------|",
+            "| Module | Median (ms) | Min (ms) | p95 (ms) | Runs | Peak (KB) | vs Baseline | Status |",
+            "|--------|------------:|---------:|---------:|-----:|----------:|-------------|--------|",
         ]
+
+        def _num(value: Optional[float]) -> str:
+            return "\u2014" if value is None else f"{value:.1f}"
+
         sorted_results = sorted(self.results, key=lambda r: r.elapsed_ms)
         for r in sorted_results:
             status_icon = "✅" if r.status == "ok" else ("❌" if r.status == "error" else "⏭")
+            peak = "\u2014" if r.peak_kb is None else f"{r.peak_kb:,.0f}"
             lines.append(
-                f"| `{r.module}` | {r.elapsed_ms:.1f} | {r.regression_label} | {status_icon} |"
+                f"| `{r.module}` | {r.elapsed_ms:.1f} | {_num(r.min_ms)} | {_num(r.p95_ms)} "
+                f"| {r.runs} | {peak} | {r.regression_label} | {status_icon} |"
             )
 
         lines.append(f"\n**Total wall time:** {self.total_ms:.0f} ms\n")
@@ -145,104 +192,176 @@ class BenchmarkReport:
 # ---------------------------------------------------------------------------
 
 
-def _time_module(name: str, fn) -> BenchmarkResult:
-    """Run *fn* and record its wall-clock time in milliseconds."""
-    start = time.perf_counter()
+def _percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of *samples* (``pct`` in 0–100)."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _peak_kb(fn) -> float:
+    """Run *fn* once under tracemalloc and return peak allocation in KB."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
     try:
         fn()
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        return BenchmarkResult(module=name, elapsed_ms=elapsed_ms, status="ok")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return peak / 1024
+
+
+def _time_module(
+    name: str,
+    fn,
+    warmup: int = 0,
+    repeat: int = 1,
+    memory: bool = False,
+) -> BenchmarkResult:
+    """Run *fn* ``warmup`` times untimed, then ``repeat`` times timed.
+
+    ``elapsed_ms`` is the median of the timed runs.  With *memory*, one
+    further run under tracemalloc records the peak allocation.
+    """
+    samples: list[float] = []
+    try:
+        for _ in range(warmup):
+            fn()
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        peak = _peak_kb(fn) if memory else None
     except Exception as exc:
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_ms = statistics.median(samples) if samples else 0.0
         return BenchmarkResult(
-            module=name, elapsed_ms=elapsed_ms, status="error", error=str(exc)[:120]
+            module=name, elapsed_ms=elapsed_ms, status="error", error=str(exc)[:120],
+            runs=len(samples),
         )
+    return BenchmarkResult(
+        module=name,
+        elapsed_ms=statistics.median(samples),
+        status="ok",
+        min_ms=min(samples),
+        p95_ms=_percentile(samples, 95),
+        runs=len(samples),
+        peak_kb=peak,
+    )
 
 
-def _build_runners(repo_path: Path) -> list[tuple[str, object]]:
-    """Return a list of (module_name, callable) pairs to benchmark."""
-    runners = []
+# ---------------------------------------------------------------------------
+# Runner registry
+# ---------------------------------------------------------------------------
 
-    try:
-        from src.health import analyze_health
-        runners.append(("health", lambda: analyze_health(repo_path / "src")))
-    except ImportError:
-        pass
+#: ``fn(repo_path, session)`` callables, by benchmark name.  See :func:`register_runner`.
+_RUNNERS: dict[str, Callable[[Path, int], object]] = {}
 
-    try:
-        from src.stats import compute_stats
-        log = repo_path / "AWAKE_LOG.md"
-        runners.append(("stats", lambda: compute_stats(repo_path=repo_path, log_path=log)))
-    except ImportError:
-        pass
 
-    try:
-        from src.dep_graph import build_dep_graph
-        runners.append(("dep_graph", lambda: build_dep_graph(repo_path / "src")))
-    except ImportError:
-        pass
+def register_runner(name: str, fn: Callable[[Path, int], object]) -> None:
+    """Register *fn* as benchmark *name*; it is called as ``fn(repo_path, session)``."""
+    _RUNNERS[name] = fn
 
-    try:
-        from src.todo_hunter import hunt_todos
-        runners.append(("todo_hunter", lambda: hunt_todos(repo_path / "src", session=15)))
-    except ImportError:
-        pass
 
-    try:
-        from src.doctor import run_doctor
-        runners.append(("doctor", lambda: run_doctor(repo_path)))
-    except ImportError:
-        pass
+def registered_runners() -> list[str]:
+    """Return the names of all registered runners, in registration order."""
+    return list(_RUNNERS)
 
-    try:
-        from src.dead_code import find_dead_code
-        runners.append(("dead_code", lambda: find_dead_code(repo_path / "src")))
-    except ImportError:
-        pass
 
-    try:
-        from src.security import audit_security
-        runners.append(("security", lambda: audit_security(repo_path / "src")))
-    except ImportError:
-        pass
+def _run_health(repo: Path, session: int):
+    from src.health import generate_health_report
+    return generate_health_report(repo_path=repo)
 
-    try:
-        from src.coverage_map import build_coverage_map
-        runners.append(("coverage_map", lambda: build_coverage_map(repo_path)))
-    except ImportError:
-        pass
 
-    try:
-        from src.blame import analyze_blame
-        runners.append(("blame", lambda: analyze_blame(repo_path)))
-    except ImportError:
-        pass
+def _run_stats(repo: Path, session: int):
+    from src.stats import compute_stats
+    return compute_stats(repo_path=repo, log_path=repo / "AWAKE_LOG.md")
 
-    try:
-        from src.maturity import assess_maturity
-        runners.append(("maturity", lambda: assess_maturity(repo_path=repo_path)))
-    except ImportError:
-        pass
 
-    try:
-        from src.dna import fingerprint_repo
-        runners.append(("dna", lambda: fingerprint_repo(repo_path=repo_path)))
-    except ImportError:
-        pass
+def _run_dep_graph(repo: Path, session: int):
+    from src.dep_graph import build_dep_graph
+    return build_dep_graph(repo / "src")
 
-    try:
-        from src.coupling import analyze_coupling
-        runners.append(("coupling", lambda: analyze_coupling(repo_path / "src")))
-    except ImportError:
-        pass
 
-    try:
-        from src.complexity import analyze_complexity
-        runners.append(("complexity", lambda: analyze_complexity(repo_path / "src", session=15)))
-    except ImportError:
-        pass
+def _run_todo_hunter(repo: Path, session: int):
+    from src.todo_hunter import hunt
+    return hunt(repo / "src", current_session=session)
 
-    return runners
+
+def _run_doctor(repo: Path, session: int):
+    from src.doctor import diagnose
+    return diagnose(repo)
+
+
+def _run_dead_code(repo: Path, session: int):
+    from src.dead_code import find_dead_code
+    return find_dead_code(repo_path=repo)
+
+
+def _run_security(repo: Path, session: int):
+    from src.security import audit_security
+    return audit_security(repo_path=repo)
+
+
+def _run_coverage_map(repo: Path, session: int):
+    from src.coverage_map import build_coverage_map
+    return build_coverage_map(repo_path=repo)
+
+
+def _run_blame(repo: Path, session: int):
+    from src.blame import analyze_blame
+    return analyze_blame(repo_path=repo)
+
+
+def _run_maturity(repo: Path, session: int):
+    from src.maturity import assess_maturity
+    return assess_maturity(repo)
+
+
+def _run_dna(repo: Path, session: int):
+    from src.dna import fingerprint_repo
+    return fingerprint_repo(repo)
+
+
+def _run_coupling(repo: Path, session: int):
+    from src.coupling import analyze_coupling
+    return analyze_coupling(repo_path=repo)
+
+
+def _run_complexity(repo: Path, session: int):
+    from src.complexity import analyze_complexity
+    return analyze_complexity(repo_path=repo)
+
+
+register_runner("health", _run_health)
+register_runner("stats", _run_stats)
+register_runner("dep_graph", _run_dep_graph)
+register_runner("todo_hunter", _run_todo_hunter)
+register_runner("doctor", _run_doctor)
+register_runner("dead_code", _run_dead_code)
+register_runner("security", _run_security)
+register_runner("coverage_map", _run_coverage_map)
+register_runner("blame", _run_blame)
+register_runner("maturity", _run_maturity)
+register_runner("dna", _run_dna)
+register_runner("coupling", _run_coupling)
+register_runner("complexity", _run_complexity)
+
+
+def _build_runners(
+    repo_path: Path,
+    session: int = 15,
+    only: Optional[list[str]] = None,
+) -> list[tuple[str, object]]:
+    """Return ``(name, zero-arg callable)`` pairs for the selected runners."""
+    repo_path = Path(repo_path).resolve()
+    names = registered_runners() if not only else only
+    unknown = [n for n in names if n not in _RUNNERS]
+    if unknown:
+        raise ValueError(f"unknown benchmark runner(s): {', '.join(unknown)}")
+    return [(n, functools.partial(_RUNNERS[n], repo_path, session)) for n in names]
 
 
 # ---------------------------------------------------------------------------
@@ -250,34 +369,46 @@ def _build_runners(repo_path: Path) -> list[tuple[str, object]]:
 # ---------------------------------------------------------------------------
 
 
-def _load_baseline(history_path: Path) -> dict[str, float]:
-    """Load the most recent baseline from benchmark_history.json."""
+def _load_baseline_window(history_path: Path, window: int = BASELINE_WINDOW) -> dict[str, list[float]]:
+    """Return each module's ``elapsed_ms`` from its last *window* successful runs."""
     if not history_path.exists():
         return {}
     try:
         data = json.loads(history_path.read_text())
-        if isinstance(data, list) and data:
-            last = data[-1]
-            return {r["module"]: r["elapsed_ms"] for r in last.get("results", [])}
-        return {}
     except Exception:
         return {}
-
-
-def _save_history(report: BenchmarkReport, history_path: Path) -> None:
-    """Append the current report to the rolling history file."""
-    history_path.parent.mkdir(parents=True, exist_ok=True)
-    existing: list = []
-    if history_path.exists():
-        try:
-            existing = json.loads(history_path.read_text())
-            if not isinstance(existing, list):
-                existing = []
-        except Exception:
-            existing = []
-    existing.append(report.to_dict())
-    existing = existing[-20:]
-    history_path.write_text(json.dumps(existing, indent=2))
+    if not isinstance(data, list):
+        return {}
+    samples: dict[str, list[float]] = {}
+    for entry in reversed(data):
+        for r in entry.get("results", []) if isinstance(entry, dict) else []:
+            if r.get("status", "ok") != "ok" or r.get("elapsed_ms") is None:
+                continue
+            values = samples.setdefault(r["module"], [])
+            if len(values) < window:
+                values.append(float(r["elapsed_ms"]))
+    return samples
+
+
+def _store_baseline_window(store, names: list[str], window: int = BASELINE_WINDOW) -> dict[str, list[float]]:
+    """Like :func:`_load_baseline_window`, read from a :class:`src.metrics_store.MetricsStore`."""
+    samples = {name: store.module_samples(name, window) for name in names}
+    return {name: values for name, values in samples.items() if values}
+
+
+def _baseline_stats(samples: list[float]) -> tuple[Optional[float], Optional[float]]:
+    """Return ``(median, robust spread)`` of *samples*.
+
+    The spread is the median absolute deviation scaled to a normal standard
+    deviation (×1.4826); it is ``None`` with fewer than three samples.
+    """
+    if not samples:
+        return None, None
+    centre = statistics.median(samples)
+    if len(samples) < 3:
+        return centre, None
+    mad = statistics.median(abs(s - centre) for s in samples)
+    return centre, 1.4826 * mad
 
 
 # ---------------------------------------------------------------------------
@@ -289,21 +420,45 @@ def run_benchmarks(
     repo_path: Optional[Path] = None,
     session: int = 15,
     persist: bool = True,
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    memory: bool = True,
+    only: Optional[list[str]] = None,
+    baseline_window: int = BASELINE_WINDOW,
 ) -> BenchmarkReport:
-    """Run all module benchmarks and return a BenchmarkReport."""
+    """Run the registered benchmarks and return a BenchmarkReport.
+
+    Args:
+        repo_path: Repository to analyse.  Defaults to this checkout.
+        session: Session number recorded with the report.
+        persist: Record the report in ``docs/metrics.db``.
+        warmup: Untimed runs per runner before timing starts.
+        repeat: Timed runs per runner.
+        memory: Record peak allocation from one extra tracemalloc run.
+        only: Runner names to execute (default: all registered runners).
+        baseline_window: Recorded runs that form the rolling baseline.
+    """
     import datetime
 
+    from src.metrics_store import METRICS_DB, open_metrics_store
+
     repo = repo_path or Path(__file__).resolve().parent.parent
-    history_path = repo / "docs" / "benchmark_history.json"
-    baseline = _load_baseline(history_path)
+    runners = _build_runners(repo, session, only)
+    names = [name for name, _ in runners]
+    if persist or (repo / METRICS_DB).exists():
+        with open_metrics_store(repo) as store:
+            baseline = _store_baseline_window(store, names, window=baseline_window)
+    else:
+        history_path = repo / "docs" / "benchmark_history.json"
+        baseline = _load_baseline_window(history_path, window=baseline_window)
 
-    runners = _build_runners(repo)
     results: list[BenchmarkResult] = []
     wall_start = time.perf_counter()
 
     for name, fn in runners:
-        result = _time_module(name, fn)
-        result.baseline_ms = baseline.get(name)
+        result = _time_module(name, fn, warmup=warmup, repeat=repeat, memory=memory)
+        result.baseline_ms, result.baseline_spread_ms = _baseline_stats(baseline.get(name, []))
         results.append(result)
 
     total_ms = (time.perf_counter() - wall_start) * 1000
@@ -316,7 +471,8 @@ def run_benchmarks(
     )
 
     if persist:
-        _save_history(report, history_path)
+        with open_metrics_store(repo) as store:
+            store.add_benchmark_run(report.to_dict())
 
     return report
 
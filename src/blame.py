@@ -9,19 +9,32 @@ Public API
 - ``BlameEntry`` — per-line blame record (author, commit, line)
 - ``FileBlame``  — aggregated human/AI stats for one file
 - ``BlameReport`` — repo-wide attribution report
-- ``analyze_blame(repo_path)`` → ``BlameReport``
+- ``analyze_blame(repo_path, *, cache, jobs)`` → ``BlameReport``
 - ``save_blame_report(report, out)``
 
+Every ``.py`` file under ``src/`` (nested packages included, private
+``_``-prefixed modules excluded) is blamed in a bounded pool of concurrent
+``git blame`` subprocesses.  With ``cache=True`` each file's result is stored
+in the analysis cache under ``(path, last commit touching it, blob sha)``, so
+a re-run only blames files that changed since the previous one.  Files with
+uncommitted changes are always re-blamed.  The last-commit map behind those
+keys is itself recorded against ``HEAD`` in ``.awake/incremental``, so a
+re-run walks only the commits made since, not the history of every file.
+
 CLI
 ---
-    awake blame [--write] [--json]
+    awake blame [--write] [--json] [--jobs N] [--no-cache]
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -39,6 +52,13 @@ _AI_AUTHOR_PATTERNS = [
 ]
 
 
+#: Upper bound on concurrent ``git blame`` subprocesses when *jobs* is unset.
+DEFAULT_BLAME_JOBS = 8
+
+#: Bump whenever the cached FileBlame payload changes shape.
+_CACHE_VERSION = "1"
+
+
 def _is_ai_author(author: str) -> bool:
     """Return True if the author name/email looks like the AI operator."""
     return any(pat.search(author) for pat in _AI_AUTHOR_PATTERNS)
@@ -257,8 +277,174 @@ def _blame_file(py_file: Path, repo_root: Path) -> FileBlame:
     return fb
 
 
-def analyze_blame(repo_path: Optional[Path] = None) -> BlameReport:
-    """Analyze git blame across all Python files in *repo_path*/src/."""
+def _git_lines(args: list[str], repo_root: Path) -> Optional[list[str]]:
+    """Run git in *repo_root* and return its stdout lines, or ``None`` on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=str(repo_root),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.splitlines()
+
+
+def _last_commits_path(repo_root: Path) -> Path:
+    from src.incremental import STATE_DIR
+    return repo_root / STATE_DIR / f"blame-commits-v{_CACHE_VERSION}.json"
+
+
+def _load_last_commits(repo_root: Path, head: str) -> tuple[Optional[str], dict[str, str]]:
+    """Return the recorded ``(HEAD, {path: last commit})``, if *head* descends from it."""
+    try:
+        state = json.loads(_last_commits_path(repo_root).read_text(encoding="utf-8"))
+        recorded, files = state["head"], dict(state["files"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, {}
+    if recorded != head and _git_lines(
+        ["merge-base", "--is-ancestor", recorded, head], repo_root
+    ) is None:
+        return None, {}
+    return recorded, files
+
+
+def _save_last_commits(repo_root: Path, head: str, files: dict[str, str]) -> None:
+    """Persist *files* against *head*; failures just mean a longer walk next time."""
+    path = _last_commits_path(repo_root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"head": head, "files": files}, fh, sort_keys=True)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
+
+
+def _walk_last_commits(
+    repo_root: Path, rev_range: Optional[str], wanted: set[str], last: dict[str, str],
+) -> None:
+    """Fill *last* from a newest-first walk, stopping once every *wanted* path is seen."""
+    from src.git_log import iter_commits
+
+    if wanted <= last.keys():
+        return
+    commits = iter_commits(repo_root, rev_range, numstat=True, paths=["src"])
+    try:
+        for commit in commits:
+            for entry in commit.numstat:
+                if entry.path not in last:
+                    last[entry.path] = commit.sha
+            if wanted <= last.keys():
+                break
+    finally:
+        commits.close()
+
+
+def _last_commits(wanted: set[str], tracked: set[str], repo_root: Path) -> dict[str, str]:
+    """Return the sha of the last commit touching each path in *wanted*.
+
+    The map is persisted against ``HEAD`` under the incremental state
+    directory.  When the recorded ``HEAD`` is an ancestor of the current one,
+    only ``recorded..HEAD`` is walked to update it; a full history walk from
+    ``HEAD`` is needed only for paths the record does not cover.
+    """
+    head_lines = _git_lines(["rev-parse", "--verify", "HEAD"], repo_root)
+    if not head_lines:
+        return {}
+    head = head_lines[0]
+    recorded, previous = _load_last_commits(repo_root, head)
+
+    last: dict[str, str] = {}
+    if recorded is not None and recorded != head:
+        # Everything touched since the recorded HEAD, newest first
+        _walk_last_commits(repo_root, f"{recorded}..{head}", set(tracked), last)
+    for rel, sha in previous.items():
+        last.setdefault(rel, sha)
+    _walk_last_commits(repo_root, head, wanted, last)
+
+    last = {rel: sha for rel, sha in last.items() if rel in tracked}
+    if recorded != head or last != previous:
+        _save_last_commits(repo_root, head, last)
+    return last
+
+
+def _blame_keys(rels: list[str], repo_root: Path) -> dict[str, str]:
+    """Return a cache key for every clean, committed file in *rels*.
+
+    The key hashes the path, the sha of the last commit touching it and its
+    blob sha at ``HEAD``; together they pin down what ``git blame`` reports.
+    Files that are untracked or modified in the working tree get no key, and
+    nothing is keyed unless *repo_root* is the top of its git checkout.
+    """
+    prefix = _git_lines(["rev-parse", "--show-prefix"], repo_root)
+    if prefix is None or any(prefix):
+        return {}
+    tree = _git_lines(["ls-tree", "-r", "HEAD", "--", "src"], repo_root)
+    dirty = _git_lines(["diff", "--name-only", "--no-renames", "HEAD", "--", "src"], repo_root)
+    if tree is None or dirty is None:
+        return {}
+    blobs: dict[str, str] = {}
+    for line in tree:
+        meta, _, path = line.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3 and parts[1] == "blob":
+            blobs[path] = parts[2]
+    modified = set(dirty)
+    wanted = {rel for rel in rels if rel in blobs and rel not in modified}
+    last = _last_commits(wanted, set(blobs), repo_root)
+    return {
+        rel: hashlib.sha256(f"{rel}\0{last[rel]}\0{blobs[rel]}".encode()).hexdigest()
+        for rel in wanted if rel in last
+    }
+
+
+def _payload(fb: FileBlame) -> dict:
+    return {
+        "total_lines": fb.total_lines,
+        "ai_lines": fb.ai_lines,
+        "human_lines": fb.human_lines,
+        "ai_authors": sorted(set(fb.ai_authors)),
+        "human_authors": sorted(set(fb.human_authors)),
+    }
+
+
+def _blame_py_files(src_dir: Path) -> list[Path]:
+    """Return the public ``.py`` files under *src_dir*, nested packages included."""
+    return sorted(
+        f for f in src_dir.rglob("*.py")
+        if not f.name.startswith("_") and "__pycache__" not in f.parts
+    )
+
+
+def analyze_blame(
+    repo_path: Optional[Path] = None,
+    *,
+    cache: bool = False,
+    jobs: Optional[int] = None,
+) -> BlameReport:
+    """Analyze git blame across all Python files under *repo_path*/src/.
+
+    Parameters
+    ----------
+    repo_path:
+        Repository root.  Defaults to the Awake checkout itself.
+    cache:
+        Reuse per-file results from ``<repo_path>/.awake/cache`` for files
+        whose last commit and blob are unchanged since they were blamed.
+    jobs:
+        Maximum concurrent ``git blame`` subprocesses (``0`` = one per CPU).
+        Defaults to ``min(DEFAULT_BLAME_JOBS, cpu_count)``.
+    """
     if repo_path is None:
         repo_path = Path(__file__).resolve().parent.parent
     repo_path = Path(repo_path)
@@ -266,11 +452,44 @@ def analyze_blame(repo_path: Optional[Path] = None) -> BlameReport:
     report = BlameReport(repo_path=str(repo_path))
     if not src_dir.exists():
         return report
-    for py_file in sorted(src_dir.glob("*.py")):
-        if py_file.name.startswith("_"):
-            continue
-        fb = _blame_file(py_file, repo_path)
-        report.files.append(fb)
+    py_files = _blame_py_files(src_dir)
+
+    store = None
+    keys: dict[str, str] = {}
+    if cache:
+        from src.analysis_cache import open_cache
+        store = open_cache(repo_path, "blame", _CACHE_VERSION)
+        keys = _blame_keys([f.relative_to(repo_path).as_posix() for f in py_files], repo_path)
+
+    results: dict[Path, FileBlame] = {}
+    todo: list[Path] = []
+    for py_file in py_files:
+        key = keys.get(py_file.relative_to(repo_path).as_posix())
+        payload = store.get(key) if store is not None and key else None
+        if payload is not None:
+            results[py_file] = FileBlame(path=str(py_file.relative_to(repo_path)), **payload)
+        else:
+            todo.append(py_file)
+
+    if jobs is None:
+        workers = min(DEFAULT_BLAME_JOBS, os.cpu_count() or 1)
+    else:
+        workers = jobs if jobs > 0 else os.cpu_count() or 1
+    workers = max(1, min(workers, len(todo)))
+    if workers == 1:
+        fresh = [_blame_file(f, repo_path) for f in todo]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blame") as pool:
+            fresh = list(pool.map(lambda f: _blame_file(f, repo_path), todo))
+
+    for py_file, fb in zip(todo, fresh):
+        results[py_file] = fb
+        key = keys.get(py_file.relative_to(repo_path).as_posix())
+        # Only cache real blame output, not the line-count fallback.
+        if store is not None and key and fb.ai_lines + fb.human_lines == fb.total_lines:
+            store.put(key, _payload(fb))
+
+    report.files = [results[f] for f in py_files]
     return report
 
 
@@ -28,6 +28,7 @@ from __future__ import annotations
 
 import json
 import re
+import sqlite3
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -292,23 +293,25 @@ class Brain:
         return p.read_text(encoding="utf-8") if p.exists() else ""
 
     def _load_health_history(self) -> dict:
-        """Load health scores from docs/health_history.json."""
-        p = self.repo_path / "docs" / "health_history.json"
-        if not p.exists():
+        """Load the latest per-file health scores from docs/metrics.db."""
+        from src.metrics_store import has_metrics, open_metrics_store
+
+        if not has_metrics(self.repo_path):
             return {}
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-            snapshots = data.get("snapshots", [])
-            if not snapshots:
-                return {}
-            latest = snapshots[-1]
-            return {
-                entry["file"]: entry["score"]
-                for entry in latest.get("files", [])
-                if "file" in entry and "score" in entry
-            }
-        except (json.JSONDecodeError, KeyError):
+            with open_metrics_store(self.repo_path) as store:
+                snapshots = store.health_snapshots()
+        except sqlite3.Error:
+            return {}
+        if not snapshots:
             return {}
+        latest = snapshots[-1]
+        scores = {}
+        for entry in latest.get("files", []):
+            name = entry.get("path", entry.get("file"))
+            if name is not None and "score" in entry:
+                scores[name] = entry["score"]
+        return scores
 
     def _load_triage_data(self) -> list[dict]:
         """Load triage JSON from docs/triage.json if available."""
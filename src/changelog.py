@@ -19,10 +19,11 @@ sessions at the top.
 from __future__ import annotations
 
 import re
-import subprocess
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from src.git_log import iter_commits
 
 
 # ---------------------------------------------------------------------------
@@ -140,23 +141,41 @@ SUBJECT_PATTERN = re.compile(
     re.IGNORECASE,
 )
 SESSION_PATTERN = re.compile(r"Session:\s*(\d+)")
-
-
-def _run_git(args: list[str], cwd: Optional[Path] = None) -> str:
-    """Run a git command and return stdout. Returns empty string on failure."""
-    try:
-        result = subprocess.run(
-            ["git"] + args,
-            capture_output=True,
-            text=True,
-            cwd=cwd or Path.cwd(),
-            timeout=30,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return ""
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return ""
+# ``git log --grep`` pre-filter for the subject lines above
+_AWAKE_GREP = r"^\[awake\]"
+
+
+def _commit_record(sha: str, subject: str, body: str) -> Optional[CommitRecord]:
+    """Build a CommitRecord from one commit, or ``None`` if it is not an Awake commit."""
+    subject = subject.strip()
+    body = body.strip()
+    subject_match = SUBJECT_PATTERN.match(subject)
+    if not subject_match:
+        return None
+
+    # Extract session number from body
+    session_match = SESSION_PATTERN.search(body)
+    return CommitRecord(
+        sha=sha.strip(),
+        subject=subject,
+        commit_type=subject_match.group(1).lower(),
+        description=subject_match.group(2).strip(),
+        session=int(session_match.group(1)) if session_match else 0,
+        body=body,
+    )
+
+
+def iter_commit_records(repo_path: Optional[Path] = None) -> Iterator[CommitRecord]:
+    """Yield a CommitRecord for each Awake commit, newest first.
+
+    History is streamed through :func:`src.git_log.iter_commits` and
+    pre-filtered by git to messages containing an ``[awake]`` line, so only
+    relevant commits are held, one at a time.
+    """
+    for c in iter_commits(repo_path, grep=_AWAKE_GREP, ignore_case=True):
+        record = _commit_record(c.sha, c.subject, c.body)
+        if record is not None:
+            yield record
 
 
 def parse_commit_log(raw_log: str) -> list[CommitRecord]:
@@ -167,53 +186,27 @@ def parse_commit_log(raw_log: str) -> list[CommitRecord]:
     commit entry, and commits are delimited by `\x1e` (record separator).
     """
     records = []
-    # Split on the record separator we inject in get_git_log
-    entries = raw_log.split("\x1e")
-
-    for entry in entries:
-        entry = entry.strip()
-        if not entry:
-            continue
-
-        parts = entry.split("\x00", maxsplit=2)
+    for entry in raw_log.split("\x1e"):
+        parts = entry.strip().split("\x00", maxsplit=2)
         if len(parts) < 2:
             continue
-
-        sha = parts[0].strip()
-        subject = parts[1].strip()
-        body = parts[2].strip() if len(parts) > 2 else ""
-
-        # Only process Awake commits
-        subject_match = SUBJECT_PATTERN.match(subject)
-        if not subject_match:
-            continue
-
-        commit_type = subject_match.group(1).lower()
-        description = subject_match.group(2).strip()
-
-        # Extract session number from body
-        session_match = SESSION_PATTERN.search(body)
-        session_num = int(session_match.group(1)) if session_match else 0
-
-        records.append(
-            CommitRecord(
-                sha=sha,
-                subject=subject,
-                commit_type=commit_type,
-                description=description,
-                session=session_num,
-                body=body,
-            )
-        )
-
+        record = _commit_record(parts[0], parts[1], parts[2] if len(parts) > 2 else "")
+        if record is not None:
+            records.append(record)
     return records
 
 
 def get_git_log(repo_path: Optional[Path] = None) -> str:
-    """Fetch the full git log in a parseable format."""
-    # %H = full SHA, %s = subject, %b = body, %x00 = null separator, %x1e = record sep
-    fmt = "%H%x00%s%x00%b%x1e"
-    return _run_git(["log", f"--pretty=format:{fmt}"], cwd=repo_path)
+    """Fetch the Awake commits of the git log in a parseable format.
+
+    Entries are ``sha\\x00subject\\x00body`` terminated by ``\\x1e`` (see
+    :func:`parse_commit_log`).  Kept for callers that want the raw text;
+    :func:`generate_changelog` reads :func:`iter_commit_records` instead.
+    """
+    return "".join(
+        f"{c.sha}\x00{c.subject}\x00{c.body}\x1e"
+        for c in iter_commits(repo_path, grep=_AWAKE_GREP, ignore_case=True)
+    )
 
 
 def group_by_session(commits: list[CommitRecord]) -> list[ChangelogSection]:
@@ -250,9 +243,7 @@ def generate_changelog(
     """
     from datetime import datetime, timezone
 
-    raw_log = get_git_log(repo_path)
-    commits = parse_commit_log(raw_log)
-    sections = group_by_session(commits)
+    sections = group_by_session(list(iter_commit_records(repo_path)))
     ts = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
     return Changelog(sections=sections, repo_name=repo_name, generated_at=ts)
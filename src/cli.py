@@ -7,8 +7,8 @@ to one (or more) modules in ``src/``.
 This file is a thin dispatcher -- all command implementations live in
 ``src/commands/``:
 
-  src/commands/analysis.py  -- health, complexity, coupling, deadcode, security,
-                               coveragemap, blame, maturity
+  src/commands/analysis.py  -- health, complexity, coupling, deadcode, refs,
+                               security, coveragemap, blame, maturity
   src/commands/meta.py      -- stats, changelog, story, reflect, evolve, status,
                                session_score, timeline, replay, compare, diff,
                                diff_sessions, insights
@@ -16,7 +16,7 @@ This file is a thin dispatcher -- all command implementations live in
                                predict, teach, dna, report, export, coverage,
                                score, test_quality, refactor, commits, semver,
                                modules, trends, plan (brain), triage, depgraph, arch
-  src/commands/infra.py     -- dashboard, init, deps, config, plugins, openapi, run
+  src/commands/infra.py     -- dashboard, init, deps, config, plugins, openapi, metrics, run
   src/commands/tools_docstrings.py -- docstrings
 
 Subcommands
@@ -48,10 +48,12 @@ awake diff-sessions -- Compare any two sessions with rich delta analysis
 awake test-quality -- Grade tests by assertion density and edge coverage
 awake report      -- Generate executive HTML report combining all analyses
 awake openapi     -- Generate OpenAPI 3.1 spec from all API endpoints
+awake metrics     -- Metric history database summary and JSON import
 awake plugins     -- Manage plugin/hook registry from awake.toml
 awake changelog --release -- Generate polished GitHub Releases notes
 awake blame       -- Human vs AI contribution attribution (git blame)
 awake deadcode    -- Dead code detector: unused functions/imports
+awake refs        -- Who references a function, class or method
 awake security    -- Security audit: common Python anti-patterns
 awake coveragemap -- Test coverage heat map ranked by weakness
 awake docstrings  -- Auto-generate missing docstrings for undocumented functions
@@ -61,15 +63,17 @@ Usage
     python -m awake.cli <command> [options]
     # or after ``pip install -e .``
     awake <command> [options]
+    awake --profile-import <command>   # per-module import cost of a command
 """
 
 from __future__ import annotations
 
 import argparse
+import importlib
 import sys
 
 # ---------------------------------------------------------------------------
-# Command imports -- pulled from domain-specific submodules
+# Command registry -- implementations are imported on first use
 # ---------------------------------------------------------------------------
 
 from src.commands import (
@@ -79,79 +83,71 @@ from src.commands import (
     _print_warn,
     _print_info,
     REPO_ROOT,
-    cmd_automerge,
 )
 
-from src.commands.tools_docstrings import cmd_docstrings
-
-from src.commands.analysis import (
-    cmd_health,
-    cmd_complexity,
-    cmd_coupling,
-    cmd_deadcode,
-    cmd_security,
-    cmd_coveragemap,
-    cmd_blame,
-    cmd_maturity,
-)
-
-from src.commands.meta import (
-    cmd_stats,
-    cmd_changelog,
-    cmd_story,
-    cmd_reflect,
-    cmd_evolve,
-    cmd_status,
-    cmd_session_score,
-    cmd_timeline,
-    cmd_replay,
-    cmd_compare,
-    cmd_diff,
-    cmd_diff_sessions,
-    cmd_insights,
-)
+# Module implementing each cmd_* function.  Nothing here is imported until a
+# command runs (or someone reads ``src.cli.cmd_<name>``), so startup only pays
+# for argparse and the command that was actually invoked.
+_COMMAND_MODULES: dict[str, tuple[str, ...]] = {
+    "src.commands.analysis": (
+        "cmd_health", "cmd_complexity", "cmd_coupling", "cmd_deadcode",
+        "cmd_refs", "cmd_security", "cmd_coveragemap", "cmd_blame", "cmd_maturity",
+    ),
+    "src.commands.meta": (
+        "cmd_stats", "cmd_changelog", "cmd_story", "cmd_reflect", "cmd_evolve",
+        "cmd_status", "cmd_session_score", "cmd_timeline", "cmd_replay",
+        "cmd_compare", "cmd_diff", "cmd_diff_sessions", "cmd_insights",
+    ),
+    "src.commands.tools": (
+        "cmd_doctor", "cmd_todos", "cmd_benchmark", "cmd_gitstats", "cmd_badges",
+        "cmd_audit", "cmd_predict", "cmd_teach", "cmd_dna", "cmd_report",
+        "cmd_export", "cmd_coverage", "cmd_score", "cmd_test_quality",
+        "cmd_refactor", "cmd_commits", "cmd_semver", "cmd_modules", "cmd_trends",
+        "cmd_plan", "cmd_triage", "cmd_depgraph", "cmd_arch",
+    ),
+    "src.commands.infra": (
+        "cmd_dashboard", "cmd_init", "cmd_deps", "cmd_config", "cmd_plugins",
+        "cmd_openapi", "cmd_metrics", "cmd_run",
+    ),
+    "src.commands.infra_automerge": ("cmd_automerge",),
+    "src.commands.tools_docstrings": ("cmd_docstrings",),
+}
+
+_COMMAND_SOURCES: dict[str, str] = {
+    name: module for module, names in _COMMAND_MODULES.items() for name in names
+}
+
+# Subcommands whose name does not map onto ``cmd_<name>``.
+_COMMAND_ALIASES = frozenset({"pr-score", "brain"})
+
+
+def __getattr__(name: str):
+    """Resolve ``cmd_*`` attributes by importing their module on first access."""
+    module = _COMMAND_SOURCES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    func = getattr(importlib.import_module(module), name)
+    globals()[name] = func
+    return func
+
+
+def _lazy(name: str):
+    """Parser ``func`` default that looks up *name* on this module when invoked.
+
+    Looking the command up at call time (rather than binding the function)
+    keeps ``patch("src.cli.cmd_<name>")`` effective for already-built parsers.
+    """
+    def run(args) -> int:
+        return getattr(sys.modules[__name__], name)(args)
+    run.__name__ = run.__qualname__ = name
+    return run
 
-from src.commands.tools import (
-    cmd_doctor,
-    cmd_todos,
-    cmd_benchmark,
-    cmd_gitstats,
-    cmd_badges,
-    cmd_audit,
-    cmd_predict,
-    cmd_teach,
-    cmd_dna,
-    cmd_report,
-    cmd_export,
-    cmd_coverage,
-    cmd_score,
-    cmd_test_quality,
-    cmd_refactor,
-    cmd_commits,
-    cmd_semver,
-    cmd_modules,
-    cmd_trends,
-    cmd_plan,
-    cmd_triage,
-    cmd_depgraph,
-    cmd_arch,
-)
-
-from src.commands.infra import (
-    cmd_dashboard,
-    cmd_init,
-    cmd_deps,
-    cmd_config,
-    cmd_plugins,
-    cmd_openapi,
-    cmd_run,
-)
 
 # Keep backwards-compatible re-exports so any code that imported these
 # symbols from src.cli continues to work.
 __all__ = [
     "cmd_health", "cmd_complexity", "cmd_coupling", "cmd_deadcode",
-    "cmd_security", "cmd_coveragemap", "cmd_blame", "cmd_maturity",
+    "cmd_refs", "cmd_security", "cmd_coveragemap", "cmd_blame", "cmd_maturity",
     "cmd_stats", "cmd_changelog", "cmd_story", "cmd_reflect", "cmd_evolve",
     "cmd_status", "cmd_session_score", "cmd_timeline", "cmd_replay",
     "cmd_compare", "cmd_diff", "cmd_diff_sessions", "cmd_insights",
@@ -161,7 +157,7 @@ __all__ = [
     "cmd_refactor", "cmd_commits", "cmd_semver", "cmd_modules", "cmd_trends",
     "cmd_plan", "cmd_triage", "cmd_depgraph", "cmd_arch",
     "cmd_dashboard", "cmd_init", "cmd_deps", "cmd_config", "cmd_plugins",
-    "cmd_openapi", "cmd_automerge", "cmd_docstrings", "cmd_run",
+    "cmd_openapi", "cmd_metrics", "cmd_automerge", "cmd_docstrings", "cmd_run",
     "build_parser", "main",
 ]
 
@@ -171,13 +167,46 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build and return the top-level argument parser."""
+class _SkippedParser:
+    """Stand-in for a subcommand left out of a single-command parser."""
+
+    def add_argument(self, *args, **kwargs) -> None:
+        return None
+
+    def set_defaults(self, **kwargs) -> None:
+        return None
+
+
+class _OnlySubparsers:
+    """Subparser action wrapper that only builds the *only* subcommand."""
+
+    def __init__(self, action, only: str) -> None:
+        self._action = action
+        self._only = only
+
+    def add_parser(self, name: str, **kwargs):
+        if name != self._only:
+            return _SkippedParser()
+        return self._action.add_parser(name, **kwargs)
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build and return the top-level argument parser.
+
+    With *only*, just that subcommand is registered; :func:`main` uses this
+    to skip building ~55 subparsers when the command is already known.
+    """
     parser = argparse.ArgumentParser(
         prog="awake",
         description="Awake -- autonomous repo intelligence",
     )
+    parser.add_argument(
+        "--profile-import", action="store_true",
+        help="Run COMMAND in a fresh interpreter and report per-module import time",
+    )
     sub = parser.add_subparsers(dest="command", required=True)
+    if only is not None:
+        sub = _OnlySubparsers(sub, only)
 
     # Common flag helpers
     def _add_json(p: argparse.ArgumentParser) -> None:
@@ -189,6 +218,26 @@ def build_parser() -> argparse.ArgumentParser:
     def _add_write(p: argparse.ArgumentParser) -> None:
         p.add_argument("--write", action="store_true", help="Write output to file")
 
+    def _add_no_cache(p: argparse.ArgumentParser) -> None:
+        p.add_argument(
+            "--no-cache", action="store_true",
+            help="Ignore the on-disk analysis cache in .awake/cache",
+        )
+
+    def _add_incremental(p: argparse.ArgumentParser) -> None:
+        p.add_argument(
+            "--incremental", action="store_true",
+            help="Re-analyze only files changed (per git) since the last "
+                 "--incremental run",
+        )
+
+    def _add_jobs(p: argparse.ArgumentParser) -> None:
+        p.add_argument(
+            "--jobs", "-j", type=int, default=None, metavar="N",
+            help="Analyse files in N worker processes (0 = all CPUs; "
+                 "default: [performance] jobs in awake.toml)",
+        )
+
     # ------------------------------------------------------------------
     # Analysis commands
     # ------------------------------------------------------------------
@@ -197,52 +246,83 @@ def build_parser() -> argparse.ArgumentParser:
     p_health = sub.add_parser("health", help="Code health analysis")
     _add_json(p_health)
     _add_repo(p_health)
-    p_health.set_defaults(func=cmd_health)
+    _add_no_cache(p_health)
+    _add_incremental(p_health)
+    _add_jobs(p_health)
+    p_health.set_defaults(func=_lazy("cmd_health"))
 
     # complexity
     p_complexity = sub.add_parser("complexity", help="Cyclomatic complexity")
     _add_write(p_complexity)
     _add_json(p_complexity)
     _add_repo(p_complexity)
-    p_complexity.set_defaults(func=cmd_complexity)
+    _add_no_cache(p_complexity)
+    _add_incremental(p_complexity)
+    _add_jobs(p_complexity)
+    p_complexity.set_defaults(func=_lazy("cmd_complexity"))
 
     # coupling
     p_coupling = sub.add_parser("coupling", help="Module coupling analysis")
     _add_write(p_coupling)
     _add_json(p_coupling)
     _add_repo(p_coupling)
-    p_coupling.set_defaults(func=cmd_coupling)
+    _add_no_cache(p_coupling)
+    _add_incremental(p_coupling)
+    p_coupling.set_defaults(func=_lazy("cmd_coupling"))
 
     # deadcode
     p_dc = sub.add_parser("deadcode", help="Dead code detector")
     _add_json(p_dc)
     _add_repo(p_dc)
-    p_dc.set_defaults(func=cmd_deadcode)
+    _add_no_cache(p_dc)
+    _add_incremental(p_dc)
+    _add_jobs(p_dc)
+    p_dc.set_defaults(func=_lazy("cmd_deadcode"))
+
+    # refs
+    p_refs = sub.add_parser("refs", help="Who references a symbol (symbol index)")
+    p_refs.add_argument("symbol", help="Qualified or bare name, e.g. src.health.analyze_file")
+    _add_json(p_refs)
+    _add_repo(p_refs)
+    _add_no_cache(p_refs)
+    _add_jobs(p_refs)
+    p_refs.set_defaults(func=_lazy("cmd_refs"))
 
     # security
     p_sec = sub.add_parser("security", help="Security audit")
+    p_sec.add_argument("--whole-repo", action="store_true",
+                       help="Also scan tests, configs and other text files for hardcoded secrets")
     _add_json(p_sec)
     _add_repo(p_sec)
-    p_sec.set_defaults(func=cmd_security)
+    _add_no_cache(p_sec)
+    _add_incremental(p_sec)
+    _add_jobs(p_sec)
+    p_sec.set_defaults(func=_lazy("cmd_security"))
 
     # coveragemap
     p_cmap = sub.add_parser("coveragemap", help="Coverage heat map")
     _add_json(p_cmap)
     _add_repo(p_cmap)
-    p_cmap.set_defaults(func=cmd_coveragemap)
+    p_cmap.set_defaults(func=_lazy("cmd_coveragemap"))
 
     # blame
     p_blame = sub.add_parser("blame", help="Human vs AI attribution")
     _add_json(p_blame)
     _add_repo(p_blame)
-    p_blame.set_defaults(func=cmd_blame)
+    _add_no_cache(p_blame)
+    p_blame.add_argument(
+        "--jobs", "-j", type=int, default=None, metavar="N",
+        help="Run up to N git blame processes at once (0 = all CPUs; "
+             "default: [performance] jobs in awake.toml)",
+    )
+    p_blame.set_defaults(func=_lazy("cmd_blame"))
 
     # maturity
     p_mat = sub.add_parser("maturity", help="Module maturity scores")
     _add_write(p_mat)
     _add_json(p_mat)
     _add_repo(p_mat)
-    p_mat.set_defaults(func=cmd_maturity)
+    p_mat.set_defaults(func=_lazy("cmd_maturity"))
 
     # ------------------------------------------------------------------
     # Meta commands
@@ -252,7 +332,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_stats = sub.add_parser("stats", help="Repository statistics")
     _add_json(p_stats)
     _add_repo(p_stats)
-    p_stats.set_defaults(func=cmd_stats)
+    p_stats.set_defaults(func=_lazy("cmd_stats"))
 
     # changelog
     p_cl = sub.add_parser("changelog", help="Render CHANGELOG.md")
@@ -261,21 +341,21 @@ def build_parser() -> argparse.ArgumentParser:
     p_cl.add_argument("--release", action="store_true", help="Generate polished GitHub Releases notes")
     p_cl.add_argument("--version", default=None, help="Version tag for release notes (e.g. v0.17.0)")
     _add_repo(p_cl)
-    p_cl.set_defaults(func=cmd_changelog)
+    p_cl.set_defaults(func=_lazy("cmd_changelog"))
 
     # story
     p_story = sub.add_parser("story", help="Repo narrative")
     _add_write(p_story)
     _add_json(p_story)
     _add_repo(p_story)
-    p_story.set_defaults(func=cmd_story)
+    p_story.set_defaults(func=_lazy("cmd_story"))
 
     # reflect
     p_reflect = sub.add_parser("reflect", help="Session meta-analysis: quality scores, patterns, and insights")
     p_reflect.add_argument("--write", action="store_true", help="Save report to docs/reflect.md")
     _add_json(p_reflect)
     _add_repo(p_reflect)
-    p_reflect.set_defaults(func=cmd_reflect)
+    p_reflect.set_defaults(func=_lazy("cmd_reflect"))
 
     # evolve
     p_evolve = sub.add_parser("evolve", help="Gap analysis and tiered evolution proposals")
@@ -284,14 +364,14 @@ def build_parser() -> argparse.ArgumentParser:
                           help="Show only proposals from a specific tier (1=quick, 2=medium, 3=exploratory)")
     _add_json(p_evolve)
     _add_repo(p_evolve)
-    p_evolve.set_defaults(func=cmd_evolve)
+    p_evolve.set_defaults(func=_lazy("cmd_evolve"))
 
     # status
     p_status = sub.add_parser("status", help="One-command comprehensive status: health, tests, modules, next action")
     p_status.add_argument("--brief", action="store_true", help="One-line summary")
     _add_json(p_status)
     _add_repo(p_status)
-    p_status.set_defaults(func=cmd_status)
+    p_status.set_defaults(func=_lazy("cmd_status"))
 
     # session-score
     p_session_score = sub.add_parser("session-score", help="Score a session on 5 quality dimensions")
@@ -299,21 +379,21 @@ def build_parser() -> argparse.ArgumentParser:
     p_session_score.add_argument("--all", action="store_true", help="Score all historical sessions")
     _add_json(p_session_score)
     _add_repo(p_session_score)
-    p_session_score.set_defaults(func=cmd_session_score)
+    p_session_score.set_defaults(func=_lazy("cmd_session_score"))
 
     # timeline
     p_timeline = sub.add_parser("timeline", help="Session timeline")
     _add_write(p_timeline)
     _add_json(p_timeline)
     _add_repo(p_timeline)
-    p_timeline.set_defaults(func=cmd_timeline)
+    p_timeline.set_defaults(func=_lazy("cmd_timeline"))
 
     # replay
     p_replay = sub.add_parser("replay", help="Replay a session")
     p_replay.add_argument("--session", type=int, default=None, help="Session number")
     p_replay.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_replay)
-    p_replay.set_defaults(func=cmd_replay)
+    p_replay.set_defaults(func=_lazy("cmd_replay"))
 
     # compare
     p_compare = sub.add_parser("compare", help="Compare two sessions")
@@ -321,14 +401,14 @@ def build_parser() -> argparse.ArgumentParser:
     p_compare.add_argument("session_b", type=int, help="Session B")
     p_compare.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_compare)
-    p_compare.set_defaults(func=cmd_compare)
+    p_compare.set_defaults(func=_lazy("cmd_compare"))
 
     # diff
     p_diff = sub.add_parser("diff", help="Visualise session diff")
     p_diff.add_argument("--session", type=int, default=None, help="Session number")
     p_diff.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_diff)
-    p_diff.set_defaults(func=cmd_diff)
+    p_diff.set_defaults(func=_lazy("cmd_diff"))
 
     # diff-sessions
     p_diffsessions = sub.add_parser("diff-sessions", help="Compare two sessions")
@@ -336,14 +416,14 @@ def build_parser() -> argparse.ArgumentParser:
     p_diffsessions.add_argument("session_b", help="Session B number")
     _add_json(p_diffsessions)
     _add_repo(p_diffsessions)
-    p_diffsessions.set_defaults(func=cmd_diff_sessions)
+    p_diffsessions.set_defaults(func=_lazy("cmd_diff_sessions"))
 
     # insights
     p_insights = sub.add_parser("insights", help="Analyze patterns across all sessions")
     _add_write(p_insights)
     _add_json(p_insights)
     _add_repo(p_insights)
-    p_insights.set_defaults(func=cmd_insights)
+    p_insights.set_defaults(func=_lazy("cmd_insights"))
 
     # ------------------------------------------------------------------
     # Tools commands
@@ -354,7 +434,7 @@ def build_parser() -> argparse.ArgumentParser:
     _add_write(p_doctor)
     _add_json(p_doctor)
     _add_repo(p_doctor)
-    p_doctor.set_defaults(func=cmd_doctor)
+    p_doctor.set_defaults(func=_lazy("cmd_doctor"))
 
     # todos
     p_todos = sub.add_parser("todos", help="TODO/FIXME hunter")
@@ -363,7 +443,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_todos.add_argument("--session", type=int, default=1, help="Current session number")
     p_todos.add_argument("--threshold", type=int, default=3, help="Stale threshold (sessions)")
     _add_repo(p_todos)
-    p_todos.set_defaults(func=cmd_todos)
+    p_todos.set_defaults(func=_lazy("cmd_todos"))
 
     # benchmark
     p_bench = sub.add_parser("benchmark", help="Performance benchmark suite")
@@ -371,15 +451,22 @@ def build_parser() -> argparse.ArgumentParser:
     _add_json(p_bench)
     p_bench.add_argument("--no-persist", action="store_true", help="Don't persist results")
     p_bench.add_argument("--session", type=int, default=None, help="Session number")
+    p_bench.add_argument("--warmup", type=int, default=1, help="Untimed runs per module (default: 1)")
+    p_bench.add_argument("--repeat", type=int, default=5, help="Timed runs per module (default: 5)")
+    p_bench.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    p_bench.add_argument(
+        "--only", action="append", default=None, metavar="RUNNER",
+        help="Benchmark only this runner (repeatable)",
+    )
     _add_repo(p_bench)
-    p_bench.set_defaults(func=cmd_benchmark)
+    p_bench.set_defaults(func=_lazy("cmd_benchmark"))
 
     # gitstats
     p_gitstats = sub.add_parser("gitstats", help="Git statistics deep-dive")
     _add_write(p_gitstats)
     _add_json(p_gitstats)
     _add_repo(p_gitstats)
-    p_gitstats.set_defaults(func=cmd_gitstats)
+    p_gitstats.set_defaults(func=_lazy("cmd_gitstats"))
 
     # badges
     p_badges = sub.add_parser("badges", help="Badge generator")
@@ -387,19 +474,19 @@ def build_parser() -> argparse.ArgumentParser:
     _add_json(p_badges)
     p_badges.add_argument("--inject", action="store_true", help="Inject badges into README.md")
     _add_repo(p_badges)
-    p_badges.set_defaults(func=cmd_badges)
+    p_badges.set_defaults(func=_lazy("cmd_badges"))
 
     # audit
     p_audit = sub.add_parser("audit", help="Comprehensive repo audit")
     _add_json(p_audit)
     _add_repo(p_audit)
-    p_audit.set_defaults(func=cmd_audit)
+    p_audit.set_defaults(func=_lazy("cmd_audit"))
 
     # predict
     p_predict = sub.add_parser("predict", help="Predictive session planner")
     _add_json(p_predict)
     _add_repo(p_predict)
-    p_predict.set_defaults(func=cmd_predict)
+    p_predict.set_defaults(func=_lazy("cmd_predict"))
 
     # teach
     p_teach = sub.add_parser("teach", help="Module tutorial generator")
@@ -407,14 +494,15 @@ def build_parser() -> argparse.ArgumentParser:
     _add_write(p_teach)
     p_teach.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_teach)
-    p_teach.set_defaults(func=cmd_teach)
+    p_teach.set_defaults(func=_lazy("cmd_teach"))
 
     # dna
     p_dna = sub.add_parser("dna", help="Repo DNA fingerprint")
     _add_write(p_dna)
     _add_json(p_dna)
     _add_repo(p_dna)
-    p_dna.set_defaults(func=cmd_dna)
+    _add_jobs(p_dna)
+    p_dna.set_defaults(func=_lazy("cmd_dna"))
 
     # report
     p_report = sub.add_parser("report", help="Executive HTML report")
@@ -422,56 +510,57 @@ def build_parser() -> argparse.ArgumentParser:
     p_report.add_argument("--open", action="store_true", help="Open in browser after generating")
     _add_json(p_report)
     _add_repo(p_report)
-    p_report.set_defaults(func=cmd_report, open=True)
+    p_report.set_defaults(func=_lazy("cmd_report"), open=True)
 
     # export
     p_export = sub.add_parser("export", help="Export analysis to JSON/Markdown/HTML")
     p_export.add_argument("--format", choices=["json", "markdown", "html"], default="json")
     _add_repo(p_export)
-    p_export.set_defaults(func=cmd_export)
+    p_export.set_defaults(func=_lazy("cmd_export"))
 
     # coverage
     p_cov = sub.add_parser("coverage", help="Test coverage trend")
     _add_json(p_cov)
     _add_repo(p_cov)
-    p_cov.set_defaults(func=cmd_coverage)
+    p_cov.set_defaults(func=_lazy("cmd_coverage"))
 
     # score / pr-score
     p_score = sub.add_parser("score", help="PR quality leaderboard")
     _add_json(p_score)
     _add_repo(p_score)
-    p_score.set_defaults(func=cmd_score)
+    p_score.set_defaults(func=_lazy("cmd_score"))
 
     p_prscore = sub.add_parser("pr-score", help="PR quality leaderboard")
     _add_json(p_prscore)
     _add_repo(p_prscore)
-    p_prscore.set_defaults(func=cmd_score)
+    p_prscore.set_defaults(func=_lazy("cmd_score"))
 
     # test-quality
     p_testquality = sub.add_parser("test-quality", help="Test quality grader")
     _add_json(p_testquality)
     _add_repo(p_testquality)
-    p_testquality.set_defaults(func=cmd_test_quality)
+    p_testquality.set_defaults(func=_lazy("cmd_test_quality"))
 
     # refactor
     p_refactor = sub.add_parser("refactor", help="Self-refactor engine")
     p_refactor.add_argument("--apply", action="store_true", help="Apply safe fixes")
     p_refactor.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_refactor)
-    p_refactor.set_defaults(func=cmd_refactor)
+    _add_jobs(p_refactor)
+    p_refactor.set_defaults(func=_lazy("cmd_refactor"))
 
     # commits
     p_commits = sub.add_parser("commits", help="Commit message quality analyzer")
     p_commits.add_argument("--top", type=int, default=500, help="Max commits to analyse (default: 500)")
     _add_json(p_commits)
     _add_repo(p_commits)
-    p_commits.set_defaults(func=cmd_commits)
+    p_commits.set_defaults(func=_lazy("cmd_commits"))
 
     # semver
     p_semver = sub.add_parser("semver", help="Semver bump recommender")
     _add_json(p_semver)
     _add_repo(p_semver)
-    p_semver.set_defaults(func=cmd_semver)
+    p_semver.set_defaults(func=_lazy("cmd_semver"))
 
     # modules
     p_modules = sub.add_parser("modules", help="Module interconnection graph")
@@ -479,47 +568,53 @@ def build_parser() -> argparse.ArgumentParser:
     p_modules.add_argument("--write", action="store_true", help="Write to docs/MODULE_GRAPH.md")
     _add_json(p_modules)
     _add_repo(p_modules)
-    p_modules.set_defaults(func=cmd_modules)
+    p_modules.set_defaults(func=_lazy("cmd_modules"))
 
     # trends
     p_trends = sub.add_parser("trends", help="Historical trend data")
     p_trends.add_argument("--write", action="store_true", help="Write to docs/trend_data.json")
+    p_trends.add_argument("--from", dest="start", type=int, default=None, metavar="SESSION",
+                          help="First session to include")
+    p_trends.add_argument("--to", dest="end", type=int, default=None, metavar="SESSION",
+                          help="Last session to include")
+    p_trends.add_argument("--points", type=int, default=None, metavar="N",
+                          help="Downsample each series to at most N min/max/mean buckets")
     _add_json(p_trends)
     _add_repo(p_trends)
-    p_trends.set_defaults(func=cmd_trends)
+    p_trends.set_defaults(func=_lazy("cmd_trends"))
 
     # plan / brain
     p_plan = sub.add_parser("plan", help="Session task planner")
     p_plan.add_argument("--session", type=int, default=1, help="Session number")
     p_plan.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_plan)
-    p_plan.set_defaults(func=cmd_plan)
+    p_plan.set_defaults(func=_lazy("cmd_plan"))
 
     p_brain = sub.add_parser("brain", help="Session task planner (alias for plan)")
     p_brain.add_argument("--session", type=int, default=1, help="Session number")
     p_brain.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_brain)
-    p_brain.set_defaults(func=cmd_plan)
+    p_brain.set_defaults(func=_lazy("cmd_plan"))
 
     # triage
     p_triage = sub.add_parser("triage", help="Issue triage")
     p_triage.add_argument("--issues", default=None, help="Path to issues JSON")
     p_triage.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_triage)
-    p_triage.set_defaults(func=cmd_triage)
+    p_triage.set_defaults(func=_lazy("cmd_triage"))
 
     # depgraph
     p_depgraph = sub.add_parser("depgraph", help="Module dependency graph")
     _add_write(p_depgraph)
     _add_json(p_depgraph)
     _add_repo(p_depgraph)
-    p_depgraph.set_defaults(func=cmd_depgraph)
+    p_depgraph.set_defaults(func=_lazy("cmd_depgraph"))
 
     # arch
     p_arch = sub.add_parser("arch", help="Architecture doc generator")
     p_arch.add_argument("--write", action="store_true")
     _add_repo(p_arch)
-    p_arch.set_defaults(func=cmd_arch)
+    p_arch.set_defaults(func=_lazy("cmd_arch"))
 
     # ------------------------------------------------------------------
     # Infrastructure commands
@@ -529,27 +624,29 @@ def build_parser() -> argparse.ArgumentParser:
     p_dash = sub.add_parser("dashboard", help="Launch React dashboard")
     p_dash.add_argument("--port", type=int, default=8710, help="Port (default: 8710)")
     p_dash.add_argument("--no-browser", action="store_true", help="Don't open browser")
+    p_dash.add_argument("--workers", type=int, default=8, help="Concurrent request threads (default: 8)")
+    p_dash.add_argument("--cache-ttl", type=float, default=300.0, help="Seconds to cache API results; 0 disables (default: 300)")
     _add_repo(p_dash)
-    p_dash.set_defaults(func=cmd_dashboard)
+    p_dash.set_defaults(func=_lazy("cmd_dashboard"))
 
     # init
     p_init = sub.add_parser("init", help="Bootstrap project scaffolding")
     p_init.add_argument("--force", action="store_true", help="Overwrite existing files")
     _add_repo(p_init)
-    p_init.set_defaults(func=cmd_init)
+    p_init.set_defaults(func=_lazy("cmd_init"))
 
     # deps
     p_deps = sub.add_parser("deps", help="Dependency freshness checker")
     p_deps.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_deps)
-    p_deps.set_defaults(func=cmd_deps)
+    p_deps.set_defaults(func=_lazy("cmd_deps"))
 
     # config
     p_config = sub.add_parser("config", help="Show or write awake.toml")
     p_config.add_argument("--write", action="store_true", help="Write default config")
     p_config.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_config)
-    p_config.set_defaults(func=cmd_config)
+    p_config.set_defaults(func=_lazy("cmd_config"))
 
     # plugins
     p_plugins = sub.add_parser("plugins", help="Plugin/hook registry")
@@ -557,7 +654,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_plugins.add_argument("--run", default=None, metavar="HOOK", help="Run all plugins for a hook")
     _add_json(p_plugins)
     _add_repo(p_plugins)
-    p_plugins.set_defaults(func=cmd_plugins)
+    p_plugins.set_defaults(func=_lazy("cmd_plugins"))
 
     # openapi
     p_openapi = sub.add_parser("openapi", help="Generate OpenAPI 3.1 spec")
@@ -565,7 +662,15 @@ def build_parser() -> argparse.ArgumentParser:
     p_openapi.add_argument("--write", action="store_true", help="Write to docs/openapi.json")
     _add_json(p_openapi)
     _add_repo(p_openapi)
-    p_openapi.set_defaults(func=cmd_openapi)
+    p_openapi.set_defaults(func=_lazy("cmd_openapi"))
+
+    # metrics
+    p_metrics = sub.add_parser("metrics", help="Metric history database (docs/metrics.db)")
+    p_metrics.add_argument("--import", dest="import_json", action="store_true",
+                           help="Re-import the legacy docs/*.json history files")
+    _add_json(p_metrics)
+    _add_repo(p_metrics)
+    p_metrics.set_defaults(func=_lazy("cmd_metrics"))
 
 
     # docstrings
@@ -575,7 +680,8 @@ def build_parser() -> argparse.ArgumentParser:
     _add_write(p_docstrings)
     _add_json(p_docstrings)
     _add_repo(p_docstrings)
-    p_docstrings.set_defaults(func=cmd_docstrings)
+    _add_jobs(p_docstrings)
+    p_docstrings.set_defaults(func=_lazy("cmd_docstrings"))
 
     # automerge
     p_automerge = sub.add_parser("automerge", help="Auto-merge eligibility gate")
@@ -585,21 +691,37 @@ def build_parser() -> argparse.ArgumentParser:
     p_automerge.add_argument("--pr", type=int, default=None, help="PR number (optional)")
     p_automerge.add_argument("--json", action="store_true", help="Output raw JSON")
     _add_repo(p_automerge)
-    p_automerge.set_defaults(func=cmd_automerge)
+    p_automerge.set_defaults(func=_lazy("cmd_automerge"))
 
 
     # run
     p_run = sub.add_parser("run", help="Full session pipeline")
     p_run.add_argument("--session", type=int, default=1, help="Session number")
     _add_repo(p_run)
-    p_run.set_defaults(func=cmd_run)
+    p_run.set_defaults(func=_lazy("cmd_run"))
 
     return parser
 
 
+def _known_command(argv: list[str]) -> str | None:
+    """Return the subcommand named by the first argument, if it is one."""
+    if not argv:
+        return None
+    name = argv[0]
+    if name in _COMMAND_ALIASES or f"cmd_{name.replace('-', '_')}" in _COMMAND_SOURCES:
+        return name
+    return None
+
+
 def main(argv=None) -> int:
     """Entry point for the awake CLI."""
-    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if "--profile-import" in argv:
+        from src.import_profile import format_import_profile, profile_imports
+        rest = [a for a in argv if a != "--profile-import"]
+        print(format_import_profile(profile_imports(rest), command=" ".join(rest[:1])))
+        return 0
+    parser = build_parser(only=_known_command(argv))
     args = parser.parse_args(argv)
     return args.func(args)
 
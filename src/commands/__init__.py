@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
 import sys
-
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any, Iterator
 
 # Repo root used by most modules
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -21,6 +24,59 @@ def _repo(path: str | None) -> Path:
     return p
 
 
+def _jobs(args, repo: Path) -> int:
+    """Worker count for per-file analysis: ``--jobs`` or ``[performance] jobs``."""
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None:
+        return jobs
+    from src.config import load_config
+    return load_config(repo).performance.jobs
+
+
+def _context(args, repo: Path):
+    """:class:`src.analysis_context.AnalysisContext` for *repo*.
+
+    Under :func:`_collect_result` (a long-lived host such as the API server)
+    this is the process-wide context, so commands share its reports.  A
+    one-shot CLI run gets a fresh context instead: there is nothing to share,
+    and fingerprinting the repository would cost more than some commands.
+    """
+    from src.analysis_context import AnalysisContext, shared_context
+    cache, jobs = not getattr(args, "no_cache", False), _jobs(args, repo)
+    if _RESULT_SINK.get() is None:
+        return AnalysisContext(repo, cache=cache, jobs=jobs)
+    return shared_context(repo, cache=cache, jobs=jobs)
+
+
+#: Receiver for :func:`_emit_json` payloads while :func:`_collect_result` is active.
+_RESULT_SINK: ContextVar[list | None] = ContextVar("awake_result_sink", default=None)
+
+
+def _emit_json(payload: Any, **dumps_kwargs) -> None:
+    """Output *payload* as the command's ``--json`` result.
+
+    On the command line this prints it as indented JSON; under
+    :func:`_collect_result` (see :mod:`src.dispatch`) the object itself is
+    handed back to the caller and nothing is printed.
+    """
+    sink = _RESULT_SINK.get()
+    if sink is not None:
+        sink.append(payload)
+        return
+    print(json.dumps(payload, indent=2, **dumps_kwargs))
+
+
+@contextmanager
+def _collect_result() -> Iterator[list]:
+    """Collect the payloads :func:`_emit_json` receives in this thread."""
+    results: list = []
+    token = _RESULT_SINK.set(results)
+    try:
+        yield results
+    finally:
+        _RESULT_SINK.reset(token)
+
+
 # ANSI colours
 RESET = "\033[0m"
 BOLD = "\033[1m"
@@ -66,6 +122,10 @@ def _print_info(msg: str) -> None:
 __all__ = [
     "REPO_ROOT",
     "_repo",
+    "_jobs",
+    "_context",
+    "_emit_json",
+    "_collect_result",
     "_print_header",
     "_print_ok",
     "_print_warn",
@@ -73,5 +133,10 @@ __all__ = [
 ]
 
 
-# Auto-merge gate
-from src.commands.infra_automerge import cmd_automerge
+def __getattr__(name: str):
+    # Auto-merge gate, imported on first use so CLI startup does not load
+    # src.automerge.
+    if name == "cmd_automerge":
+        from src.commands.infra_automerge import cmd_automerge
+        return cmd_automerge
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,24 @@
 """Analysis command group for Awake CLI.
 
-Commands: health, complexity, coupling, dead_code (deadcode), security,
+Commands: health, complexity, coupling, dead_code (deadcode), refs, security,
 coverage_map (coveragemap), blame, maturity.
 """
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from src.commands import _repo, _print_header, _print_ok, _print_warn, _print_info
+from src.commands import _repo, _emit_json, _jobs, _context, _print_header, _print_ok, _print_warn, _print_info
+
+
+def _use_cache(args) -> bool:
+    """Whether the on-disk analysis cache is enabled for this invocation."""
+    return not getattr(args, "no_cache", False)
+
+
+def _incremental(args) -> bool:
+    """Whether to re-analyze only files changed since the last ``--incremental`` run."""
+    return getattr(args, "incremental", False)
 
 
 # ---------------------------------------------------------------------------
@@ -22,9 +31,14 @@ def cmd_health(args) -> int:
     from src.health import generate_health_report
     _print_header("Code Health Report")
     repo = _repo(getattr(args, "repo", None))
-    report = generate_health_report(repo_path=repo)
+    if _incremental(args):
+        report = generate_health_report(
+            repo_path=repo, cache=_use_cache(args), jobs=_jobs(args, repo), incremental=True,
+        )
+    else:
+        report = _context(args, repo).health
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(f"Overall score: {report.overall_health_score}/100")
@@ -41,9 +55,12 @@ def cmd_complexity(args) -> int:
     from src.complexity import analyze_complexity, save_complexity_report
     _print_header("Cyclomatic Complexity Analysis")
     repo = _repo(getattr(args, "repo", None))
-    report = analyze_complexity(repo_path=repo)
+    report = analyze_complexity(
+        repo_path=repo, cache=_use_cache(args), jobs=_jobs(args, repo),
+        incremental=_incremental(args),
+    )
     if args.json:
-        print(report.to_json())
+        _emit_json(report.to_dict())
         return 0
     if args.write:
         out = repo / "docs" / "complexity_report.md"
@@ -70,9 +87,11 @@ def cmd_coupling(args) -> int:
     from src.coupling import analyze_coupling, save_coupling_report
     _print_header("Module Coupling Analysis")
     repo = _repo(getattr(args, "repo", None))
-    report = analyze_coupling(repo_path=repo)
+    report = analyze_coupling(
+        repo_path=repo, cache=_use_cache(args), incremental=_incremental(args)
+    )
     if args.json:
-        print(report.to_json())
+        _emit_json(report.to_dict())
         return 0
     if args.write:
         out = repo / "docs" / "coupling_report.md"
@@ -99,9 +118,14 @@ def cmd_deadcode(args) -> int:
     from src.dead_code import find_dead_code
     _print_header("Dead Code Detector")
     repo = _repo(getattr(args, "repo", None))
-    report = find_dead_code(repo)
+    if _incremental(args):
+        report = find_dead_code(
+            repo, cache=_use_cache(args), jobs=_jobs(args, repo), incremental=True,
+        )
+    else:
+        report = _context(args, repo).dead_code
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(
@@ -112,6 +136,41 @@ def cmd_deadcode(args) -> int:
     return 0
 
 
+# ---------------------------------------------------------------------------
+# refs
+# ---------------------------------------------------------------------------
+
+
+def cmd_refs(args) -> int:
+    """Who references a symbol: resolved reference sites from the symbol index."""
+    from src.symbol_index import build_symbol_index
+    repo = _repo(getattr(args, "repo", None))
+    index = build_symbol_index(repo, persist=_use_cache(args), jobs=_jobs(args, repo))
+    matches = index.find(args.symbol)
+    results = [
+        (d, [r for r in index.references_to(d.qualname) if not d.contains(r)])
+        for d in matches
+    ]
+    if args.json:
+        _emit_json([
+            {"definition": d.to_dict(), "references": [r.to_dict() for r in refs]}
+            for d, refs in results
+        ])
+        return 0 if matches else 1
+    _print_header(f"References: {args.symbol}")
+    if not matches:
+        _print_warn(f"No definition matches {args.symbol!r}")
+        return 1
+    for d, refs in results:
+        print(f"\n  {d.qualname}  ({d.kind}, {d.file}:{d.line})")
+        for r in sorted(refs, key=lambda r: (r.file, r.line)):
+            print(f"    {r.file}:{r.line}  [{r.kind}]")
+        if not refs:
+            print("    (no references)")
+    _print_info(f"Definitions: {len(matches)}  References: {sum(len(r) for _, r in results)}")
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # security
 # ---------------------------------------------------------------------------
@@ -122,9 +181,16 @@ def cmd_security(args) -> int:
     from src.security import audit_security
     _print_header("Security Audit")
     repo = _repo(getattr(args, "repo", None))
-    report = audit_security(repo)
+    whole_repo = getattr(args, "whole_repo", False)
+    if _incremental(args) or whole_repo:
+        report = audit_security(
+            repo, cache=_use_cache(args), jobs=_jobs(args, repo),
+            incremental=_incremental(args), whole_repo=whole_repo,
+        )
+    else:
+        report = _context(args, repo).security
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     grade = report.grade
@@ -147,7 +213,7 @@ def cmd_coveragemap(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = build_coverage_map(repo)
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(f"Avg score: {report.avg_score:.1f}  Modules: {len(report.entries)}  Without tests: {len(report.modules_without_tests)}")
@@ -164,9 +230,9 @@ def cmd_blame(args) -> int:
     from src.blame import analyze_blame
     _print_header("Blame Attribution")
     repo = _repo(getattr(args, "repo", None))
-    report = analyze_blame(repo)
+    report = analyze_blame(repo, cache=_use_cache(args), jobs=_jobs(args, repo))
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(
@@ -193,7 +259,7 @@ def cmd_maturity(args) -> int:
         _print_ok(f"Report written to {out}")
         return 0
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     module_count = len(report.modules)
@@ -1,6 +1,6 @@
 """Infrastructure command group for Awake CLI.
 
-Commands: dashboard (terminal), server (web), init, deps, config, plugins, openapi.
+Commands: dashboard (terminal), server (web), init, deps, config, plugins, openapi, metrics.
 """
 
 from __future__ import annotations
@@ -8,7 +8,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from src.commands import _repo, _print_header, _print_ok, _print_warn, _print_info
+from src.commands import _repo, _emit_json, _print_header, _print_ok, _print_warn, _print_info
 
 
 # ---------------------------------------------------------------------------
@@ -25,7 +25,13 @@ def cmd_dashboard(args) -> int:
     _print_ok(f"Starting API server on port {port} ...")
     _print_info("Open http://127.0.0.1:8710 in your browser.")
     _print_info("Press Ctrl+C to stop.")
-    start_server(port=port, repo_path=repo, open_browser=not getattr(args, "no_browser", False))
+    start_server(
+        port=port,
+        repo_path=repo,
+        open_browser=not getattr(args, "no_browser", False),
+        workers=getattr(args, "workers", 8),
+        cache_ttl=getattr(args, "cache_ttl", 300.0),
+    )
     return 0
 
 
@@ -63,7 +69,7 @@ def cmd_deps(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = check_freshness(repo)
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     stale = [d for d in report.packages if d.status == "outdated"]
@@ -96,7 +102,7 @@ def cmd_config(args) -> int:
     if config_path.exists():
         cfg = AwakeConfig.from_toml(config_path)
         if args.json:
-            print(json.dumps(cfg.to_dict(), indent=2))
+            _emit_json(cfg.to_dict())
             return 0
         print(cfg.to_markdown())
     else:
@@ -122,7 +128,7 @@ def cmd_plugins(args) -> int:
         hook = args.run
         report = run_plugins(hook, repo_root=repo)
         if args.json:
-            print(json.dumps(report.to_dict(), indent=2))
+            _emit_json(report.to_dict())
             return 0
         print(report.to_markdown())
         _print_info(
@@ -132,7 +138,7 @@ def cmd_plugins(args) -> int:
         return 0
     if args.json:
         defs = load_plugin_definitions(repo)
-        print(json.dumps([d.to_dict() for d in defs], indent=2))
+        _emit_json([d.to_dict() for d in defs])
         return 0
     print(list_plugins(repo))
     return 0
@@ -150,7 +156,7 @@ def cmd_openapi(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     spec = generate_openapi_spec(repo)
     if args.json or getattr(args, "format", "json") == "json":
-        print(json.dumps(spec.to_dict(), indent=2))
+        _emit_json(spec.to_dict())
         if getattr(args, "write", False):
             out = repo / "docs" / "openapi.json"
             out.parent.mkdir(exist_ok=True)
@@ -170,6 +176,32 @@ def cmd_openapi(args) -> int:
     return 0
 
 
+# ---------------------------------------------------------------------------
+# metrics (history database)
+# ---------------------------------------------------------------------------
+
+
+def cmd_metrics(args) -> int:
+    """Summarise docs/metrics.db, optionally re-importing the legacy JSON history."""
+    from src.metrics_store import open_metrics_store
+    _print_header("Metrics Store")
+    repo = _repo(getattr(args, "repo", None))
+    reimport = getattr(args, "import_json", False)
+    with open_metrics_store(repo, import_legacy=not reimport) as store:
+        imported = store.import_json(repo, force=True) if reimport else {}
+        counts = store.counts()
+        path = store.path
+    if args.json:
+        _emit_json({"path": str(path), "counts": counts, "imported": imported})
+        return 0
+    for kind, n in imported.items():
+        _print_ok(f"Imported {n} {kind} record(s)")
+    for table, n in counts.items():
+        _print_info(f"{table:<20} {n:>6}")
+    _print_info(f"Database: {path}")
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # run (full pipeline)
 # ---------------------------------------------------------------------------
@@ -8,10 +8,8 @@ whether a PR is eligible.
 
 from __future__ import annotations
 
-import json
-
 from src.automerge import decide_automerge
-from src.commands import _repo, _print_header, _print_ok, _print_warn
+from src.commands import _repo, _emit_json, _print_header, _print_ok, _print_warn
 
 
 def cmd_automerge(args) -> int:
@@ -27,7 +25,7 @@ def cmd_automerge(args) -> int:
     )
 
     if getattr(args, "json", False):
-        print(json.dumps(decision.to_dict(), indent=2))
+        _emit_json(decision.to_dict())
         return 0 if decision.eligible else 1
 
     if decision.eligible:
@@ -6,10 +6,9 @@ timeline, replay, compare, diff, diff_sessions.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from src.commands import _repo, _print_header, _print_ok, _print_warn, _print_info
+from src.commands import _repo, _emit_json, _context, _print_header, _print_ok, _print_warn, _print_info
 
 
 # ---------------------------------------------------------------------------
@@ -25,7 +24,7 @@ def cmd_stats(args) -> int:
     log_path = repo / "AWAKE_LOG.md"
     stats = compute_stats(repo_path=repo, log_path=log_path)
     if args.json:
-        print(json.dumps(stats.to_dict(), indent=2))
+        _emit_json(stats.to_dict())
         return 0
     print(stats.readme_table())
     print()
@@ -48,7 +47,7 @@ def cmd_changelog(args) -> int:
         version = getattr(args, "version", None)
         notes = generate_release_notes(repo, version=version)
         if args.json:
-            print(json.dumps(notes.to_dict(), indent=2))
+            _emit_json(notes.to_dict())
             return 0
         if args.write:
             out = repo / "RELEASE_NOTES.md"
@@ -64,7 +63,7 @@ def cmd_changelog(args) -> int:
         _print_ok(f"Written to {out}")
         return 0
     if args.json:
-        print(json.dumps(changelog.to_dict(), indent=2))
+        _emit_json(changelog.to_dict())
         return 0
     print(changelog.to_markdown())
     return 0
@@ -87,7 +86,7 @@ def cmd_story(args) -> int:
         _print_ok(f"Story written to {out}")
         return 0
     if args.json:
-        print(json.dumps(story.to_dict(), indent=2))
+        _emit_json(story.to_dict())
         return 0
     print(story.to_markdown())
     _print_info(
@@ -105,11 +104,11 @@ def cmd_reflect(args) -> int:
     """Analyze all past sessions and produce meta-insights."""
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from reflect import generate_reflection, format_reflection, reflect_to_json, save_reflection
+    from reflect import generate_reflection, format_reflection, reflect_to_dict, save_reflection
 
     report = generate_reflection()
     if args.json:
-        print(reflect_to_json(report))
+        _emit_json(reflect_to_dict(report))
         return 0
     print(format_reflection(report))
     if getattr(args, "write", False):
@@ -128,11 +127,11 @@ def cmd_evolve(args) -> int:
     """Generate gap analysis and evolution proposals."""
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from evolve import generate_evolution, format_evolution, evolve_to_json, save_evolution
+    from evolve import generate_evolution, format_evolution, evolve_to_dict, save_evolution
 
     report = generate_evolution()
     if args.json:
-        print(evolve_to_json(report))
+        _emit_json(evolve_to_dict(report))
         return 0
     tier = getattr(args, "tier", None)
     if tier:
@@ -162,11 +161,12 @@ def cmd_status(args) -> int:
     """Show comprehensive at-a-glance status of the repo."""
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from status import generate_status, format_status, status_to_json
+    from status import generate_status, format_status, status_to_dict
 
-    report = generate_status(_repo(getattr(args, "repo", None)))
+    repo = _repo(getattr(args, "repo", None))
+    report = generate_status(repo, context=_context(args, repo))
     if args.json:
-        print(status_to_json(report))
+        _emit_json(status_to_dict(report))
         return 0
     if getattr(args, "brief", False):
         print(report.summary)
@@ -185,24 +185,24 @@ def cmd_session_score(args) -> int:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from session_scorer import (
-        score_session, score_all_sessions,
-        format_session_score, session_score_to_json, SESSION_DATA,
+        score_session, score_all_sessions, session_row,
+        format_session_score, session_score_to_dict,
     )
 
+    log_path = _repo(getattr(args, "repo", None)) / "AWAKE_LOG.md"
     if getattr(args, "all", False):
-        scores = score_all_sessions()
+        scores = score_all_sessions(log_path)
         if args.json:
-            print(json.dumps(
-                [{"session": s.session, "total": s.total, "grade": s.grade} for s in scores],
-                indent=2,
-            ))
+            _emit_json(
+                [{"session": s.session, "total": s.total, "grade": s.grade} for s in scores]
+            )
             return 0
         for s in sorted(scores, key=lambda x: x.total, reverse=True):
             print(f"  S{s.session:>2}  {s.grade:>3}  {s.total:>5.1f}/100")
         return 0
 
     session_num = getattr(args, "session", None) or 18
-    row = next((r for r in SESSION_DATA if r[0] == session_num), None)
+    row = session_row(session_num, log_path)
     if row is None:
         print(f"No data for session {session_num}. Use --all to see all sessions.")
         return 1
@@ -210,7 +210,7 @@ def cmd_session_score(args) -> int:
     _, features, tests, cli, api, health = row
     score = score_session(session_num, features, tests, cli, api, health)
     if args.json:
-        print(session_score_to_json(score))
+        _emit_json(session_score_to_dict(score))
         return 0
     print(format_session_score(score))
     return 0
@@ -229,7 +229,7 @@ def cmd_timeline(args) -> int:
     log_path = repo / "AWAKE_LOG.md"
     timeline = build_timeline(log_path=log_path, repo_path=repo)
     if args.json:
-        print(timeline.to_json())
+        _emit_json(timeline.to_dict())
         return 0
     if args.write:
         out = repo / "docs" / "timeline.md"
@@ -261,7 +261,7 @@ def cmd_replay(args) -> int:
             _print_warn(f"Session {args.session} not found in {log_path}")
             return 1
         if args.json:
-            print(json.dumps(r.to_dict(), indent=2, default=str))
+            _emit_json(r.to_dict(), default=str)
         else:
             print(r.to_markdown())
     else:
@@ -287,7 +287,7 @@ def cmd_compare(args) -> int:
     log_path = repo / "AWAKE_LOG.md"
     comparison = compare_sessions(log_path=log_path, session_a=args.session_a, session_b=args.session_b)
     if args.json:
-        print(json.dumps(comparison.to_dict(), indent=2, default=str))
+        _emit_json(comparison.to_dict(), default=str)
         return 0
     print(comparison.to_markdown())
     return 0
@@ -307,7 +307,7 @@ def cmd_diff(args) -> int:
     md = render_session_diff(diff)
     if args.json:
         import dataclasses
-        print(json.dumps(dataclasses.asdict(diff), indent=2))
+        _emit_json(dataclasses.asdict(diff))
         return 0
     print(md)
     return 0
@@ -327,7 +327,7 @@ def cmd_diff_sessions(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = compare_sessions(repo, session_a, session_b)
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     print()
@@ -347,7 +347,7 @@ def cmd_insights(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = generate_insights(repo_path=repo)
     if args.json:
-        print(report.to_json())
+        _emit_json(report.to_dict())
         return 0
     if args.write:
         out = repo / "docs" / "insights_report.md"
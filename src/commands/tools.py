@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from src.commands import _repo, _print_header, _print_ok, _print_warn, _print_info
+from src.commands import _repo, _emit_json, _jobs, _context, _print_header, _print_ok, _print_warn, _print_info
 
 
 # ---------------------------------------------------------------------------
@@ -30,7 +30,7 @@ def cmd_doctor(args) -> int:
         _print_ok(f"Report written to {out}")
         return 0
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2, default=str))
+        _emit_json(report.to_dict(), default=str)
         return 0
     print(render_report(report))
     grade = report.grade
@@ -60,7 +60,7 @@ def cmd_todos(args) -> int:
         _print_ok(f"Report written to {out}")
         return 0
     if args.json:
-        print(json.dumps([i.to_dict() for i in items], indent=2, default=str))
+        _emit_json([i.to_dict() for i in items], default=str)
         return 0
     print(render_todo_report(items, current_session=args.session, threshold=args.threshold))
     stale_count = sum(1 for i in items if i.is_stale)
@@ -81,14 +81,27 @@ def cmd_benchmark(args) -> int:
     from src.benchmark import run_benchmarks, save_benchmark_report
     _print_header("Performance Benchmark Suite")
     repo = _repo(getattr(args, "repo", None))
-    report = run_benchmarks(repo)
+    kwargs = {"session": args.session} if getattr(args, "session", None) is not None else {}
+    try:
+        report = run_benchmarks(
+            repo,
+            persist=not getattr(args, "no_persist", False),
+            warmup=getattr(args, "warmup", 1),
+            repeat=getattr(args, "repeat", 5),
+            memory=not getattr(args, "no_memory", False),
+            only=getattr(args, "only", None),
+            **kwargs,
+        )
+    except ValueError as exc:
+        _print_warn(str(exc))
+        return 1
     if args.write:
         out = repo / "docs" / "benchmark_report.md"
         save_benchmark_report(report, out)
         _print_ok(f"Report written to {out}")
         return 0
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     regressions = report.regressions
@@ -116,7 +129,7 @@ def cmd_gitstats(args) -> int:
         _print_ok(f"Report written to {out}")
         return 0
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(
@@ -137,7 +150,7 @@ def cmd_badges(args) -> int:
     from src.badges import generate_badges
     _print_header("Badge Generator")
     repo = _repo(getattr(args, "repo", None))
-    report = generate_badges(repo)
+    report = generate_badges(repo, context=_context(args, repo))
     if args.inject:
         from src.badges import write_badges_to_readme
         ok = write_badges_to_readme(report, repo / "README.md")
@@ -147,7 +160,7 @@ def cmd_badges(args) -> int:
             _print_warn("Could not inject badges into README.md")
         return 0
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     if args.write:
         out = repo / "docs" / "badges.json"
@@ -169,9 +182,9 @@ def cmd_audit(args) -> int:
     from src.audit import run_audit
     _print_header("Comprehensive Repo Audit")
     repo = _repo(getattr(args, "repo", None))
-    report = run_audit(repo)
+    report = run_audit(repo, context=_context(args, repo))
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     grade = report.overall_grade
@@ -194,9 +207,9 @@ def cmd_predict(args) -> int:
     from src.predict import predict_next_session
     _print_header("Predictive Session Planner")
     repo = _repo(getattr(args, "repo", None))
-    report = predict_next_session(repo)
+    report = predict_next_session(repo, context=_context(args, repo))
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     top = report.top_items[:1]
@@ -237,7 +250,7 @@ def cmd_teach(args) -> int:
         _print_ok(f"Tutorial written to {out}")
         return 0
     if args.json:
-        print(json.dumps(tutorial.to_dict(), indent=2))
+        _emit_json(tutorial.to_dict())
         return 0
     print(tutorial.to_markdown())
     return 0
@@ -253,14 +266,14 @@ def cmd_dna(args) -> int:
     from src.dna import fingerprint_repo, save_dna_report
     _print_header("Repo DNA Fingerprint")
     repo = _repo(getattr(args, "repo", None))
-    dna = fingerprint_repo(repo)
+    dna = fingerprint_repo(repo, jobs=_jobs(args, repo))
     if args.write:
         out = repo / "docs" / "dna.md"
         save_dna_report(dna, out)
         _print_ok(f"DNA report written to {out}")
         return 0
     if args.json:
-        print(json.dumps(dna.to_dict(), indent=2))
+        _emit_json(dna.to_dict())
         return 0
     print(dna.to_markdown())
     return 0
@@ -278,9 +291,9 @@ def cmd_report(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     output = Path(args.output) if getattr(args, "output", None) else repo / "docs" / "report.html"
     output.parent.mkdir(parents=True, exist_ok=True)
-    report = generate_report(repo)
+    report = generate_report(repo, context=_context(args, repo))
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     html = report.to_html()
     output.write_text(html, encoding="utf-8")
@@ -322,18 +335,20 @@ def cmd_export(args) -> int:
 
 def cmd_coverage(args) -> int:
     """Show test coverage trend."""
-    from src.coverage_tracker import CoverageHistory
+    from src.coverage_tracker import load_coverage_history
+    from src.metrics_store import METRICS_DB, has_metrics, open_metrics_store
     _print_header("Test Coverage Trend")
     repo = _repo(getattr(args, "repo", None))
-    history_path = repo / "docs" / "coverage_history.json"
-    if not history_path.exists():
-        _print_warn(f"No coverage history found at {history_path}")
+    history = None
+    if has_metrics(repo):
+        with open_metrics_store(repo) as store:
+            history = load_coverage_history(store)
+    if not history or not history.snapshots:
+        _print_warn(f"No coverage history found in {repo / METRICS_DB}")
         _print_info("Run `awake run` to generate initial coverage data.")
         return 0
-    with history_path.open() as f:
-        history = CoverageHistory.from_dict(json.load(f))
     if args.json:
-        print(json.dumps(history.to_dict(), indent=2))
+        _emit_json(history.to_dict())
         return 0
     print(history.to_markdown())
     latest = history.latest()
@@ -349,17 +364,20 @@ def cmd_coverage(args) -> int:
 
 def cmd_score(args) -> int:
     """Show PR quality leaderboard."""
+    from src.metrics_store import METRICS_DB, has_metrics, open_metrics_store
     from src.pr_scorer import load_scores, render_leaderboard
     _print_header("PR Quality Leaderboard")
     repo = _repo(getattr(args, "repo", None))
-    scores_path = repo / "docs" / "pr_scores.json"
-    if not scores_path.exists():
-        _print_warn(f"No PR scores found at {scores_path}")
+    scores = []
+    if has_metrics(repo):
+        with open_metrics_store(repo) as store:
+            scores = load_scores(store)
+    if not scores:
+        _print_warn(f"No PR scores found in {repo / METRICS_DB}")
         _print_info("Run `awake run` to score the latest PRs.")
         return 0
-    scores = load_scores(scores_path)
     if args.json:
-        print(json.dumps([s.__dict__ for s in scores], indent=2, default=str))
+        _emit_json([s.__dict__ for s in scores], default=str)
         return 0
     print(render_leaderboard(scores))
     return 0
@@ -377,7 +395,7 @@ def cmd_test_quality(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = analyze_test_quality(repo)
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(
@@ -403,13 +421,13 @@ def cmd_refactor(args) -> int:
     _print_header("Self-Refactor Engine")
     repo = _repo(getattr(args, "repo", None))
     engine = RefactorEngine(repo_path=repo)
-    report = engine.analyze()
+    report = engine.analyze(jobs=_jobs(args, repo))
     if args.apply:
         applied = engine.apply_safe_fixes(report)
         _print_ok(f"Applied {applied} safe fixes")
         return 0
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     return 0
@@ -427,7 +445,7 @@ def cmd_commits(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = analyze_commits(repo, max_commits=getattr(args, "top", 500))
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(
@@ -449,7 +467,7 @@ def cmd_semver(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     report = analyze_semver(repo)
     if args.json:
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
     print(report.to_markdown())
     _print_info(
@@ -472,7 +490,7 @@ def cmd_modules(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     graph = generate_module_graph(repo)
     if args.json:
-        print(json.dumps(graph.to_dict(), indent=2))
+        _emit_json(graph.to_dict())
         return 0
     if getattr(args, "ascii", False):
         print(graph.to_ascii())
@@ -499,13 +517,23 @@ def cmd_trends(args) -> int:
     _print_header("Historical Trend Data")
     repo = _repo(getattr(args, "repo", None))
     td = generate_trend_data(repo)
+    window = dict(
+        start=getattr(args, "start", None),
+        end=getattr(args, "end", None),
+        points=getattr(args, "points", None),
+    )
+    try:
+        data = td.to_dict(**window)
+    except ValueError as exc:
+        _print_warn(str(exc))
+        return 1
     if args.json:
-        print(json.dumps(td.to_dict(), indent=2))
+        _emit_json(data)
         return 0
     if getattr(args, "write", False):
         out = repo / "docs" / "trend_data.json"
         out.parent.mkdir(exist_ok=True)
-        out.write_text(json.dumps(td.to_dict(), indent=2), encoding="utf-8")
+        out.write_text(json.dumps(data, indent=2), encoding="utf-8")
         _print_ok(f"Written to {out}")
         return 0
     print(td.to_markdown())
@@ -528,7 +556,7 @@ def cmd_plan(args) -> int:
         session_number=args.session,
     )
     if args.json:
-        print(json.dumps(plan.to_dict(), indent=2, default=str))
+        _emit_json(plan.to_dict(), default=str)
         return 0
     print(plan.to_markdown())
     return 0
@@ -552,7 +580,7 @@ def cmd_triage(args) -> int:
     issues = load_issues(issues_path)
     triaged = triage_issues(issues)
     if args.json:
-        print(json.dumps([t.to_dict() for t in triaged], indent=2, default=str))
+        _emit_json([t.to_dict() for t in triaged], default=str)
         return 0
     print(render_triage_report(triaged))
     return 0
@@ -575,7 +603,7 @@ def cmd_depgraph(args) -> int:
         _print_ok(f"Written to {out} (+ JSON sidecar)")
         return 0
     if args.json:
-        print(json.dumps(graph.to_dict(), indent=2, default=str))
+        _emit_json(graph.to_dict(), default=str)
         return 0
     print(render_dep_graph(graph))
     cycles = graph.find_cycles()
@@ -5,15 +5,13 @@ This is a thin wrapper around :mod:`src.docstring_gen`.
 
 from __future__ import annotations
 
-import json
-
 from src.docstring_gen import (
     scan_missing_docstrings,
     apply_docstrings,
     save_docstring_report,
     render_markdown,
 )
-from src.commands import _repo, _print_header, _print_ok, _print_warn, _print_info
+from src.commands import _repo, _emit_json, _jobs, _print_header, _print_ok, _print_warn, _print_info
 
 
 def cmd_docstrings(args) -> int:
@@ -21,7 +19,7 @@ def cmd_docstrings(args) -> int:
     repo = _repo(getattr(args, "repo", None))
     _print_header("Docstring Generator")
 
-    report = scan_missing_docstrings(repo)
+    report = scan_missing_docstrings(repo, jobs=_jobs(args, repo))
 
     if getattr(args, "apply", False) or getattr(args, "dry_run", False):
         dry = getattr(args, "dry_run", False)
@@ -33,7 +31,7 @@ def cmd_docstrings(args) -> int:
             _print_ok("No files to modify.")
 
     if getattr(args, "json", False):
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
         return 0
 
     if getattr(args, "write", False):
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import json
 import re
-import subprocess
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
@@ -185,27 +184,12 @@ def _score_commit(record: CommitRecord) -> None:
 
 
 def _git_log(repo_root: Path, max_count: int = 500) -> list[CommitRecord]:
-    sep = "\x1f"
-    fmt = f"{sep}%H{sep}%s{sep}%b{sep}%an{sep}%ai"
-    try:
-        result = subprocess.run(
-            ["git", "log", f"--max-count={max_count}", f"--format={fmt}"],
-            capture_output=True, text=True, cwd=str(repo_root), timeout=30,
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return []
-    if result.returncode != 0:
-        return []
+    from src.git_log import iter_commits
+
     records: list[CommitRecord] = []
-    raw_entries = result.stdout.split(sep)[1:]
-    it = iter(raw_entries)
-    for sha, subject, body, author, date in zip(it, it, it, it, it):
-        sha = sha.strip()
-        subject = subject.strip()
-        if not sha:
-            continue
-        is_ns = any(re.search(p, subject + " " + body.strip(), re.I) for p in NS_PATTERNS)
-        records.append(CommitRecord(sha=sha, subject=subject, body=body.strip(), author=author.strip(), date=date.strip()[:10], is_awake=is_ns))
+    for c in iter_commits(repo_root, max_count=max_count):
+        is_ns = any(re.search(p, c.subject + " " + c.body, re.I) for p in NS_PATTERNS)
+        records.append(CommitRecord(sha=c.sha, subject=c.subject, body=c.body, author=c.author, date=c.date[:10], is_awake=is_ns))
     return records
 
 
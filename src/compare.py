@@ -19,6 +19,8 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+from src.session_index import SessionIndex, load_session_index
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -159,14 +161,18 @@ class SessionComparison:
 
 def _extract_session(log_content: str, session_number: int) -> Optional[SessionSnapshot]:
     """Extract a SessionSnapshot for the given session number from log content."""
-    # Split into session blocks
-    blocks = re.split(r"(?=^## Session \d+)", log_content, flags=re.MULTILINE)
-    for block in blocks:
+    return _snapshot_from_index(SessionIndex.from_text(log_content), session_number)
+
+
+def _snapshot_from_index(index: SessionIndex, session_number: int) -> Optional[SessionSnapshot]:
+    """Extract a SessionSnapshot for *session_number* from an indexed log."""
+    for entry in index:
+        if entry.number != session_number:
+            continue
+        block = index.section(entry)
         header = re.match(r"## Session (\d+)\s*[\u2014-]\s*(.+?)$", block, flags=re.MULTILINE)
         if not header:
             continue
-        if int(header.group(1)) != session_number:
-            continue
 
         date = header.group(2).strip()
         snap = SessionSnapshot(session_number=session_number, date=date)
@@ -226,15 +232,12 @@ def compare_sessions(
     Returns:
         SessionComparison with deltas and side-by-side metrics.
     """
-    if log_path.exists():
-        content = log_path.read_text(encoding="utf-8")
-    else:
-        content = ""
+    index = load_session_index(log_path)
 
-    snap_a = _extract_session(content, session_a) or SessionSnapshot(
+    snap_a = _snapshot_from_index(index, session_a) or SessionSnapshot(
         session_number=session_a, date="not found"
     )
-    snap_b = _extract_session(content, session_b) or SessionSnapshot(
+    snap_b = _snapshot_from_index(index, session_b) or SessionSnapshot(
         session_number=session_b, date="not found"
     )
 
@@ -37,6 +37,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import AstPass, register_pass
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -46,6 +48,9 @@ from typing import Optional
 _HIGH_THRESHOLD = 15
 _MEDIUM_THRESHOLD = 6
 
+#: Bump whenever _analyse_tree's output changes so stale cache entries are ignored.
+_CACHE_VERSION = "1"
+
 #: Node types that each add 1 to complexity
 _DECISION_NODES = (
     ast.If,
@@ -233,80 +238,76 @@ class ComplexityReport:
 # ---------------------------------------------------------------------------
 
 
-class _ComplexityVisitor(ast.NodeVisitor):
-    """Compute cyclomatic complexity for a single function node.
+class _ComplexityVisitor(AstPass):
+    """Compute cyclomatic complexity for every function in a module.
 
-    Intended to be used on the *body statements* of a function, not on the
-    function node itself.  Any nested ``FunctionDef`` / ``AsyncFunctionDef``
-    encountered during traversal is skipped so that inner functions do not
-    inflate the outer function's score.
+    Runs as an :class:`~src._ast_utils.AstPass`, so it can share a single
+    traversal with other analyzers.  A stack of enclosing scopes is kept so
+    each decision point is credited only to its innermost function: nodes
+    inside a nested ``def`` count toward that inner function, and nodes
+    directly inside a nested ``class`` body (outside any method) count toward
+    nothing, matching the old per-function visitor that skipped both.
 
     Boolean operators are weighted by the number of operands minus 1, since
     each additional operand introduces one more branch.
+
+    After the walk, :attr:`functions` holds ``(name, lineno, complexity)``
+    tuples in source (pre-order) order.
     """
 
     def __init__(self) -> None:
-        # Start at 1 (the single entry path through the function)
-        self.complexity: int = 1
-
-    def _count(self, node: ast.AST) -> None:
-        """Increment complexity and recurse into children."""
-        self.complexity += 1
-        self.generic_visit(node)
-
-    # --- decision-point nodes ---
-
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802
-        """Count the ``if`` branch; elif chains are nested If nodes."""
-        self._count(node)
-
-    def visit_For(self, node: ast.For) -> None:  # noqa: N802
-        """Count a ``for`` loop."""
-        self._count(node)
-
-    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:  # noqa: N802
-        """Count an ``async for`` loop."""
-        self._count(node)
-
-    def visit_While(self, node: ast.While) -> None:  # noqa: N802
-        """Count a ``while`` loop."""
-        self._count(node)
+        self.functions: list[tuple[str, int, int]] = []
+        # Each frame is the index into self.functions, or None for a class.
+        self._scopes: list[Optional[int]] = []
+        self._scores: list[int] = []
 
-    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:  # noqa: N802
-        """Count each ``except`` clause."""
-        self._count(node)
+    def _count(self, node: ast.AST, weight: int = 1) -> None:
+        """Credit *weight* to the innermost function, if any."""
+        if self._scopes and self._scopes[-1] is not None:
+            self._scores[self._scopes[-1]] += weight
 
-    def visit_With(self, node: ast.With) -> None:  # noqa: N802
-        """Count a ``with`` statement."""
-        self._count(node)
+    # --- scopes ---
 
-    def visit_AsyncWith(self, node: ast.AsyncWith) -> None:  # noqa: N802
-        """Count an ``async with`` statement."""
-        self._count(node)
-
-    def visit_Assert(self, node: ast.Assert) -> None:  # noqa: N802
-        """Count an ``assert`` statement."""
-        self._count(node)
-
-    def visit_ListComp(self, node: ast.ListComp) -> None:  # noqa: N802
-        """Count a list comprehension."""
-        self._count(node)
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Open a new function scope starting at complexity 1."""
+        self._scopes.append(len(self._scores))
+        # Start at 1 (the single entry path through the function)
+        self._scores.append(1)
+        self.functions.append((node.name, node.lineno, 1))
 
-    def visit_DictComp(self, node: ast.DictComp) -> None:  # noqa: N802
-        """Count a dict comprehension."""
-        self._count(node)
+    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
 
-    def visit_SetComp(self, node: ast.SetComp) -> None:  # noqa: N802
-        """Count a set comprehension."""
-        self._count(node)
+    def leave_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Close the function scope and record its final score."""
+        idx = self._scopes.pop()
+        name, lineno, _ = self.functions[idx]
+        self.functions[idx] = (name, lineno, self._scores[idx])
 
-    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:  # noqa: N802
-        """Count a generator expression."""
-        self._count(node)
+    leave_AsyncFunctionDef = leave_FunctionDef  # type: ignore[assignment]
 
-    def visit_IfExp(self, node: ast.IfExp) -> None:  # noqa: N802
-        """Count a ternary expression (``x if cond else y``)."""
-        self._count(node)
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        """Class bodies are not part of any enclosing function's score."""
+        self._scopes.append(None)
+
+    def leave_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        """Close the class scope."""
+        self._scopes.pop()
+
+    # --- decision-point nodes (elif chains are nested If nodes) ---
+
+    visit_If = _count
+    visit_For = _count
+    visit_AsyncFor = _count
+    visit_While = _count
+    visit_ExceptHandler = _count
+    visit_With = _count
+    visit_AsyncWith = _count
+    visit_Assert = _count
+    visit_ListComp = _count
+    visit_DictComp = _count
+    visit_SetComp = _count
+    visit_GeneratorExp = _count
+    visit_IfExp = _count
 
     def visit_BoolOp(self, node: ast.BoolOp) -> None:  # noqa: N802
         """Count each additional boolean operand as a branch.
@@ -314,30 +315,10 @@ class _ComplexityVisitor(ast.NodeVisitor):
         ``a and b`` → +1 (two operands, one extra branch)
         ``a and b and c`` → +2
         """
-        # Each additional operand beyond the first adds a branch
-        self.complexity += len(node.values) - 1
-        self.generic_visit(node)
+        self._count(node, len(node.values) - 1)
 
-    # --- nested function / class definitions are NOT counted in the outer scope ---
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
-        """Skip nested function definitions entirely.
-
-        Nested functions are analysed independently by :func:`_analyse_tree`;
-        their decision points must not be counted toward the outer function.
-        """
-        # Do NOT call generic_visit — stop traversal into this sub-tree.
-        pass
-
-    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        """Skip nested class definitions entirely.
-
-        Methods defined inside nested classes are collected by the top-level
-        ``ast.walk`` in :func:`_analyse_tree` and analysed independently.
-        """
-        pass
+register_pass("complexity", _ComplexityVisitor)
 
 
 # ---------------------------------------------------------------------------
@@ -366,10 +347,9 @@ def _analyse_tree(
 ) -> list[FunctionComplexity]:
     """Extract per-function complexity records from a parsed module AST.
 
-    Walks the top-level AST to find all ``FunctionDef`` and
-    ``AsyncFunctionDef`` nodes (including methods inside classes).
-    For each, a dedicated :class:`_ComplexityVisitor` computes complexity
-    so that nested functions/classes do not inflate the outer score.
+    Runs :class:`_ComplexityVisitor` once over the whole tree to score every
+    ``FunctionDef`` and ``AsyncFunctionDef`` (including methods inside
+    classes); nested functions/classes do not inflate the outer score.
 
     Args:
         tree: Parsed AST of a Python source file.
@@ -378,30 +358,26 @@ def _analyse_tree(
     Returns:
         List of :class:`FunctionComplexity` entries, one per function.
     """
-    entries: list[FunctionComplexity] = []
+    visitor = _ComplexityVisitor()
+    visitor.visit(tree)
+    return _entries_from_pass(visitor, rel_path)
 
-    for node in ast.walk(tree):
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            continue
 
-        visitor = _ComplexityVisitor()
-        # We visit the body of the function, not the function node itself
-        # so that the outermost visit_FunctionDef guard works correctly.
-        for child in ast.iter_child_nodes(node):
-            visitor.visit(child)
-
-        complexity = visitor.complexity
-        entries.append(
-            FunctionComplexity(
-                function=node.name,
-                file=rel_path,
-                line=node.lineno,
-                complexity=complexity,
-                rank=_rank(complexity),
-            )
+def _entries_from_pass(
+    visitor: _ComplexityVisitor,
+    rel_path: str,
+) -> list[FunctionComplexity]:
+    """Convert a finished :class:`_ComplexityVisitor` into result records."""
+    return [
+        FunctionComplexity(
+            function=name,
+            file=rel_path,
+            line=lineno,
+            complexity=complexity,
+            rank=_rank(complexity),
         )
-
-    return entries
+        for name, lineno, complexity in visitor.functions
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -409,7 +385,51 @@ def _analyse_tree(
 # ---------------------------------------------------------------------------
 
 
-def analyze_complexity(repo_path: Optional[Path] = None) -> ComplexityReport:
+def _analyse_file(
+    py_file: Path,
+    rel_path: str,
+    cache=None,
+) -> Optional[list[FunctionComplexity]]:
+    """Return complexity entries for *py_file*, or ``None`` if it fails to parse.
+
+    When *cache* is given the entries are looked up by content digest before
+    parsing and stored after a miss.
+    """
+    from src._ast_utils import load_source, pass_result
+
+    digest = cache.digest(py_file) if cache is not None else None
+    if digest is not None:
+        payload = cache.get(digest)
+        if payload is not None:
+            if not payload["ok"]:
+                return None
+            return [
+                FunctionComplexity(file=rel_path, **entry)
+                for entry in payload["entries"]
+            ]
+
+    parsed = load_source(py_file)
+    entries: Optional[list[FunctionComplexity]] = None
+    if parsed is not None and parsed.tree is not None:
+        entries = _entries_from_pass(pass_result(parsed, "complexity"), rel_path)
+    if digest is not None:
+        cache.put(digest, {
+            "ok": entries is not None,
+            "entries": [
+                {k: v for k, v in e.to_dict().items() if k != "file"}
+                for e in entries or []
+            ],
+        })
+    return entries
+
+
+def analyze_complexity(
+    repo_path: Optional[Path] = None,
+    *,
+    cache: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
+) -> ComplexityReport:
     """Compute cyclomatic complexity for every function in ``src/``.
 
     Scans all ``*.py`` files under ``<repo_path>/src/`` (recursively),
@@ -423,6 +443,15 @@ def analyze_complexity(repo_path: Optional[Path] = None) -> ComplexityReport:
             Root of the repository.  Defaults to the parent of the directory
             containing this module (i.e. the repository root when installed
             normally).
+        cache:
+            Reuse per-file results from ``<repo_path>/.awake/cache`` while the
+            file content is unchanged.
+        jobs:
+            Worker processes for per-file analysis (0 = all CPUs).  Results
+            are merged in path order, identical to the serial run.
+        incremental:
+            Re-parse only files git reports changed since the last
+            incremental run (see :mod:`src.incremental`); implies *cache*.
 
     Returns:
         :class:`ComplexityReport` with all per-function results and
@@ -442,15 +471,26 @@ def analyze_complexity(repo_path: Optional[Path] = None) -> ComplexityReport:
     parsed_count = 0
 
     all_results: list[FunctionComplexity] = []
+    store = None
+    if cache or incremental:
+        from src.analysis_cache import open_cache
+        store = open_cache(
+            repo_path, "complexity", _CACHE_VERSION, incremental=incremental
+        )
+
+    from src._parallel import map_files
 
-    for py_file in py_files:
-        tree = _parse_file(py_file)
-        if tree is None:
+    rel_paths = [str(f.relative_to(repo_path)) for f in py_files]
+    per_file = map_files(
+        _analyse_file, py_files, rel_paths, [store] * len(py_files), jobs=jobs
+    )
+    for entries in per_file:
+        if entries is None:
             continue
         parsed_count += 1
-        rel_path = str(py_file.relative_to(repo_path))
-        entries = _analyse_tree(tree, rel_path)
         all_results.extend(entries)
+    if incremental:
+        store.record_run(py_files)
 
     # Sort by descending complexity, then file, then line for stable ordering
     all_results.sort(key=lambda r: (-r.complexity, r.file, r.line))
@@ -80,6 +80,17 @@ class SessionConfig:
         return asdict(self)
 
 
+@dataclass
+class PerformanceConfig:
+    """Settings that trade resources for speed."""
+
+    jobs: int = 1                       # Worker processes for per-file analysis (0 = all CPUs)
+
+    def to_dict(self) -> dict:
+        """Return a dictionary representation of the performance config"""
+        return asdict(self)
+
+
 @dataclass
 class AwakeConfig:
     """Top-level Awake configuration object.
@@ -90,6 +101,7 @@ class AwakeConfig:
     thresholds: ThresholdsConfig = field(default_factory=ThresholdsConfig)
     output: OutputConfig = field(default_factory=OutputConfig)
     session: SessionConfig = field(default_factory=SessionConfig)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
     _source: Optional[str] = field(default=None, repr=False)
 
     # ------------------------------------------------------------------
@@ -102,6 +114,7 @@ class AwakeConfig:
             "thresholds": self.thresholds.to_dict(),
             "output": self.output.to_dict(),
             "session": self.session.to_dict(),
+            "performance": self.performance.to_dict(),
         }
 
     def to_markdown(self) -> str:
@@ -140,6 +153,17 @@ class AwakeConfig:
             label = k.replace("_", " ").title()
             lines.append(f"| {label} | {v} |")
 
+        lines += [
+            "",
+            "## Performance",
+            "",
+            "| Setting | Value |",
+            "|---------|-------|",
+        ]
+        for k, v in self.performance.to_dict().items():
+            label = k.replace("_", " ").title()
+            lines.append(f"| {label} | {v} |")
+
         lines += ["", "---", ""]
         return "\n".join(lines)
 
@@ -188,7 +212,19 @@ class AwakeConfig:
                 if k in SessionConfig.__dataclass_fields__  # type: ignore[attr-defined]
             }
         )
-        return cls(thresholds=thresholds, output=output, session=session)
+        performance = PerformanceConfig(
+            **{
+                k: v
+                for k, v in data.get("performance", {}).items()
+                if k in PerformanceConfig.__dataclass_fields__  # type: ignore[attr-defined]
+            }
+        )
+        return cls(
+            thresholds=thresholds,
+            output=output,
+            session=session,
+            performance=performance,
+        )
 
 
 # ---------------------------------------------------------------------------
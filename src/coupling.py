@@ -40,7 +40,6 @@ CLI
 
 from __future__ import annotations
 
-import ast
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -112,11 +111,15 @@ class CouplingReport:
         Absolute path to the repository root that was analysed.
     files_scanned:
         Total number of ``src/`` Python files parsed.
+    components:
+        Strongly connected groups of more than one module (import cycles),
+        dependencies first.
     """
 
     modules: list[ModuleCoupling] = field(default_factory=list)
     repo_path: str = ""
     files_scanned: int = 0
+    components: list[list[str]] = field(default_factory=list)
 
     # ---------------------------------------------------------------------------
     # Aggregate properties
@@ -159,6 +162,7 @@ class CouplingReport:
             "medium_count": self.medium_count,
             "low_count": self.low_count,
             "modules": [m.to_dict() for m in self.modules],
+            "components": self.components,
         }
 
     def to_json(self) -> str:
@@ -174,6 +178,7 @@ class CouplingReport:
         2. Per-module table sorted by instability descending (most unstable
            modules first), then alphabetically by module name.
         3. Detailed dependency listings for HIGH-ranked modules.
+        4. Strongly connected module groups, if any.
         """
         lines: list[str] = []
 
@@ -232,35 +237,14 @@ class CouplingReport:
                     )
                 lines.append("")
 
-        return "\n".join(lines)
-
-
-# ---------------------------------------------------------------------------
-# AST import collector
-# ---------------------------------------------------------------------------
-
-
-class _ImportCollector(ast.NodeVisitor):
-    """Collect all module names referenced in ``import`` / ``from … import`` statements.
-
-    Only top-level module names are stored (e.g. ``from src.health import X``
-    yields ``"src.health"`` and ``import os.path`` yields ``"os"``).
-    """
+        if self.components:
+            lines.append("## Strongly Connected Components\n")
+            lines.append("Modules in one group import each other, directly or in a cycle.\n")
+            for component in self.components:
+                lines.append(f"- {', '.join(f'`{c}`' for c in component)}")
+            lines.append("")
 
-    def __init__(self) -> None:
-        self.imports: list[str] = []
-
-    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
-        """Record each name from a bare ``import`` statement."""
-        for alias in node.names:
-            self.imports.append(alias.name)
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
-        """Record the module name from a ``from … import`` statement."""
-        if node.module:
-            self.imports.append(node.module)
-        self.generic_visit(node)
+        return "\n".join(lines)
 
 
 # ---------------------------------------------------------------------------
@@ -268,12 +252,6 @@ class _ImportCollector(ast.NodeVisitor):
 # ---------------------------------------------------------------------------
 
 
-def _parse_file(py_file: Path) -> Optional[ast.Module]:
-    """Parse *py_file* and return its AST, or ``None`` on syntax error."""
-    from src._ast_utils import parse_file
-    return parse_file(py_file)
-
-
 def _rank(instability: float, ce: int) -> str:
     """Compute the coupling rank string from instability and efferent count.
 
@@ -312,33 +290,48 @@ def _instability(ca: int, ce: int) -> float:
 # ---------------------------------------------------------------------------
 
 
-def analyze_coupling(repo_path: Optional[Path] = None) -> CouplingReport:
+def analyze_coupling(
+    repo_path: Optional[Path] = None,
+    *,
+    cache: bool = False,
+    incremental: bool = False,
+    graph=None,
+) -> CouplingReport:
     """Analyze module coupling across all ``src/`` Python files.
 
     Algorithm
     ---------
-    1. Enumerate every ``*.py`` file under ``<repo_path>/src/`` (non-recursive
-       for the top-level ``src/`` directory, matching the pattern used by
-       ``dead_code.py``; sub-packages such as ``src/commands/`` are also
-       included via recursive glob so their coupling is tracked).
-    2. Build a mapping from *module name* (file stem, or ``commands.analysis``
-       style dotted name for sub-packages) to its ``Path``.
-    3. Parse each file with ``ast`` and collect all import statements.
-    4. For each import, check whether the imported module path matches a known
-       ``src/`` module; if so, record the dependency edge.
-    5. Compute Ca, Ce, instability, and rank for every module.
+    1. Build the shared import graph (:func:`src._graph.build_import_graph`)
+       over every ``*.py`` file under ``<repo_path>/src/``, sub-packages such
+       as ``src/commands/`` included.  Module keys are file stems, or
+       ``commands.analysis`` style dotted names for sub-packages.
+    2. Ce is a module's out-degree in that graph, Ca its in-degree.
+    3. Compute instability and rank for every module.
+    4. Record the graph's strongly connected components of more than one
+       module.
 
     Parameters
     ----------
     repo_path:
         Root of the repository.  Defaults to the parent of this file's
         directory (i.e. the project root when installed normally).
+    cache:
+        Reuse per-file import lists from ``<repo_path>/.awake/cache`` while
+        the file content is unchanged.
+    incremental:
+        Re-parse only files git reports changed since the last incremental
+        run (see :mod:`src.incremental`); implies *cache*.
+    graph:
+        A prebuilt import graph to reuse (e.g. from
+        :attr:`src.analysis_context.AnalysisContext.import_graph`).
 
     Returns
     -------
     CouplingReport
         Populated report ready for rendering or saving.
     """
+    from src._graph import build_import_graph
+
     if repo_path is None:
         repo_path = Path(__file__).resolve().parent.parent
     repo_path = Path(repo_path)
@@ -349,97 +342,14 @@ def analyze_coupling(repo_path: Optional[Path] = None) -> CouplingReport:
     if not src_dir.exists():
         return report
 
-    # ---- Enumerate all src/ Python files ----
-    py_files: list[Path] = sorted(src_dir.rglob("*.py"))
-    # Filter out __init__ and __pycache__ artifacts
-    py_files = [
-        f for f in py_files
-        if not f.name.startswith("__")
-    ]
-    report.files_scanned = len(py_files)
-
-    if not py_files:
-        return report
-
-    # ---- Build module name → Path index ----
-    # For a file like src/health.py  → module key "health"
-    # For src/commands/analysis.py   → module key "commands.analysis"
-    # We also store the full dotted import path variants that code might use,
-    # e.g. "src.health", so we can recognise both styles.
-    module_index: dict[str, Path] = {}  # canonical key → Path
-    # Maps every recognised import string → canonical key
-    import_to_key: dict[str, str] = {}
-
-    for py_file in py_files:
-        rel = py_file.relative_to(src_dir)          # e.g. health.py or commands/analysis.py
-        parts = list(rel.with_suffix("").parts)      # e.g. ["health"] or ["commands", "analysis"]
-        canonical = ".".join(parts)                  # "health" or "commands.analysis"
-        module_index[canonical] = py_file
-
-        # Recognise several import spellings:
-        #   "health", "src.health", "commands.analysis", "src.commands.analysis"
-        import_to_key[canonical] = canonical
-        import_to_key[f"src.{canonical}"] = canonical
-        # Also bare stem for disambiguation (last segment)
-        stem = parts[-1]
-        # Only add bare stem if it doesn't conflict with an existing entry
-        if stem not in import_to_key:
-            import_to_key[stem] = canonical
-
-    # ---- Collect raw import edges: importer → set of imported canonical keys ----
-    # edges[canonical_key] = set of canonical keys this module imports
-    edges: dict[str, set[str]] = {key: set() for key in module_index}
-
-    for py_file in py_files:
-        rel = py_file.relative_to(src_dir)
-        parts = list(rel.with_suffix("").parts)
-        canonical = ".".join(parts)
-
-        tree = _parse_file(py_file)
-        if tree is None:
-            continue
-
-        collector = _ImportCollector()
-        collector.visit(tree)
-
-        for imp in collector.imports:
-            # Try the full dotted name first, then progressively shorter prefixes
-            # e.g. "src.commands.analysis" → try full, then "src.commands", then "src"
-            matched_key: Optional[str] = None
-
-            # Direct lookup
-            if imp in import_to_key:
-                matched_key = import_to_key[imp]
-            else:
-                # Try progressively stripping the rightmost segment
-                # (handles ``from src.health import generate_health_report``)
-                parts_imp = imp.split(".")
-                for length in range(len(parts_imp), 0, -1):
-                    prefix = ".".join(parts_imp[:length])
-                    if prefix in import_to_key:
-                        matched_key = import_to_key[prefix]
-                        break
-
-            if matched_key is not None and matched_key != canonical:
-                edges[canonical].add(matched_key)
-
-    # ---- Compute Ca and Ce for every module ----
-    # Ce[key] = len(edges[key])
-    # Ca[key] = number of other modules whose edge-set contains key
-    ce_map: dict[str, int] = {key: len(deps) for key, deps in edges.items()}
-    ca_map: dict[str, int] = {key: 0 for key in module_index}
-    dependents_map: dict[str, list[str]] = {key: [] for key in module_index}
-
-    for importer, deps in edges.items():
-        for dep_key in deps:
-            if dep_key in ca_map:
-                ca_map[dep_key] += 1
-                dependents_map[dep_key].append(importer)
+    if graph is None:
+        graph = build_import_graph(repo_path, cache=cache, incremental=incremental)
+    report.files_scanned = len(graph)
 
     # ---- Build ModuleCoupling records ----
-    for canonical, py_file in sorted(module_index.items()):
-        ca = ca_map[canonical]
-        ce = ce_map[canonical]
+    for canonical, py_file in graph.paths.items():
+        ca = graph.in_degree(canonical)
+        ce = graph.out_degree(canonical)
         inst = _instability(ca, ce)
         rnk = _rank(inst, ce)
         rel_file = str(py_file.relative_to(repo_path))
@@ -451,11 +361,12 @@ def analyze_coupling(repo_path: Optional[Path] = None) -> CouplingReport:
             ce=ce,
             instability=inst,
             rank=rnk,
-            dependents=sorted(dependents_map[canonical]),
-            dependencies=sorted(edges[canonical]),
+            dependents=graph.predecessors(canonical),
+            dependencies=graph.successors(canonical),
         )
         report.modules.append(mc)
 
+    report.components = [c for c in graph.strongly_connected_components() if len(c) > 1]
     return report
 
 
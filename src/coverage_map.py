@@ -32,6 +32,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import parse_file
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -248,11 +250,7 @@ def _count_test_functions(tree: ast.Module) -> int:
 
 def _parse_or_none(path: Path) -> Optional[ast.Module]:
     """Parse *path* as Python, returning None on any error."""
-    try:
-        src = path.read_text(encoding="utf-8", errors="replace")
-        return ast.parse(src, filename=str(path))
-    except (SyntaxError, OSError):
-        return None
+    return parse_file(path)
 
 
 # ---------------------------------------------------------------------------
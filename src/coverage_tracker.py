@@ -1,9 +1,9 @@
 """Coverage tracker for Awake.
 
 Runs pytest with --cov and parses coverage output to track test coverage
-percentage over time. Stores per-session snapshots in a lightweight JSON
-file (docs/coverage_history.json) and renders trend data as Markdown for
-embedding in reports or AWAKE_LOG.md.
+percentage over time. Stores per-session snapshots in the metrics database
+(docs/metrics.db, see src/metrics_store.py) or an explicit JSON history file,
+and renders trend data as Markdown for embedding in reports or AWAKE_LOG.md.
 
 Coverage is collected via pytest-cov (already installed as a dev dependency).
 The module is intentionally subprocess-based so it works with any test runner
@@ -200,8 +200,12 @@ def parse_coverage_output(output: str) -> dict:
     return result
 
 
-def load_coverage_history(history_path: Path) -> CoverageHistory:
-    """Load coverage history from a JSON file."""
+def load_coverage_history(history_path) -> CoverageHistory:
+    """Load coverage history from a JSON file or a metrics store."""
+    from src.metrics_store import MetricsStore
+
+    if isinstance(history_path, MetricsStore):
+        return CoverageHistory.from_dict({"snapshots": history_path.coverage_snapshots()})
     if not history_path.exists():
         return CoverageHistory()
     try:
@@ -232,14 +236,13 @@ def record_coverage(
     Args:
         session: Current session number.
         repo_path: Path to the git repository root. Defaults to CWD.
-        history_path: Path to save the JSON history file.
+        history_path: JSON history file to use instead of docs/metrics.db.
         timestamp: Override timestamp for the snapshot.
 
     Returns:
         The newly created CoverageSnapshot.
     """
     root = repo_path or Path.cwd()
-    hp = history_path or (root / "docs" / "coverage_history.json")
     ts = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     output = run_coverage(root)
@@ -255,8 +258,15 @@ def record_coverage(
         missing_lines=parsed["missing_lines"],
     )
 
-    history = load_coverage_history(hp)
+    if history_path is None:
+        from src.metrics_store import open_metrics_store
+
+        with open_metrics_store(root) as store:
+            store.upsert_coverage_snapshot(snapshot.to_dict())
+        return snapshot
+
+    history = load_coverage_history(history_path)
     history.append(snapshot)
-    save_coverage_history(history, hp)
+    save_coverage_history(history, history_path)
 
     return snapshot
@@ -109,18 +109,24 @@ class DashboardData:
 # ---------------------------------------------------------------------------
 
 
-def build_dashboard(repo_path: Optional[Path] = None) -> DashboardData:
+def build_dashboard(repo_path: Optional[Path] = None, context=None) -> DashboardData:
     """Collect data from all available Awake modules and build DashboardData.
 
     Gracefully skips any module that fails to load or produces no data.
 
     Args:
         repo_path: Repository root. Defaults to CWD.
+        context: Optional :class:`src.analysis_context.AnalysisContext` whose
+            reports are reused instead of recomputed.  Defaults to the
+            process-wide context for *repo_path*.
 
     Returns:
         DashboardData ready for rendering.
     """
+    from src.analysis_context import shared_context
+
     repo = repo_path or Path.cwd()
+    ctx = context if context is not None else shared_context(repo)
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     dash = DashboardData(
         generated_at=ts,
@@ -129,8 +135,7 @@ def build_dashboard(repo_path: Optional[Path] = None) -> DashboardData:
 
     # --- Health panel ---
     try:
-        from src.health import generate_health_report
-        rpt = generate_health_report(repo_path=repo)
+        rpt = ctx.health
         panel = DashboardPanel(title="Code Health")
         panel.items = [
             ("Score", f"{rpt.overall_health_score}/100"),
@@ -148,9 +153,7 @@ def build_dashboard(repo_path: Optional[Path] = None) -> DashboardData:
 
     # --- Stats panel ---
     try:
-        from src.stats import compute_stats
-        log_path = repo / "AWAKE_LOG.md"
-        stats = compute_stats(repo_path=repo, log_path=log_path)
+        stats = ctx.repo_stats
         panel = DashboardPanel(title="Repository Stats")
         panel.items = [
             ("Nights active", str(stats.nights_active)),
@@ -183,9 +186,7 @@ def build_dashboard(repo_path: Optional[Path] = None) -> DashboardData:
 
     # --- Session summary panel ---
     try:
-        from src.stats import parse_awake_log
-        log_path = repo / "AWAKE_LOG.md"
-        sessions = parse_awake_log(log_path)
+        sessions = ctx.sessions
         panel = DashboardPanel(title="Session Summary")
         if sessions:
             latest = sessions[-1]
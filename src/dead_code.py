@@ -1,8 +1,9 @@
 """Dead code detector for Awake.
 
-Scans all Python files in src/ using AST analysis to find:
-- Functions that are defined but never called anywhere in the src/ tree
-- Classes that are defined but never instantiated or subclassed
+Scans all Python files in src/ using the symbol index
+(:mod:`src.symbol_index`) to find:
+- Functions whose qualified name is never referenced in src/ or tests/
+- Classes that are never instantiated, subclassed or otherwise referenced
 - Imports that are brought in but never referenced in the same file
 
 Results are ranked by confidence (HIGH / MEDIUM / LOW) and can be
@@ -22,7 +23,6 @@ CLI
 
 from __future__ import annotations
 
-import ast
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -150,108 +150,74 @@ class DeadCodeReport:
         return json.dumps(self.to_dict(), indent=2)
 
 
-# ---------------------------------------------------------------------------
-# AST collectors
-# ---------------------------------------------------------------------------
-
-
-class _NameCollector(ast.NodeVisitor):
-    """Collect every Name/Attribute reference used in a module."""
-
-    def __init__(self) -> None:
-        self.used: set[str] = set()
-
-    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
-        """Record a Name node reference as used"""
-        self.used.add(node.id)
-        self.generic_visit(node)
-
-    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
-        """Record an Attribute node reference as used"""
-        self.used.add(node.attr)
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
-        """Visit a Call node and recurse into its children"""
-        self.generic_visit(node)
-
-
-class _DefCollector(ast.NodeVisitor):
-    """Collect top-level function/class definitions and imports in a module."""
-
-    def __init__(self) -> None:
-        self.functions: list[tuple[str, int]] = []   # (name, lineno)
-        self.classes: list[tuple[str, int]] = []
-        self.imports: list[tuple[str, int]] = []     # (alias, lineno)
-        self._depth = 0
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
-        """Record a top-level function definition and recurse"""
-        if self._depth == 0:
-            self.functions.append((node.name, node.lineno))
-        self._depth += 1
-        self.generic_visit(node)
-        self._depth -= 1
-
-    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        """Record a top-level class definition and recurse"""
-        if self._depth == 0:
-            self.classes.append((node.name, node.lineno))
-        self._depth += 1
-        self.generic_visit(node)
-        self._depth -= 1
-
-    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
-        """Record imported names from an import statement"""
-        for alias in node.names:
-            local_name = alias.asname or alias.name.split(".")[0]
-            self.imports.append((local_name, node.lineno))
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
-        """Record imported names from a from-import statement"""
-        for alias in node.names:
-            if alias.name == "*":
-                continue
-            local_name = alias.asname or alias.name
-            self.imports.append((local_name, node.lineno))
-        self.generic_visit(node)
-
-
 # ---------------------------------------------------------------------------
 # Core analysis
 # ---------------------------------------------------------------------------
 
 
-def _parse_file(py_file: Path) -> Optional[ast.Module]:
-    """Parse *py_file* and return its AST, or None on syntax error."""
-    from src._ast_utils import parse_file
-    return parse_file(py_file)
+_SKIP_NAMES = {"main", "setup", "teardown"}
 
 
-def find_dead_code(repo_path: Optional[Path] = None) -> DeadCodeReport:
+def _live_references(index, definition) -> list:
+    """Return the references that keep *definition* alive.
+
+    Resolved references from outside its own body count (a dotted string
+    literal naming it resolves like any other reference), plus bare names in
+    files that star-import, where names cannot be resolved.  A bare string
+    literal naming it (an ``__all__`` entry, a registry key) counts only in
+    its own module or in a module that imports that module.
+    """
+    refs = [r for r in index.references_to(definition.qualname) if not definition.contains(r)]
+    module = index.payload(definition.file)["module"]
+    importers: Optional[set[str]] = None
+    for ref in index.unresolved(definition.name):
+        payload = index.payload(ref.file) or {}
+        if ref.kind == "name" and payload.get("star"):
+            refs.append(ref)
+        elif ref.kind == "string":
+            if importers is None:
+                importers = {r.file for r in index.references_to(module) if r.kind == "import"}
+            if ref.file == definition.file or ref.file in importers:
+                refs.append(ref)
+    return refs
+
+
+def find_dead_code(
+    repo_path: Optional[Path] = None,
+    *,
+    cache: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
+) -> DeadCodeReport:
     """Find dead-code candidates across all src/ Python files.
 
     Strategy
     --------
-    1. Parse every ``src/*.py`` file and collect all defined names and all
-       *used* names.
-    2. Build a global ``used`` set from **all** files combined (so a function
-       used only in cli.py is not flagged as dead just because it is defined
-       in another module).
-    3. Definitions whose name never appears anywhere in the global used-names
-       set are HIGH confidence candidates.
-    4. Dunder names (``__init__``, ``__str__``, …), ``main``, and names
-       prefixed with ``_`` are excluded from function/class candidates to
-       reduce false positives.
+    1. Build the symbol index (:mod:`src.symbol_index`) over ``src/`` and
+       ``tests/``: qualified definitions plus every reference resolved
+       through the importing file's bindings.
+    2. A top-level function or class in ``src/*.py`` is live if something
+       outside its own body references its qualified name, a star-importing
+       file uses the bare name, or a string literal names it in its own
+       module or in a module importing that module.
+    3. Definitions with no live reference are HIGH confidence candidates.
+       Those referenced only from ``tests/``, or matched only by attribute
+       name on an object whose type is unknown, are LOW confidence.
+    4. ``main``, ``setup``, ``teardown`` and names prefixed with ``_`` are
+       excluded from function/class candidates to reduce false positives.
     5. Imports whose local alias is not used within the *same* file are
        flagged with MEDIUM confidence.
 
-    Note: This is intentionally conservative.  We do not flag anything used
-    via ``getattr`` or dynamic dispatch.
+    Note: This is intentionally conservative.  We do not flag methods, which
+    are usually reached through instances whose type is not tracked.
+
+    With ``cache=True`` or ``incremental=True`` the index is persisted under
+    ``<repo_path>/.awake/index`` and only files whose content changed since
+    the last run are parsed again; ``jobs > 1`` parses them in that many
+    worker processes.
     """
+    from src.symbol_index import build_symbol_index
+
     if repo_path is None:
         repo_path = Path(__file__).resolve().parent.parent
     repo_path = Path(repo_path)
@@ -268,67 +234,53 @@ def find_dead_code(repo_path: Optional[Path] = None) -> DeadCodeReport:
     )
     report.files_scanned = len(py_files)
 
-    # ---- Pass 1: collect defs and uses per file ----
-    per_file_defs: dict[Path, _DefCollector] = {}
-    per_file_uses: dict[Path, _NameCollector] = {}
-    global_uses: set[str] = set()
+    index = build_symbol_index(repo_path, persist=cache or incremental, jobs=jobs)
+    definitions = index.definitions
 
     for py_file in py_files:
-        tree = _parse_file(py_file)
-        if tree is None:
-            continue
-        defs = _DefCollector()
-        uses = _NameCollector()
-        defs.visit(tree)
-        uses.visit(tree)
-        per_file_defs[py_file] = defs
-        per_file_uses[py_file] = uses
-        global_uses.update(uses.used)
-
-    # ---- Pass 2: flag dead functions/classes ----
-    _SKIP_PREFIXES = ("_",)
-    _SKIP_NAMES = {"main", "setup", "teardown"}
-
-    for py_file, defs in per_file_defs.items():
         rel = str(py_file.relative_to(repo_path))
-        module_name = py_file.stem
-
-        for fname, lineno in defs.functions:
-            if fname.startswith("_") or fname in _SKIP_NAMES:
-                continue
-            if fname not in global_uses:
-                report.items.append(
-                    DeadItem(
-                        kind="function",
-                        name=f"{module_name}.{fname}",
-                        file=rel,
-                        line=lineno,
-                        confidence="HIGH",
-                        reason="Never called in any src/ file",
-                    )
-                )
+        symbols = index.payload(py_file.relative_to(repo_path).as_posix())
+        if symbols is None:
+            continue
 
-        for cname, lineno in defs.classes:
-            if cname.startswith("_"):
-                continue
-            if cname not in global_uses:
+        # ---- Functions and classes: liveness from the reference index ----
+        candidates = [d for d in (definitions[q] for q, *_ in symbols["defs"])
+                      if d.kind in ("function", "class")]
+        for kind in ("function", "class"):
+            for d in (c for c in candidates if c.kind == kind):
+                if d.name.startswith("_") or (kind == "function" and d.name in _SKIP_NAMES):
+                    continue
+                refs = _live_references(index, d)
+                if any(r.file.startswith("src/") for r in refs):
+                    continue
+                if refs:
+                    confidence, reason = "LOW", "Referenced only from tests/"
+                elif any(r.kind == "attribute" for r in index.unresolved(d.name)):
+                    confidence, reason = "LOW", "Only matched by name on an untracked object"
+                elif kind == "function":
+                    confidence, reason = "HIGH", "Never referenced in src/ or tests/"
+                else:
+                    confidence, reason = "HIGH", "Never instantiated or referenced in src/ or tests/"
                 report.items.append(
                     DeadItem(
-                        kind="class",
-                        name=f"{module_name}.{cname}",
+                        kind=kind,
+                        name=f"{py_file.stem}.{d.name}",
                         file=rel,
-                        line=lineno,
-                        confidence="HIGH",
-                        reason="Never instantiated or referenced in any src/ file",
+                        line=d.line,
+                        confidence=confidence,
+                        reason=reason,
                     )
                 )
 
-    # ---- Pass 3: flag unused imports (per-file) ----
-    for py_file, defs in per_file_defs.items():
+    # ---- Unused imports (per-file) ----
+    for py_file in py_files:
         rel = str(py_file.relative_to(repo_path))
-        local_uses = per_file_uses.get(py_file, _NameCollector()).used
+        symbols = index.payload(py_file.relative_to(repo_path).as_posix())
+        if symbols is None:
+            continue
+        local_uses = set(symbols["names"])
 
-        for alias, lineno in defs.imports:
+        for alias, _target, lineno in symbols["imports"]:
             if alias.startswith("_"):
                 continue
             if alias not in local_uses:
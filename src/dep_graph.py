@@ -4,7 +4,7 @@ Analyzes import relationships between all modules in ``src/`` and renders
 a Markdown dependency matrix plus an ASCII adjacency list.  Detects:
 
 - Which modules each file imports from within ``src/``
-- Circular dependency chains
+- Circular dependency chains (Tarjan SCC + capped cycle enumeration)
 - Most-depended-upon modules (coupling hot-spots)
 - Isolated modules (no cross-module imports)
 
@@ -25,6 +25,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source
+from src._graph import DEFAULT_CYCLE_LIMIT, Graph
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -77,52 +80,44 @@ class DepGraph:
                     counts[dep] += 1
         return counts
 
-    def find_cycles(self) -> list[list[str]]:
-        """Detect circular dependency chains using DFS.
+    def to_graph(self) -> Graph:
+        """Return the import edges as a :class:`src._graph.Graph`."""
+        return Graph(
+            (n.name for n in self.nodes),
+            ((n.name, dep) for n in self.nodes for dep in n.imports),
+        )
+
+    def find_cycles(self, limit: Optional[int] = DEFAULT_CYCLE_LIMIT) -> list[list[str]]:
+        """Detect circular dependency chains, at most *limit* of them.
 
-        Returns list of cycles (each cycle is a list of module names).
+        Tarjan's algorithm narrows the search to strongly connected module
+        groups, and Johnson's algorithm enumerates each elementary cycle in
+        them exactly once.  Returns list of cycles (each cycle is a list of
+        module names, starting and ending with its smallest name).
         """
-        adj: dict[str, list[str]] = {n.name: list(n.imports) for n in self.nodes}
-        visited: set[str] = set()
-        path: list[str] = []
-        on_path: set[str] = set()
-        cycles: list[list[str]] = []
-
-        def dfs(node: str) -> None:
-            """Traverse the graph depth-first to detect cycles"""
-            if node in on_path:
-                # Found cycle — extract it
-                idx = path.index(node)
-                cycle = path[idx:] + [node]
-                # Deduplicate
-                cycle_key = tuple(sorted(cycle[:-1]))
-                for existing in cycles:
-                    if tuple(sorted(existing[:-1])) == cycle_key:
-                        return
-                cycles.append(cycle)
-                return
-            if node in visited:
-                return
-            visited.add(node)
-            on_path.add(node)
-            path.append(node)
-            for neighbor in adj.get(node, []):
-                dfs(neighbor)
-            path.pop()
-            on_path.discard(node)
-
-        for name in adj:
-            dfs(name)
-
-        return cycles
+        return self.to_graph().find_cycles(limit)
+
+    def find_cycles_bounded(
+        self, limit: Optional[int] = DEFAULT_CYCLE_LIMIT,
+    ) -> tuple[list[list[str]], bool]:
+        """Return ``(cycles, truncated)``: :meth:`find_cycles` plus whether it stopped early."""
+        return self.to_graph().find_cycles_bounded(limit)
+
+    @property
+    def components(self) -> list[list[str]]:
+        """Strongly connected groups of more than one module, dependencies first."""
+        return [c for c in self.to_graph().strongly_connected_components() if len(c) > 1]
 
     def to_dict(self) -> dict:
         """Serialize to dict."""
+        cycles, truncated = self.find_cycles_bounded()
         return {
             "generated_at": self.generated_at,
             "modules": [n.to_dict() for n in self.nodes],
             "fan_in": self.fan_in,
-            "cycles": self.find_cycles(),
+            "components": self.components,
+            "cycles": cycles,
+            "cycles_truncated": truncated,
         }
 
 
@@ -135,12 +130,16 @@ def _parse_src_imports(source: str, known_modules: set[str]) -> list[str]:
 
     Handles both ``import src.foo`` and ``from src.foo import ...`` forms.
     """
-    imports: list[str] = []
     try:
         tree = ast.parse(source)
     except SyntaxError:
-        return imports
+        return []
+    return _imports_from_tree(tree, known_modules)
+
 
+def _imports_from_tree(tree: ast.Module, known_modules: set[str]) -> list[str]:
+    """Return src/ module names imported by an already-parsed *tree*."""
+    imports: list[str] = []
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
@@ -180,13 +179,18 @@ def build_dep_graph(src_path: Path) -> DepGraph:
 
     nodes: list[ModuleNode] = []
     for py_file in py_files:
-        source = py_file.read_text(encoding="utf-8", errors="replace")
-        imports = _parse_src_imports(source, known_modules)
+        parsed = load_source(py_file)
+        if parsed is None:
+            continue
+        imports = (
+            _imports_from_tree(parsed.tree, known_modules)
+            if parsed.tree is not None else []
+        )
         nodes.append(ModuleNode(
             name=py_file.stem,
             path=str(py_file.relative_to(src_path.parent)) if src_path.parent != src_path else str(py_file),
             imports=imports,
-            line_count=len(source.splitlines()),
+            line_count=len(parsed.lines),
         ))
 
     return DepGraph(nodes=nodes)
@@ -202,7 +206,7 @@ def render_dep_graph(graph: DepGraph) -> str:
     Includes:
     - Dependency adjacency list (who imports who)
     - Fan-in / fan-out coupling table
-    - Circular dependency warnings
+    - Strongly connected module groups and circular dependency chains
     - Isolation report
     """
     lines: list[str] = [
@@ -250,14 +254,24 @@ def render_dep_graph(graph: DepGraph) -> str:
         lines.append("")
 
     # --- Cycles ---
-    cycles = graph.find_cycles()
+    cycles, truncated = graph.find_cycles_bounded()
     lines += ["## Circular Dependencies", ""]
     if cycles:
+        components = graph.components
+        if components:
+            lines.append(f"**{len(components)} strongly connected module group(s):**")
+            lines.append("")
+            for component in components:
+                lines.append(f"- {', '.join(f'`{c}`' for c in component)}")
+            lines.append("")
         lines.append(f"⚠️  **{len(cycles)} circular dependency chain(s) detected:**")
         lines.append("")
         for cycle in cycles:
             chain = " → ".join(f"`{c}`" for c in cycle)
             lines.append(f"- {chain}")
+        if truncated:
+            lines.append("")
+            lines.append(f"*Enumeration stopped after {len(cycles)} chains.*")
     else:
         lines.append("✅ No circular dependencies detected.")
     lines.append("")
@@ -1,7 +1,8 @@
 """Session diff engine - compare any two sessions with rich delta analysis.
 
-Reads AWAKE_LOG.md and git history to produce a detailed side-by-side
-comparison of any two sessions.
+Reads the structured session journal (falling back to AWAKE_LOG.md for
+sessions it does not cover) and git history to produce a detailed
+side-by-side comparison of any two sessions.
 
 CLI
 ---
@@ -128,13 +129,39 @@ _SEED: dict[int, dict] = {
 }
 
 
+def _snapshot_from_record(record: dict) -> SessionSnapshot:
+    from src.session_journal import record_metrics
+
+    metrics = record_metrics(record)
+    return SessionSnapshot(
+        session=record["session_number"],
+        date=str(record.get("date", "")),
+        prs=metrics["prs"],
+        tests=metrics["tests"],
+        modules=metrics["modules"],
+        lines_changed=metrics["lines_changed"],
+        health_score=metrics["health_score"],
+        tasks_completed=metrics["tasks_completed"],
+        task_names=metrics["task_names"],
+        decisions=list(record.get("decisions") or []),
+        notes=str(record.get("notes", "")),
+    )
+
+
 def _parse_sessions_from_log(log_path: Path) -> dict[int, SessionSnapshot]:
+    from src.session_index import load_session_index
+    from src.session_journal import load_records
+
+    result: dict[int, SessionSnapshot] = {
+        num: _snapshot_from_record(record) for num, record in load_records(log_path).items()
+    }
     if not log_path.exists():
-        return {}
-    text = log_path.read_text(encoding="utf-8", errors="replace")
-    blocks = re.split(r"(?=## Session \d+)", text)
-    result: dict[int, SessionSnapshot] = {}
-    for block in blocks:
+        return result
+    index = load_session_index(log_path)
+    for entry in index:
+        if entry.number in result:
+            continue
+        block = index.section(entry)
         m = re.match(r"## Session (\d+) . (.+?)$", block, re.MULTILINE)
         if not m:
             continue
@@ -195,8 +222,14 @@ def _build_delta(name: str, val_a: object, val_b: object, higher_is_better: bool
 
 def compare_sessions(repo_root: Path, session_a: int, session_b: int) -> SessionDiffReport:
     """Compare two sessions and return a rich delta report."""
+    from src.session_journal import read_session
+
     log_path = repo_root / "AWAKE_LOG.md"
-    all_sessions = _parse_sessions_from_log(log_path)
+    records = {n: read_session(log_path, n) for n in (session_a, session_b)}
+    if all(records.values()):
+        all_sessions = {n: _snapshot_from_record(r) for n, r in records.items()}
+    else:
+        all_sessions = _parse_sessions_from_log(log_path)
     snap_a = all_sessions.get(session_a, SessionSnapshot(session=session_a))
     snap_b = all_sessions.get(session_b, SessionSnapshot(session=session_b))
     snap_a = _enrich_snapshot(snap_a, session_a)
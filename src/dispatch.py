@@ -0,0 +1,182 @@
+"""In-process dispatch of Awake CLI commands.
+
+The API server (and anything else that wants a command's ``--json`` result)
+used to spawn ``python -m src.cli ...`` per call, paying interpreter start-up
+and a full re-import every time.  :func:`run_command` instead parses the
+arguments with the CLI's own parser and calls the ``cmd_*`` function from
+``src/commands`` directly, so a request costs only the analysis itself — and
+nothing at all for data the analyzers already hold in their process-wide
+caches.
+
+Commands hand their ``--json`` payload to
+:func:`src.commands._emit_json`, which prints it on the command line; under
+:func:`run_command` the payload object is returned to the caller instead, so
+nothing is rendered to text and parsed back.  Stdout is left alone.  Each
+thread's stderr is captured (via a per-thread proxy, so concurrent dispatches
+never see each other's output) to explain argument errors and non-zero
+exits.
+
+Commands listed in ``SUBPROCESS_COMMANDS`` opt out and still run in a fresh
+interpreter (e.g. ``benchmark``, whose timings would be skewed by the warm
+caches of a long-lived process); their stdout must be a single JSON
+document.
+
+Public API
+----------
+- ``SUBPROCESS_COMMANDS``                 — commands that always fork
+- ``CommandError``                        — non-zero exit, bad arguments or no result
+- ``run_command(cli_args, repo_path)``    → the command's JSON payload
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+import json
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+
+#: Commands that must run in a child interpreter rather than in-process.
+SUBPROCESS_COMMANDS: frozenset[str] = frozenset({"benchmark"})
+
+
+class CommandError(RuntimeError):
+    """Raised when a dispatched command fails or produces no JSON result."""
+
+
+# ---------------------------------------------------------------------------
+# Per-thread stderr capture
+# ---------------------------------------------------------------------------
+
+
+class _ThreadLocalStream:
+    """File-like proxy that sends each capturing thread's writes to its buffer."""
+
+    def __init__(self, fallback: TextIO) -> None:
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @property
+    def _target(self) -> TextIO:
+        return getattr(self._local, "buffer", None) or self._fallback
+
+    def write(self, text: str) -> int:
+        return self._target.write(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def isatty(self) -> bool:
+        return self._target.isatty()
+
+    def __getattr__(self, name: str):
+        return getattr(self._fallback, name)
+
+
+_capture_lock = threading.Lock()
+_capture_depth = 0
+
+
+@contextmanager
+def _capture_stderr() -> Iterator[io.StringIO]:
+    """Capture this thread's stderr into a fresh buffer."""
+    global _capture_depth
+    with _capture_lock:
+        if _capture_depth == 0:
+            sys.stderr = _ThreadLocalStream(sys.stderr)  # type: ignore[assignment]
+        _capture_depth += 1
+        proxy = sys.stderr
+
+    err = io.StringIO()
+    saved = getattr(proxy._local, "buffer", None)
+    proxy._local.buffer = err
+    try:
+        yield err
+    finally:
+        proxy._local.buffer = saved
+        with _capture_lock:
+            _capture_depth -= 1
+            if _capture_depth == 0 and sys.stderr is proxy:
+                sys.stderr = proxy._fallback
+
+
+# ---------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def _parser():
+    from src.cli import build_parser
+    return build_parser()
+
+
+def _run_in_process(cli_args: list[str], repo_path: Path) -> Any:
+    from src.commands import _collect_result
+
+    with _capture_stderr() as err, _collect_result() as results:
+        try:
+            args = _parser().parse_args([*cli_args, "--repo", str(repo_path)])
+            code = args.func(args)
+        except SystemExit as exc:
+            message = err.getvalue().strip() or str(exc.code or "")
+            raise CommandError(message or f"{cli_args[0]}: invalid arguments") from None
+    if code:
+        raise CommandError(err.getvalue() or "Command failed")
+    if not results:
+        raise CommandError(f"{cli_args[0]}: command produced no JSON result")
+    return results[-1]
+
+
+def _run_subprocess(cli_args: list[str], repo_path: Path, timeout: int) -> Any:
+    result = subprocess.run(
+        [sys.executable, "-m", "src.cli"] + cli_args,
+        capture_output=True,
+        text=True,
+        cwd=str(repo_path),
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        raise CommandError(result.stderr or "Command failed")
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError as exc:
+        raise CommandError(f"{cli_args[0]}: output is not JSON ({exc})") from None
+
+
+def run_command(
+    cli_args: list[str],
+    repo_path: Path,
+    *,
+    timeout: int = 120,
+) -> Any:
+    """Run ``awake <cli_args>`` against *repo_path* and return its JSON payload.
+
+    The payload is the dict or list the command would print with ``--json``,
+    returned as an object rather than as text.
+
+    Parameters
+    ----------
+    cli_args:
+        Command name followed by its arguments, e.g. ``["health", "--json"]``.
+        ``--repo`` is appended automatically.
+    repo_path:
+        Repository the command operates on.
+    timeout:
+        Seconds before a subprocess-dispatched command is killed.  In-process
+        commands are not interrupted.
+
+    Raises
+    ------
+    CommandError
+        If the arguments are rejected, the command returns non-zero, or it
+        finishes without producing a JSON result.
+    """
+    if cli_args and cli_args[0] in SUBPROCESS_COMMANDS:
+        return _run_subprocess(cli_args, repo_path, timeout)
+    return _run_in_process(cli_args, repo_path)
@@ -40,11 +40,12 @@ import ast
 import hashlib
 import json
 import math
-import re
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source, parse_file
+
 
 # ---------------------------------------------------------------------------
 # Block characters for visual rendering
@@ -244,127 +245,113 @@ class RepoDna:
 # ---------------------------------------------------------------------------
 # Metric collection
 # ---------------------------------------------------------------------------
+#
+# fingerprint_repo reads and parses every file once: _scan_src_file and
+# _count_test_functions reduce each file to the numbers the channels need,
+# and the _*_from_stats helpers combine them.  The _compute_* functions are
+# single-channel conveniences over the same code.
+
+
+_CC_NODES = (ast.If, ast.For, ast.While, ast.Try, ast.ExceptHandler, ast.With, ast.Assert)
+
+
+@dataclass(frozen=True)
+class _SrcFileStats:
+    """Everything the DNA channels need from one ``src/*.py`` file."""
+
+    name: str
+    size_bytes: int
+    line_count: int
+    parsed: bool
+    avg_complexity: float       # 5.0 when the file does not parse
+    total_imports: int
+    src_imports: int
+    public_functions: int
+    documented_functions: int
+
+
+def _scan_src_file(path: Path) -> _SrcFileStats:
+    """Collect one source file's channel inputs from a single tree walk."""
+    parsed = load_source(path)
+    size = path.stat().st_size
+    lines = len(parsed.lines) if parsed is not None else 0
+    tree = parsed.tree if parsed is not None else None
+    if tree is None:
+        return _SrcFileStats(path.stem, size, lines, False, 5.0, 0, 0, 0, 0)
+
+    ccs: list[float] = []
+    total_imports = src_imports = public = documented = 0
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            ccs.append(float(1 + sum(1 for child in ast.walk(node) if isinstance(child, _CC_NODES))))
+            if not node.name.startswith("_"):
+                public += 1
+                if ast.get_docstring(node):
+                    documented += 1
+        elif isinstance(node, ast.ImportFrom):
+            total_imports += 1
+            if node.module and node.module.startswith("src."):
+                src_imports += 1
+        elif isinstance(node, ast.Import):
+            total_imports += 1
+
+    avg = sum(ccs) / len(ccs) if ccs else 1.0
+    return _SrcFileStats(
+        path.stem, size, lines, True, avg, total_imports, src_imports, public, documented
+    )
 
 
-def _compute_avg_complexity(src_dir: Path) -> tuple[float, list[tuple[str, float]]]:
-    """Compute average cyclomatic complexity per file.
+def _count_test_functions(path: Path) -> int:
+    """Count ``test_*`` functions in one test file (0 if it does not parse)."""
+    tree = parse_file(path)
+    if tree is None:
+        return 0
+    return sum(
+        1 for node in ast.walk(tree)
+        if isinstance(node, ast.FunctionDef) and node.name.startswith("test_")
+    )
 
-    Returns:
-        (global_avg, [(filename, avg_cc), ...])
-    """
-    results: list[tuple[str, float]] = []
-
-    for f in sorted(src_dir.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
-        try:
-            tree = ast.parse(f.read_text(encoding="utf-8"))
-        except Exception:
-            results.append((f.stem, 5.0))
-            continue
-
-        ccs: list[float] = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                cc = 1 + sum(
-                    1
-                    for child in ast.walk(node)
-                    if isinstance(
-                        child,
-                        (ast.If, ast.For, ast.While, ast.Try, ast.ExceptHandler,
-                         ast.With, ast.Assert),
-                    )
-                )
-                ccs.append(float(cc))
-
-        avg = sum(ccs) / len(ccs) if ccs else 1.0
-        results.append((f.stem, avg))
 
+def _collect_src_stats(src_dir: Path, jobs: int = 1) -> list[_SrcFileStats]:
+    """Scan every public ``src/*.py`` file once, in name order."""
+    from src._parallel import map_files
+
+    files = [f for f in sorted(src_dir.glob("*.py")) if not f.name.startswith("_")]
+    return map_files(_scan_src_file, files, jobs=jobs)
+
+
+def _collect_test_count(tests_dir: Path, jobs: int = 1) -> int:
+    """Total ``test_*`` functions across ``tests/test_*.py``."""
+    from src._parallel import map_files
+
+    return sum(map_files(_count_test_functions, sorted(tests_dir.glob("test_*.py")), jobs=jobs))
+
+
+def _complexity_from_stats(stats: list[_SrcFileStats]) -> tuple[float, list[tuple[str, float]]]:
+    results = [(s.name, s.avg_complexity) for s in stats]
     if not results:
         return 1.0, []
-
     global_avg = sum(v for _, v in results) / len(results)
     return global_avg, results
 
 
-def _compute_coupling_ratio(src_dir: Path) -> float:
-    """Compute the average ratio of src imports to total imports per file."""
-    ratios: list[float] = []
-
-    for f in sorted(src_dir.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
-        try:
-            tree = ast.parse(f.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-
-        total_imports = 0
-        src_imports = 0
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                total_imports += 1
-                if node.module and node.module.startswith("src."):
-                    src_imports += 1
-            elif isinstance(node, ast.Import):
-                total_imports += 1
-
-        if total_imports > 0:
-            ratios.append(src_imports / total_imports)
-        else:
-            ratios.append(0.0)
-
+def _coupling_from_stats(stats: list[_SrcFileStats]) -> float:
+    ratios = [
+        s.src_imports / s.total_imports if s.total_imports > 0 else 0.0
+        for s in stats
+        if s.parsed
+    ]
     return sum(ratios) / len(ratios) if ratios else 0.0
 
 
-def _compute_docstring_coverage(src_dir: Path) -> float:
-    """Compute average docstring coverage across all public functions."""
-    covered = 0
-    total = 0
-
-    for f in sorted(src_dir.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
-        try:
-            tree = ast.parse(f.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if not node.name.startswith("_"):
-                    total += 1
-                    if ast.get_docstring(node):
-                        covered += 1
-
+def _doc_coverage_from_stats(stats: list[_SrcFileStats]) -> float:
+    total = sum(s.public_functions for s in stats)
+    covered = sum(s.documented_functions for s in stats)
     return covered / total if total > 0 else 0.0
 
 
-def _compute_test_depth(src_dir: Path, tests_dir: Path) -> float:
-    """Compute the ratio of test functions to public source functions."""
-    src_symbols = 0
-    test_fns = 0
-
-    for f in sorted(src_dir.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
-        try:
-            tree = ast.parse(f.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if not node.name.startswith("_"):
-                    src_symbols += 1
-
-    for f in sorted(tests_dir.glob("test_*.py")):
-        try:
-            tree = ast.parse(f.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-                test_fns += 1
-
+def _test_depth_from_stats(stats: list[_SrcFileStats], test_fns: int) -> float:
+    src_symbols = sum(s.public_functions for s in stats)
     if src_symbols == 0:
         return 0.0
     ratio = test_fns / src_symbols
@@ -372,18 +359,13 @@ def _compute_test_depth(src_dir: Path, tests_dir: Path) -> float:
     return min(ratio / 5.0, 1.0)
 
 
-def _compute_file_size_entropy(src_dir: Path) -> float:
-    """Compute entropy of file size distribution (higher = more uniform).
+def _size_entropy_from_stats(stats: list[_SrcFileStats]) -> float:
+    """Entropy of file size distribution (higher = more uniform).
 
     0.0 = all weight in one file (monolith)
     1.0 = perfectly uniform distribution
     """
-    sizes = []
-    for f in sorted(src_dir.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
-        sizes.append(len(f.read_bytes()))
-
+    sizes = [s.size_bytes for s in stats]
     if not sizes or len(sizes) == 1:
         return 0.5
 
@@ -400,40 +382,27 @@ def _compute_file_size_entropy(src_dir: Path) -> float:
     return min(entropy / max_entropy, 1.0)
 
 
-def _compute_age_entropy(log_path: Path, src_dir: Path) -> float:
-    """Compute entropy of module age distribution.
+def _age_entropy_from_names(log_path: Path, names: list[str]) -> float:
+    """Entropy of module age distribution.
 
     1.0 = modules were added evenly across all sessions (well-paced growth)
     0.0 = all modules added in one session (burst)
     """
+    from src.session_index import load_session_index
+
     if not log_path.exists():
         return 0.5
 
-    content = log_path.read_text(encoding="utf-8")
-    session_headers = list(re.finditer(r"^## Session (\d+)", content, re.MULTILINE))
-    if not session_headers:
+    index = load_session_index(log_path)
+    if not len(index):
         return 0.5
 
-    last_session = int(session_headers[-1].group(1))
-    session_counts: dict[int, int] = {i: 0 for i in range(1, last_session + 1)}
-
-    for f in sorted(src_dir.glob("*.py")):
-        if f.name.startswith("_"):
-            continue
-        name = f.stem
-        pattern = re.compile(rf"src/{re.escape(name)}\.py", re.IGNORECASE)
-        for m_hdr in session_headers:
-            session_num = int(m_hdr.group(1))
-            idx = session_headers.index(m_hdr)
-            end = (
-                session_headers[idx + 1].start()
-                if idx + 1 < len(session_headers)
-                else len(content)
-            )
-            section = content[m_hdr.start():end]
-            if pattern.search(section):
-                session_counts[session_num] += 1
-                break
+    first = index.first_mentions()
+    session_counts: dict[int, int] = {}
+    for name in names:
+        entry = first.get(name.lower())
+        if entry is not None:
+            session_counts[entry.number] = session_counts.get(entry.number, 0) + 1
 
     counts = [v for v in session_counts.values() if v > 0]
     if len(counts) <= 1:
@@ -448,6 +417,40 @@ def _compute_age_entropy(log_path: Path, src_dir: Path) -> float:
     return min(entropy / max_entropy, 1.0)
 
 
+def _compute_avg_complexity(src_dir: Path) -> tuple[float, list[tuple[str, float]]]:
+    """Compute average cyclomatic complexity per file.
+
+    Returns:
+        (global_avg, [(filename, avg_cc), ...])
+    """
+    return _complexity_from_stats(_collect_src_stats(src_dir))
+
+
+def _compute_coupling_ratio(src_dir: Path) -> float:
+    """Compute the average ratio of src imports to total imports per file."""
+    return _coupling_from_stats(_collect_src_stats(src_dir))
+
+
+def _compute_docstring_coverage(src_dir: Path) -> float:
+    """Compute average docstring coverage across all public functions."""
+    return _doc_coverage_from_stats(_collect_src_stats(src_dir))
+
+
+def _compute_test_depth(src_dir: Path, tests_dir: Path) -> float:
+    """Compute the ratio of test functions to public source functions."""
+    return _test_depth_from_stats(_collect_src_stats(src_dir), _collect_test_count(tests_dir))
+
+
+def _compute_file_size_entropy(src_dir: Path) -> float:
+    """Compute entropy of file size distribution (see _size_entropy_from_stats)."""
+    return _size_entropy_from_stats(_collect_src_stats(src_dir))
+
+
+def _compute_age_entropy(log_path: Path, src_dir: Path) -> float:
+    """Compute entropy of module age distribution (see _age_entropy_from_names)."""
+    return _age_entropy_from_names(log_path, [s.name for s in _collect_src_stats(src_dir)])
+
+
 def _compute_hex_digest(channels: list[DnaChannel]) -> str:
     """Compute a deterministic 8-char hex digest from channel values."""
     # Use the channel values as a key
@@ -524,12 +527,16 @@ def _normalise_complexity(avg_cc: float) -> float:
 # ---------------------------------------------------------------------------
 
 
-def fingerprint_repo(repo_path: Path, repo_name: str = "awake") -> RepoDna:
+def fingerprint_repo(repo_path: Path, repo_name: str = "awake", *, jobs: int = 1) -> RepoDna:
     """Generate the DNA fingerprint for a repository.
 
+    Collects every channel's inputs in one traversal of src/ and tests/.
+
     Args:
         repo_path: Path to the repository root.
         repo_name: Display name for the repository.
+        jobs: Worker processes for the per-file scan (0 = all CPUs).
+            Results are merged in name order, identical to the serial run.
 
     Returns:
         A RepoDna instance with all channels populated.
@@ -547,21 +554,21 @@ def fingerprint_repo(repo_path: Path, repo_name: str = "awake") -> RepoDna:
             hex_digest="00000000",
         )
 
+    # One pass over src/ and tests/
+    stats = _collect_src_stats(src_dir, jobs=jobs)
+    test_fns = _collect_test_count(tests_dir, jobs=jobs)
+
     # Collect raw metrics
-    avg_cc, per_file_cc = _compute_avg_complexity(src_dir)
-    coupling_ratio = _compute_coupling_ratio(src_dir)
-    doc_coverage = _compute_docstring_coverage(src_dir)
-    test_depth = _compute_test_depth(src_dir, tests_dir)
-    size_entropy = _compute_file_size_entropy(src_dir)
-    age_entropy = _compute_age_entropy(log_path, src_dir)
+    avg_cc, per_file_cc = _complexity_from_stats(stats)
+    coupling_ratio = _coupling_from_stats(stats)
+    doc_coverage = _doc_coverage_from_stats(stats)
+    test_depth = _test_depth_from_stats(stats, test_fns)
+    size_entropy = _size_entropy_from_stats(stats)
+    age_entropy = _age_entropy_from_names(log_path, [s.name for s in stats])
 
     # Compute aggregate stats
-    total_modules = len([f for f in src_dir.glob("*.py") if not f.name.startswith("_")])
-    total_lines = sum(
-        len(f.read_text(encoding="utf-8", errors="replace").splitlines())
-        for f in src_dir.glob("*.py")
-        if not f.name.startswith("_")
-    )
+    total_modules = len(stats)
+    total_lines = sum(s.line_count for s in stats)
 
     # Normalise all channels to 0–1 (higher = better where applicable)
     channels = [
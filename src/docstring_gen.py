@@ -36,6 +36,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -406,18 +408,91 @@ def generate_docstring(item: MissingDocstring) -> str:
     return "\n".join(lines)
 
 
-def scan_missing_docstrings(repo_path: str | Path) -> DocstringReport:
+def _scan_file(py_file: Path, rel: str) -> DocstringReport:
+    """Scan one file and return a single-file :class:`DocstringReport`."""
+    report = DocstringReport()
+    parsed = load_source(py_file)
+    if parsed is None:
+        report.errors.append(f"{rel}: unreadable")
+        return report
+    if parsed.tree is None:
+        report.errors.append(f"{rel}: {parsed.syntax_error}")
+        return report
+    tree = parsed.tree
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            report.total_items += 1
+            if _has_docstring(node):
+                report.documented += 1
+            else:
+                report.undocumented += 1
+                bases = []
+                for b in node.bases:
+                    bs = _annotation_to_str(b)
+                    if bs:
+                        bases.append(bs)
+                item = MissingDocstring(
+                    kind="class",
+                    name=node.name,
+                    qualified_name=f"{rel}::{node.name}",
+                    file=rel,
+                    line=node.lineno,
+                    bases=bases,
+                )
+                item.generated_docstring = generate_docstring(item)
+                report.items.append(item)
+
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            report.total_items += 1
+            if _has_docstring(node):
+                report.documented += 1
+            else:
+                report.undocumented += 1
+                # Determine if it's a method (parent is a ClassDef)
+                kind = "function"
+                # We can't easily get parent from ast.walk, so check name hints
+                params = _get_params(node)
+                # Check if first arg in .args.args is self/cls
+                if node.args.args and node.args.args[0].arg in ("self", "cls"):
+                    kind = "method"
+
+                ret = _annotation_to_str(node.returns)
+                decos = _decorator_names(node.decorator_list)
+
+                item = MissingDocstring(
+                    kind=kind,
+                    name=node.name,
+                    qualified_name=f"{rel}::{node.name}",
+                    file=rel,
+                    line=node.lineno,
+                    params=params,
+                    return_annotation=ret,
+                    decorators=decos,
+                )
+                item.generated_docstring = generate_docstring(item)
+                report.items.append(item)
+
+    return report
+
+
+def scan_missing_docstrings(repo_path: str | Path, jobs: int = 1) -> DocstringReport:
     """Scan all Python files under ``src/`` for missing docstrings.
 
     Parameters
     ----------
     repo_path:
         Path to the repository root.
+    jobs:
+        Worker processes for per-file scanning (0 = all CPUs).  Per-file
+        results are merged in path order, identical to the serial run.
 
     Returns
     -------
     DocstringReport
     """
+    from src._parallel import map_files
+
     repo = Path(repo_path)
     src_dir = repo / "src"
     if not src_dir.exists():
@@ -427,67 +502,13 @@ def scan_missing_docstrings(repo_path: str | Path) -> DocstringReport:
     py_files = sorted(src_dir.rglob("*.py"))
     report.files_scanned = len(py_files)
 
-    for py_file in py_files:
-        rel = str(py_file.relative_to(repo))
-        try:
-            source = py_file.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(py_file))
-        except (SyntaxError, UnicodeDecodeError) as e:
-            report.errors.append(f"{rel}: {e}")
-            continue
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                report.total_items += 1
-                if _has_docstring(node):
-                    report.documented += 1
-                else:
-                    report.undocumented += 1
-                    bases = []
-                    for b in node.bases:
-                        bs = _annotation_to_str(b)
-                        if bs:
-                            bases.append(bs)
-                    item = MissingDocstring(
-                        kind="class",
-                        name=node.name,
-                        qualified_name=f"{rel}::{node.name}",
-                        file=rel,
-                        line=node.lineno,
-                        bases=bases,
-                    )
-                    item.generated_docstring = generate_docstring(item)
-                    report.items.append(item)
-
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                report.total_items += 1
-                if _has_docstring(node):
-                    report.documented += 1
-                else:
-                    report.undocumented += 1
-                    # Determine if it's a method (parent is a ClassDef)
-                    kind = "function"
-                    # We can't easily get parent from ast.walk, so check name hints
-                    params = _get_params(node)
-                    # Check if first arg in .args.args is self/cls
-                    if node.args.args and node.args.args[0].arg in ("self", "cls"):
-                        kind = "method"
-
-                    ret = _annotation_to_str(node.returns)
-                    decos = _decorator_names(node.decorator_list)
-
-                    item = MissingDocstring(
-                        kind=kind,
-                        name=node.name,
-                        qualified_name=f"{rel}::{node.name}",
-                        file=rel,
-                        line=node.lineno,
-                        params=params,
-                        return_annotation=ret,
-                        decorators=decos,
-                    )
-                    item.generated_docstring = generate_docstring(item)
-                    report.items.append(item)
+    rels = [str(f.relative_to(repo)) for f in py_files]
+    for part in map_files(_scan_file, py_files, rels, jobs=jobs):
+        report.total_items += part.total_items
+        report.documented += part.documented
+        report.undocumented += part.undocumented
+        report.items.extend(part.items)
+        report.errors.extend(part.errors)
 
     if report.total_items > 0:
         report.coverage_pct = (report.documented / report.total_items) * 100
@@ -31,6 +31,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source, parse_file, read_source
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -153,7 +155,8 @@ def _check_test_coverage(repo_root: Path) -> Check:
 
     src_modules = {p.stem for p in src.glob("*.py") if p.name != "__init__.py"}
     test_modules = {p.name[5:-3] for p in tests.glob("test_*.py")}  # strip "test_" and ".py"
-    untested = src_modules - test_modules
+    # Private helpers such as ``_ast_utils`` are tested in ``test_ast_utils.py``.
+    untested = {m for m in src_modules - test_modules if m.lstrip("_") not in test_modules}
 
     if not untested:
         return Check(STATUS_OK, "test coverage (file)", "Every src/ module has a test file")
@@ -170,9 +173,9 @@ def _check_syntax(repo_root: Path) -> Check:
 
     bad: list[str] = []
     for py_file in sorted(src.glob("*.py")):
-        try:
-            ast.parse(py_file.read_text(encoding="utf-8", errors="replace"))
-        except SyntaxError as exc:
+        parsed = load_source(py_file)
+        if parsed is not None and parsed.syntax_error is not None:
+            exc = parsed.syntax_error
             bad.append(f"{py_file.name}:{exc.lineno}: {exc.msg}")
 
     if bad:
@@ -195,9 +198,8 @@ def _check_docstrings(repo_root: Path) -> Check:
     for py_file in sorted(src.glob("*.py")):
         if py_file.name == "__init__.py":
             continue
-        try:
-            tree = ast.parse(py_file.read_text(encoding="utf-8", errors="replace"))
-        except SyntaxError:
+        tree = parse_file(py_file)
+        if tree is None:
             continue
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -227,7 +229,7 @@ def _check_future_annotations(repo_root: Path) -> Check:
 
     missing: list[str] = []
     for py_file in sorted(src.glob("*.py")):
-        code = py_file.read_text(encoding="utf-8", errors="replace")
+        code = read_source(py_file) or ""
         if "from __future__ import annotations" not in code:
             missing.append(py_file.name)
 
@@ -311,11 +313,10 @@ def _check_todos(repo_root: Path) -> Check:
     todo_pattern = re.compile(r"#\s*(TODO|FIXME|HACK|XXX)", re.IGNORECASE)
     found: dict[str, int] = {}
     for py_file in sorted(src.glob("*.py")):
-        try:
-            lines = py_file.read_text(encoding="utf-8", errors="replace").splitlines()
-        except OSError:
+        parsed = load_source(py_file)
+        if parsed is None:
             continue
-        for line in lines:
+        for line in parsed.lines:
             m = todo_pattern.search(line)
             if m:
                 tag = m.group(1).upper()
@@ -350,14 +350,14 @@ def format_evolution(report):
     return "\n".join(lines)
 
 
-def evolve_to_json(report):
-    """Serialize EvolutionReport to JSON."""
+def evolve_to_dict(report) -> dict:
+    """Serialize EvolutionReport to a JSON-compatible dict."""
     def _to_dict(obj):
         if hasattr(obj, '__dict__'):
             return vars(obj)
         return obj
 
-    data = {
+    return {
         "current_session": report.current_session,
         "summary": report.summary,
         "gap_areas": [_to_dict(g) for g in report.gap_areas],
@@ -365,7 +365,11 @@ def evolve_to_json(report):
         "tier2": [_to_dict(p) for p in report.tier2],
         "tier3": [_to_dict(p) for p in report.tier3],
     }
-    return json.dumps(data, indent=2)
+
+
+def evolve_to_json(report):
+    """Serialize EvolutionReport to JSON."""
+    return json.dumps(evolve_to_dict(report), indent=2)
 
 
 def save_evolution(report, path):
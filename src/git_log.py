@@ -0,0 +1,260 @@
+"""Streaming git-log reader shared by Awake's history analyzers.
+
+Several modules (changelog, semver, commit_analyzer, release_notes, stats,
+gitstats) need the commit history.  Rather than each one buffering a whole
+``git log`` into memory with ``capture_output`` and regex-parsing it,
+:func:`iter_commits` reads ``git log`` from a pipe and yields one typed
+:class:`GitCommit` at a time, so memory stays flat however long the history.
+
+Wire format
+-----------
+Each commit is printed as ``\\x1e`` + ``\\x1f``-separated fields + ``\\x1d``::
+
+    \\x1e<sha>\\x1f<parents>\\x1f<author>\\x1f<email>\\x1f<author date>
+        \\x1f<committer date>\\x1f<subject>\\x1f<body>\\x1d
+
+The body may span lines; everything after ``\\x1d`` up to the next ``\\x1e``
+is the commit's ``--numstat`` output when requested.
+
+Public API
+----------
+- ``NumstatEntry``  — one ``--numstat`` row
+- ``GitCommit``     — one commit record
+- ``iter_commits(repo, rev_range, *, max_count, ...)`` → ``Iterator[GitCommit]``
+- ``parse_log_stream(lines)``  → ``Iterator[GitCommit]`` (the parser alone)
+"""
+
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+
+_RECORD = "\x1e"
+_FIELD = "\x1f"
+_END = "\x1d"
+
+_FIELDS = ("%H", "%P", "{an}", "{ae}", "%ai", "%ci", "%s", "%b")
+
+
+@dataclass(frozen=True)
+class NumstatEntry:
+    """One ``--numstat`` row; binary files have ``None`` line counts."""
+
+    path: str
+    insertions: Optional[int]
+    deletions: Optional[int]
+
+    @property
+    def is_binary(self) -> bool:
+        """True when git reported ``-`` counts (binary content)."""
+        return self.insertions is None
+
+
+@dataclass
+class GitCommit:
+    """A single commit as read from ``git log``.
+
+    Dates are git's ISO-like ``%ai`` / ``%ci`` strings
+    (``2026-02-01 23:00:00 +0000``).
+    """
+
+    sha: str
+    parents: tuple[str, ...]
+    author: str
+    email: str
+    date: str
+    committer_date: str
+    subject: str
+    body: str
+    numstat: list[NumstatEntry] = field(default_factory=list)
+
+    @property
+    def is_merge(self) -> bool:
+        """True for commits with more than one parent."""
+        return len(self.parents) > 1
+
+    @property
+    def message(self) -> str:
+        """Full commit message: subject, blank line, body."""
+        return f"{self.subject}\n\n{self.body}" if self.body else self.subject
+
+    @property
+    def insertions(self) -> int:
+        """Lines added across non-binary files."""
+        return sum(e.insertions or 0 for e in self.numstat)
+
+    @property
+    def deletions(self) -> int:
+        """Lines removed across non-binary files."""
+        return sum(e.deletions or 0 for e in self.numstat)
+
+    @property
+    def files_changed(self) -> int:
+        """Number of non-binary files touched."""
+        return sum(1 for e in self.numstat if not e.is_binary)
+
+
+def _log_command(
+    rev_range: Union[str, Iterable[str], None],
+    *,
+    max_count: Optional[int],
+    no_walk: bool,
+    no_merges: bool,
+    grep: Optional[str],
+    ignore_case: bool,
+    numstat: bool,
+    mailmap: bool,
+    paths: Optional[Iterable[str]],
+) -> list[str]:
+    fields = [f.format(an="%aN" if mailmap else "%an", ae="%aE" if mailmap else "%ae")
+              for f in _FIELDS]
+    fmt = "%x1e" + "%x1f".join(fields) + "%x1d"
+    cmd = ["git", "log", f"--format={fmt}"]
+    if max_count is not None:
+        cmd.append(f"--max-count={max_count}")
+    if no_walk:
+        cmd.append("--no-walk=unsorted")
+    if no_merges:
+        cmd.append("--no-merges")
+    if grep:
+        cmd += ["-E", f"--grep={grep}"]
+        if ignore_case:
+            cmd.append("--regexp-ignore-case")
+    if numstat:
+        cmd += ["--numstat", "--no-renames"]
+    if isinstance(rev_range, str):
+        cmd.append(rev_range)
+    elif rev_range:
+        cmd += list(rev_range)
+    cmd.append("--")
+    if paths:
+        cmd += list(paths)
+    return cmd
+
+
+def _parse_numstat(line: str) -> Optional[NumstatEntry]:
+    parts = line.split("\t", 2)
+    if len(parts) != 3:
+        return None
+    ins, dels, path = parts
+    if ins == "-" and dels == "-":
+        return NumstatEntry(path=path, insertions=None, deletions=None)
+    try:
+        return NumstatEntry(path=path, insertions=int(ins), deletions=int(dels))
+    except ValueError:
+        return None
+
+
+def _make_commit(header: str) -> Optional[GitCommit]:
+    parts = header.split(_FIELD)
+    if len(parts) != len(_FIELDS):
+        return None
+    sha, parents, author, email, date, cdate, subject, body = parts
+    return GitCommit(
+        sha=sha.strip(),
+        parents=tuple(parents.split()),
+        author=author.strip(),
+        email=email.strip(),
+        date=date.strip(),
+        committer_date=cdate.strip(),
+        subject=subject.strip(),
+        body=body.strip(),
+    )
+
+
+def parse_log_stream(lines: Iterable[str]) -> Iterator[GitCommit]:
+    """Parse :func:`iter_commits`' wire format from an iterable of lines."""
+    current: Optional[GitCommit] = None
+    header: Optional[list[str]] = None
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith(_RECORD):
+            if current is not None:
+                yield current
+            current, header = None, [line[1:]]
+        elif header is None:
+            if current is not None and line:
+                entry = _parse_numstat(line)
+                if entry is not None:
+                    current.numstat.append(entry)
+            continue
+        else:
+            header.append(line)
+        if header is not None and _END in header[-1]:
+            text = "\n".join(header)
+            current = _make_commit(text[: text.rindex(_END)])
+            header = None
+    if current is not None:
+        yield current
+
+
+def iter_commits(
+    repo_path: Optional[Path] = None,
+    rev_range: Union[str, Iterable[str], None] = None,
+    *,
+    max_count: Optional[int] = None,
+    no_walk: bool = False,
+    no_merges: bool = False,
+    grep: Optional[str] = None,
+    ignore_case: bool = False,
+    numstat: bool = False,
+    mailmap: bool = False,
+    paths: Optional[Iterable[str]] = None,
+) -> Iterator[GitCommit]:
+    """Yield the commits of ``git log`` in *repo_path* lazily, newest first.
+
+    Parameters
+    ----------
+    repo_path:
+        Working directory for git.  Defaults to the current directory.
+    rev_range:
+        Revision or range, e.g. ``"v1.2.0..HEAD"``, or a sequence of
+        revisions.  Defaults to ``HEAD``.
+    max_count:
+        Stop after this many commits.
+    no_walk:
+        Show only the given revisions themselves, in the order given,
+        without walking their ancestry (``git log --no-walk``).
+    no_merges:
+        Skip merge commits.
+    grep:
+        Extended regex the commit message must match (``git log --grep``).
+    ignore_case:
+        Match *grep* case-insensitively.
+    numstat:
+        Populate :attr:`GitCommit.numstat` (renames are not detected).
+    mailmap:
+        Report mailmap-canonical author names and emails.
+    paths:
+        Limit history to commits touching these paths.
+
+    Yields nothing when git is unavailable or *repo_path* is not a
+    repository.  Closing the iterator early terminates the git process.
+    """
+    cmd = _log_command(
+        rev_range, max_count=max_count, no_walk=no_walk, no_merges=no_merges,
+        grep=grep, ignore_case=ignore_case, numstat=numstat, mailmap=mailmap, paths=paths,
+    )
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=str(repo_path or Path.cwd()),
+        )
+    except OSError:
+        return
+    try:
+        assert proc.stdout is not None
+        yield from parse_log_stream(proc.stdout)
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
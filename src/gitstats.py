@@ -2,7 +2,7 @@
 
 Provides a detailed breakdown of commit frequency, code churn rate,
 average PR size, contributor velocity, and day-of-week activity patterns.
-Uses only stdlib (subprocess + re) and works on any git repository.
+Uses only stdlib (via :mod:`src.git_log`) and works on any git repository.
 
 Usage
 -----
@@ -13,28 +13,15 @@ Usage
 
 from __future__ import annotations
 
+import datetime
 import json
 import re
-import subprocess
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
-
-def _git(cmd: list[str], cwd: Path) -> str:
-    """Run a git command and return stdout, or '' on failure."""
-    try:
-        result = subprocess.run(
-            ["git"] + cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(cwd),
-            timeout=30,
-        )
-        return result.stdout.strip() if result.returncode == 0 else ""
-    except Exception:
-        return ""
+from src.git_log import GitCommit, iter_commits
 
 
 @dataclass
@@ -183,83 +170,93 @@ class GitStatsReport:
         return "\n".join(lines)
 
 
+_COMMIT_LINE_RE = re.compile(
+    r"^([0-9a-f]{40})\|(.+?)\|(\d{4}-\d{2}-\d{2}) (\d{2}):\d{2}:\d{2}[^|]*\|(.*)$"
+)
+_PR_SUBJECT_RE = re.compile(r"(merge pull request|^merge branch)", re.I)
+
+
+def _parse_commit_line(line: str) -> Optional[CommitRecord]:
+    """Parse one ``%H|%aN|%ai|%s`` line, or return ``None`` if it does not match."""
+    m = _COMMIT_LINE_RE.match(line.strip())
+    if not m:
+        return None
+    sha, author, date_str, hour_str, subject = m.groups()
+    try:
+        weekday = datetime.date.fromisoformat(date_str).strftime("%A")
+    except ValueError:
+        weekday = "Unknown"
+    return CommitRecord(
+        sha=sha, author=author, date=date_str, weekday=weekday,
+        hour=int(hour_str), insertions=0, deletions=0, files_changed=0, subject=subject,
+    )
+
+
 def _parse_commits(raw_log: str) -> list[CommitRecord]:
     """Parse git log output into CommitRecord objects."""
     records: list[CommitRecord] = []
-    log_pattern = re.compile(
-        r"^([0-9a-f]{40})\|(.+?)\|(\d{4}-\d{2}-\d{2}) (\d{2}):\d{2}:\d{2}[^|]*\|(.*)$"
-    )
     for line in raw_log.splitlines():
-        m = log_pattern.match(line.strip())
-        if not m:
-            continue
-        sha, author, date_str, hour_str, subject = m.groups()
-        import datetime
-        try:
-            dt = datetime.date.fromisoformat(date_str)
-            weekday = dt.strftime("%A")
-        except ValueError:
-            weekday = "Unknown"
-        records.append(CommitRecord(
-            sha=sha, author=author, date=date_str, weekday=weekday,
-            hour=int(hour_str), insertions=0, deletions=0, files_changed=0, subject=subject,
-        ))
+        record = _parse_commit_line(line)
+        if record is not None:
+            records.append(record)
     return records
 
 
-def _enrich_with_numstat(records: list[CommitRecord], cwd: Path) -> None:
-    """Fill insertions/deletions/files_changed using git diff-tree --numstat."""
-    if not records:
-        return
-    sha_map = {r.sha: r for r in records[:200]}
-    for sha, r in sha_map.items():
-        out = _git(["diff-tree", "--numstat", "-r", "--no-commit-id", sha], cwd)
-        ins = dels = files = 0
-        for line in out.splitlines():
-            parts = line.split("\t")
-            if len(parts) == 3:
-                try:
-                    ins += int(parts[0])
-                    dels += int(parts[1])
-                    files += 1
-                except ValueError:
-                    pass
-        r.insertions, r.deletions, r.files_changed = ins, dels, files
+def _record_from_commit(commit: GitCommit) -> Optional[CommitRecord]:
+    """Convert a streamed :class:`~src.git_log.GitCommit` into a CommitRecord."""
+    record = _parse_commit_line(
+        f"{commit.sha}|{commit.author}|{commit.date}|{commit.subject}"
+    )
+    if record is not None:
+        record.insertions = commit.insertions
+        record.deletions = commit.deletions
+        record.files_changed = commit.files_changed
+    return record
 
 
 def compute_git_stats(repo_path: Optional[Path] = None) -> GitStatsReport:
-    """Compute detailed git statistics for *repo_path*."""
-    import datetime
-    repo = repo_path or Path(__file__).resolve().parent.parent
-    raw_log = _git(["log", "--format=%H|%aN|%ai|%s", "--no-merges"], repo)
-    records = _parse_commits(raw_log)
-    if not records:
-        return GitStatsReport()
-
-    _enrich_with_numstat(records, repo)
+    """Compute detailed git statistics for *repo_path*.
 
-    total_commits = len(records)
-    total_ins = sum(r.insertions for r in records)
-    total_dels = sum(r.deletions for r in records)
-    total_files = sum(r.files_changed for r in records)
+    The whole history is read in one streaming ``git log --numstat`` pass
+    (:func:`src.git_log.iter_commits`): merge commits only feed the PR
+    estimate, every other commit contributes its churn.  Aggregates are
+    accumulated on the fly, so memory stays flat however long the history is.
+    """
+    repo = repo_path or Path(__file__).resolve().parent.parent
 
+    total_commits = total_ins = total_dels = total_files = 0
+    estimated_prs = 0
     commits_by_weekday: dict[str, int] = defaultdict(int)
     commits_by_hour: dict[int, int] = defaultdict(int)
+    commits_by_date: dict[str, int] = defaultdict(int)
     contributor_commits: dict[str, int] = defaultdict(int)
     contributor_ins: dict[str, int] = defaultdict(int)
     contributor_dels: dict[str, int] = defaultdict(int)
-    active_dates: set[str] = set()
 
-    for r in records:
+    for commit in iter_commits(repo, numstat=True, mailmap=True):
+        if _PR_SUBJECT_RE.search(commit.subject):
+            estimated_prs += 1
+        if commit.is_merge:
+            continue
+        r = _record_from_commit(commit)
+        if r is None:
+            continue
+        total_commits += 1
+        total_ins += r.insertions
+        total_dels += r.deletions
+        total_files += r.files_changed
         commits_by_weekday[r.weekday] += 1
         commits_by_hour[r.hour] += 1
+        commits_by_date[r.date] += 1
         contributor_commits[r.author] += 1
         contributor_ins[r.author] += r.insertions
         contributor_dels[r.author] += r.deletions
-        active_dates.add(r.date)
 
-    active_days = len(active_dates)
-    dates_sorted = sorted(active_dates)
+    if not total_commits:
+        return GitStatsReport()
+
+    active_days = len(commits_by_date)
+    dates_sorted = sorted(commits_by_date)
     first_date = dates_sorted[0] if dates_sorted else ""
     last_date = dates_sorted[-1] if dates_sorted else ""
     churn_rate = ((total_ins + total_dels) / active_days) if active_days else 0.0
@@ -268,16 +265,11 @@ def compute_git_stats(repo_path: Optional[Path] = None) -> GitStatsReport:
     if last_date:
         try:
             last_dt = datetime.date.fromisoformat(last_date)
-            cutoff = last_dt - datetime.timedelta(days=30)
-            recent_velocity = sum(1 for r in records if r.date >= cutoff.isoformat())
+            cutoff = (last_dt - datetime.timedelta(days=30)).isoformat()
+            recent_velocity = sum(n for d, n in commits_by_date.items() if d >= cutoff)
         except ValueError:
             pass
 
-    full_log = _git(["log", "--format=%s"], repo)
-    estimated_prs = sum(
-        1 for line in full_log.splitlines()
-        if re.search(r"(merge pull request|^merge branch)", line, re.I)
-    )
     avg_pr_size = (total_ins + total_dels) / estimated_prs if estimated_prs else 0.0
 
     contributors = [
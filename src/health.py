@@ -21,6 +21,15 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+try:
+    from src._ast_utils import (
+        AstPass, load_source, pass_result, register_pass,
+    )
+except ModuleNotFoundError:
+    from _ast_utils import (
+        AstPass, load_source, pass_result, register_pass,
+    )
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -181,57 +190,101 @@ class HealthReport:
 # ---------------------------------------------------------------------------
 
 MAX_LINE_LENGTH = 88
+#: Bump whenever analyze_file's output changes so stale cache entries are ignored.
+_CACHE_VERSION = "1"
 TODO_PATTERN = re.compile(r"\b(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE)
 
 
+class _HealthPass(AstPass):
+    """Count functions, classes and public docstrings in one traversal."""
+
+    def __init__(self) -> None:
+        self.functions = 0
+        self.classes = 0
+        self.public_items = 0
+        self.documented = 0
+
+    def _public_item(self, node: ast.AST) -> None:
+        # Skip private/dunder items
+        if node.name.startswith("_"):
+            return
+        self.public_items += 1
+        if (
+            node.body
+            and isinstance(node.body[0], ast.Expr)
+            and isinstance(node.body[0].value, ast.Constant)
+            and isinstance(node.body[0].value.value, str)
+        ):
+            self.documented += 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Count a function and check its docstring."""
+        self.functions += 1
+        self._public_item(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        """Count a class and check its docstring."""
+        self.classes += 1
+        self._public_item(node)
+
+    @property
+    def docstring_coverage(self) -> float:
+        """Fraction of public functions/classes/methods with docstrings."""
+        if self.public_items == 0:
+            return 1.0  # No public items → full coverage by convention
+        return round(self.documented / self.public_items, 3)
+
+
+register_pass("health", _HealthPass)
+
+
 def _count_docstring_coverage(tree: ast.Module) -> float:
     """Return the fraction of public functions/classes/methods with docstrings."""
-    total = 0
-    documented = 0
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            # Skip private/dunder items
-            if node.name.startswith("_"):
-                continue
-            total += 1
-            if (
-                node.body
-                and isinstance(node.body[0], ast.Expr)
-                and isinstance(node.body[0].value, ast.Constant)
-                and isinstance(node.body[0].value.value, str)
-            ):
-                documented += 1
-
-    if total == 0:
-        return 1.0  # No public items → full coverage by convention
-    return round(documented / total, 3)
+    counter = _HealthPass()
+    counter.visit(tree)
+    return counter.docstring_coverage
 
 
 def _count_ast_items(tree: ast.Module) -> tuple[int, int]:
     """Return (function_count, class_count) from a parsed AST."""
-    functions = sum(
-        1
-        for node in ast.walk(tree)
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-    )
-    classes = sum(
-        1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
-    )
-    return functions, classes
+    counter = _HealthPass()
+    counter.visit(tree)
+    return counter.functions, counter.classes
+
+
+def analyze_file(path: Path, cache=None) -> FileHealth:
+    """Analyze a single Python source file and return a FileHealth record.
+
+    When *cache* (an :class:`~src.analysis_cache.AnalysisCache`) is given, the
+    result is looked up by the file's content digest first and stored after a
+    miss, so an unchanged file is never re-parsed.
+    """
+    digest = cache.digest(path) if cache is not None else None
+    if digest is not None:
+        payload = cache.get(digest)
+        if payload is not None:
+            return FileHealth(**{**payload, "path": str(path)})
+
+    fh = _analyze_source(path)
+    if digest is not None:
+        payload = fh.to_dict()
+        del payload["path"]
+        cache.put(digest, payload)
+    return fh
 
 
-def analyze_file(path: Path) -> FileHealth:
-    """Analyze a single Python source file and return a FileHealth record."""
+def _analyze_source(path: Path) -> FileHealth:
+    """Compute a FileHealth record for *path* from its parsed source."""
     fh = FileHealth(path=str(path))
 
-    try:
-        source = path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
+    parsed = load_source(path)
+    if parsed is None:
         fh.parse_error = True
         return fh
 
-    raw_lines = source.splitlines()
+    raw_lines = parsed.lines
     fh.total_lines = len(raw_lines)
 
     for line in raw_lines:
@@ -250,12 +303,12 @@ def analyze_file(path: Path) -> FileHealth:
             fh.todo_count += 1
 
     # AST-based analysis
-    try:
-        tree = ast.parse(source, filename=str(path))
-        fh.function_count, fh.class_count = _count_ast_items(tree)
-        fh.docstring_coverage = _count_docstring_coverage(tree)
-    except SyntaxError:
+    if parsed.tree is None:
         fh.parse_error = True
+    else:
+        counts = pass_result(parsed, "health")
+        fh.function_count, fh.class_count = counts.functions, counts.classes
+        fh.docstring_coverage = counts.docstring_coverage
 
     return fh
 
@@ -264,20 +317,41 @@ def analyze_directory(
     root: Path,
     glob: str = "src/**/*.py",
     exclude: Optional[list[str]] = None,
+    cache: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
 ) -> list[FileHealth]:
-    """Analyze all Python files matching a glob pattern under root."""
+    """Analyze all Python files matching a glob pattern under root.
+
+    With ``cache=True`` per-file results are persisted under
+    ``<root>/.awake/cache`` and reused while the file content is unchanged.
+    ``jobs > 1`` spreads the files over that many worker processes; results
+    are merged in path order, identical to the serial run.
+    ``incremental=True`` re-parses only files git reports changed since the
+    last incremental run (see :mod:`src.incremental`).
+    """
+    from src._parallel import map_files
+
     exclude_patterns = exclude or []
-    results = []
+    store = None
+    if cache or incremental:
+        from src.analysis_cache import open_cache
+        store = open_cache(root, "health", _CACHE_VERSION, incremental=incremental)
 
+    files: list[Path] = []
     for py_file in sorted(root.glob(glob)):
         # Skip excluded patterns
         rel = py_file.relative_to(root)
         if any(ex in str(rel) for ex in exclude_patterns):
             continue
-        fh = analyze_file(py_file)
+        files.append(py_file)
+
+    results = map_files(analyze_file, files, [store] * len(files), jobs=jobs)
+    for py_file, fh in zip(files, results):
         # Store relative path for readability
-        fh.path = str(rel)
-        results.append(fh)
+        fh.path = str(py_file.relative_to(root))
+    if incremental:
+        store.record_run(files)
 
     return results
 
@@ -288,6 +362,9 @@ def generate_health_report(
     glob: str = "src/**/*.py",
     exclude: Optional[list[str]] = None,
     timestamp: str = "",
+    cache: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
 ) -> HealthReport:
     """Generate a full health report for the repository.
 
@@ -296,6 +373,10 @@ def generate_health_report(
         glob: Glob pattern for Python source files.
         exclude: List of path substrings to exclude from analysis.
         timestamp: ISO timestamp string for the report header.
+        cache: Reuse per-file results from the on-disk analysis cache.
+        jobs: Worker processes for per-file analysis (0 = all CPUs).
+        incremental: Re-parse only files changed since the last incremental
+            run according to git; implies *cache*.
 
     Returns:
         HealthReport with per-file and aggregate metrics.
@@ -303,7 +384,10 @@ def generate_health_report(
     from datetime import datetime, timezone
 
     root = repo_path or Path.cwd()
-    files = analyze_directory(root, glob=glob, exclude=exclude or ["__init__"])
+    files = analyze_directory(
+        root, glob=glob, exclude=exclude or ["__init__"],
+        cache=cache, jobs=jobs, incremental=incremental,
+    )
     ts = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     return HealthReport(files=files, generated_at=ts)
 
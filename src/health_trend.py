@@ -1,8 +1,9 @@
 """Health trend visualization for Awake.
 
 Tracks code health scores across sessions and renders sparklines and
-trend tables in Markdown.  Stores history in ``docs/health_history.json``
-alongside the existing ``docs/coverage_history.json`` pattern.
+trend tables in Markdown.  History is stored in the ``health_snapshots``
+table of ``docs/metrics.db`` (see ``src/metrics_store.py``); an explicit
+JSON ``history_path`` is still supported.
 
 Health trend data is collected at the end of each session by running
 ``generate_health_report()`` from ``src/health.py`` and appending the
@@ -252,8 +253,12 @@ def snapshot_from_health_report(session: int, report: object) -> HealthSnapshot:
     )
 
 
-def load_health_history(history_path: Path) -> HealthTrendHistory:
-    """Load HealthTrendHistory from JSON file, creating empty if missing."""
+def load_health_history(history_path) -> HealthTrendHistory:
+    """Load HealthTrendHistory from a JSON file or a metrics store, creating empty if missing."""
+    from src.metrics_store import MetricsStore
+
+    if isinstance(history_path, MetricsStore):
+        return HealthTrendHistory.from_dict({"snapshots": history_path.health_snapshots()})
     if not history_path.exists():
         return HealthTrendHistory()
     with history_path.open(encoding="utf-8") as f:
@@ -283,17 +288,21 @@ def record_session_health(
     Args:
         repo_path: Repository root.
         session: Current session number.
-        history_path: Override for docs/health_history.json.
+        history_path: JSON history file to use instead of docs/metrics.db.
 
     Returns:
         Updated HealthTrendHistory.
     """
     from src.health import generate_health_report
+    from src.metrics_store import open_metrics_store
 
-    hp = history_path or (repo_path / "docs" / "health_history.json")
-    history = load_health_history(hp)
     report = generate_health_report(repo_path=repo_path)
     snap = snapshot_from_health_report(session, report)
+    if history_path is None:
+        with open_metrics_store(repo_path) as store:
+            store.upsert_health_snapshot(snap.to_dict())
+            return load_health_history(store)
+    history = load_health_history(history_path)
     history.append(snap)
-    save_health_history(history, hp)
+    save_health_history(history, history_path)
     return history
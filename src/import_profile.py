@@ -0,0 +1,93 @@
+"""Import-time profiler for the Awake CLI.
+
+Runs an ``awake`` command in a fresh interpreter with ``python -X importtime``
+and summarises which modules dominate startup.  The command's own output is
+discarded; only the import timings are reported, always as text.  The
+command runs in the caller's working directory.
+
+CLI
+---
+    awake --profile-import status          # Import cost of `awake status`
+    awake --profile-import health --repo ../other
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+@dataclass
+class ImportTiming:
+    """Import cost of one module, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    def to_dict(self) -> dict:
+        """Return a dictionary representation of this timing"""
+        return asdict(self)
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` output into timings, in import order."""
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if m:
+            timings.append(ImportTiming(
+                module=m.group(4),
+                self_us=int(m.group(1)),
+                cumulative_us=int(m.group(2)),
+                depth=(len(m.group(3)) - 1) // 2,
+            ))
+    return timings
+
+
+def profile_imports(argv: list[str], cwd: Optional[Path] = None, timeout: int = 120) -> list[ImportTiming]:
+    """Run ``awake <argv>`` with ``-X importtime`` and return its import timings.
+
+    The command runs in *cwd* (default: the current directory); this
+    checkout stays importable from there via ``PYTHONPATH``.
+    """
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli", *argv],
+        capture_output=True,
+        text=True,
+        cwd=str(cwd or Path.cwd()),
+        env=env,
+        timeout=timeout,
+    )
+    return parse_importtime(result.stderr)
+
+
+def format_import_profile(timings: list[ImportTiming], command: str = "", top: int = 25) -> str:
+    """Render the *top* most expensive imports and the per-package totals."""
+    total = sum(t.self_us for t in timings)
+    title = f"IMPORT PROFILE: awake {command}".rstrip()
+    lines = [title, "=" * 60, f"  {len(timings)} modules  ·  {total / 1000:.1f} ms total", ""]
+    lines.append(f"  {'Module':<40} {'Self ms':>8} {'Cum ms':>8}")
+    lines.append(f"  {'-' * 40} {'-' * 8:>8} {'-' * 8:>8}")
+    for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {t.module:<40} {t.self_us / 1000:>8.1f} {t.cumulative_us / 1000:>8.1f}")
+
+    packages: dict[str, int] = {}
+    for t in timings:
+        root = t.module.split(".")[0]
+        packages[root] = packages.get(root, 0) + t.self_us
+    lines += ["", "  By top-level package (self time):"]
+    for name, us in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:10]:
+        lines.append(f"    {name:<38} {us / 1000:>8.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,154 @@
+"""Git-driven incremental analysis for Awake.
+
+``--incremental`` runs of health, complexity, security, deadcode and coupling
+remember, per analyzer, the ``HEAD`` sha of the last run and the content
+digest of every file it saw.  On the next run git reports which files changed
+since that sha; every other file's digest is taken from the record instead of
+being read and hashed, and its per-file result comes straight out of the
+content-addressed :mod:`src.analysis_cache`.  Only changed files are parsed.
+
+Layout
+------
+    .awake/incremental/<analyzer>-v<version>.json
+        {"head": "<sha>", "files": {"src/x.py": "<digest>", ...}}
+
+Only files that were tracked and clean relative to ``HEAD`` are recorded, so
+a recorded digest is always the digest of the committed blob.  Untracked and
+locally modified files are re-hashed on every run.  Outside a git checkout,
+or when the recorded sha is no longer reachable, every file is re-hashed,
+which still yields the exact full-run result.
+
+Public API
+----------
+- ``STATE_DIR``         — repo-relative state root
+- ``IncrementalCache``  — :class:`~src.analysis_cache.AnalysisCache` that
+  trusts git for unchanged files' digests
+- ``git_paths(args, cwd)`` — paths from a NUL-separated git listing
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.analysis_cache import AnalysisCache
+
+
+#: Incremental state root, relative to the repository root.
+STATE_DIR = Path(".awake") / "incremental"
+
+
+def git_paths(args: list[str], cwd: Path) -> Optional[set[str]]:
+    """Run a NUL-separated git listing and return its paths, or ``None`` on failure."""
+    try:
+        result = subprocess.run(
+            ["git", args[0], "-z", *args[1:]],
+            capture_output=True,
+            text=True,
+            cwd=str(cwd),
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return {p for p in result.stdout.split("\0") if p}
+
+
+def _git_head(cwd: Path) -> Optional[str]:
+    """Return the sha of ``HEAD`` in *cwd*, or ``None`` outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=str(cwd),
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+class IncrementalCache(AnalysisCache):
+    """Analysis cache that skips hashing files git reports unchanged.
+
+    Construction reads the analyzer's last-run record and asks git which
+    paths differ between the recorded ``HEAD`` and the working tree; the
+    remaining recorded digests are served by :meth:`digest` without touching
+    the file.  Call :meth:`record_run` after the analyzer finishes.
+    """
+
+    def __init__(self, repo_path: Path, analyzer: str, version: str) -> None:
+        super().__init__(repo_path, analyzer, version)
+        self.repo_path = Path(repo_path)
+        self.state_path = self.repo_path / STATE_DIR / f"{analyzer}-v{version}.json"
+        self.known = self._load_known()
+
+    def _rel(self, path: Path) -> Optional[str]:
+        try:
+            return Path(path).relative_to(self.repo_path).as_posix()
+        except ValueError:
+            return None
+
+    def _load_known(self) -> dict[str, str]:
+        """Return recorded digests of files unchanged since the recorded HEAD."""
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            head, files = state["head"], state["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        changed = git_paths(
+            ["diff", "--name-only", "--relative", "--no-renames", head, "--"],
+            self.repo_path,
+        )
+        if changed is None:
+            return {}
+        return {rel: d for rel, d in files.items() if rel not in changed}
+
+    def digest(self, path: Path) -> Optional[str]:
+        """Return the recorded digest for an unchanged file, else hash it."""
+        known = self.known.get(self._rel(path) or "")
+        return known if known is not None else super().digest(path)
+
+    def record_run(self, files: Iterable[Path]) -> None:
+        """Persist ``HEAD`` and the digests of *files* that are clean and tracked.
+
+        Silently does nothing outside a git checkout or when the state file
+        cannot be written; the next run then simply re-hashes everything.
+        """
+        head = _git_head(self.repo_path)
+        if head is None:
+            return
+        dirty = git_paths(["diff", "--name-only", "--relative", "HEAD", "--"], self.repo_path)
+        tracked = git_paths(["ls-files"], self.repo_path)
+        if dirty is None or tracked is None:
+            return
+
+        digests: dict[str, str] = {}
+        for path in files:
+            rel = self._rel(path)
+            if rel is None or rel in dirty or rel not in tracked:
+                continue
+            digest = self.digest(path)
+            if digest:
+                digests[rel] = digest
+
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump({"head": head, "files": digests}, fh, sort_keys=True)
+                os.replace(tmp, self.state_path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            pass
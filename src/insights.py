@@ -25,6 +25,8 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+from src.session_index import SessionIndex, load_session_index
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -243,18 +245,18 @@ def _parse_sessions(log_text: str) -> list[SessionRecord]:
     Returns:
         List of SessionRecord objects, one per session heading found.
     """
-    # Split the document into per-session chunks using the ## Session N header
-    # as a delimiter.
-    session_matches = list(_RE_SESSION_HEADER.finditer(log_text))
-    if not session_matches:
-        return []
+    return _records_from_index(SessionIndex.from_text(log_text))
+
 
+def _records_from_index(index: SessionIndex) -> list[SessionRecord]:
+    """Build SessionRecord objects from an indexed log."""
     records: list[SessionRecord] = []
 
-    for idx, match in enumerate(session_matches):
-        start = match.start()
-        end = session_matches[idx + 1].start() if idx + 1 < len(session_matches) else len(log_text)
-        chunk = log_text[start:end]
+    for entry in index:
+        chunk = index.section(entry)
+        match = _RE_SESSION_HEADER.match(chunk)
+        if not match:
+            continue
 
         session_num = int(match.group(1))
         session_title = match.group(2).strip()
@@ -789,11 +791,7 @@ def generate_insights(
     if log_path is None:
         log_path = repo_path / "AWAKE_LOG.md"
 
-    log_text = ""
-    if log_path.exists():
-        log_text = log_path.read_text(encoding="utf-8")
-
-    records = _parse_sessions(log_text)
+    records = _records_from_index(load_session_index(log_path))
 
     if not records:
         return InsightsReport(
@@ -30,9 +30,13 @@ from __future__ import annotations
 import ast
 import json
 import re
+from collections import Counter
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+from src._ast_utils import parse_file, read_source
+from src.session_index import load_session_index
 
 
 # ---------------------------------------------------------------------------
@@ -264,9 +268,8 @@ class MaturityReport:
 
 def _count_tests_in_file(path: Path) -> int:
     """Count test functions in a test file."""
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"))
-    except Exception:
+    tree = parse_file(path)
+    if tree is None:
         return 0
     return sum(
         1
@@ -277,10 +280,8 @@ def _count_tests_in_file(path: Path) -> int:
 
 def _analyze_src_file(path: Path) -> tuple[int, float, float]:
     """Return (public_function_count, docstring_coverage, avg_complexity)."""
-    try:
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source)
-    except Exception:
+    tree = parse_file(path)
+    if tree is None:
         return 0, 0.0, 5.0
 
     public_funcs = []
@@ -315,88 +316,104 @@ def _analyze_src_file(path: Path) -> tuple[int, float, float]:
     return len(public_funcs), doc_cov, avg_cc
 
 
-def _estimate_session_age(name: str, log_path: Path) -> int:
-    """Estimate how many sessions ago a module was introduced.
+def _session_age_index(log_path: Path) -> tuple[dict[str, int], int]:
+    """Return ``({module: session_age}, default_age)`` from one pass over the log.
 
-    Scans AWAKE_LOG.md for the earliest session that mentions src/<name>.py.
-    Returns 0 if the log doesn't exist or no mention is found.
+    A module's age counts the sessions from the earliest one mentioning
+    ``src/<name>.py`` to the latest session.  *default_age* applies to
+    modules the log never mentions: 1, or 0 if the log is missing or empty.
     """
     if not log_path.exists():
-        return 0
+        return {}, 0
 
-    content = log_path.read_text(encoding="utf-8")
+    index = load_session_index(log_path)
+    if not len(index):
+        return {}, 0
 
-    # Find all session headers
-    session_headers = list(
-        re.finditer(r"^## Session (\d+)", content, re.MULTILINE)
-    )
-    if not session_headers:
-        return 0
+    latest = index.latest_number
+    ages = {
+        name: latest - entry.number + 1
+        for name, entry in index.first_mentions().items()
+    }
+    return ages, 1  # default: one session old
 
-    last_session = int(session_headers[-1].group(1))
 
-    # Find earliest session that mentions this module
-    pattern = re.compile(
-        rf"src/{re.escape(name)}\.py",
-        re.IGNORECASE,
-    )
+def _estimate_session_age(name: str, log_path: Path) -> int:
+    """Estimate how many sessions ago a module was introduced.
 
-    for m_hdr in session_headers:
-        session_num = int(m_hdr.group(1))
-        # Get text of this section
-        next_i = session_headers.index(m_hdr) + 1
-        end = (
-            session_headers[next_i].start()
-            if next_i < len(session_headers)
-            else len(content)
-        )
-        section = content[m_hdr.start():end]
-        if pattern.search(section):
-            return last_session - session_num + 1
+    Scans AWAKE_LOG.md for the earliest session that mentions src/<name>.py.
+    Returns 0 if the log doesn't exist or no mention is found.
+    """
+    ages, default = _session_age_index(log_path)
+    return ages.get(name.lower(), default)
 
-    return 1  # default: one session old
 
+#: Every ``src.<word>`` / ``from src import <word>`` occurrence, overlaps included.
+_SRC_REF_RE = re.compile(r"(?=(?:src\.|from src import )(\w+))")
 
-def _estimate_instability(name: str, src_dir: Path) -> float:
-    """Estimate the instability of a module (0=stable, 1=unstable).
+
+def _instability_index(src_dir: Path, names: Iterable[str] = ()) -> dict[str, float]:
+    """Estimate the instability of every module in *src_dir* (0=stable, 1=unstable).
 
     Uses a simplified version of Robert Martin's instability metric:
     I = Ce / (Ca + Ce)
     where Ca = number of modules that import this module (afferent)
           Ce = number of modules this module imports from src (efferent)
+
+    Each file is read and parsed once.  A file counts towards a module's Ca
+    when it contains ``src.<name>`` or ``from src import <name>`` as a
+    substring, which is matched by expanding every referenced word into its
+    prefixes.  *names* adds modules that have no file of their own.
     """
     all_files = list(src_dir.glob("*.py"))
-    afferent = 0
-    efferent = 0
+    modules = {f.stem for f in all_files} | set(names)
+    afferent: Counter[str] = Counter()
+    efferent: dict[str, int] = {}
 
     for f in all_files:
-        if f.stem == name:
-            # Count this module's own imports from src
-            try:
-                source = f.read_text(encoding="utf-8")
-                tree = ast.parse(source)
-                efferent = sum(
-                    1
-                    for node in ast.walk(tree)
-                    if isinstance(node, ast.ImportFrom)
-                    and node.module
-                    and node.module.startswith("src.")
-                )
-            except Exception:
-                efferent = 0
+        # Count this module's own imports from src
+        tree = parse_file(f)
+        efferent[f.stem] = 0 if tree is None else sum(
+            1
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom)
+            and node.module
+            and node.module.startswith("src.")
+        )
+        # Every module this file refers to
+        source = read_source(f) or ""
+        referenced: set[str] = set()
+        for word in set(_SRC_REF_RE.findall(source)):
+            referenced.update(
+                word[:i] for i in range(1, len(word) + 1) if word[:i] in modules
+            )
+        referenced.discard(f.stem)
+        afferent.update(referenced)
+
+    result: dict[str, float] = {}
+    for name in modules:
+        total = afferent[name] + efferent.get(name, 0)
+        if total == 0:
+            result[name] = 0.5  # neutral / unknown
         else:
-            # Check if this other file imports our module
-            try:
-                source = f.read_text(encoding="utf-8")
-                if f"src.{name}" in source or f"from src import {name}" in source:
-                    afferent += 1
-            except Exception:
-                pass
+            result[name] = round(efferent.get(name, 0) / total, 3)
+    return result
 
-    total = afferent + efferent
-    if total == 0:
-        return 0.5  # neutral / unknown
-    return round(efferent / total, 3)
+
+def _estimate_instability(name: str, src_dir: Path) -> float:
+    """Estimate the instability of a module (0=stable, 1=unstable).
+
+    See :func:`_instability_index`, which scores every module at once.
+    """
+    return _instability_index(src_dir, (name,))[name]
+
+
+def _test_count_index(tests_dir: Path) -> dict[str, int]:
+    """Map module name to the test function count of ``tests/test_<name>.py``."""
+    return {
+        path.stem[len("test_"):]: _count_tests_in_file(path)
+        for path in tests_dir.glob("test_*.py")
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -456,12 +473,8 @@ def _score_coupling(instability: float) -> float:
 
 def _has_module_docstring(path: Path) -> bool:
     """Return True if the module has a top-level docstring."""
-    try:
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source)
-        return bool(ast.get_docstring(tree))
-    except Exception:
-        return False
+    tree = parse_file(path)
+    return tree is not None and bool(ast.get_docstring(tree))
 
 
 # ---------------------------------------------------------------------------
@@ -488,17 +501,46 @@ def score_module_maturity(
     Returns:
         A ModuleMaturity instance with all scores populated.
     """
-    src_path = src_dir / f"{name}.py"
     test_path_candidate = tests_dir / f"test_{name}.py"
-    has_test_file = test_path_candidate.exists()
-    test_path = str(test_path_candidate.relative_to(src_dir.parent)) if has_test_file else None
+    test_count = (
+        _count_tests_in_file(test_path_candidate) if test_path_candidate.exists() else None
+    )
+    return _build_module_maturity(
+        name,
+        src_dir,
+        tests_dir,
+        test_count=test_count,
+        session_age=_estimate_session_age(name, log_path),
+        instability=_estimate_instability(name, src_dir),
+        max_sessions=max_sessions,
+    )
+
 
-    # Collect metrics
-    test_count = _count_tests_in_file(test_path_candidate) if has_test_file else 0
+def _build_module_maturity(
+    name: str,
+    src_dir: Path,
+    tests_dir: Path,
+    *,
+    test_count: Optional[int],
+    session_age: int,
+    instability: float,
+    max_sessions: int,
+) -> ModuleMaturity:
+    """Score one module from precomputed cross-module metrics.
+
+    *test_count* is ``None`` when the module has no test file.
+    """
+    src_path = src_dir / f"{name}.py"
+    has_test_file = test_count is not None
+    test_path = (
+        str((tests_dir / f"test_{name}.py").relative_to(src_dir.parent))
+        if has_test_file else None
+    )
+    test_count = test_count or 0
+
+    # Collect per-file metrics
     public_funcs, doc_cov, avg_cc = _analyze_src_file(src_path)
     has_module_doc = _has_module_docstring(src_path)
-    session_age = _estimate_session_age(name, log_path)
-    instability = _estimate_instability(name, src_dir)
 
     # Score each dimension
     test_score = _score_tests(test_count, has_test_file)
@@ -530,6 +572,9 @@ def assess_maturity(
 ) -> MaturityReport:
     """Assess maturity for all modules in src/.
 
+    The import graph, test counts and first-mention session map are built
+    once for the whole tree, so the cost grows linearly with module count.
+
     Args:
         repo_path: Path to the repository root.
 
@@ -551,21 +596,26 @@ def assess_maturity(
     # Count total sessions for age normalisation
     max_sessions = 1
     if log_path.exists():
-        content = log_path.read_text(encoding="utf-8")
-        session_matches = re.findall(r"^## Session (\d+)", content, re.MULTILINE)
-        if session_matches:
-            max_sessions = max(int(s) for s in session_matches)
+        session_numbers = load_session_index(log_path).numbers()
+        if session_numbers:
+            max_sessions = max(session_numbers)
+
+    instability = _instability_index(src_dir)
+    test_counts = _test_count_index(tests_dir)
+    ages, default_age = _session_age_index(log_path)
 
     modules = []
     for src_file in sorted(src_dir.glob("*.py")):
         if src_file.name.startswith("_"):
             continue
         name = src_file.stem
-        m = score_module_maturity(
-            name=name,
-            src_dir=src_dir,
-            tests_dir=tests_dir,
-            log_path=log_path,
+        m = _build_module_maturity(
+            name,
+            src_dir,
+            tests_dir,
+            test_count=test_counts.get(name),
+            session_age=ages.get(name.lower(), default_age),
+            instability=instability[name],
             max_sessions=max_sessions,
         )
         modules.append(m)
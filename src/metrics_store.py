@@ -0,0 +1,357 @@
+"""Embedded SQLite store for Awake's metric history.
+
+Replaces the history JSON files in ``docs/`` (``pr_scores.json``,
+``health_history.json``, ``coverage_history.json`` and
+``benchmark_history.json``), which were loaded, modified and rewritten in
+full on every update.  Each kind of record lives in its own table keyed by
+an indexed primary key, so an upsert is a single B-tree write and history
+never has to be truncated.
+
+Every row keeps its full JSON payload in a ``data`` column alongside the
+indexed scalar columns used for lookups, so callers round-trip the same
+dictionaries the JSON files held.
+
+Legacy files are imported once, on first use.  Benchmark runs imported from
+``benchmark_history.json`` record it as their ``source``, so a forced
+re-import replaces them instead of appending duplicates that would skew the
+rolling baseline.
+
+Layout
+------
+    docs/metrics.db
+
+    pr_scores           (pr_number PK, session, total, scored_at, data)
+    health_snapshots    (session PK, timestamp, overall_score, data)
+    coverage_snapshots  (session PK, timestamp, total_coverage, data)
+    benchmark_runs      (id PK, session, timestamp, total_ms, source, data)
+    benchmark_results   (run_id, module) PK, index on (module, status, run_id)
+    imports             (source PK, imported_at)
+
+Public API
+----------
+- ``METRICS_DB``                           — repo-relative database path
+- ``MetricsStore(path)``                   — one open database
+- ``open_metrics_store(repo, import_legacy=True)`` → ``MetricsStore``
+- ``has_metrics(repo)``                    — whether any history exists yet
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+
+#: Database location, relative to the repository root.
+METRICS_DB = Path("docs") / "metrics.db"
+
+#: Legacy JSON history files, relative to the repository root.
+LEGACY_FILES = {
+    "pr_scores": Path("docs") / "pr_scores.json",
+    "health": Path("docs") / "health_history.json",
+    "coverage": Path("docs") / "coverage_history.json",
+    "benchmark": Path("docs") / "benchmark_history.json",
+}
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pr_scores (
+    pr_number INTEGER PRIMARY KEY,
+    session   INTEGER,
+    total     INTEGER,
+    scored_at TEXT,
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pr_scores_session ON pr_scores (session);
+
+CREATE TABLE IF NOT EXISTS health_snapshots (
+    session       INTEGER PRIMARY KEY,
+    timestamp     TEXT,
+    overall_score REAL,
+    data          TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS coverage_snapshots (
+    session        INTEGER PRIMARY KEY,
+    timestamp      TEXT,
+    total_coverage REAL,
+    data           TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS benchmark_runs (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    session   INTEGER,
+    timestamp TEXT,
+    total_ms  REAL,
+    source    TEXT,              -- legacy file the run was imported from
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS benchmark_runs_source ON benchmark_runs (source);
+
+CREATE TABLE IF NOT EXISTS benchmark_results (
+    run_id     INTEGER NOT NULL REFERENCES benchmark_runs (id) ON DELETE CASCADE,
+    module     TEXT NOT NULL,
+    elapsed_ms REAL,
+    status     TEXT,
+    data       TEXT NOT NULL,
+    PRIMARY KEY (run_id, module)
+);
+CREATE INDEX IF NOT EXISTS benchmark_results_module
+    ON benchmark_results (module, status, run_id);
+
+CREATE TABLE IF NOT EXISTS imports (
+    source      TEXT PRIMARY KEY,
+    imported_at TEXT NOT NULL
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class MetricsStore:
+    """Metric history tables in one SQLite database.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _data(self, sql: str, params: tuple = ()) -> list[dict]:
+        return [json.loads(row["data"]) for row in self._conn.execute(sql, params)]
+
+    # ------------------------------------------------------------------
+    # PR scores
+    # ------------------------------------------------------------------
+
+    def upsert_pr_score(self, data: dict, total: Optional[int] = None) -> None:
+        """Insert or replace the score for ``data["pr_number"]``."""
+        with self._conn:
+            self._put_pr_score(data, total)
+
+    def _put_pr_score(self, data: dict, total: Optional[int] = None) -> None:
+        if total is None:
+            total = sum(d.get("score", 0) for d in data.get("dimensions", []))
+        self._conn.execute(
+            "INSERT INTO pr_scores (pr_number, session, total, scored_at, data) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (pr_number) DO UPDATE SET "
+            "session = excluded.session, total = excluded.total, "
+            "scored_at = excluded.scored_at, data = excluded.data",
+            (data["pr_number"], data.get("session"), total, data.get("scored_at", ""),
+             json.dumps(data)),
+        )
+
+    def pr_scores(self) -> list[dict]:
+        """Return every stored PR score, ordered by PR number."""
+        return self._data("SELECT data FROM pr_scores ORDER BY pr_number")
+
+    # ------------------------------------------------------------------
+    # Health and coverage snapshots
+    # ------------------------------------------------------------------
+
+    def upsert_health_snapshot(self, data: dict) -> None:
+        """Insert or replace the health snapshot for ``data["session"]``."""
+        with self._conn:
+            self._put_health_snapshot(data)
+
+    def _put_health_snapshot(self, data: dict) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO health_snapshots (session, timestamp, overall_score, data) "
+            "VALUES (?, ?, ?, ?)",
+            (data["session"], data.get("timestamp", ""), data.get("overall_score"),
+             json.dumps(data)),
+        )
+
+    def health_snapshots(self, since: Optional[int] = None, until: Optional[int] = None) -> list[dict]:
+        """Return health snapshots for sessions in ``[since, until]``, by session."""
+        return self._data(*self._session_range("health_snapshots", since, until))
+
+    def upsert_coverage_snapshot(self, data: dict) -> None:
+        """Insert or replace the coverage snapshot for ``data["session"]``."""
+        with self._conn:
+            self._put_coverage_snapshot(data)
+
+    def _put_coverage_snapshot(self, data: dict) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO coverage_snapshots (session, timestamp, total_coverage, data) "
+            "VALUES (?, ?, ?, ?)",
+            (data["session"], data.get("timestamp", ""), data.get("total_coverage"),
+             json.dumps(data)),
+        )
+
+    def coverage_snapshots(self, since: Optional[int] = None, until: Optional[int] = None) -> list[dict]:
+        """Return coverage snapshots for sessions in ``[since, until]``, by session."""
+        return self._data(*self._session_range("coverage_snapshots", since, until))
+
+    @staticmethod
+    def _session_range(table: str, since: Optional[int], until: Optional[int]) -> tuple[str, tuple]:
+        lo = since if since is not None else -(2 ** 62)
+        hi = until if until is not None else 2 ** 62
+        return f"SELECT data FROM {table} WHERE session BETWEEN ? AND ? ORDER BY session", (lo, hi)
+
+    # ------------------------------------------------------------------
+    # Benchmark runs
+    # ------------------------------------------------------------------
+
+    def add_benchmark_run(self, report: dict, *, source: Optional[str] = None) -> int:
+        """Append a benchmark report (``BenchmarkReport.to_dict()``); return its run id.
+
+        *source* names the legacy file an imported run came from.
+        """
+        with self._conn:
+            return self._put_benchmark_run(report, source)
+
+    def _put_benchmark_run(self, report: dict, source: Optional[str] = None) -> int:
+        run = {k: v for k, v in report.items() if k != "results"}
+        # Validate every result before writing, so a bad row leaves no partial run.
+        results = [
+            (r["module"], r.get("elapsed_ms"), r.get("status", "ok"), json.dumps(r))
+            for r in report.get("results", [])
+        ]
+        cur = self._conn.execute(
+            "INSERT INTO benchmark_runs (session, timestamp, total_ms, source, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                run.get("session"), run.get("timestamp", ""), run.get("total_ms"),
+                source, json.dumps(run),
+            ),
+        )
+        run_id = cur.lastrowid
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO benchmark_results (run_id, module, elapsed_ms, status, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(run_id, *row) for row in results],
+        )
+        return run_id
+
+    def benchmark_runs(self, limit: Optional[int] = None) -> list[dict]:
+        """Return benchmark reports, oldest first (the newest *limit* if given)."""
+        sql = "SELECT id, data FROM benchmark_runs ORDER BY id DESC"
+        params: tuple = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        runs = []
+        for row in reversed(self._conn.execute(sql, params).fetchall()):
+            run = json.loads(row["data"])
+            run["results"] = self._data(
+                "SELECT data FROM benchmark_results WHERE run_id = ? ORDER BY rowid", (row["id"],)
+            )
+            runs.append(run)
+        return runs
+
+    def module_samples(self, module: str, limit: int) -> list[float]:
+        """Return *module*'s ``elapsed_ms`` from its last *limit* successful runs, newest first."""
+        rows = self._conn.execute(
+            "SELECT elapsed_ms FROM benchmark_results WHERE module = ? AND status = 'ok' "
+            "AND elapsed_ms IS NOT NULL ORDER BY run_id DESC LIMIT ?",
+            (module, limit),
+        )
+        return [float(r["elapsed_ms"]) for r in rows]
+
+    # ------------------------------------------------------------------
+    # Summary and legacy import
+    # ------------------------------------------------------------------
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of rows in each history table."""
+        tables = ("pr_scores", "health_snapshots", "coverage_snapshots", "benchmark_runs")
+        return {
+            t: self._conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in tables
+        }
+
+    def import_json(self, repo_path: Path, *, force: bool = False) -> dict[str, int]:
+        """Import the legacy ``docs/*.json`` history files under *repo_path*.
+
+        Each file is imported once; pass *force* to import it again, which
+        replaces the records it imported before.  Files that are missing or
+        unreadable are skipped.  Returns the number of records imported per
+        kind.
+        """
+        imported: dict[str, int] = {}
+        for kind, rel in LEGACY_FILES.items():
+            path = Path(repo_path) / rel
+            source = str(rel)
+            if not path.exists():
+                continue
+            if not force and self._conn.execute(
+                "SELECT 1 FROM imports WHERE source = ?", (source,)
+            ).fetchone():
+                continue
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            with self._conn:
+                imported[kind] = self._import_payload(kind, payload, source)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO imports (source, imported_at) VALUES (?, ?)",
+                    (source, _now()),
+                )
+        return imported
+
+    def _import_payload(self, kind: str, payload: Any, source: str) -> int:
+        """Write one legacy file's records; the caller owns the transaction."""
+        if kind in ("pr_scores", "benchmark"):
+            rows = payload if isinstance(payload, list) else []
+        else:
+            rows = payload.get("snapshots", []) if isinstance(payload, dict) else []
+        if kind == "benchmark":
+            # Runs are appended, not upserted: drop the previous import first.
+            self._conn.execute("DELETE FROM benchmark_runs WHERE source = ?", (source,))
+        add = {
+            "pr_scores": self._put_pr_score,
+            "benchmark": functools.partial(self._put_benchmark_run, source=source),
+            "health": self._put_health_snapshot,
+            "coverage": self._put_coverage_snapshot,
+        }[kind]
+        count = 0
+        for item in rows:
+            try:
+                add(item)
+            except (KeyError, TypeError, AttributeError):
+                continue
+            count += 1
+        return count
+
+
+def open_metrics_store(repo_path: Path, *, import_legacy: bool = True) -> MetricsStore:
+    """Open ``<repo>/docs/metrics.db``, importing legacy JSON history on first use."""
+    store = MetricsStore(Path(repo_path) / METRICS_DB)
+    if import_legacy:
+        store.import_json(repo_path)
+    return store
+
+
+def has_metrics(repo_path: Path) -> bool:
+    """Return True if *repo_path* has a metrics database or legacy history file.
+
+    Read-only commands check this before :func:`open_metrics_store`, so they
+    never create an empty database.
+    """
+    repo = Path(repo_path)
+    return (repo / METRICS_DB).exists() or any((repo / rel).exists() for rel in LEGACY_FILES.values())
@@ -13,7 +13,6 @@ CLI
 
 from __future__ import annotations
 
-import ast
 import json
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
@@ -180,50 +179,33 @@ def _discover_modules(src_dir: Path) -> list[str]:
     return sorted(p.stem for p in src_dir.glob("*.py") if p.stem != "__init__")
 
 
-def _extract_imports(src_file: Path, module_names: set) -> list[str]:
-    try:
-        tree = ast.parse(src_file.read_text(encoding="utf-8", errors="replace"))
-    except SyntaxError:
-        return []
-    imported: set = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                base = alias.name.split(".")[0]
-                if base in module_names:
-                    imported.add(base)
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                parts = node.module.split(".")
-                if len(parts) >= 2 and parts[0] == "src" and parts[1] in module_names:
-                    imported.add(parts[1])
-                elif parts[0] in module_names:
-                    imported.add(parts[0])
-    return sorted(imported)
-
-
-def generate_module_graph(repo_root: Path) -> ModuleGraph:
-    """Build the full module interconnection graph from AST analysis."""
+def generate_module_graph(repo_root: Path, *, graph=None) -> ModuleGraph:
+    """Build the full module interconnection graph from the shared import graph.
+
+    *graph* is a prebuilt :class:`src._graph.ImportGraph` to reuse; by default
+    one is built for *repo_root*.  Only modules directly inside ``src/`` are
+    drawn.
+    """
+    from src._graph import build_import_graph
+
     src_dir = repo_root / "src"
     if not src_dir.exists():
         return ModuleGraph()
-    module_names = _discover_modules(src_dir)
-    name_set = set(module_names)
+    if graph is None:
+        graph = build_import_graph(repo_root)
+    top = graph.top_level()
     nodes: list[ModuleNode] = []
     edges: list = []
-    imported_by: dict = {m: [] for m in module_names}
-    for mod_name in module_names:
-        src_file = src_dir / f"{mod_name}.py"
-        imports = _extract_imports(src_file, name_set)
-        imports = [i for i in imports if i != mod_name]
+    for mod_name in _discover_modules(src_dir):
+        known = mod_name in top
         layer = _LAYER_MAP.get(mod_name, "misc")
-        nodes.append(ModuleNode(name=mod_name, layer=layer, imports=imports))
-        for dep in imports:
-            edges.append((mod_name, dep))
-            if dep in imported_by:
-                imported_by[dep].append(mod_name)
-    for node in nodes:
-        node.imported_by = imported_by.get(node.name, [])
+        nodes.append(ModuleNode(
+            name=mod_name,
+            layer=layer,
+            imports=top.successors(mod_name) if known else [],
+            imported_by=top.predecessors(mod_name) if known else [],
+        ))
+        edges.extend((mod_name, dep) for dep in nodes[-1].imports)
     layers: dict = {}
     for node in nodes:
         layers.setdefault(node.layer, []).append(node.name)
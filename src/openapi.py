@@ -205,6 +205,14 @@ _PARAMETERIZED: dict[str, list[OpenAPIParameter]] = {
     ],
 }
 
+_QUERY_PARAMETERS: dict[str, list[OpenAPIParameter]] = {
+    "/api/trends": [
+        OpenAPIParameter(name="from", location="query", description="First session to include", required=False, schema_type="integer"),
+        OpenAPIParameter(name="to", location="query", description="Last session to include", required=False, schema_type="integer"),
+        OpenAPIParameter(name="points", location="query", description="Downsample each series to at most N min/max/mean buckets", required=False, schema_type="integer"),
+    ],
+}
+
 _COMMON_FORMAT_PARAM = OpenAPIParameter(name="format", location="query", description="Response format override: json | markdown", required=False)
 
 
@@ -228,6 +236,7 @@ def generate_openapi_spec(repo_root: Optional[Path] = None) -> OpenAPISpec:
         params = list(_PARAMETERIZED.get(route, []))
         if route not in _PARAMETERIZED and route not in ("/api", "/api/"):
             params.append(_COMMON_FORMAT_PARAM)
+        params.extend(_QUERY_PARAMETERS.get(route, []))
         op = OpenAPIOperation(
             operation_id=op_id,
             summary=summary,
@@ -363,12 +363,20 @@ def score_pr(
 # ---------------------------------------------------------------------------
 
 
-def load_scores(storage_path: Path) -> list[PRScore]:
-    """Load stored PR scores from a JSON file."""
-    if not storage_path.exists():
+def load_scores(storage_path) -> list[PRScore]:
+    """Load stored PR scores from a JSON file or a :class:`src.metrics_store.MetricsStore`."""
+    from src.metrics_store import MetricsStore
+
+    if isinstance(storage_path, MetricsStore):
+        raw = storage_path.pr_scores()
+    elif not storage_path.exists():
         return []
+    else:
+        try:
+            raw = json.loads(storage_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return []
     try:
-        raw = json.loads(storage_path.read_text(encoding="utf-8"))
         scores = []
         for item in raw:
             dims = [DimensionScore(**d) for d in item.pop("dimensions", [])]
@@ -388,8 +396,17 @@ def save_scores(scores: list[PRScore], storage_path: Path) -> None:
     storage_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 
-def upsert_score(score: PRScore, storage_path: Path) -> list[PRScore]:
-    """Add or replace a PR score in storage. Returns updated list."""
+def upsert_score(score: PRScore, storage_path) -> list[PRScore]:
+    """Add or replace a PR score in storage. Returns updated list.
+
+    *storage_path* is a legacy JSON file (rewritten in full) or a
+    :class:`src.metrics_store.MetricsStore` (a single indexed upsert).
+    """
+    from src.metrics_store import MetricsStore
+
+    if isinstance(storage_path, MetricsStore):
+        storage_path.upsert_pr_score(asdict(score), total=score.total)
+        return load_scores(storage_path)
     scores = load_scores(storage_path)
     scores = [s for s in scores if s.pr_number != score.pr_number]
     scores.append(score)
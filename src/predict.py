@@ -28,6 +28,9 @@ from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import parse_file, read_source
+from src.session_index import load_session_index
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -140,16 +143,15 @@ def _parse_session_log(log_path: Path) -> list[dict]:
     """Parse AWAKE_LOG.md into a list of session dicts."""
     if not log_path.exists():
         return []
-    text = log_path.read_text(encoding="utf-8")
-    # Extract session blocks by heading
-    session_re = re.compile(
-        r"## Session (\d+)[^\n]*\n(.*?)(?=## Session \d+|$)",
-        re.DOTALL,
-    )
+    index = load_session_index(log_path)
     sessions = []
-    for m in session_re.finditer(text):
-        num = int(m.group(1))
-        body = m.group(2)
+    for entry in index:
+        section = index.section(entry)
+        if "\n" not in section:
+            continue
+        num = entry.number
+        # Session body: everything after the heading line
+        body = section[section.index("\n") + 1:]
         # Extract modules mentioned (src/*.py references)
         modules = re.findall(r"`src/([a-z_]+)\.py`", body)
         # Extract PR count from stats snapshot
@@ -198,11 +200,12 @@ def _compute_age_signal(module: str, sessions: list[dict], latest_session: int)
     return PredictionSignal(name="Module Age", score=score, weight=0.25, rationale=rationale)
 
 
-def _compute_coverage_signal(module: str, repo_path: Path) -> PredictionSignal:
+def _compute_coverage_signal(module: str, repo_path: Path, context=None) -> PredictionSignal:
     """Modules with low test coverage get higher urgency."""
     try:
-        from src.coverage_map import build_coverage_map
-        cov = build_coverage_map(repo_path=repo_path)
+        from src.analysis_context import AnalysisContext
+        ctx = context if context is not None else AnalysisContext(repo_path)
+        cov = ctx.coverage_map
         entry = next((e for e in cov.entries if e.module_name == module), None)
         if entry is None:
             return PredictionSignal(
@@ -230,7 +233,9 @@ def _compute_complexity_signal(module: str, repo_path: Path) -> PredictionSignal
         if not src_file.exists():
             return PredictionSignal(name="Complexity", score=30.0, weight=0.20, rationale="file not found")
         import ast
-        tree = ast.parse(src_file.read_text(encoding="utf-8"))
+        tree = parse_file(src_file)
+        if tree is None:
+            raise SyntaxError(str(src_file))
         # Rough complexity: count branches
         branch_nodes = (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With)
         branch_count = sum(1 for n in ast.walk(tree) if isinstance(n, branch_nodes))
@@ -252,7 +257,9 @@ def _compute_todo_signal(module: str, repo_path: Path) -> PredictionSignal:
         src_file = repo_path / "src" / f"{module}.py"
         if not src_file.exists():
             return PredictionSignal(name="TODO Debt", score=0.0, weight=0.15, rationale="file not found")
-        text = src_file.read_text(encoding="utf-8")
+        text = read_source(src_file)
+        if text is None:
+            raise OSError(str(src_file))
         todo_count = len(re.findall(r"#\s*(TODO|FIXME|HACK|XXX)", text, re.IGNORECASE))
         urgency = min(100.0, todo_count * 25.0)
         rationale = f"{todo_count} TODO/FIXME annotations"
@@ -303,10 +310,17 @@ def _build_recommendation(module: str, signals: list[PredictionSignal], score: f
 # Public API
 # ---------------------------------------------------------------------------
 
-def predict_next_session(repo_path: Path) -> PredictionReport:
-    """Analyse session history and produce a ranked set of next-session actions."""
+def predict_next_session(repo_path: Path, context=None) -> PredictionReport:
+    """Analyse session history and produce a ranked set of next-session actions.
+
+    *context* is an optional :class:`src.analysis_context.AnalysisContext`;
+    the coverage map is built once from it and shared by every module.
+    """
     import datetime
 
+    from src.analysis_context import AnalysisContext
+
+    ctx = context if context is not None else AnalysisContext(repo_path)
     log_path = repo_path / "AWAKE_LOG.md"
     sessions = _parse_session_log(log_path)
     latest_session = sessions[-1]["session"] if sessions else 0
@@ -322,7 +336,7 @@ def predict_next_session(repo_path: Path) -> PredictionReport:
     for module in modules:
         # Compute all signals
         age_sig = _compute_age_signal(module, sessions, latest_session)
-        cov_sig = _compute_coverage_signal(module, repo_path)
+        cov_sig = _compute_coverage_signal(module, repo_path, ctx)
         cx_sig = _compute_complexity_signal(module, repo_path)
         todo_sig = _compute_todo_signal(module, repo_path)
         health_sig = _compute_health_signal(module, sessions)
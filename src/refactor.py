@@ -28,6 +28,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -309,17 +311,13 @@ def _analyse_file(path: Path, repo_root: Path) -> FileRefactorResult:
     rel = str(path.relative_to(repo_root))
     result = FileRefactorResult(path=rel)
 
-    try:
-        source = path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
+    parsed = load_source(path)
+    if parsed is None or parsed.tree is None:
         return result
 
-    source_lines = source.splitlines()
-
-    try:
-        tree = ast.parse(source, filename=str(path))
-    except SyntaxError:
-        return result
+    source = parsed.text
+    source_lines = list(parsed.lines)
+    tree = parsed.tree
 
     result.suggestions += _analyse_missing_docstrings(tree, source_lines, rel)
     result.suggestions += _analyse_long_lines(source_lines, rel)
@@ -369,17 +367,26 @@ class RefactorEngine:
         self,
         glob: str = "src/**/*.py",
         exclude: Optional[list[str]] = None,
+        jobs: int = 1,
     ) -> RefactorReport:
-        """Analyse all Python source files and return a RefactorReport."""
+        """Analyse all Python source files and return a RefactorReport.
+
+        ``jobs > 1`` analyses files in that many worker processes; results
+        are merged in path order, identical to the serial run.
+        """
+        from src._parallel import map_files
+
         exclude = exclude or ["__init__"]
         ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
         report = RefactorReport(generated_at=ts, session=self.session)
 
-        for py_file in sorted(self.repo_path.glob(glob)):
-            rel = str(py_file.relative_to(self.repo_path))
-            if any(ex in rel for ex in exclude):
-                continue
-            file_result = _analyse_file(py_file, self.repo_path)
+        files = [
+            py_file for py_file in sorted(self.repo_path.glob(glob))
+            if not any(ex in str(py_file.relative_to(self.repo_path)) for ex in exclude)
+        ]
+        for file_result in map_files(
+            _analyse_file, files, [self.repo_path] * len(files), jobs=jobs
+        ):
             if file_result.suggestions:
                 report.files.append(file_result)
 
@@ -398,12 +405,15 @@ class RefactorEngine:
         return applied
 
 
-def find_refactor_candidates(repo_path: Path | None = None) -> list[RefactorSuggestion]:
+def find_refactor_candidates(
+    repo_path: Path | None = None,
+    jobs: int = 1,
+) -> list[RefactorSuggestion]:
     """Convenience wrapper: return flat list of all refactor suggestions.
 
     Used by ``src.audit`` and other modules that only need the candidate list
     without the full engine/report machinery.
     """
     engine = RefactorEngine(repo_path=repo_path)
-    report = engine.analyze()
+    report = engine.analyze(jobs=jobs)
     return report.all_suggestions
@@ -396,9 +396,9 @@ def format_reflection(report):
     return "\n".join(lines)
 
 
-def reflect_to_json(report):
-    """Serialize ReflectionReport to JSON."""
-    data = {
+def reflect_to_dict(report) -> dict:
+    """Serialize ReflectionReport to a JSON-compatible dict."""
+    return {
         "total_sessions": report.total_sessions,
         "avg_score": report.avg_score,
         "score_trend": report.score_trend,
@@ -417,7 +417,11 @@ def reflect_to_json(report):
         "patterns": report.patterns,
         "insights": report.insights,
     }
-    return json.dumps(data, indent=2)
+
+
+def reflect_to_json(report):
+    """Serialize ReflectionReport to JSON."""
+    return json.dumps(reflect_to_dict(report), indent=2)
 
 
 def save_reflection(report, path):
@@ -135,25 +135,16 @@ class ReleaseNotes:
 
 
 def _git_log_range(repo_root: Path, since_tag: Optional[str] = None, max_count: int = 200) -> list[dict]:
-    sep = "\x1e"
-    fmt = f"{sep}%H{sep}%s{sep}%b{sep}%an{sep}%ae"
-    cmd = ["git", "log", f"--format={fmt}"]
+    from src.git_log import iter_commits
+
     if since_tag:
-        cmd.append(f"{since_tag}..HEAD")
+        log = iter_commits(repo_root, f"{since_tag}..HEAD")
     else:
-        cmd += [f"--max-count={max_count}"]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(repo_root), timeout=30)
-        if result.returncode != 0:
-            return []
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return []
-    commits = []
-    raw = result.stdout.split(sep)[1:]
-    it = iter(raw)
-    for sha, subject, body, author_name, author_email in zip(it, it, it, it, it):
-        commits.append({"sha": sha.strip(), "subject": subject.strip(), "body": body.strip(), "author": author_name.strip(), "email": author_email.strip()})
-    return commits
+        log = iter_commits(repo_root, max_count=max_count)
+    return [
+        {"sha": c.sha, "subject": c.subject, "body": c.body, "author": c.author, "email": c.email}
+        for c in log
+    ]
 
 
 def _latest_tag(repo_root: Path) -> Optional[str]:
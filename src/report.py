@@ -18,14 +18,11 @@ CLI
 
 from __future__ import annotations
 
-import json
-import subprocess
-import sys
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 
 from src.scoring import grade_colour as _grade_colour, score_colour as _score_colour, score_to_grade as _score_to_grade
 
@@ -178,36 +175,28 @@ def _render_html(report: ExecutiveReport) -> str:
 </html>"""
 
 
-def _run_cmd(args: list[str], repo_root: Path) -> Optional[dict]:
-    """Run a awake CLI command and return parsed JSON."""
+# Analyses the report draws on, keyed by section.  Each loader reads one
+# report from the shared AnalysisContext; independent loaders run in parallel.
+_LOADERS: dict[str, Callable] = {
+    "stats": lambda ctx: ctx.repo_stats,
+    "health": lambda ctx: ctx.health,
+}
+
+
+def _load(name: str, context) -> Optional[Any]:
+    """Return the *name* analysis from *context*, or None if it fails."""
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli"] + args + ["--json"],
-            capture_output=True, text=True, cwd=str(repo_root), timeout=60,
-        )
-        if result.returncode != 0:
-            return None
-        out = result.stdout
-        for i, ch in enumerate(out):
-            if ch in ("{", "["):
-                return json.loads(out[i:])
-        return None
+        return _LOADERS[name](context)
     except Exception:
         return None
 
 
-def _safe_score(d: Optional[dict], *keys: str) -> Optional[float]:
-    if not d:
-        return None
-    for k in keys:
-        if isinstance(d, dict):
-            d = d.get(k)
-        else:
-            return None
-    try:
-        return float(d)
-    except (TypeError, ValueError):
-        return None
+def _gather(context, names: Iterable[str]) -> dict[str, Optional[Any]]:
+    """Load every analysis in *names* concurrently, preserving order."""
+    names = list(names)
+    with ThreadPoolExecutor(max_workers=max(len(names), 1)) as pool:
+        results = list(pool.map(lambda n: _load(n, context), names))
+    return dict(zip(names, results))
 
 
 # _score_to_grade imported from src.scoring above
@@ -237,42 +226,49 @@ def _bar_chart_html(items: list) -> str:
     return f'<div>{"".join(rows)}</div>'
 
 
-def generate_report(repo_root: Path, session_number: int = 0) -> ExecutiveReport:
-    """Build the full executive report by gathering all analysis outputs."""
+def generate_report(repo_root: Path, session_number: int = 0, *, context=None) -> ExecutiveReport:
+    """Build the full executive report by gathering all analysis outputs.
+
+    Analyses run in-process and concurrently.  Pass *context* (an
+    :class:`src.analysis_context.AnalysisContext`) to reuse reports that
+    other aggregators have already computed.
+    """
+    from src.analysis_context import AnalysisContext
+
+    repo_root = Path(repo_root)
+    ctx = context if context is not None else AnalysisContext(repo_root)
     now = datetime.now(timezone.utc).strftime("%B %d, %Y at %H:%M UTC")
     repo_name = repo_root.name
 
     if session_number == 0:
-        log = repo_root / "AWAKE_LOG.md"
-        if log.exists():
-            import re
-            matches = re.findall(r"## Session (\d+)", log.read_text())
-            if matches:
-                session_number = int(matches[-1])
+        try:
+            session_number = ctx.session_index.latest_number or 0
+        except Exception:
+            session_number = 0
 
     sections: list[ReportSection] = []
     scores: list[float] = []
     headline: dict = {}
 
-    stats_data = _run_cmd(["stats"], repo_root)
-    if stats_data:
-        nights = stats_data.get("sessions_count", 0)
-        prs = stats_data.get("total_prs", 0)
-        commits = stats_data.get("total_commits", 0)
-        lines = stats_data.get("total_lines_changed", 0)
-        headline.update({"Sessions": nights, "Total PRs": prs, "Commits": commits, "Lines Changed": f"{lines:,}" if isinstance(lines, int) else lines})
+    data = _gather(ctx, _LOADERS)
+
+    stats = data["stats"]
+    if stats is not None:
+        lines = stats.lines_changed
+        headline.update({
+            "Sessions": stats.nights_active,
+            "Total PRs": stats.total_prs,
+            "Commits": stats.total_commits,
+            "Lines Changed": f"{lines:,}" if isinstance(lines, int) else lines,
+        })
         content = _html_table_from_list([{"Metric": k, "Value": v} for k, v in headline.items()], ["Metric", "Value"])
         sections.append(ReportSection(title="Repository Stats", icon="&#128202;", content_html=content))
 
-    health_data = _run_cmd(["health"], repo_root)
-    health_score = _safe_score(health_data, "overall_health_score")
-    if health_score is None:
-        health_score = _safe_score(health_data, "summary", "average_health")
-    if health_score is not None:
+    health = data["health"]
+    if health is not None:
+        health_score = float(health.overall_health_score)
         scores.append(health_score)
-    if health_data:
-        files = health_data.get("files", [])
-        bar_items = [(f.get("name", ""), float(f.get("health_score", 0)), _score_colour(float(f.get("health_score", 0)))) for f in files[:10]]
+        bar_items = [(Path(f.path).name, f.health_score, _score_colour(f.health_score)) for f in health.files[:10]]
         content = f"<p>Overall health: <strong>{health_score:.0f}/100</strong></p>{_bar_chart_html(bar_items)}"
         sections.append(ReportSection(title="Code Health", icon="&#127973;", content_html=content, score=health_score, grade=_score_to_grade(health_score)))
 
@@ -10,7 +10,8 @@ Checks performed
 3. ``subprocess`` with ``shell=True``  — shell injection vector
 4. ``os.system`` calls                 — shell injection vector
 5. ``hashlib.md5`` / ``hashlib.sha1``  — weak hash algorithms
-6. Hardcoded secrets (naive heuristic) — passwords/tokens/keys in literals
+6. Hardcoded secrets (naive heuristic) — passwords/tokens/keys in literals;
+   with ``whole_repo=True`` every text file in the repo is checked
 7. ``tempfile.mktemp`` (deprecated)    — insecure temp file creation
 8. ``yaml.load`` without Loader=       — arbitrary code execution via YAML
 9. ``assert`` used for access control  — stripped in optimised mode
@@ -23,22 +24,27 @@ Public API
 ----------
 - ``SecurityFinding`` — a single finding
 - ``SecurityReport``  — full report
-- ``audit_security(repo_path)`` → ``SecurityReport``
+- ``audit_security(repo_path, whole_repo=False)`` → ``SecurityReport``
 - ``save_security_report(report, out_path)``
 
 CLI
 ---
-    awake security [--write] [--json]
+    awake security [--write] [--json] [--whole-repo]
 """
 
 from __future__ import annotations
 
 import ast
 import json
+import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+from src._ast_utils import (
+    AstPass, load_source, pass_result, register_pass,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -201,32 +207,156 @@ class SecurityReport:
 # Regex-based heuristics for hardcoded secrets
 # ---------------------------------------------------------------------------
 
-_SECRET_PATTERNS: list[tuple[re.Pattern, str]] = [
-    (re.compile(r'(?i)(password|passwd|pwd)\s*=\s*["\'][^"\']{4,}["\']'), "Hardcoded password literal"),
-    (re.compile(r'(?i)(api_key|apikey|api_token|secret_key|secret)\s*=\s*["\'][^"\']{8,}["\']'), "Hardcoded API key/secret"),
-    (re.compile(r'(?i)(token|auth_token|access_token)\s*=\s*["\'][^"\']{8,}["\']'), "Hardcoded auth token"),
-    (re.compile(r'(?i)private_key\s*=\s*["\'][^"\']{8,}["\']'), "Hardcoded private key"),
+#: ``(group name, key alternation, minimum literal length, title)``.  The
+#: alternatives are compiled into a single regex so each line is matched
+#: once rather than once per pattern.
+_SECRET_PATTERNS: list[tuple[str, str, int, str]] = [
+    ("password", r"password|passwd|pwd", 4, "Hardcoded password literal"),
+    ("api_key", r"api_key|apikey|api_token|secret_key|secret", 8, "Hardcoded API key/secret"),
+    ("token", r"token|auth_token|access_token", 8, "Hardcoded auth token"),
+    ("private_key", r"private_key", 8, "Hardcoded private key"),
 ]
 
+# ``[ \t]`` and ``\n`` in the literal class keep every match on one line.
+_SECRET_SOURCE = "(?i)" + "|".join(
+    rf"""(?P<{name}>(?:{keys})[ \t]*=[ \t]*["'][^"'\n]{{{min_len},}}["'])"""
+    for name, keys, min_len, _ in _SECRET_PATTERNS
+)
+_SECRET_RE = re.compile(_SECRET_SOURCE)
+_SECRET_CANDIDATE_BYTES = re.compile(rb"""=[ \t]*["']""")
+_SECRET_TITLES: dict[str, str] = {name: title for name, _, _, title in _SECRET_PATTERNS}
+
+#: Files at least this large are scanned through ``mmap`` instead of being read.
+MMAP_THRESHOLD = 1 << 20
+
+#: Directories never descended into by a whole-repo scan outside git.
+_SKIP_DIRS = frozenset({
+    ".git", ".awake", "__pycache__", "node_modules", ".venv", "venv",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+})
+
+
+def _secret_finding(rel: str, lineno: int, line: str, title: str) -> SecurityFinding:
+    return SecurityFinding(
+        rule="S010",
+        title=title,
+        severity="HIGH",
+        cwe="CWE-259",
+        file=rel,
+        line=lineno,
+        snippet=line.strip()[:80],
+        description=(
+            "Hardcoded credentials in source code can be "
+            "extracted from version control history. Use "
+            "environment variables or a secrets manager."
+        ),
+    )
+
+
+def _scan_secret_lines(lines: list[str], rel: str) -> list[SecurityFinding]:
+    """Return one S010 finding per line of *lines* holding a secret-like assignment."""
+    findings = []
+    for lineno, line in enumerate(lines, start=1):
+        # Every pattern needs ``=`` and a quote; most lines have neither.
+        if "=" not in line or ('"' not in line and "'" not in line):
+            continue
+        m = _SECRET_RE.search(line)
+        if m:
+            findings.append(_secret_finding(rel, lineno, line, _SECRET_TITLES[m.lastgroup]))
+    return findings
+
+
+def _scan_secret_buffer(buf, rel: str) -> list[SecurityFinding]:
+    """Scan a bytes-like *buf* (e.g. an ``mmap``) without splitting it into lines.
+
+    Every pattern has ``=`` followed by a quote, so candidate positions are
+    found with one literal-prefixed regex over the whole buffer.  Only the
+    lines that hold one are decoded and matched with the same ``str`` pattern
+    as :func:`_scan_secret_lines`, so minimum literal lengths count
+    characters, not UTF-8 bytes.
+    """
+    findings: list[SecurityFinding] = []
+    line_no, counted_to, line_end = 1, 0, -1
+    for candidate in _SECRET_CANDIDATE_BYTES.finditer(buf):
+        if candidate.start() < line_end:
+            continue
+        start = buf.rfind(b"\n", 0, candidate.start()) + 1
+        line_end = buf.find(b"\n", candidate.end())
+        if line_end == -1:
+            line_end = len(buf)
+        text = buf[start:line_end].decode("utf-8", "replace")
+        m = _SECRET_RE.search(text)
+        if m:
+            line_no += buf[counted_to:start].count(b"\n")
+            counted_to = start
+            findings.append(_secret_finding(rel, line_no, text, _SECRET_TITLES[m.lastgroup]))
+    return findings
+
+
+def _scan_secrets_file(path: Path, rel: str) -> list[SecurityFinding]:
+    """Secret-scan any text file; binary and unreadable files yield no findings."""
+    import mmap
+
+    try:
+        with path.open("rb") as fh:
+            if b"\0" in fh.read(8192):
+                return []
+            size = path.stat().st_size
+            if size == 0:
+                return []
+            if size >= MMAP_THRESHOLD:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    return _scan_secret_buffer(buf, rel)
+            fh.seek(0)
+            data = fh.read()
+    except (OSError, ValueError):
+        return []
+    return _scan_secret_buffer(data, rel)
+
+
+def _repo_text_files(repo_path: Path, exclude: set[Path]) -> list[Path]:
+    """Return the repo's files (git-tracked plus untracked, unignored) minus *exclude*."""
+    from src.incremental import git_paths
+
+    listed = git_paths(["ls-files", "--cached", "--others", "--exclude-standard"], repo_path)
+    if listed is not None:
+        candidates = [repo_path / p for p in listed]
+    else:
+        candidates = []
+        for root, dirs, names in os.walk(repo_path):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            candidates.extend(Path(root) / name for name in names)
+    return sorted(p for p in candidates if p not in exclude and p.is_file())
+
 
 # ---------------------------------------------------------------------------
 # AST-based checks
 # ---------------------------------------------------------------------------
 
 
-class _SecurityVisitor(ast.NodeVisitor):
-    """Walk an AST and emit security findings."""
+def _snippet(lines: Sequence[str], lineno: int) -> str:
+    """Return the source line at *lineno* (1-based), truncated to 80 chars."""
+    if 1 <= lineno <= len(lines):
+        return lines[lineno - 1].strip()[:80]
+    return ""
+
+
+class _SecurityVisitor(AstPass):
+    """Walk an AST and emit security findings.
 
-    def __init__(self, rel_path: str, source_lines: list[str]) -> None:
+    Findings carry *rel_path* as their ``file``; the shared instance run by
+    :func:`~src._ast_utils.pass_result` has neither a path nor the source
+    lines, so :func:`_scan_file` fills in ``file`` and ``snippet`` per call.
+    """
+
+    def __init__(self, rel_path: str = "", source_lines: Sequence[str] = ()) -> None:
         self.findings: list[SecurityFinding] = []
         self._rel = rel_path
         self._lines = source_lines
 
     def _snippet(self, lineno: int) -> str:
         """Return the source line at *lineno* (1-based), truncated to 80 chars."""
-        if 1 <= lineno <= len(self._lines):
-            return self._lines[lineno - 1].strip()[:80]
-        return ""
+        return _snippet(self._lines, lineno)
 
     def _add(self, rule: str, title: str, severity: str, cwe: str,
              lineno: int, description: str) -> None:
@@ -328,8 +458,6 @@ class _SecurityVisitor(ast.NodeVisitor):
                     "tempfile.NamedTemporaryFile() instead.",
                 )
 
-        self.generic_visit(node)
-
     # ---- S009: assert for access control ----
     def visit_Assert(self, node: ast.Assert) -> None:  # noqa: N802
         """Flag assert statements used for authentication or access control checks"""
@@ -348,15 +476,71 @@ class _SecurityVisitor(ast.NodeVisitor):
                 "assert statements are removed when Python runs with -O "
                 "(optimise flag). Do not use assert for security checks.",
             )
-        self.generic_visit(node)
+
+
+register_pass("security", _SecurityVisitor)
 
 
 # ---------------------------------------------------------------------------
 # Core analysis
 # ---------------------------------------------------------------------------
 
-
-def audit_security(repo_path: Optional[Path] = None) -> SecurityReport:
+#: Bump whenever the emitted findings change so stale cache entries are ignored.
+_CACHE_VERSION = "2"
+
+
+def _scan_file(py_file: Path, rel: str) -> Optional[list[SecurityFinding]]:
+    """Run every check on *py_file*; ``None`` if it cannot be parsed."""
+    parsed = load_source(py_file)
+    if parsed is None or parsed.tree is None:
+        return None
+    source_lines = parsed.lines
+
+    # AST-based checks (shared traversal; stamp this file's path and lines on the copies)
+    findings = [
+        replace(f, file=rel, snippet=_snippet(source_lines, f.line))
+        for f in pass_result(parsed, "security").findings
+    ]
+
+    # Regex-based heuristic checks (hardcoded secrets)
+    findings.extend(_scan_secret_lines(source_lines, rel))
+    return findings
+
+
+def _audit_file(py_file: Path, rel: str, cache=None) -> Optional[list[SecurityFinding]]:
+    """Return findings for *py_file*, consulting the on-disk *cache* first."""
+    digest = cache.digest(py_file) if cache is not None else None
+    if digest is not None:
+        payload = cache.get(digest)
+        if payload is not None:
+            if not payload["ok"]:
+                return None
+            return [SecurityFinding(file=rel, **f) for f in payload["findings"]]
+
+    findings = _scan_file(py_file, rel)
+    if digest is not None:
+        cache.put(digest, {
+            "ok": findings is not None,
+            "findings": [
+                {
+                    "rule": f.rule, "title": f.title, "severity": f.severity,
+                    "cwe": f.cwe, "line": f.line, "snippet": f.snippet,
+                    "description": f.description,
+                }
+                for f in findings or []
+            ],
+        })
+    return findings
+
+
+def audit_security(
+    repo_path: Optional[Path] = None,
+    *,
+    cache: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
+    whole_repo: bool = False,
+) -> SecurityReport:
     """Audit all src/ Python files for common security anti-patterns.
 
     Parameters
@@ -364,6 +548,20 @@ def audit_security(repo_path: Optional[Path] = None) -> SecurityReport:
     repo_path:
         Root of the Awake repo.  Defaults to the repo root when
         installed via ``pip install -e .``.
+    cache:
+        Reuse per-file findings from ``<repo_path>/.awake/cache`` while the
+        file content is unchanged.
+    jobs:
+        Worker processes for per-file scanning (0 = all CPUs).  Findings are
+        merged in path order, identical to the serial run.
+    incremental:
+        Re-scan only files git reports changed since the last incremental
+        run (see :mod:`src.incremental`); implies *cache*.
+    whole_repo:
+        Also run the hardcoded-secret check over every other text file in
+        the repository (tests, configs, docs; git-tracked and untracked but
+        not ignored files).  Files of ``MMAP_THRESHOLD`` bytes or more are
+        scanned through ``mmap``.
     """
     if repo_path is None:
         repo_path = Path(__file__).resolve().parent.parent
@@ -372,46 +570,32 @@ def audit_security(repo_path: Optional[Path] = None) -> SecurityReport:
 
     report = SecurityReport(repo_path=str(repo_path))
 
-    if not src_dir.exists():
+    py_files = sorted(src_dir.glob("*.py")) if src_dir.exists() else []
+    extra_files = _repo_text_files(repo_path, set(py_files)) if whole_repo else []
+    if not py_files and not extra_files:
         return report
-
-    py_files = sorted(src_dir.glob("*.py"))
-    report.files_scanned = len(py_files)
-
-    for py_file in py_files:
-        try:
-            source = py_file.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(py_file))
-        except SyntaxError:
-            continue
-
-        rel = str(py_file.relative_to(repo_path))
-        source_lines = source.splitlines()
-
-        # AST-based checks
-        visitor = _SecurityVisitor(rel, source_lines)
-        visitor.visit(tree)
-        report.findings.extend(visitor.findings)
-
-        # Regex-based heuristic checks (hardcoded secrets)
-        for lineno, raw_line in enumerate(source_lines, start=1):
-            for pattern, title in _SECRET_PATTERNS:
-                if pattern.search(raw_line):
-                    snippet = raw_line.strip()[:80]
-                    report.findings.append(SecurityFinding(
-                        rule="S010",
-                        title=title,
-                        severity="HIGH",
-                        cwe="CWE-259",
-                        file=rel,
-                        line=lineno,
-                        snippet=snippet,
-                        description=(
-                            "Hardcoded credentials in source code can be "
-                            "extracted from version control history. Use "
-                            "environment variables or a secrets manager."
-                        ),
-                    ))
+    report.files_scanned = len(py_files) + len(extra_files)
+
+    store = None
+    if cache or incremental:
+        from src.analysis_cache import open_cache
+        store = open_cache(
+            repo_path, "security", _CACHE_VERSION, incremental=incremental
+        )
+
+    from src._parallel import map_files
+
+    rels = [str(f.relative_to(repo_path)) for f in py_files]
+    for findings in map_files(
+        _audit_file, py_files, rels, [store] * len(py_files), jobs=jobs
+    ):
+        if findings:
+            report.findings.extend(findings)
+    extra_rels = [str(f.relative_to(repo_path)) for f in extra_files]
+    for findings in map_files(_scan_secrets_file, extra_files, extra_rels, jobs=jobs):
+        report.findings.extend(findings)
+    if incremental:
+        store.record_run(py_files)
 
     return report
 
@@ -186,19 +186,10 @@ def _get_latest_tag(repo_path: Path) -> Optional[str]:
 
 def _get_commits_since(ref: Optional[str], repo_path: Path) -> list[tuple[str, str]]:
     """Return list of (sha, subject) since *ref* (or all commits if None)."""
-    if ref:
-        log_range = f"{ref}..HEAD"
-    else:
-        log_range = "HEAD"
-    out = _run_git(["log", log_range, "--format=%H|%s"], repo_path)
-    if not out:
-        return []
-    result = []
-    for line in out.splitlines():
-        if "|" in line:
-            sha, subject = line.split("|", 1)
-            result.append((sha.strip(), subject.strip()))
-    return result
+    from src.git_log import iter_commits
+
+    log_range = f"{ref}..HEAD" if ref else "HEAD"
+    return [(c.sha, c.subject) for c in iter_commits(repo_path, log_range)]
 
 
 def _parse_version(version: str) -> tuple[int, int, int]:
@@ -1,7 +1,12 @@
 """HTTP API server for the Awake dashboard — Session 17 update.
 
 Wraps CLI commands as JSON HTTP endpoints.  Uses only stdlib
-(http.server + subprocess) to maintain the zero-dependency principle.
+(http.server) to maintain the zero-dependency principle; commands are
+dispatched in-process via :mod:`src.dispatch`.  Requests are served by a
+bounded pool of worker threads, and simultaneous identical requests are
+coalesced into a single command run.  Command results are cached until the
+repository changes (see :mod:`src.api_cache`) and responses carry ETags so
+browsers revalidate with ``304 Not Modified``.
 
 Endpoints
 ---------
@@ -36,6 +41,7 @@ GET /api/openapi         -- OpenAPI 3.1 spec for this server (Session 17)
 GET /api/report          -- Executive HTML summary report (Session 17)
 GET /api/modules         -- Module interconnection Mermaid graph (Session 17)
 GET /api/trends          -- Historical session-over-session trend data (Session 17)
+                            ?from=&to=&points= selects a session range and downsamples
 GET /api/commits         -- Commit message quality analysis (Session 17)
 GET /api/diff-sessions/<a>/<b> -- Compare sessions A and B (Session 17)
 GET /api/test-quality    -- Test quality grader (Session 17)
@@ -52,12 +58,18 @@ from __future__ import annotations
 
 import json
 import re
-import subprocess
-import sys
+import threading
 import webbrowser
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Hashable, Optional
+
+from src.api_cache import DEFAULT_TTL, ResultCache, etag_for, etag_matches
+
+
+#: Default number of threads serving requests concurrently.
+DEFAULT_WORKERS = 8
 
 
 ROUTE_MAP: dict[str, list[str]] = {
@@ -99,6 +111,12 @@ ROUTE_MAP: dict[str, list[str]] = {
     "/api/status": ["status", "--json"],
 }
 
+#: Query-string parameters forwarded to a static route's command, as
+#: ``{route: {param: cli_flag}}``.  Values must be non-negative integers.
+QUERY_PARAMS: dict[str, dict[str, str]] = {
+    "/api/trends": {"from": "--from", "to": "--to", "points": "--points"},
+}
+
 PARAMETERIZED_ROUTES: dict[str, tuple[str, list[str]]] = {
     r"/api/replay/(\d+)": ("replay", ["--json", "--session"]),
     r"/api/diff/(\d+)": ("diff", ["--json", "--session"]),
@@ -108,33 +126,170 @@ PARAMETERIZED_ROUTES: dict[str, tuple[str, list[str]]] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+
+
+class _Flight:
+    """One in-progress computation that later callers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single computation.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running block and receive the same result (or exception).  Once
+    the call finishes the key is forgotten, so the next request recomputes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, sharing one execution among concurrent callers of *key*."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+#: Process-wide coalescing of identical in-flight command runs.
+_COMMAND_FLIGHTS = SingleFlight()
+
+
+class AwakeHTTPServer(ThreadingHTTPServer):
+    """HTTP server that handles requests on a bounded pool of worker threads.
+
+    ``ThreadingHTTPServer`` starts a new thread per connection; the dashboard
+    fires a dozen queries at once, so requests are instead queued onto
+    *workers* threads and a slow ``/api/audit`` no longer blocks the rest.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        workers: int = DEFAULT_WORKERS,
+        cache_ttl: float = DEFAULT_TTL,
+    ) -> None:
+        super().__init__(server_address, handler_class)
+        self.workers = max(1, workers)
+        self.result_cache = ResultCache(ttl=cache_ttl)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="awake-api"
+        )
+
+    def process_request(self, request, client_address) -> None:
+        """Queue the request onto the worker pool instead of a new thread."""
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        """Close the socket and stop accepting queued work."""
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _query_args(path: str, query: str) -> list[str]:
+    """Translate *query* into CLI flags for *path* using :data:`QUERY_PARAMS`.
+
+    Unknown parameters are ignored; a known parameter with a non-integer
+    value raises ``ValueError``.
+    """
+    from urllib.parse import parse_qsl
+
+    flags = QUERY_PARAMS.get(path)
+    if not flags or not query:
+        return []
+    args: list[str] = []
+    for name, value in parse_qsl(query):
+        flag = flags.get(name)
+        if flag is None or value == "":
+            continue
+        if not value.isdigit():
+            raise ValueError(f"query parameter {name!r} must be a non-negative integer")
+        args += [flag, value]
+    return args
+
+
 class AwakeHandler(BaseHTTPRequestHandler):
     """HTTP request handler that dispatches to awake CLI commands."""
 
     def _run_command(self, cli_args: list[str]) -> str:
-        """Run a awake CLI command and return the JSON portion of stdout."""
-        repo = getattr(self.server, "repo_path", Path("."))
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli"] + cli_args,
-            capture_output=True,
-            text=True,
-            cwd=str(repo),
-            timeout=120,
+        """Run a awake CLI command and return its JSON result as a response body.
+
+        Commands are dispatched in-process (see :mod:`src.dispatch`); those
+        in ``SUBPROCESS_COMMANDS`` still run in a child interpreter.
+        Simultaneous identical requests share one run.
+        """
+        from src.dispatch import run_command
+
+        repo = Path(getattr(self.server, "repo_path", Path(".")))
+        return _COMMAND_FLIGHTS.do(
+            (str(repo), tuple(cli_args)),
+            lambda: json.dumps(run_command(cli_args, repo), indent=2, default=str),
         )
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr or "Command failed")
-        output = result.stdout
-        for i, ch in enumerate(output):
-            if ch in ("{", "["):
-                return output[i:]
-        return output
+
+    def _cached_command(self, cli_args: list[str]) -> str:
+        """Return :meth:`_run_command` output, served from the server's result cache.
+
+        Entries are invalidated when the repo fingerprint (HEAD, ``src/``
+        tree, ``AWAKE_LOG.md`` mtime) changes or their TTL expires.
+        """
+        cache = getattr(self.server, "result_cache", None)
+        if not isinstance(cache, ResultCache):
+            return self._run_command(cli_args)
+        repo = Path(getattr(self.server, "repo_path", Path(".")))
+        key = (str(repo), tuple(cli_args))
+        fingerprint = cache.fingerprint(repo)
+        body = cache.get(key, fingerprint)
+        if body is None:
+            body = self._run_command(cli_args)
+            cache.put(key, fingerprint, body)
+        return body
 
     def _send_json(self, code: int, body: str) -> None:
+        etag = None
+        if code == 200:
+            etag = etag_for(body)
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                code, body = 304, ""
         self.send_response(code)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
         self.send_header("Content-Type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, If-None-Match")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
         self.end_headers()
         self.wfile.write(body.encode("utf-8"))
 
@@ -145,12 +300,17 @@ class AwakeHandler(BaseHTTPRequestHandler):
     def do_GET(self) -> None:
         """Route incoming GET requests to the appropriate CLI command or handler"""
         # Strip query string for routing
-        path = self.path.split("?")[0]
+        path, _, query = self.path.partition("?")
 
         # Static routes
         if path in ROUTE_MAP:
             try:
-                output = self._run_command(ROUTE_MAP[path])
+                extra = _query_args(path, query)
+            except ValueError as exc:
+                self._send_json(400, json.dumps({"error": str(exc)}))
+                return
+            try:
+                output = self._cached_command(ROUTE_MAP[path] + extra)
                 self._send_json(200, output)
             except Exception as exc:
                 self._send_json(500, json.dumps({"error": str(exc)}))
@@ -163,14 +323,14 @@ class AwakeHandler(BaseHTTPRequestHandler):
                 try:
                     if cmd == "teach":
                         param = match.group(1)
-                        output = self._run_command([cmd, param] + base_args)
+                        output = self._cached_command([cmd, param] + base_args)
                     elif cmd == "diff-sessions":
                         # Two parameters: session_a and session_b
                         a, b = match.group(1), match.group(2)
-                        output = self._run_command([cmd, a, b] + base_args)
+                        output = self._cached_command([cmd, a, b] + base_args)
                     else:
                         param = match.group(1)
-                        output = self._run_command([cmd] + base_args + [param])
+                        output = self._cached_command([cmd] + base_args + [param])
                     self._send_json(200, output)
                 except Exception as exc:
                     self._send_json(500, json.dumps({"error": str(exc)}))
@@ -209,12 +369,13 @@ class AwakeHandler(BaseHTTPRequestHandler):
             try:
                 import sys as _sys
                 _sys.path.insert(0, str(Path(__file__).resolve().parent))
-                from session_scorer import score_session, score_all_sessions, session_score_to_json, SESSION_DATA
+                from session_scorer import score_session, score_all_sessions, session_score_to_json, session_row
                 import json as _json
+                log_path = Path(getattr(self.server, "repo_path", Path("."))) / "AWAKE_LOG.md"
                 parts = path.split("/")
                 if len(parts) >= 4 and parts[3].isdigit():
                     session_num = int(parts[3])
-                    row = next((r for r in SESSION_DATA if r[0] == session_num), None)
+                    row = session_row(session_num, log_path)
                     if row:
                         _, features, tests, cli, api, health = row
                         score = score_session(session_num, features, tests, cli, api, health)
@@ -222,7 +383,7 @@ class AwakeHandler(BaseHTTPRequestHandler):
                     else:
                         self._send_json(404, _json.dumps({"error": f"No data for session {session_num}"}))
                 else:
-                    scores = score_all_sessions()
+                    scores = score_all_sessions(log_path)
                     data = [{"session": s.session, "total": s.total, "grade": s.grade,
                              "verdict": s.verdict} for s in scores]
                     self._send_json(200, _json.dumps({"scores": data}, indent=2))
@@ -272,9 +433,17 @@ def start_server(
     port: int = 8710,
     repo_path: Optional[Path] = None,
     open_browser: bool = True,
+    workers: int = DEFAULT_WORKERS,
+    cache_ttl: float = DEFAULT_TTL,
 ) -> None:
-    """Start the dashboard API server."""
-    server = HTTPServer(("127.0.0.1", port), AwakeHandler)
+    """Start the dashboard API server with *workers* request threads.
+
+    Command results are cached for up to *cache_ttl* seconds (``0`` disables
+    the cache) or until the repository changes.
+    """
+    server = AwakeHTTPServer(
+        ("127.0.0.1", port), AwakeHandler, workers=workers, cache_ttl=cache_ttl
+    )
     server.repo_path = repo_path or Path(__file__).resolve().parent.parent
     print(f"Awake API server running on http://127.0.0.1:{port}")
     if open_browser:
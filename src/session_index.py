@@ -0,0 +1,354 @@
+"""Indexed, shared view of AWAKE_LOG.md for Awake's session-history modules.
+
+stats, timeline, predict, insights, trend_data, session_replay,
+diff_sessions, compare, story and maturity all need the log split into
+``## Session N`` sections.  Instead of each one re-reading and re-splitting
+the file, they ask :func:`load_session_index` for a :class:`SessionIndex`:
+the sections' offsets plus a little metadata, built once per process and
+persisted to disk so the next process skips the scan as well.
+
+A section starts at a line matching ``## Session <N>`` and runs up to the
+next such line (or the end of the log); it includes its header line.  Each
+module still applies its own regexes to :meth:`SessionIndex.section` text.
+
+Caching
+-------
+In memory the index is keyed by the log's resolved path and revalidated by
+``(mtime_ns, size)``; on disk it lives at::
+
+    <log dir>/.awake/cache/session-index-v<version>/<log name>.json
+
+and is trusted while the log's ``(mtime_ns, size)`` still match, without
+reading the log at all.  Logs modified within :data:`_RACY_WINDOW_NS` of being
+indexed are re-hashed instead, as in :mod:`src._ast_utils`, and an index
+whose content digest still matches is reused.
+
+Public API
+----------
+- ``SessionEntry``                      — one indexed section
+- ``SessionIndex``                      — the index with its query methods
+- ``load_session_index(log_path)``      → ``SessionIndex`` (empty if missing)
+- ``clear_session_index_cache()``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+try:
+    from src.analysis_cache import CACHE_DIR
+except ModuleNotFoundError:
+    from analysis_cache import CACHE_DIR
+
+
+#: Bump whenever the on-disk index format or SessionEntry fields change.
+_INDEX_VERSION = "1"
+
+#: Logs whose mtime is this close to the indexing time are re-hashed on lookup.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_HEADER_RE = re.compile(r"^##[ \t]+Session[ \t]+(\d+)(.*)$", re.MULTILINE)
+_MODULE_RE = re.compile(r"src/(\w+)\.py", re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_LONG_DATE_RE = re.compile(r"\b([A-Z][a-z]+\.? \d{1,2}, \d{4})\b")
+
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SessionEntry:
+    """One ``## Session N`` section of the log."""
+
+    number: int
+    #: Header text after ``## Session N``, e.g. ``"— February 27, 2026"``.
+    title: str
+    #: ISO date found in the header, or ``None``.
+    date: Optional[str]
+    #: Character offsets of the section in the normalised log text.
+    start: int
+    end: int
+    #: Lower-cased names of modules mentioned as ``src/<name>.py``.
+    modules: frozenset[str]
+
+    def to_list(self) -> list:
+        """Serialise to the compact on-disk form."""
+        return [self.number, self.title, self.date, self.start, self.end,
+                sorted(self.modules)]
+
+    @classmethod
+    def from_list(cls, row: list) -> "SessionEntry":
+        """Inverse of :meth:`to_list`."""
+        number, title, iso, start, end, modules = row
+        return cls(number, title, iso, start, end, frozenset(modules))
+
+
+def _parse_header_date(title: str) -> Optional[str]:
+    """Return the ISO date in a session header, or ``None``."""
+    m = _ISO_DATE_RE.search(title)
+    if m:
+        try:
+            return date.fromisoformat(m.group(1)).isoformat()
+        except ValueError:
+            return None
+    m = _LONG_DATE_RE.search(title)
+    if m:
+        text = m.group(1).replace(".", "")
+        for fmt in ("%B %d, %Y", "%b %d, %Y"):
+            try:
+                return datetime.strptime(text, fmt).date().isoformat()
+            except ValueError:
+                continue
+    return None
+
+
+def _scan(text: str) -> tuple[SessionEntry, ...]:
+    """Split *text* into :class:`SessionEntry` records in log order."""
+    headers = list(_HEADER_RE.finditer(text))
+    entries = []
+    for i, m in enumerate(headers):
+        start = m.start()
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        title = m.group(2).strip()
+        entries.append(SessionEntry(
+            number=int(m.group(1)),
+            title=title,
+            date=_parse_header_date(title),
+            start=start,
+            end=end,
+            modules=frozenset(
+                name.lower() for name in _MODULE_RE.findall(text, start, end)
+            ),
+        ))
+    return tuple(entries)
+
+
+class SessionIndex:
+    """Parsed section index of one AWAKE_LOG.md.
+
+    Iterating yields :class:`SessionEntry` objects in log order.  The log
+    text itself is read lazily, the first time a section is requested.
+    """
+
+    def __init__(
+        self,
+        entries: tuple[SessionEntry, ...] = (),
+        *,
+        path: Optional[Path] = None,
+        text: Optional[str] = None,
+        digest: str = "",
+    ) -> None:
+        self.path = path
+        self.digest = digest
+        self._text = text
+        self._set_entries(entries)
+
+    def _set_entries(self, entries: tuple[SessionEntry, ...]) -> None:
+        self._entries = entries
+        self._by_number: dict[int, SessionEntry] = {e.number: e for e in entries}
+
+    @classmethod
+    def from_text(cls, text: str) -> "SessionIndex":
+        """Index log *text* that did not come from a file."""
+        return cls(_scan(text), text=text)
+
+    # -- access ----------------------------------------------------------
+
+    def __iter__(self) -> Iterator[SessionEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def text(self) -> str:
+        """The full (newline-normalised) log text."""
+        if self._text is None:
+            digest, text = _read_text(self.path) if self.path is not None else ("", "")
+            if digest != self.digest:
+                # The log changed since it was indexed: re-index what we read.
+                self._set_entries(_scan(text))
+                self.digest = digest
+            self._text = text
+        return self._text
+
+    def section(self, entry: SessionEntry) -> str:
+        """Return the text of *entry*, header line included."""
+        return self.text[entry.start:entry.end]
+
+    # -- queries ---------------------------------------------------------
+
+    def get(self, number: int) -> Optional[SessionEntry]:
+        """Return session *number* (the last one, if the log repeats it)."""
+        return self._by_number.get(number)
+
+    def numbers(self) -> list[int]:
+        """Return every session number, in log order."""
+        return [e.number for e in self._entries]
+
+    @property
+    def latest_number(self) -> Optional[int]:
+        """Number of the last section in the log, or ``None`` if empty."""
+        return self._entries[-1].number if self._entries else None
+
+    def mentioning(self, module: str) -> list[SessionEntry]:
+        """Return the sessions that mention ``src/<module>.py``, in log order."""
+        key = module.lower()
+        return [e for e in self._entries if key in e.modules]
+
+    def first_mentions(self) -> dict[str, SessionEntry]:
+        """Map every mentioned module to the first session mentioning it."""
+        first: dict[str, SessionEntry] = {}
+        for entry in self._entries:
+            for name in entry.modules:
+                first.setdefault(name, entry)
+        return first
+
+    def between(
+        self,
+        start: Union[date, str, None] = None,
+        end: Union[date, str, None] = None,
+    ) -> list[SessionEntry]:
+        """Return dated sessions whose header date lies in ``[start, end]``."""
+        lo = start.isoformat() if isinstance(start, date) else start
+        hi = end.isoformat() if isinstance(end, date) else end
+        return [
+            e for e in self._entries
+            if e.date is not None
+            and (lo is None or e.date >= lo)
+            and (hi is None or e.date <= hi)
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Loading and caching
+# ---------------------------------------------------------------------------
+
+
+def _read_text(path: Path) -> tuple[str, str]:
+    """Return ``(sha256, text)`` of *path*, newlines normalised as read_text does."""
+    data = path.read_bytes()
+    text = data.decode("utf-8", errors="replace")
+    return hashlib.sha256(data).hexdigest(), text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _disk_path(log_path: Path) -> Path:
+    return log_path.parent / CACHE_DIR / f"session-index-v{_INDEX_VERSION}" / f"{log_path.name}.json"
+
+
+def _load_disk(log_path: Path) -> Optional[dict]:
+    """Return the persisted index payload for *log_path*, or ``None``."""
+    try:
+        payload = json.loads(_disk_path(log_path).read_text(encoding="utf-8"))
+        payload["entries"] = tuple(SessionEntry.from_list(r) for r in payload.pop("sessions"))
+        return payload
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_disk(log_path: Path, st: os.stat_result, index: "SessionIndex") -> None:
+    """Persist *index* atomically; write failures are silently ignored."""
+    target = _disk_path(log_path)
+    payload = {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "indexed_ns": time.time_ns(),
+        "digest": index.digest,
+        "sessions": [e.to_list() for e in index],
+    }
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
+
+
+def _is_fresh(st: os.stat_result, mtime_ns: int, size: int, indexed_ns: int) -> bool:
+    """True if *st* matches a record taken at *indexed_ns*, outside the racy window."""
+    return (
+        st.st_mtime_ns == mtime_ns
+        and st.st_size == size
+        and st.st_mtime_ns < indexed_ns - _RACY_WINDOW_NS
+    )
+
+
+@dataclass
+class _Memo:
+    mtime_ns: int
+    size: int
+    loaded_ns: int
+    index: SessionIndex
+
+
+_MEMO: dict[str, _Memo] = {}
+_LOCK = threading.Lock()
+
+
+def load_session_index(log_path: Path, *, persist: bool = True) -> SessionIndex:
+    """Return the :class:`SessionIndex` of *log_path*.
+
+    Parameters
+    ----------
+    log_path:
+        Path to AWAKE_LOG.md.  A missing or unreadable file yields an empty
+        index.
+    persist:
+        Read and write the on-disk copy under ``.awake/cache``.
+    """
+    path = Path(log_path).resolve()
+    key = str(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return SessionIndex(path=Path(log_path), text="")
+
+    with _LOCK:
+        memo = _MEMO.get(key)
+    if memo is not None and _is_fresh(st, memo.mtime_ns, memo.size, memo.loaded_ns):
+        return memo.index
+
+    disk = _load_disk(path) if persist else None
+    if disk is not None and _is_fresh(st, disk["mtime_ns"], disk["size"], disk["indexed_ns"]):
+        # Trust the stat signature: the log is only read if a section is asked for.
+        index = SessionIndex(disk["entries"], path=path, digest=disk["digest"])
+    else:
+        try:
+            digest, text = _read_text(path)
+        except OSError:
+            return SessionIndex(path=Path(log_path), text="")
+        if memo is not None and memo.index.digest == digest:
+            index = memo.index
+        else:
+            entries = disk["entries"] if disk is not None and disk["digest"] == digest else _scan(text)
+            index = SessionIndex(entries, path=path, text=text, digest=digest)
+        if persist:
+            _save_disk(path, st, index)
+
+    with _LOCK:
+        _MEMO[key] = _Memo(st.st_mtime_ns, st.st_size, time.time_ns(), index)
+    return index
+
+
+def clear_session_index_cache() -> None:
+    """Forget every in-memory index (the on-disk copies are kept)."""
+    with _LOCK:
+        _MEMO.clear()
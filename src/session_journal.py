@@ -0,0 +1,278 @@
+"""Append-only structured session journal that sits beside AWAKE_LOG.md.
+
+Every entry written by :func:`src.session_logger.append_session_to_log` is
+also appended, as one JSON object per line, to ``AWAKE_LOG.jsonl`` next to
+the Markdown log.  History readers (replay, diff-sessions, trends,
+session-score) use the journal when it has the session they need, and fall
+back to scraping the Markdown for older sessions written before it existed.
+
+Offset index
+------------
+``<log dir>/.awake/cache/session-journal-v<version>/<journal name>.idx`` maps a session number to
+the byte range of its latest journal line, so :func:`read_session` costs
+one seek in the index and one in the journal however long the log grows::
+
+    header  : 8-byte magic, u64 journal size covered by the index
+    slot N  : u64 offset, u64 length      (at byte 16 + 16 * N; 0 = absent)
+
+The index is derived data: when its recorded size disagrees with the
+journal's (a crash, a hand edit, a fresh clone) it is rebuilt with one scan.
+
+Public API
+----------
+- ``journal_path(log_path)``          → ``Path`` of the ``.jsonl`` journal
+- ``append_record(log_path, record)`` — append one session record
+- ``read_session(log_path, number)``  → latest record for *number* or ``None``
+- ``load_records(log_path)``          → ``{number: record}`` (latest wins)
+- ``record_metrics(record)``          → numeric metrics from a record
+- ``rebuild_index(log_path)``
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from src.analysis_cache import CACHE_DIR
+except ModuleNotFoundError:
+    from analysis_cache import CACHE_DIR
+
+#: Journal format version stored in every record.
+JOURNAL_VERSION = 1
+
+_MAGIC = b"AWKJIDX1"
+_HEADER = struct.Struct("<8sQ")
+_SLOT = struct.Struct("<QQ")
+
+#: Session numbers above this are journaled but not indexed (keeps the
+#: sparse index file bounded).
+_MAX_INDEXED_SESSION = 1_000_000
+
+_INT_RE = re.compile(r"-?\d[\d,]*")
+_FLOAT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+
+def journal_path(log_path: Path) -> Path:
+    """Return the journal that accompanies *log_path* (``AWAKE_LOG.jsonl``)."""
+    log_path = Path(log_path)
+    return log_path.with_suffix(".jsonl")
+
+
+def _index_path(log_path: Path) -> Path:
+    journal = journal_path(log_path)
+    return journal.parent / CACHE_DIR / f"session-journal-v{JOURNAL_VERSION}" / f"{journal.name}.idx"
+
+
+# ---------------------------------------------------------------------------
+# Index maintenance
+# ---------------------------------------------------------------------------
+
+
+def _slot_position(number: int) -> Optional[int]:
+    if not 0 <= number <= _MAX_INDEXED_SESSION:
+        return None
+    return _HEADER.size + number * _SLOT.size
+
+
+def _write_header(fh, size: int) -> None:
+    fh.seek(0)
+    fh.write(_HEADER.pack(_MAGIC, size))
+
+
+def _read_header(fh) -> Optional[int]:
+    fh.seek(0)
+    raw = fh.read(_HEADER.size)
+    if len(raw) != _HEADER.size:
+        return None
+    magic, size = _HEADER.unpack(raw)
+    return size if magic == _MAGIC else None
+
+
+def rebuild_index(log_path: Path) -> None:
+    """Regenerate the offset index from a full scan of the journal."""
+    journal = journal_path(log_path)
+    index = _index_path(log_path)
+    index.parent.mkdir(parents=True, exist_ok=True)
+    slots: dict[int, tuple[int, int]] = {}
+    offset = 0
+    with open(journal, "rb") as fh:
+        for line in fh:
+            number = _record_number(line)
+            if number is not None:
+                slots[number] = (offset, len(line))
+            offset += len(line)
+    tmp = index.with_suffix(".tmp")
+    with open(tmp, "wb") as out:
+        _write_header(out, offset)
+        for number, (start, length) in slots.items():
+            pos = _slot_position(number)
+            if pos is not None:
+                out.seek(pos)
+                out.write(_SLOT.pack(start, length))
+    tmp.replace(index)
+
+
+def _record_number(line: bytes) -> Optional[int]:
+    """Return the session number of a raw journal line, or ``None`` if unusable."""
+    try:
+        number = json.loads(line)["session_number"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    return number if isinstance(number, int) else None
+
+
+def _ensure_index(log_path: Path, journal_size: int) -> None:
+    """Rebuild the index unless it already covers *journal_size* bytes."""
+    try:
+        with open(_index_path(log_path), "rb") as fh:
+            if _read_header(fh) == journal_size:
+                return
+    except OSError:
+        pass
+    rebuild_index(log_path)
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+
+def append_record(log_path: Path, record: dict) -> None:
+    """Append *record* (a ``SessionEntry.to_dict()``) to the journal.
+
+    Adds ``journal_version`` and ``recorded_at`` fields, then points the
+    session's index slot at the new line.
+    """
+    record = {
+        "journal_version": JOURNAL_VERSION,
+        "recorded_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        **record,
+    }
+    data = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+    journal = journal_path(log_path)
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    with open(journal, "ab") as fh:
+        offset = fh.tell()
+        fh.write(data)
+
+    index = _index_path(log_path)
+    index.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(index, "r+b") as fh:
+            if _read_header(fh) != offset:
+                raise OSError("index out of date")
+            pos = _slot_position(record.get("session_number", -1))
+            if pos is not None:
+                fh.seek(pos)
+                fh.write(_SLOT.pack(offset, len(data)))
+            _write_header(fh, offset + len(data))
+    except OSError:
+        rebuild_index(log_path)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+
+def read_session(log_path: Path, number: int) -> Optional[dict]:
+    """Return the latest journal record for session *number*, or ``None``."""
+    journal = journal_path(log_path)
+    try:
+        size = journal.stat().st_size
+    except OSError:
+        return None
+    pos = _slot_position(number)
+    if pos is None:
+        return load_records(log_path).get(number)
+    try:
+        _ensure_index(log_path, size)
+        with open(_index_path(log_path), "rb") as fh:
+            fh.seek(pos)
+            raw = fh.read(_SLOT.size)
+        if len(raw) != _SLOT.size:
+            return None
+        offset, length = _SLOT.unpack(raw)
+        if not length:
+            return None
+        with open(journal, "rb") as fh:
+            fh.seek(offset)
+            return json.loads(fh.read(length))
+    except (OSError, ValueError):
+        return None
+
+
+def load_records(log_path: Path) -> dict[int, dict]:
+    """Return every journaled session as ``{number: record}``, latest line winning."""
+    records: dict[int, dict] = {}
+    try:
+        with open(journal_path(log_path), "rb") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                number = record.get("session_number") if isinstance(record, dict) else None
+                if isinstance(number, int):
+                    records[number] = record
+    except OSError:
+        pass
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Derived metrics
+# ---------------------------------------------------------------------------
+
+
+def _stat(stats: dict, keys: tuple[str, ...], pattern: re.Pattern) -> Optional[str]:
+    for key in keys:
+        if key in stats:
+            m = pattern.search(str(stats[key]))
+            if m:
+                return m.group(0)
+    return None
+
+
+def record_metrics(record: dict) -> dict[str, Any]:
+    """Return the numeric session metrics that a journal record carries.
+
+    Keys: ``prs`` (distinct PR numbers), ``tasks_completed``, ``task_names``,
+    ``tests``, ``modules``, ``lines_changed``, ``cli_commands``,
+    ``api_endpoints`` (``0`` when not recorded) and ``health_score``
+    (``None`` when not recorded).  Counts come from the
+    ``stats_snapshot`` under any of the labels the Markdown log uses.
+    """
+    stats = {str(k).lower().replace(" ", "_"): v
+             for k, v in (record.get("stats_snapshot") or {}).items()}
+    tasks = record.get("tasks") or []
+    pr_numbers = {pr.get("number") for pr in record.get("prs") or []}
+    pr_numbers |= {t["pr"].get("number") for t in tasks if t.get("pr")}
+    pr_numbers.discard(None)
+
+    def _int(*keys: str) -> int:
+        text = _stat(stats, keys, _INT_RE)
+        return int(text.replace(",", "")) if text else 0
+
+    health = _stat(stats, ("health", "health_score"), _FLOAT_RE)
+    return {
+        "prs": len(pr_numbers),
+        "tasks_completed": sum(1 for t in tasks if t.get("status") == "completed"),
+        "task_names": [t.get("name", "") for t in tasks],
+        "tests": _int("tests", "test_count", "test_suite", "total_tests"),
+        "modules": _int("modules", "source_modules", "source_files"),
+        "lines_changed": _int("lines_changed", "lines_added"),
+        "cli_commands": _int("cli_commands", "cli_subcommands", "commands"),
+        "api_endpoints": _int("api_endpoints", "endpoints"),
+        "health_score": float(health) if health else None,
+    }
@@ -3,6 +3,9 @@
 Generates structured, append-only entries for AWAKE_LOG.md at the end
 of each autonomous development session. Records decisions, outcomes, and
 metadata that make the log machine-readable and human-meaningful.
+
+Each entry is also appended to the JSON-lines journal kept by
+:mod:`src.session_journal`, which history readers prefer over the Markdown.
 """
 
 from __future__ import annotations
@@ -14,6 +17,8 @@ from pathlib import Path
 from typing import Optional
 import re
 
+from src.session_journal import append_record
+
 
 @dataclass
 class PRRecord:
@@ -66,6 +71,40 @@ class SessionEntry:
         """Return a dictionary representation of the session entry"""
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionEntry":
+        """Rebuild a session entry from :meth:`to_dict` output (extra keys ignored)."""
+
+        def _pr(raw: Optional[dict]) -> Optional[PRRecord]:
+            if not raw:
+                return None
+            return PRRecord(
+                number=raw.get("number", 0),
+                title=raw.get("title", ""),
+                branch=raw.get("branch", ""),
+                url=raw.get("url", ""),
+                status=raw.get("status", "open"),
+            )
+
+        return cls(
+            session_number=data["session_number"],
+            date=data.get("date", ""),
+            operator=data.get("operator", "Computer (autonomous)"),
+            tasks=[
+                TaskRecord(
+                    name=t.get("name", ""),
+                    description=t.get("description", ""),
+                    status=t.get("status", "completed"),
+                    pr=_pr(t.get("pr")),
+                )
+                for t in data.get("tasks") or []
+            ],
+            prs=[_pr(p) for p in data.get("prs") or [] if p],
+            decisions=list(data.get("decisions") or []),
+            stats_snapshot=dict(data.get("stats_snapshot") or {}),
+            notes=data.get("notes", ""),
+        )
+
     def to_markdown(self) -> str:
         """Render the session entry as a Markdown section for AWAKE_LOG.md."""
         lines = [
@@ -122,12 +161,12 @@ def append_session_to_log(
     *,
     dry_run: bool = False,
 ) -> str:
-    """Append a session entry to AWAKE_LOG.md.
+    """Append a session entry to AWAKE_LOG.md and its JSON-lines journal.
 
     Args:
         log_path: Path to the log file.
         entry: The SessionEntry to append.
-        dry_run: If True, return the new content without writing.
+        dry_run: If True, return the new content without writing either file.
 
     Returns:
         The full new log content.
@@ -149,6 +188,7 @@ def append_session_to_log(
 
     if not dry_run:
         log_path.write_text(updated, encoding="utf-8")
+        append_record(log_path, entry.to_dict())
 
     return updated
 
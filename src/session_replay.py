@@ -1,7 +1,8 @@
 """Session replay module for Awake.
 
 Reconstructs a complete picture of what any past session did, sourced
-entirely from AWAKE_LOG.md.  Given a session number, ``replay()``
+from the structured session journal (``AWAKE_LOG.jsonl``) when it has the
+session and from AWAKE_LOG.md otherwise.  Given a session number, ``replay()``
 returns a ``SessionReplay`` object with:
 
 - Session metadata (date, operator, session number)
@@ -29,6 +30,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from src.session_index import SessionIndex, load_session_index
+from src.session_journal import load_records, read_session
+from src.session_logger import SessionEntry
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -222,25 +227,24 @@ class SessionReplay:
 # Parsing helpers
 # ---------------------------------------------------------------------------
 
-def _extract_session_sections(log_text: str) -> dict[int, str]:
-    """Split AWAKE_LOG.md into per-session text blocks."""
-    sections: dict[int, str] = {}
-    pattern = r"(?=^## Session (\d+)\s*[\u2014-])"
-    parts = re.split(pattern, log_text, flags=re.MULTILINE)
-
-    i = 0
-    while i < len(parts):
-        if i + 1 < len(parts) and parts[i].isdigit():
-            session_num = int(parts[i])
-            session_text = parts[i + 1]
-            sections[session_num] = session_text
-            i += 2
-        else:
-            i += 1
+_REPLAY_HEADER_RE = re.compile(r"## Session (\d+)\s*[\u2014-]")
 
+
+def _sections_from_index(index: SessionIndex) -> dict[int, str]:
+    """Map session number to section text for every replayable section."""
+    sections: dict[int, str] = {}
+    for entry in index:
+        section_text = index.section(entry)
+        if _REPLAY_HEADER_RE.match(section_text):
+            sections[entry.number] = section_text
     return sections
 
 
+def _extract_session_sections(log_text: str) -> dict[int, str]:
+    """Split AWAKE_LOG.md into per-session text blocks."""
+    return _sections_from_index(SessionIndex.from_text(log_text))
+
+
 def _parse_session_section(session_number: int, section_text: str) -> SessionReplay:
     """Parse a single session section from the log into a SessionReplay."""
     date_match = re.search(r"^## Session \d+\s*[\u2014-]\s*(.+)$", section_text, re.MULTILINE)
@@ -367,6 +371,41 @@ def _parse_session_section(session_number: int, section_text: str) -> SessionRep
     )
 
 
+def _replay_from_record(record: dict) -> SessionReplay:
+    """Build a SessionReplay directly from a session journal record."""
+    entry = SessionEntry.from_dict(record)
+    tasks = [
+        ReplayedTask(
+            name=t.name,
+            description=t.description,
+            status=t.status,
+            pr_number=t.pr.number if t.pr else None,
+            pr_url=t.pr.url if t.pr else "",
+        )
+        for t in entry.tasks
+    ]
+    prs = [
+        ReplayedPR(number=p.number, title=p.title, url=p.url, branch=p.branch)
+        for p in entry.prs
+        if p.number
+    ]
+    stats = {
+        str(k).lower().replace(" ", "_"): str(v)
+        for k, v in entry.stats_snapshot.items()
+    }
+    return SessionReplay(
+        session_number=entry.session_number,
+        date=entry.date,
+        operator=entry.operator,
+        tasks=tasks,
+        prs=prs,
+        decisions=list(entry.decisions),
+        stats_snapshot=stats,
+        notes=entry.notes,
+        raw_section=entry.to_markdown(),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -381,35 +420,46 @@ def replay(log_path: Path, session_number: int) -> Optional[SessionReplay]:
     Returns:
         A SessionReplay, or None if session not found.
     """
+    record = read_session(log_path, session_number)
+    if record is not None:
+        return _replay_from_record(record)
+
     if not log_path.exists():
         return None
 
-    log_text = log_path.read_text(encoding="utf-8")
-    sections = _extract_session_sections(log_text)
-
-    if session_number not in sections:
+    index = load_session_index(log_path)
+    entry = index.get(session_number)
+    if entry is None:
+        return None
+    section_text = index.section(entry)
+    if not _REPLAY_HEADER_RE.match(section_text):
         return None
 
-    return _parse_session_section(session_number, sections[session_number])
+    return _parse_session_section(session_number, section_text)
 
 
 def replay_all(log_path: Path) -> list[SessionReplay]:
     """Reconstruct every session from the log.
 
+    Journaled sessions come from their journal records; the rest are
+    parsed from the Markdown log.
+
     Returns:
         List of SessionReplay objects sorted by session_number ascending.
     """
-    if not log_path.exists():
-        return []
-
-    log_text = log_path.read_text(encoding="utf-8")
-    sections = _extract_session_sections(log_text)
-
-    replays = []
-    for session_num in sorted(sections.keys()):
-        replays.append(_parse_session_section(session_num, sections[session_num]))
+    replays: dict[int, SessionReplay] = {
+        num: _replay_from_record(record) for num, record in load_records(log_path).items()
+    }
+    if log_path.exists():
+        index = load_session_index(log_path)
+        for entry in index:
+            if entry.number in replays:
+                continue
+            section_text = index.section(entry)
+            if _REPLAY_HEADER_RE.match(section_text):
+                replays[entry.number] = _parse_session_section(entry.number, section_text)
 
-    return replays
+    return [replays[num] for num in sorted(replays)]
 
 
 def compare_sessions(
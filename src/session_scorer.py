@@ -10,6 +10,10 @@ Rates each Awake session across 5 dimensions:
 
 Produces a 0-100 score and A+/A/B+/B/C/D/F grade for any session.
 
+Scoring inputs come from the structured session journal when it records the
+session and the one before it (the dimensions are deltas between the two),
+and from the built-in SESSION_DATA table otherwise.
+
 CLI: awake session-score [--session N] [--json] [--all]
 API: GET /api/session-score
 """
@@ -17,11 +21,13 @@ API: GET /api/session-score
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional
 
 from src.scoring import score_to_grade as _grade
+from src.session_journal import load_records, read_session, record_metrics
 
 
 # ---------------------------------------------------------------------------
@@ -260,9 +266,9 @@ def format_session_score(score):
     return "\n".join(lines)
 
 
-def session_score_to_json(score):
-    """Serialize to JSON."""
-    data = {
+def session_score_to_dict(score) -> dict:
+    """Serialize SessionQualityScore to a JSON-compatible dict."""
+    return {
         "session": score.session,
         "total": score.total,
         "grade": score.grade,
@@ -276,7 +282,11 @@ def session_score_to_json(score):
             for d in score.dimensions
         ],
     }
-    return json.dumps(data, indent=2)
+
+
+def session_score_to_json(score):
+    """Serialize to JSON."""
+    return json.dumps(session_score_to_dict(score), indent=2)
 
 
 # ---------------------------------------------------------------------------
@@ -306,11 +316,59 @@ SESSION_DATA = [
 ]
 
 
-def score_all_sessions():
-    """Score all historical sessions and return list."""
+_MODULE_RE = re.compile(r"src/\w+\.py")
+
+
+def _row_from_records(session, record, previous):
+    """Build a SESSION_DATA-style row from two consecutive journal records."""
+    cur = record_metrics(record)
+    prev = record_metrics(previous)
+    if cur["modules"] and prev["modules"]:
+        features = max(cur["modules"] - prev["modules"], 0)
+    else:
+        descriptions = " ".join(t.get("description", "") for t in record.get("tasks") or [])
+        features = len(set(_MODULE_RE.findall(descriptions)))
+    health_delta = 0.0
+    if cur["health_score"] is not None and prev["health_score"] is not None:
+        health_delta = round(cur["health_score"] - prev["health_score"], 1)
+    return (
+        session,
+        features,
+        max(cur["tests"] - prev["tests"], 0),
+        max(cur["cli_commands"] - prev["cli_commands"], 0),
+        max(cur["api_endpoints"] - prev["api_endpoints"], 0),
+        health_delta,
+    )
+
+
+def session_row(session, log_path=None):
+    """Return the ``(session, features, tests, cli, api, health_delta)`` row for *session*.
+
+    Prefers the session journal beside *log_path*; falls back to SESSION_DATA.
+    Returns None when neither has the session.
+    """
+    if log_path is not None:
+        record = read_session(Path(log_path), session)
+        previous = read_session(Path(log_path), session - 1) if record else None
+        if record and previous:
+            return _row_from_records(session, record, previous)
+    return next((r for r in SESSION_DATA if r[0] == session), None)
+
+
+def score_all_sessions(log_path=None):
+    """Score all historical sessions and return list.
+
+    With *log_path*, journaled sessions override and extend SESSION_DATA.
+    """
+    rows = {r[0]: r for r in SESSION_DATA}
+    if log_path is not None:
+        records = load_records(Path(log_path))
+        for num, record in records.items():
+            if num - 1 in records:
+                rows[num] = _row_from_records(num, record, records[num - 1])
     return [
         score_session(s, f, t, c, a, h)
-        for s, f, t, c, a, h in SESSION_DATA
+        for s, f, t, c, a, h in (rows[n] for n in sorted(rows))
     ]
 
 
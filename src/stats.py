@@ -20,6 +20,13 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+try:
+    from src.git_log import iter_commits
+    from src.session_index import load_session_index
+except ModuleNotFoundError:
+    from git_log import iter_commits
+    from session_index import load_session_index
+
 
 @dataclass
 class RepoStats:
@@ -94,14 +101,8 @@ def count_lines_changed(repo_path: Optional[Path] = None) -> int:
 
 
 def get_commit_messages(repo_path: Optional[Path] = None) -> list[str]:
-    """Return all commit messages in the repository."""
-    output = _run_git(
-        ["log", "--pretty=format:%s"],
-        cwd=repo_path,
-    )
-    if not output:
-        return []
-    return [line.strip() for line in output.splitlines() if line.strip()]
+    """Return all commit messages (subjects) in the repository."""
+    return [c.subject for c in iter_commits(repo_path) if c.subject]
 
 
 def count_awake_sessions(repo_path: Optional[Path] = None) -> int:
@@ -128,13 +129,12 @@ def parse_awake_log(log_path: Path) -> list[dict]:
     if not log_path.exists():
         return []
 
-    content = log_path.read_text(encoding="utf-8")
+    index = load_session_index(log_path)
     sessions = []
 
-    # Match session headers like: ## Session 1 — February 27, 2026
-    session_blocks = re.split(r"(?=^## Session \d+)", content, flags=re.MULTILINE)
-
-    for block in session_blocks:
+    for entry in index:
+        block = index.section(entry)
+        # Match session headers like: ## Session 1 — February 27, 2026
         header_match = re.match(
             r"## Session (\d+) — (.+?)$", block, flags=re.MULTILINE
         )
@@ -17,9 +17,6 @@ API: GET /api/status
 from __future__ import annotations
 
 import json
-import os
-import subprocess
-import sys
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -181,10 +178,28 @@ def _check_red_flags(health_score, test_count, source_modules):
 # Public API
 # ---------------------------------------------------------------------------
 
-def generate_status(root=None):
-    """Generate a comprehensive status report for the repo."""
+def _context_health_info(context):
+    """(grade, score, trend) from a context's health report, if already computed."""
+    if "health" not in context.computed:
+        return None
+    try:
+        from src.scoring import score_to_grade
+        score = float(context.health.overall_health_score)
+    except Exception:
+        return None
+    return score_to_grade(score), score, "STABLE"
+
+
+def generate_status(root=None, context=None):
+    """Generate a comprehensive status report for the repo.
+
+    With an :class:`src.analysis_context.AnalysisContext`, the session number
+    comes from its session index and the health figures from its health
+    report when another aggregator has already computed it; status never
+    triggers a full health analysis itself.
+    """
     if root is None:
-        root = Path.cwd()
+        root = Path.cwd() if context is None else context.repo_path
     root = Path(root)
 
     src   = root / "src"
@@ -196,7 +211,14 @@ def generate_status(root=None):
     cli_commands     = _count_cli_commands(src / "cli.py")
     api_endpoints    = _count_api_endpoints(src / "server.py")
     session          = _get_session_number(log)
-    health_grade, health_score, health_trend = _get_health_info(src)
+    health_info      = None
+    if context is not None:
+        try:
+            session = max(context.session_index.numbers(), default=session)
+        except Exception:
+            pass
+        health_info = _context_health_info(context)
+    health_grade, health_score, health_trend = health_info or _get_health_info(src)
     top_rec          = _get_top_recommendation(src)
     total_prs        = _get_pr_count(src)
     red_flags, warnings = _check_red_flags(health_score, test_count, source_modules)
@@ -302,9 +324,9 @@ def format_status(report):
     return "\n".join(lines)
 
 
-def status_to_json(report):
-    """Serialize StatusReport to JSON."""
-    data = {
+def status_to_dict(report) -> dict:
+    """Serialize StatusReport to a JSON-compatible dict."""
+    return {
         "generated_at": report.generated_at,
         "session": report.session,
         "project_age_days": report.project_age_days,
@@ -323,7 +345,11 @@ def status_to_json(report):
         "overall_status": report.overall_status,
         "summary": report.summary,
     }
-    return json.dumps(data, indent=2)
+
+
+def status_to_json(report):
+    """Serialize StatusReport to JSON."""
+    return json.dumps(status_to_dict(report), indent=2)
 
 
 if __name__ == "__main__":
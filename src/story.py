@@ -26,6 +26,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from src.session_index import SessionIndex, load_session_index
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -178,14 +180,17 @@ def _parse_int(s: str) -> int:
 
 def _split_sessions(content: str) -> list[tuple[int, str, str]]:
     """Return list of (session_number, date, section_text) tuples."""
+    return _sessions_from_index(SessionIndex.from_text(content))
+
+
+def _sessions_from_index(index: SessionIndex) -> list[tuple[int, str, str]]:
+    """Return (session_number, date, section_text) tuples from an indexed log."""
     results = []
-    matches = list(_SESSION_HEADER_RE.finditer(content))
-    for i, m in enumerate(matches):
-        number = int(m.group(1))
-        date = m.group(2).strip()
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-        results.append((number, date, content[start:end]))
+    for entry in index:
+        section = index.section(entry)
+        m = _SESSION_HEADER_RE.match(section)
+        if m:
+            results.append((int(m.group(1)), m.group(2).strip(), section))
     return results
 
 
@@ -342,8 +347,7 @@ def generate_story(
             prologue="No session history found yet. Run your first awake session to start the story.",
         )
 
-    content = log_path.read_text(encoding="utf-8")
-    sessions_raw = _split_sessions(content)
+    sessions_raw = _sessions_from_index(load_session_index(log_path))
 
     chapters: list[SessionChapter] = []
     cumulative_prs = 0
@@ -0,0 +1,501 @@
+"""Persistent symbol table and reference index for Awake.
+
+Indexes every Python file under ``src/`` and ``tests/``: the definitions it
+makes (top-level functions, classes and methods, by qualified name such as
+``src.health.HealthReport.to_dict``) and the sites that reference them.
+References are resolved through each file's imports, so ``h.analyze()``
+after ``import src.health as h`` points at ``src.health.analyze`` rather
+than at any attribute that happens to be called ``analyze``.
+
+Reference kinds
+---------------
+- ``name``      — a bare name, resolved via imports or the file's own defs
+- ``attribute`` — ``a.b.c`` rooted at a resolvable name, or ``self.x`` /
+  ``cls.x`` inside a class; other attribute accesses stay unresolved
+- ``import``    — the target of an ``import`` / ``from ... import``, and
+  the full dotted module of a plain ``import a.b``
+- ``string``    — an identifier-like string literal (``__all__`` entries,
+  registry tables, ``getattr`` / ``patch`` targets)
+
+Unresolved references keep their leaf ``name`` with an empty ``target``.
+
+The index is built incrementally: each file's entry records its stat
+signature and content digest, and only files whose bytes changed since the
+last build are parsed again.  With ``persist=True`` the index lives at
+``.awake/index/symbols-v<version>.json``.
+
+Public API
+----------
+- ``SymbolDef`` / ``SymbolRef``             — one definition / reference site
+- ``SymbolIndex``                           — queries over the indexed files
+- ``build_symbol_index(repo, roots, persist, jobs)`` → ``SymbolIndex``
+
+CLI
+---
+    awake refs src.health.generate_health_report   # Who references it
+    awake refs generate_health_report --json
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src._ast_utils import AstPass, _RACY_WINDOW_NS, register_pass
+
+
+#: Index directory, relative to the repository root.
+INDEX_DIR = Path(".awake") / "index"
+
+#: Bump whenever the per-file payload changes so stale indexes are rebuilt.
+_INDEX_VERSION = "2"
+
+#: Directories indexed by default, relative to the repository root.
+DEFAULT_ROOTS = ("src", "tests")
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+
+
+# ---------------------------------------------------------------------------
+# Data classes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SymbolDef:
+    """A function, class or method definition."""
+
+    qualname: str    # e.g. "src.health.HealthReport.to_dict"
+    kind: str        # "function" | "class" | "method"
+    file: str        # relative path within repo
+    line: int
+    end_line: int
+
+    def contains(self, ref: "SymbolRef") -> bool:
+        """True if *ref* sits inside this definition's own body."""
+        return ref.file == self.file and self.line <= ref.line <= self.end_line
+
+    @property
+    def name(self) -> str:
+        """Unqualified name of the definition."""
+        return self.qualname.rpartition(".")[2]
+
+    def to_dict(self) -> dict:
+        """Serialise to a JSON-compatible dict."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class SymbolRef:
+    """One site that refers to a symbol."""
+
+    target: str      # resolved qualified name, "" when unresolved
+    name: str        # leaf identifier
+    file: str
+    line: int
+    kind: str        # "name" | "attribute" | "import" | "string"
+
+    def to_dict(self) -> dict:
+        """Serialise to a JSON-compatible dict."""
+        return asdict(self)
+
+
+# ---------------------------------------------------------------------------
+# Per-file collection
+# ---------------------------------------------------------------------------
+
+
+def _chain(node: ast.AST) -> Optional[list[str]]:
+    """Return ``["a", "b", "c"]`` for ``a.b.c``, or ``None`` if not Name-rooted."""
+    parts: list[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return parts[::-1]
+
+
+class _SymbolPass(AstPass):
+    """Collect definitions, imports and raw (unresolved) references in a module."""
+
+    def __init__(self) -> None:
+        self.defs: list[tuple[str, str, int, int]] = []         # (local qualname, kind, line, end)
+        self.imports: list[tuple[str, str, int, int]] = []      # (alias, target, level, line)
+        self.star_imports: list[tuple[str, int]] = []           # (module, level)
+        self.refs: list[tuple[tuple, str, int]] = []            # (chain, class ctx, line)
+        self.strings: list[tuple[str, int]] = []
+        self.modules: list[tuple[str, int]] = []                # (dotted module, line) of plain imports
+        self.names: set[str] = set()                            # Name ids and attribute names
+        self._scope: list[tuple[str, str]] = []                 # ("class" | "function", name)
+
+    def _addressable(self) -> bool:
+        return all(kind == "class" for kind, _ in self._scope)
+
+    def _class_ctx(self) -> str:
+        classes: list[str] = []
+        for kind, name in self._scope:
+            if kind != "class":
+                break
+            classes.append(name)
+        return ".".join(classes)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        """Record a class reachable by qualified name"""
+        if self._addressable():
+            qual = ".".join([n for _, n in self._scope] + [node.name])
+            self.defs.append((qual, "class", node.lineno, node.end_lineno or node.lineno))
+        self._scope.append(("class", node.name))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Record a top-level function or a method"""
+        if self._addressable():
+            qual = ".".join([n for _, n in self._scope] + [node.name])
+            kind = "method" if self._scope else "function"
+            self.defs.append((qual, kind, node.lineno, node.end_lineno or node.lineno))
+        self._scope.append(("function", node.name))
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
+
+    def _leave_scope(self, node: ast.AST) -> None:
+        self._scope.pop()
+
+    leave_FunctionDef = _leave_scope
+    leave_AsyncFunctionDef = _leave_scope
+    leave_ClassDef = _leave_scope
+
+    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
+        """Record the names bound by an import statement"""
+        for alias in node.names:
+            if alias.asname:
+                self.imports.append((alias.asname, alias.name, 0, node.lineno))
+            else:
+                root = alias.name.split(".")[0]
+                self.imports.append((root, root, 0, node.lineno))
+                if root != alias.name:
+                    self.modules.append((alias.name, node.lineno))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
+        """Record the names bound by a from-import statement"""
+        module = node.module or ""
+        for alias in node.names:
+            if alias.name == "*":
+                self.star_imports.append((module, node.level))
+                continue
+            target = f"{module}.{alias.name}" if module else alias.name
+            self.imports.append((alias.asname or alias.name, target, node.level, node.lineno))
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        """Record a name reference"""
+        self.names.add(node.id)
+        if isinstance(node.ctx, ast.Load):
+            self.refs.append(((node.id,), self._class_ctx(), node.lineno))
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
+        """Record an attribute reference with its Name-rooted chain, if any"""
+        self.names.add(node.attr)
+        chain = _chain(node)
+        self.refs.append((tuple(chain) if chain else (None, node.attr), self._class_ctx(), node.lineno))
+
+    def visit_Constant(self, node: ast.Constant) -> None:  # noqa: N802
+        """Record identifier-like string literals"""
+        value = node.value
+        if isinstance(value, str) and len(value) <= 200 and _IDENTIFIER_RE.fullmatch(value):
+            self.strings.append((value, node.lineno))
+
+
+register_pass("symbol_index", _SymbolPass)
+
+
+def module_name(rel: str) -> str:
+    """Return the dotted module name for repo-relative path *rel*."""
+    parts = list(Path(rel).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _absolute(module: str, is_package: bool, target: str, level: int) -> str:
+    """Resolve a relative import *target* at *level* inside *module*."""
+    if level == 0:
+        return target
+    package = module.split(".") if is_package else module.split(".")[:-1]
+    base = package[: len(package) - (level - 1)] if level > 1 else package
+    return ".".join([*base, target] if target else base)
+
+
+def _file_symbols(sp: _SymbolPass, rel: str) -> dict:
+    """Resolve the raw references of one file into its index payload."""
+    module = module_name(rel)
+    is_package = Path(rel).name == "__init__.py"
+    bindings: dict[str, str] = {}
+    imports: list[list] = []
+    refs: set[tuple[str, str, int, str]] = set()
+
+    for name in (q for q, _, _, _ in sp.defs if "." not in q):
+        bindings[name] = f"{module}.{name}"
+    for alias, target, level, line in sp.imports:
+        resolved = _absolute(module, is_package, target, level)
+        bindings[alias] = resolved
+        imports.append([alias, resolved, line])
+        refs.add((resolved, resolved.rpartition(".")[2], line, "import"))
+    for dotted, line in sp.modules:
+        refs.add((dotted, dotted.rpartition(".")[2], line, "import"))
+
+    for chain, ctx, line in sp.refs:
+        root, rest = chain[0], list(chain[1:])
+        kind = "attribute" if rest else "name"
+        if root in ("self", "cls") and ctx and rest:
+            base = f"{module}.{ctx}"
+        elif root is not None and root in bindings:
+            base = bindings[root]
+        else:
+            refs.add(("", chain[-1], line, kind))
+            continue
+        refs.add((".".join([base, *rest]), chain[-1], line, kind))
+
+    for value, line in sp.strings:
+        leaf = value.rpartition(".")[2]
+        refs.add((value if "." in value else "", leaf, line, "string"))
+
+    return {
+        "module": module,
+        "defs": [[f"{module}.{q}", kind, line, end] for q, kind, line, end in sp.defs],
+        "imports": imports,
+        "star": bool(sp.star_imports),
+        "refs": sorted(list(r) for r in refs),
+        "names": sorted(sp.names),
+    }
+
+
+def _index_file(py_file: Path, rel: str) -> Optional[dict]:
+    """Return the index payload for *py_file*, or ``None`` if it cannot be parsed."""
+    from src._ast_utils import load_source, pass_result
+
+    parsed = load_source(py_file)
+    if parsed is None or parsed.tree is None:
+        return None
+    return _file_symbols(pass_result(parsed, "symbol_index"), rel)
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class SymbolIndex:
+    """Definitions and references across the indexed files.
+
+    ``files`` maps each repo-relative path to its payload (``None`` for a
+    file that failed to parse).  Lookup tables are built on first query.
+    """
+
+    def __init__(self, files: dict[str, Optional[dict]]) -> None:
+        self.files = files
+        #: Paths parsed during the build that produced this index.
+        self.reindexed: list[str] = []
+        self._defs: Optional[dict[str, SymbolDef]] = None
+        self._by_target: Optional[dict[str, list[tuple]]] = None
+        self._by_name: Optional[dict[str, list[tuple]]] = None
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __repr__(self) -> str:
+        return f"SymbolIndex(files={len(self.files)}, reindexed={len(self.reindexed)})"
+
+    def payload(self, rel: str) -> Optional[dict]:
+        """Return the raw payload for *rel* (``None`` if missing or unparsable)."""
+        return self.files.get(rel)
+
+    @property
+    def definitions(self) -> dict[str, SymbolDef]:
+        """Every definition, keyed by qualified name."""
+        if self._defs is None:
+            self._defs = {
+                q: SymbolDef(qualname=q, kind=kind, file=rel, line=line, end_line=end)
+                for rel, p in self.files.items() if p
+                for q, kind, line, end in p["defs"]
+            }
+        return self._defs
+
+    def references(self) -> Iterable[SymbolRef]:
+        """Yield every reference site in file order."""
+        for rel, p in self.files.items():
+            if p:
+                for target, name, line, kind in p["refs"]:
+                    yield SymbolRef(target=target, name=name, file=rel, line=line, kind=kind)
+
+    def _canonical(self, target: str, modules: set[str], tops: set[str]) -> str:
+        """Map ``mod.f`` imported via a ``sys.path`` root onto ``src.mod.f``."""
+        parts = target.split(".")
+        if parts[0] in tops:
+            return target
+        for top in tops:
+            if any(".".join([top, *parts[:i]]) in modules for i in range(1, len(parts) + 1)):
+                return f"{top}.{target}"
+        return target
+
+    def _build_lookups(self) -> None:
+        modules = {p["module"] for p in self.files.values() if p}
+        tops = {m.split(".")[0] for m in modules}
+        exact: dict[str, list[tuple]] = {}
+        by_name: dict[str, list[tuple]] = {}
+        for rel, p in self.files.items():
+            if p:
+                for ref in p["refs"]:
+                    table, key = (exact, ref[0]) if ref[0] else (by_name, ref[1])
+                    table.setdefault(key, []).append((rel, ref))
+        # Register each target under every dotted prefix: ``m.C.f`` also references ``m.C``.
+        by_target: dict[str, list[tuple]] = {}
+        for target, refs in exact.items():
+            parts = self._canonical(target, modules, tops).split(".")
+            for i in range(1, len(parts) + 1):
+                by_target.setdefault(".".join(parts[:i]), []).extend(refs)
+        self._by_target, self._by_name = by_target, by_name
+
+    @staticmethod
+    def _refs(entries: list[tuple]) -> list[SymbolRef]:
+        return [
+            SymbolRef(target=target, name=name, file=rel, line=line, kind=kind)
+            for rel, (target, name, line, kind) in entries
+        ]
+
+    def references_to(self, qualname: str) -> list[SymbolRef]:
+        """Return the resolved references to *qualname* or to anything inside it."""
+        if self._by_target is None:
+            self._build_lookups()
+        return self._refs(self._by_target.get(qualname, []))
+
+    def unresolved(self, name: str) -> list[SymbolRef]:
+        """Return the references to leaf *name* that could not be resolved."""
+        if self._by_name is None:
+            self._build_lookups()
+        return self._refs(self._by_name.get(name, []))
+
+    def find(self, name: str) -> list[SymbolDef]:
+        """Return definitions whose qualified name is *name* or ends with ``.name``."""
+        suffix = "." + name
+        return sorted(
+            (d for q, d in self.definitions.items() if q == name or q.endswith(suffix)),
+            key=lambda d: d.qualname,
+        )
+
+    def to_dict(self) -> dict:
+        """Serialise to a JSON-compatible dict."""
+        return {"version": _INDEX_VERSION, "files": self.files}
+
+
+def _index_path(repo_path: Path) -> Path:
+    return Path(repo_path) / INDEX_DIR / f"symbols-v{_INDEX_VERSION}.json"
+
+
+def _load_state(path: Path) -> dict:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("version") != _INDEX_VERSION:
+        return {}
+    return state
+
+
+def _save_state(path: Path, state: dict) -> None:
+    """Atomically write *state*; failures are silently ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(state, fh, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
+
+
+def _python_files(repo_path: Path, roots: Iterable[str]) -> list[Path]:
+    files: list[Path] = []
+    for root in roots:
+        directory = repo_path / root
+        if directory.is_dir():
+            files.extend(f for f in directory.rglob("*.py") if "__pycache__" not in f.parts)
+    return sorted(files)
+
+
+def build_symbol_index(
+    repo_path: Optional[Path] = None,
+    *,
+    roots: Iterable[str] = DEFAULT_ROOTS,
+    persist: bool = True,
+    jobs: int = 1,
+) -> SymbolIndex:
+    """Build (or refresh) the symbol index for *repo_path*.
+
+    Args:
+        repo_path: Repository root.  Defaults to this checkout.
+        roots: Directories to index, relative to *repo_path*.
+        persist: Read and update ``.awake/index``; otherwise index in memory.
+        jobs: Worker processes for parsing changed files (0 = all CPUs).
+
+    A file is re-parsed only when its content digest differs from the
+    indexed one; an unchanged stat signature outside the racy window skips
+    even the digest.
+    """
+    from src._ast_utils import file_digest
+    from src._parallel import map_files
+
+    if repo_path is None:
+        repo_path = Path(__file__).resolve().parent.parent
+    repo_path = Path(repo_path)
+    state_path = _index_path(repo_path)
+    state = _load_state(state_path) if persist else {}
+    previous, saved_ns = state.get("files", {}), state.get("saved_ns", 0)
+
+    entries: dict[str, dict] = {}
+    stale: list[tuple[Path, str]] = []
+    for py_file in _python_files(repo_path, roots):
+        rel = py_file.relative_to(repo_path).as_posix()
+        try:
+            st = py_file.stat()
+        except OSError:
+            continue
+        entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        old = previous.get(rel)
+        if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size \
+                and st.st_mtime_ns < saved_ns - _RACY_WINDOW_NS:
+            entries[rel] = old
+            continue
+        entry["digest"] = file_digest(py_file)
+        if old and entry["digest"] and old.get("digest") == entry["digest"]:
+            entries[rel] = {**old, **entry}
+            continue
+        entries[rel] = entry
+        stale.append((py_file, rel))
+
+    payloads = map_files(
+        _index_file, [f for f, _ in stale], [r for _, r in stale], jobs=jobs
+    )
+    for (_, rel), payload in zip(stale, payloads):
+        entries[rel]["symbols"] = payload
+
+    if persist and (stale or entries.keys() != previous.keys() or any(
+        e["mtime_ns"] != previous[rel]["mtime_ns"] for rel, e in entries.items()
+    )):
+        _save_state(state_path, {
+            "version": _INDEX_VERSION, "saved_ns": time.time_ns(), "files": entries,
+        })
+
+    index = SymbolIndex({rel: e.get("symbols") for rel, e in entries.items()})
+    index.reindexed = [rel for _, rel in stale]
+    return index
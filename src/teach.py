@@ -10,6 +10,9 @@ reads ``src/<name>.py`` and produces a structured walkthrough that explains:
 5. **Usage examples** — practical code snippets showing how to call the module
 6. **Internal design choices** — what decisions are reflected in the code structure
 
+Each public class and function also lists the files that reference it, taken
+from the symbol index (:mod:`src.symbol_index`).
+
 The tutorial is generated entirely from static analysis (AST + source parsing) —
 no runtime execution, no external AI calls.  It reads the same code you already
 have and explains it in plain language.
@@ -29,6 +32,8 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+from src._ast_utils import load_source
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -48,6 +53,7 @@ class FunctionDoc:
     is_method: bool = False
     class_name: str = ""
     body_summary: str = ""       # 1-line summary of what the body does
+    referenced_by: list[str] = field(default_factory=list)  # files that use it
 
     def to_dict(self) -> dict:
         """Return a dictionary representation of the function documentation"""
@@ -65,6 +71,7 @@ class ClassDoc:
     methods: list[str] = field(default_factory=list)
     is_dataclass: bool = False
     line_number: int = 0
+    referenced_by: list[str] = field(default_factory=list)  # files that use it
 
     def to_dict(self) -> dict:
         """Return a dictionary representation of the class documentation"""
@@ -152,6 +159,9 @@ class ModuleTutorial:
                     if public_methods:
                         lines.append(f"**Methods:** `{'`, `'.join(public_methods)}`")
                         lines.append("")
+                if cls.referenced_by:
+                    lines.append(_referenced_by_line(cls.referenced_by))
+                    lines.append("")
 
         # Public API
         if self.functions:
@@ -179,6 +189,9 @@ class ModuleTutorial:
                 if fn.returns:
                     lines.append(f"**Returns:** `{fn.returns}`")
                     lines.append("")
+                if fn.referenced_by:
+                    lines.append(_referenced_by_line(fn.referenced_by))
+                    lines.append("")
 
         # How it works (algorithm narrative)
         entry_fn = _find_entry_function(self.functions)
@@ -215,6 +228,13 @@ class ModuleTutorial:
         return "\n".join(lines)
 
 
+def _referenced_by_line(files: list[str], limit: int = 8) -> str:
+    """Render a ``**Referenced by:**`` line listing at most *limit* files."""
+    shown = "`, `".join(files[:limit])
+    more = f" and {len(files) - limit} more" if len(files) > limit else ""
+    return f"**Referenced by:** `{shown}`{more}"
+
+
 # ---------------------------------------------------------------------------
 # AST extraction
 # ---------------------------------------------------------------------------
@@ -293,16 +313,17 @@ def _get_body_summary(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
 
 def _parse_module(src_path: Path) -> ModuleTutorial:
     """Parse a Python source file into a ModuleTutorial."""
-    source = src_path.read_text(encoding="utf-8")
-    lines_count = len(source.splitlines())
+    parsed = load_source(src_path)
+    if parsed is None:
+        raise FileNotFoundError(src_path)
+    lines_count = len(parsed.lines)
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError as e:
+    tree = parsed.tree
+    if tree is None:
         return ModuleTutorial(
             module_name=src_path.stem,
             module_path=str(src_path),
-            module_docstring=f"(Parse error: {e})",
+            module_docstring=f"(Parse error: {parsed.syntax_error})",
             total_lines=lines_count,
         )
 
@@ -618,7 +639,21 @@ def teach_module(module_name: str, repo_path: Path) -> ModuleTutorial:
                 if not p.stem.startswith("_")
             )
         )
-    return _parse_module(src_path)
+    tutorial = _parse_module(src_path)
+    _attach_references(tutorial, repo_path)
+    return tutorial
+
+
+def _attach_references(tutorial: ModuleTutorial, repo_path: Path) -> None:
+    """Fill ``referenced_by`` for top-level classes and functions from the symbol index."""
+    from src.symbol_index import build_symbol_index
+
+    index = build_symbol_index(repo_path)
+    own_file = f"src/{tutorial.module_name}.py"
+    prefix = f"src.{tutorial.module_name}."
+    for doc in [*tutorial.classes, *(f for f in tutorial.functions if not f.is_method)]:
+        refs = index.references_to(prefix + doc.name)
+        doc.referenced_by = sorted({r.file for r in refs if r.file != own_file})
 
 
 def save_tutorial(tutorial: ModuleTutorial, output_path: Path) -> None:
@@ -19,6 +19,8 @@ from typing import Optional
 
 from src.scoring import score_to_grade as _grade
 
+from src._ast_utils import AstPass, load_source, pass_result, register_pass
+
 @dataclass
 class TestFileScore:
     """Hold quality metrics and score for a single test file"""
@@ -113,7 +115,7 @@ _EDGE_CASE_WORDS = {
 }
 
 
-class _TestFileVisitor(ast.NodeVisitor):
+class _TestFileVisitor(AstPass):
     def __init__(self):
         self.test_count = 0
         self.assertion_count = 0
@@ -131,13 +133,11 @@ class _TestFileVisitor(ast.NodeVisitor):
         for alias in node.names:
             if "mock" in alias.name.lower():
                 self._has_mock_import = True
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Track mock and pytest from-imports"""
         if node.module and ("mock" in node.module.lower() or "pytest" in node.module.lower()):
             self._has_mock_import = True
-        self.generic_visit(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Count tests, docstrings, edge cases, parametrize decorators, and fixtures"""
@@ -162,14 +162,12 @@ class _TestFileVisitor(ast.NodeVisitor):
                 self.parametrize_count += 1
             elif isinstance(dec_node, ast.Attribute) and "fixture" in dec_node.attr.lower():
                 self.fixture_count += 1
-        self.generic_visit(node)
 
     visit_AsyncFunctionDef = visit_FunctionDef
 
     def visit_Assert(self, node: ast.Assert) -> None:
         """Count bare assert statements"""
         self.assertion_count += 1
-        self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:
         """Count assertion helper calls and mock usage"""
@@ -183,7 +181,6 @@ class _TestFileVisitor(ast.NodeVisitor):
                 self.assertion_count += 1
             if node.func.id in ("patch", "MagicMock", "Mock", "AsyncMock"):
                 self.mock_usage += 1
-        self.generic_visit(node)
 
     def visit_With(self, node: ast.With) -> None:
         """Count pytest.raises and pytest.warns context managers as assertions"""
@@ -194,7 +191,9 @@ class _TestFileVisitor(ast.NodeVisitor):
                     self.assertion_count += 1
                 elif isinstance(ctx.func, ast.Name) and ctx.func.id in ("raises", "warns"):
                     self.assertion_count += 1
-        self.generic_visit(node)
+
+
+register_pass("test_quality", _TestFileVisitor)
 
 
 # _grade imported from src.scoring above
@@ -202,14 +201,11 @@ class _TestFileVisitor(ast.NodeVisitor):
 
 def _score_test_file(path: Path, module_name: str) -> TestFileScore:
     fs = TestFileScore(file=path.name, module=module_name)
-    try:
-        source = path.read_text(encoding="utf-8", errors="replace")
-        tree = ast.parse(source)
-    except (SyntaxError, OSError):
+    parsed = load_source(path)
+    if parsed is None or parsed.tree is None:
         fs.issues.append("could not parse")
         return fs
-    visitor = _TestFileVisitor()
-    visitor.visit(tree)
+    visitor = pass_result(parsed, "test_quality")
     fs.test_count = visitor.test_count
     fs.assertion_count = visitor.assertion_count
     fs.mock_usage_count = visitor.mock_usage + (1 if visitor._has_mock_import else 0)
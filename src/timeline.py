@@ -98,21 +98,18 @@ def _parse_log(log_path: Path) -> list[SessionNode]:
     if not log_path.exists():
         return []
 
-    text = log_path.read_text(encoding="utf-8")
-    sections = _SESSION_HEADER_RE.split(text)
+    from src.session_index import load_session_index
 
+    index = load_session_index(log_path)
     nodes: list[SessionNode] = []
-    i = 1
-    while i < len(sections) - 2:
-        session_num_str = sections[i].strip()
-        date_str = sections[i + 1].strip()
-        body = sections[i + 2] if i + 2 < len(sections) else ""
-
-        try:
-            session_num = int(session_num_str)
-        except ValueError:
-            i += 3
+    for entry in index:
+        section = index.section(entry)
+        header = _SESSION_HEADER_RE.match(section)
+        if not header:
             continue
+        session_num = int(header.group(1))
+        date_str = header.group(2).strip()
+        body = section[header.end():]
 
         pr_matches = _PR_LINE_RE.findall(body)
         pr_count = len(set(pr_matches))
@@ -149,7 +146,6 @@ def _parse_log(log_path: Path) -> list[SessionNode]:
             highlight=highlight,
         )
         nodes.append(node)
-        i += 3
 
     nodes.sort(key=lambda n: n.session_number)
 
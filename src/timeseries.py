@@ -0,0 +1,149 @@
+"""Columnar time series with range queries and downsampling.
+
+Session-indexed metrics (health, tests, coverage, ...) are held as one
+sorted ``array('q')`` of x positions (session numbers) plus one
+``array('d')`` per metric, with ``NaN`` marking a missing value.  Range
+queries bisect the x column, so slicing ``[from, to]`` never walks the
+whole history, and :meth:`SeriesFrame.downsample` reduces any number of
+points to a fixed budget of min/max/mean buckets for charting.
+
+Public API
+----------
+- ``Series(name, x, y)``              — one metric column
+- ``SeriesFrame(x, columns)``         — several metrics sharing one x axis
+- ``SeriesFrame.from_rows(rows, x, metrics)`` → ``SeriesFrame``
+- ``bucket_bounds(n, points)``        — equal-count bucket index ranges
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+
+def _to_float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _to_value(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def bucket_bounds(n: int, points: int) -> list[tuple[int, int]]:
+    """Split ``range(n)`` into at most *points* contiguous, near-equal ``(start, stop)`` ranges."""
+    if n <= 0 or points <= 0:
+        return []
+    points = min(points, n)
+    return [(i * n // points, (i + 1) * n // points) for i in range(points)]
+
+
+@dataclass
+class Bucket:
+    """Aggregate of one run of consecutive points."""
+
+    start: int
+    end: int
+    count: int
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+
+
+class Series:
+    """One metric as parallel ``x`` (int) and ``y`` (float, NaN = missing) arrays."""
+
+    __slots__ = ("name", "x", "y")
+
+    def __init__(self, name: str, x: Iterable[int], y: Iterable[Optional[float]]) -> None:
+        self.name = name
+        self.x = x if isinstance(x, array) else array("q", x)
+        self.y = array("d", (_to_float(v) for v in y))
+        if len(self.x) != len(self.y):
+            raise ValueError(f"series {name!r}: {len(self.x)} x values but {len(self.y)} y values")
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __repr__(self) -> str:
+        return f"Series({self.name!r}, points={len(self)})"
+
+    def values(self) -> list[Optional[float]]:
+        """Return the y values with ``None`` for missing points."""
+        return [_to_value(v) for v in self.y]
+
+    def range(self, start: Optional[int] = None, end: Optional[int] = None) -> "Series":
+        """Return the points with ``start <= x <= end`` (either bound may be omitted)."""
+        lo, hi = _slice(self.x, start, end)
+        series = Series.__new__(Series)
+        series.name, series.x, series.y = self.name, self.x[lo:hi], self.y[lo:hi]
+        return series
+
+    def downsample(self, points: int) -> list[Bucket]:
+        """Aggregate the series into at most *points* min/max/mean buckets."""
+        buckets = []
+        for lo, hi in bucket_bounds(len(self), points):
+            present = [v for v in self.y[lo:hi] if not math.isnan(v)]
+            buckets.append(Bucket(
+                start=self.x[lo],
+                end=self.x[hi - 1],
+                count=hi - lo,
+                min=min(present) if present else None,
+                max=max(present) if present else None,
+                mean=sum(present) / len(present) if present else None,
+            ))
+        return buckets
+
+
+class SeriesFrame:
+    """Several metric columns sharing one sorted x axis."""
+
+    __slots__ = ("x", "columns")
+
+    def __init__(self, x: Iterable[int], columns: dict[str, Iterable[Optional[float]]]) -> None:
+        self.x = x if isinstance(x, array) else array("q", x)
+        if any(a > b for a, b in zip(self.x, self.x[1:])):
+            raise ValueError("x values must be sorted")
+        self.columns: dict[str, array] = {
+            name: Series(name, self.x, values).y for name, values in columns.items()
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Sequence, x: str, metrics: Sequence[str]) -> "SeriesFrame":
+        """Build a frame from objects sorted by attribute *x*, one column per metric attribute."""
+        return cls(
+            (getattr(r, x) for r in rows),
+            {m: [getattr(r, m) for r in rows] for m in metrics},
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __repr__(self) -> str:
+        return f"SeriesFrame(points={len(self)}, columns={list(self.columns)})"
+
+    def series(self, name: str) -> Series:
+        """Return column *name* as a :class:`Series`."""
+        series = Series.__new__(Series)
+        series.name, series.x, series.y = name, self.x, self.columns[name]
+        return series
+
+    def range(self, start: Optional[int] = None, end: Optional[int] = None) -> "SeriesFrame":
+        """Return the rows with ``start <= x <= end`` (either bound may be omitted)."""
+        lo, hi = _slice(self.x, start, end)
+        frame = SeriesFrame.__new__(SeriesFrame)
+        frame.x = self.x[lo:hi]
+        frame.columns = {name: col[lo:hi] for name, col in self.columns.items()}
+        return frame
+
+    def downsample(self, points: int) -> dict[str, list[Bucket]]:
+        """Aggregate every column into at most *points* buckets (see :meth:`Series.downsample`)."""
+        return {name: self.series(name).downsample(points) for name in self.columns}
+
+
+def _slice(x: array, start: Optional[int], end: Optional[int]) -> tuple[int, int]:
+    lo = 0 if start is None else bisect_left(x, start)
+    hi = len(x) if end is None else bisect_right(x, end)
+    return lo, max(lo, hi)
@@ -5,6 +5,11 @@ comments.  Maps each annotation to the session when it was introduced (via
 ``git log``), computes its age in sessions, and flags items that have been
 sitting unresolved for more than ``threshold`` sessions.
 
+Each file with annotations is blamed once with ``git blame --porcelain``, and
+the session numbers of all blamed commits are resolved together with a
+batched ``git log --no-walk``, so git is invoked once per annotated file
+rather than twice per annotation.
+
 Output:
 
 - A list of ``TodoItem`` objects with file, line, text, session age
@@ -88,39 +93,79 @@ def _run_git(args: list[str], cwd: Path) -> str:
         return ""
 
 
-def _session_from_commit(commit_sha: str, repo_root: Path) -> Optional[int]:
-    """Extract the Awake session number from a commit's log message.
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+_NULL_SHA = "0" * 40
+
+#: Shas passed to one ``git log --no-walk`` call.
+_SHA_BATCH = 256
+
+#: Session number per commit sha, memoised for the life of the process.
+_SESSION_MEMO: dict[str, Optional[int]] = {}
 
-    Looks for patterns like 'Session: 3' or '[awake] ... session-4-...'
-    in the commit subject + body.
+
+def _session_from_message(message: str) -> Optional[int]:
+    """Extract the Awake session number from a commit message.
+
+    Looks for patterns like 'Session: 3' or '[awake] ... session-4-...'.
     """
-    if not commit_sha:
-        return None
-    log = _run_git(["log", "--format=%s%n%b", "-n", "1", commit_sha], repo_root)
-    m = re.search(r"[Ss]ession[:\s]+(\d+)", log)
+    m = re.search(r"[Ss]ession[:\s]+(\d+)", message)
     if m:
         return int(m.group(1))
     # Try branch name pattern: awake/session-4-something
-    m2 = re.search(r"awake/session-(\d+)", log, re.IGNORECASE)
+    m2 = re.search(r"awake/session-(\d+)", message, re.IGNORECASE)
     if m2:
         return int(m2.group(1))
     return None
 
 
+def _resolve_sessions(shas: set[str], repo_root: Path) -> dict[str, Optional[int]]:
+    """Map each commit sha in *shas* to its session number.
+
+    Shas not yet memoised are looked up with one ``git log --no-walk`` per
+    :data:`_SHA_BATCH` commits rather than one ``git log`` each.
+    """
+    from src.git_log import iter_commits
+
+    missing = sorted(sha for sha in shas if sha not in _SESSION_MEMO)
+    for i in range(0, len(missing), _SHA_BATCH):
+        batch = missing[i:i + _SHA_BATCH]
+        for commit in iter_commits(repo_root, batch, no_walk=True):
+            _SESSION_MEMO[commit.sha] = _session_from_message(commit.message)
+        for sha in batch:
+            _SESSION_MEMO.setdefault(sha, None)
+    return {sha: _SESSION_MEMO.get(sha) for sha in shas}
+
+
+def _session_from_commit(commit_sha: str, repo_root: Path) -> Optional[int]:
+    """Extract the Awake session number from a commit's log message."""
+    if not commit_sha:
+        return None
+    return _resolve_sessions({commit_sha}, repo_root)[commit_sha]
+
+
+def _blame_file(file_path: Path, repo_root: Path) -> dict[int, str]:
+    """Return ``{line_number: commit_sha}`` for every committed line of *file_path*.
+
+    Runs a single ``git blame --porcelain`` over the whole file.  Lines not
+    yet committed are omitted.
+    """
+    rel = str(file_path.relative_to(repo_root))
+    out = _run_git(["blame", "--porcelain", "--", rel], repo_root)
+    shas: dict[int, str] = {}
+    for line in out.splitlines():
+        if line.startswith("\t"):
+            continue
+        # Group header: <sha> <orig_line> <final_line> [<num_lines>]
+        parts = line.split()
+        if len(parts) >= 3 and _SHA_RE.match(parts[0]) and parts[2].isdigit():
+            if parts[0] != _NULL_SHA:
+                shas[int(parts[2])] = parts[0]
+    return shas
+
+
 def _blame_line(file_path: Path, line_number: int, repo_root: Path) -> Optional[str]:
     """Return the commit SHA responsible for *line_number* in *file_path*."""
-    rel = str(file_path.relative_to(repo_root))
-    out = _run_git(
-        ["blame", "-L", f"{line_number},{line_number}", "--porcelain", rel],
-        repo_root,
-    )
-    if not out:
-        return None
-    # First line of porcelain blame output is: <sha> <orig_line> <final_line> ...
-    sha = out.split()[0] if out.split() else None
-    if sha and len(sha) >= 7 and sha != "0" * 40:
-        return sha
-    return None
+    return _blame_file(file_path, repo_root).get(line_number)
 
 
 # ---------------------------------------------------------------------------
@@ -158,8 +203,9 @@ def hunt(
     repo_root = _find_repo_root(src_path)
     items: list[TodoItem] = []
 
-    py_files = sorted(src_path.glob("*.py"))
-    for py_file in py_files:
+    found: list[tuple[Path, int, str, str]] = []
+    blame: dict[Path, dict[int, str]] = {}
+    for py_file in sorted(src_path.glob("*.py")):
         try:
             lines = py_file.read_text(encoding="utf-8", errors="replace").splitlines()
         except OSError:
@@ -169,28 +215,36 @@ def hunt(
             m = TODO_PATTERN.search(line_text)
             if not m:
                 continue
-
-            tag = m.group(1).upper()
-            text = m.group(2).strip()
-
-            # Try to get the blame commit for this line
-            sha = _blame_line(py_file, lineno, repo_root)
-            introduced = _session_from_commit(sha, repo_root) if sha else None
-
-            if introduced is not None:
-                age = max(0, current_session - introduced)
-            else:
-                age = 0
-
-            items.append(TodoItem(
-                file=str(py_file.relative_to(repo_root)),
-                line=lineno,
-                tag=tag,
-                text=text,
-                introduced_session=introduced,
-                age_sessions=age,
-                is_stale=age >= threshold,
-            ))
+            found.append((py_file, lineno, m.group(1).upper(), m.group(2).strip()))
+            # One blame per file that actually has annotations
+            if py_file not in blame:
+                blame[py_file] = _blame_file(py_file, repo_root)
+
+    # Only the commits that introduced annotated lines need a session lookup
+    shas = {
+        sha for py_file, lineno, _, _ in found
+        if (sha := blame[py_file].get(lineno))
+    }
+    sessions = _resolve_sessions(shas, repo_root) if shas else {}
+
+    for py_file, lineno, tag, text in found:
+        sha = blame[py_file].get(lineno)
+        introduced = sessions.get(sha) if sha else None
+
+        if introduced is not None:
+            age = max(0, current_session - introduced)
+        else:
+            age = 0
+
+        items.append(TodoItem(
+            file=str(py_file.relative_to(repo_root)),
+            line=lineno,
+            tag=tag,
+            text=text,
+            introduced_session=introduced,
+            age_sessions=age,
+            is_stale=age >= threshold,
+        ))
 
     # Sort: severity asc, age desc, then file/line
     items.sort(key=lambda i: (i.severity, -i.age_sessions, i.file, i.line))
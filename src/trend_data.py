@@ -1,12 +1,18 @@
 """Historical trend data aggregator for the React dashboard.
 
-Parses AWAKE_LOG.md and available analysis artefacts to produce
+Reads the structured session journal, AWAKE_LOG.md (for sessions the
+journal does not cover) and available analysis artefacts to produce
 session-over-session metrics for dashboard trend charts.
 
+Series are held column-wise in a :class:`src.timeseries.SeriesFrame`, so a
+``[from, to]`` session range is a bisect and ``points`` downsamples long
+histories to a fixed number of min/max/mean buckets for charting.
+
 CLI
 ---
     awake trends                   # Print JSON to stdout
     awake trends --write           # Write docs/trend_data.json
+    awake trends --json --from 10 --to 200 --points 100
 """
 
 from __future__ import annotations
@@ -17,6 +23,14 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+from src.timeseries import SeriesFrame
+
+#: Metrics exposed as chart series, in output order.
+SERIES_METRICS = (
+    "prs", "tests", "modules", "lines_changed", "health_score",
+    "coverage_pct", "security_score", "maturity_avg", "dead_code_count",
+)
+
 
 @dataclass
 class SessionMetrics:
@@ -46,31 +60,79 @@ class TrendData:
     total_sessions: int = 0
     latest_session: int = 0
 
-    def to_dict(self) -> dict:
-        """Return a dictionary representation including chart-ready series data"""
-        return {
-            "sessions": [s.to_dict() for s in self.sessions],
+    def to_dict(
+        self,
+        *,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        points: Optional[int] = None,
+    ) -> dict:
+        """Return a dictionary representation including chart-ready series data.
+
+        Args:
+            start: First session to include.
+            end: Last session to include.
+            points: Maximum number of points per series.  Longer ranges are
+                downsampled into min/max/mean buckets; ``sessions`` is then
+                left empty and ``series`` holds bucket means, with the
+                extremes under ``bands``.
+        """
+        if points is not None and points < 1:
+            raise ValueError(f"points must be at least 1, got {points}")
+        frame = self.frame().range(start, end)
+        downsampled = points is not None and len(frame) > points
+        if downsampled:
+            sessions, series = [], self._downsampled_series(frame, points)
+        else:
+            wanted = set(frame.x)
+            sessions = [s for s in self.sessions if s.session in wanted]
+            series = self._build_series(sessions)
+        data = {
+            "sessions": [s.to_dict() for s in sessions],
             "total_sessions": self.total_sessions,
             "latest_session": self.latest_session,
-            "series": self._build_series(),
+            "series": series,
         }
+        if start is not None or end is not None or points is not None:
+            data["range"] = {
+                "from": start, "to": end, "points": points,
+                "matched": len(frame), "downsampled": downsampled,
+            }
+        return data
+
+    def frame(self) -> SeriesFrame:
+        """Return the per-session metrics as a columnar :class:`SeriesFrame`."""
+        rows = sorted(self.sessions, key=lambda s: s.session)
+        return SeriesFrame.from_rows(rows, "session", SERIES_METRICS)
+
+    @staticmethod
+    def _build_series(sessions: list[SessionMetrics]) -> dict:
+        series: dict = {"labels": [f"S{s.session}" for s in sessions]}
+        for attr in SERIES_METRICS:
+            series[attr] = [getattr(s, attr) for s in sessions]
+        return series
+
+    @staticmethod
+    def _downsampled_series(frame: SeriesFrame, points: int) -> dict:
+        def _round(v: Optional[float]) -> Optional[float]:
+            return None if v is None else round(v, 2)
 
-    def _build_series(self) -> dict:
-        labels = [f"S{s.session}" for s in self.sessions]
-        def _values(attr: str) -> list:
-            return [getattr(s, attr) for s in self.sessions]
-        return {
-            "labels": labels,
-            "prs": _values("prs"),
-            "tests": _values("tests"),
-            "modules": _values("modules"),
-            "lines_changed": _values("lines_changed"),
-            "health_score": _values("health_score"),
-            "coverage_pct": _values("coverage_pct"),
-            "security_score": _values("security_score"),
-            "maturity_avg": _values("maturity_avg"),
-            "dead_code_count": _values("dead_code_count"),
+        buckets = frame.downsample(points)
+        first = buckets[SERIES_METRICS[0]]
+        series: dict = {
+            "labels": [f"S{b.start}" if b.start == b.end else f"S{b.start}-S{b.end}" for b in first],
+            "start": [b.start for b in first],
+            "end": [b.end for b in first],
         }
+        bands: dict = {}
+        for attr in SERIES_METRICS:
+            series[attr] = [_round(b.mean) for b in buckets[attr]]
+            bands[attr] = {
+                "min": [_round(b.min) for b in buckets[attr]],
+                "max": [_round(b.max) for b in buckets[attr]],
+            }
+        series["bands"] = bands
+        return series
 
     def to_markdown(self) -> str:
         """Render the trend data as a Markdown table"""
@@ -127,13 +189,40 @@ def _interpolate_cumulative(metrics: list[SessionMetrics]) -> None:
                 last_value = current
 
 
+def _metrics_from_record(record: dict) -> SessionMetrics:
+    from src.session_journal import record_metrics
+
+    values = record_metrics(record)
+    return SessionMetrics(
+        session=record["session_number"],
+        date=str(record.get("date", "")),
+        prs=values["prs"],
+        tests=values["tests"],
+        modules=values["modules"],
+        lines_changed=values["lines_changed"],
+        health_score=values["health_score"],
+    )
+
+
 def _parse_log(log_path: Path) -> list[SessionMetrics]:
-    if not log_path.exists():
-        return []
-    text = log_path.read_text(encoding="utf-8", errors="replace")
+    from src.session_journal import load_records
+
+    records = load_records(log_path)
+    metrics: list[SessionMetrics] = [_metrics_from_record(r) for r in records.values()]
+    if log_path.exists():
+        metrics.extend(_parse_markdown_log(log_path, skip=records.keys()))
+    return sorted(metrics, key=lambda sm: sm.session)
+
+
+def _parse_markdown_log(log_path: Path, skip=()) -> list[SessionMetrics]:
+    from src.session_index import load_session_index
+
+    index = load_session_index(log_path)
     metrics: list[SessionMetrics] = []
-    session_blocks = re.split(r"(?=## Session \d+)", text)
-    for block in session_blocks:
+    for entry in index:
+        if entry.number in skip:
+            continue
+        block = index.section(entry)
         m = re.match(r"## Session (\d+) . (.+?)$", block, re.MULTILINE)
         if not m:
             continue
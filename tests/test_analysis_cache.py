@@ -0,0 +1,156 @@
+"""Tests for src/analysis_cache.py — persistent per-file analysis cache."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src._ast_utils import clear_source_cache, get_source_store
+from src.analysis_cache import (
+    CACHE_DIR,
+    AnalysisCache,
+    clear_analysis_cache,
+    open_cache,
+)
+from src.complexity import analyze_complexity
+from src.coupling import analyze_coupling
+from src.dead_code import find_dead_code
+from src.health import generate_health_report
+from src.security import audit_security
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "alpha.py").write_text(
+        '"""Alpha."""\n'
+        "import os\n"
+        "from src.beta import helper\n\n"
+        "def run(x):\n"
+        '    """Run."""\n'
+        "    if x and os:\n"
+        "        return helper(x)\n"
+        "    return eval('1')\n"
+    )
+    (src / "beta.py").write_text(
+        "def helper(y):\n"
+        "    return [i for i in range(y)]\n\n"
+        "def unused():\n"
+        "    pass\n"
+        'password = "hunter2hunter2"\n'
+    )
+    (src / "broken.py").write_text("def oops(:\n")
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# AnalysisCache
+# ---------------------------------------------------------------------------
+
+
+class TestAnalysisCache:
+    def test_roundtrip(self, tmp_path: Path):
+        cache = AnalysisCache(tmp_path, "demo", "1")
+        cache.put("ab" * 32, {"x": [1, 2]})
+        assert cache.get("ab" * 32) == {"x": [1, 2]}
+        assert cache.hits == 1
+
+    def test_miss_counts(self, tmp_path: Path):
+        cache = AnalysisCache(tmp_path, "demo", "1")
+        assert cache.get("cd" * 32) is None
+        assert cache.get(None) is None
+        assert cache.misses == 2
+
+    def test_layout_under_awake_dir(self, tmp_path: Path):
+        cache = AnalysisCache(tmp_path, "demo", "3")
+        cache.put("ef" * 32, [])
+        expected = tmp_path / CACHE_DIR / "demo-v3" / "ef" / ("ef" * 32 + ".json")
+        assert json.loads(expected.read_text()) == []
+
+    def test_version_isolates_entries(self, tmp_path: Path):
+        AnalysisCache(tmp_path, "demo", "1").put("aa" * 32, 1)
+        assert AnalysisCache(tmp_path, "demo", "2").get("aa" * 32) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        cache = AnalysisCache(tmp_path, "demo", "1")
+        cache.put("bb" * 32, 1)
+        (cache.directory / "bb" / ("bb" * 32 + ".json")).write_text("{not json")
+        assert cache.get("bb" * 32) is None
+
+    def test_open_cache_disabled(self, tmp_path: Path):
+        assert open_cache(tmp_path, "demo", "1", enabled=False) is None
+        assert isinstance(open_cache(tmp_path, "demo", "1"), AnalysisCache)
+
+    def test_clear(self, tmp_path: Path):
+        cache = AnalysisCache(tmp_path, "demo", "1")
+        cache.put("aa" * 32, 1)
+        cache.put("bb" * 32, 2)
+        assert clear_analysis_cache(tmp_path) == 2
+        assert not (tmp_path / CACHE_DIR).exists()
+        assert clear_analysis_cache(tmp_path) == 0
+
+
+# ---------------------------------------------------------------------------
+# Analyzer integration — cached results must equal fresh results
+# ---------------------------------------------------------------------------
+
+
+def _run_twice(fn, repo: Path):
+    fresh = fn(repo)
+    clear_source_cache()
+    cached = fn(repo)
+    return fresh, cached
+
+
+class TestAnalyzerIntegration:
+    def test_health_cached_matches(self, repo: Path):
+        fresh, cached = _run_twice(
+            lambda r: generate_health_report(r, timestamp="t", cache=True), repo
+        )
+        assert cached.to_dict() == fresh.to_dict()
+
+    def test_complexity_cached_matches(self, repo: Path):
+        fresh, cached = _run_twice(
+            lambda r: analyze_complexity(r, cache=True), repo
+        )
+        assert cached.to_dict() == fresh.to_dict()
+        assert cached.files_scanned == 2
+
+    def test_security_cached_matches(self, repo: Path):
+        fresh, cached = _run_twice(lambda r: audit_security(r, cache=True), repo)
+        assert cached.to_dict() == fresh.to_dict()
+        assert cached.high_count >= 2
+
+    def test_dead_code_cached_matches(self, repo: Path):
+        fresh, cached = _run_twice(lambda r: find_dead_code(r, cache=True), repo)
+        assert cached.to_dict() == fresh.to_dict()
+
+    def test_coupling_cached_matches(self, repo: Path):
+        fresh, cached = _run_twice(lambda r: analyze_coupling(r, cache=True), repo)
+        assert cached.to_dict() == fresh.to_dict()
+
+    def test_warm_run_does_no_parsing(self, repo: Path):
+        analyze_complexity(repo, cache=True)
+        audit_security(repo, cache=True)
+        clear_source_cache()
+        analyze_complexity(repo, cache=True)
+        audit_security(repo, cache=True)
+        assert get_source_store().misses == 0
+
+    def test_edit_invalidates_one_file(self, repo: Path):
+        analyze_complexity(repo, cache=True)
+        (repo / "src" / "beta.py").write_text(
+            "def helper(y):\n    if y:\n        return 1\n    return 0\n"
+        )
+        clear_source_cache()
+        report = analyze_complexity(repo, cache=True)
+        assert get_source_store().misses == 1
+        helper = next(r for r in report.results if r.function == "helper")
+        assert helper.complexity == 2
+
+    def test_cache_disabled_writes_nothing(self, repo: Path):
+        analyze_complexity(repo)
+        generate_health_report(repo)
+        assert not (repo / CACHE_DIR).exists()
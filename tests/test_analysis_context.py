@@ -0,0 +1,157 @@
+"""Tests for src/analysis_context.py — shared memoised analysis reports."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.analysis_context import AnalysisContext, clear_shared_contexts, shared_context
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_contexts():
+    clear_shared_contexts()
+    yield
+    clear_shared_contexts()
+
+
+@pytest.fixture
+def repo(tmp_path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src" / "alpha.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "AWAKE_LOG.md").write_text(
+        "# Awake Log\n\n## Session 3 — Jan 1, 2026\n\nWork.\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+def _health(score: float = 81.0) -> MagicMock:
+    report = MagicMock()
+    report.overall_health_score = score
+    report.files = []
+    report.total_lines = 10
+    report.total_functions = 1
+    report.total_classes = 0
+    report.overall_docstring_coverage = 0.5
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Memoisation
+# ---------------------------------------------------------------------------
+
+
+def test_report_is_computed_once(repo):
+    ctx = AnalysisContext(repo)
+    with patch("src.health.generate_health_report", return_value=_health()) as gen:
+        assert ctx.health is ctx.health
+    assert gen.call_count == 1
+    assert ctx.computed == ["health"]
+
+
+def test_failures_are_memoised(repo):
+    ctx = AnalysisContext(repo)
+    with patch("src.security.audit_security", side_effect=RuntimeError("boom")) as audit:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                ctx.security
+    assert audit.call_count == 1
+
+
+def test_shared_context_retries_failures(repo):
+    ctx = shared_context(repo)
+    with patch("src.security.audit_security", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            ctx.security
+    with patch("src.security.audit_security", return_value="ok") as audit:
+        assert shared_context(repo) is ctx
+        assert ctx.security == "ok"
+        assert ctx.security == "ok"
+    assert audit.call_count == 1
+
+
+def test_options_are_forwarded(repo):
+    ctx = AnalysisContext(repo, cache=True, jobs=3)
+    with patch("src.dead_code.find_dead_code") as find:
+        ctx.dead_code
+    find.assert_called_once_with(repo_path=repo, cache=True, jobs=3)
+
+
+def test_session_index_reads_log(repo):
+    assert AnalysisContext(repo).session_index.numbers() == [3]
+
+
+# ---------------------------------------------------------------------------
+# Process-wide contexts
+# ---------------------------------------------------------------------------
+
+
+def test_shared_context_is_reused(repo):
+    assert shared_context(repo) is shared_context(repo)
+    assert shared_context(repo) is not shared_context(repo, jobs=2)
+
+
+def test_shared_context_replaced_when_source_changes(repo):
+    first = shared_context(repo)
+    (repo / "src" / "beta.py").write_text("X = 1\n", encoding="utf-8")
+    assert shared_context(repo) is not first
+
+
+# ---------------------------------------------------------------------------
+# Aggregators share one context
+# ---------------------------------------------------------------------------
+
+
+def test_aggregators_compute_health_once(repo):
+    from src.audit import run_audit
+    from src.badges import generate_badges
+    from src.dashboard import build_dashboard
+    from src.status import generate_status
+
+    ctx = AnalysisContext(repo)
+    security = MagicMock(grade="A", findings=[])
+    with patch("src.health.generate_health_report", return_value=_health(81.0)) as gen, \
+         patch("src.security.audit_security", return_value=security) as sec:
+        audit = run_audit(repo, context=ctx)
+        badges = generate_badges(repo, context=ctx)
+        build_dashboard(repo, context=ctx)
+        status = generate_status(repo, context=ctx)
+    assert gen.call_count == 1
+    assert sec.call_count == 1
+    assert audit.sections[0].score == 81.0
+    assert status.health_score == 81.0
+    assert status.session == 3
+    assert any(b.label.lower() == "health" and "81" in b.message for b in badges.badges)
+
+
+def test_status_does_not_compute_health(repo):
+    from src.status import generate_status
+
+    ctx = AnalysisContext(repo)
+    with patch("src.health.generate_health_report") as gen:
+        generate_status(repo, context=ctx)
+    gen.assert_not_called()
+
+
+def test_commands_share_process_context(repo):
+    from src.dispatch import run_command
+
+    health = _health(81.0)
+    health.to_dict.return_value = {"score": 81.0}
+    with patch("src.health.generate_health_report", return_value=health) as gen:
+        assert run_command(["health", "--json"], repo) == {"score": 81.0}
+        run_command(["status", "--json"], repo)
+        run_command(["audit", "--json"], repo)
+    assert gen.call_count == 1
+
+
+def test_cli_run_skips_repo_fingerprint(repo, capsys):
+    from src.cli import build_parser
+
+    args = build_parser().parse_args(["status", "--json", "--repo", str(repo)])
+    with patch("src.analysis_context._fingerprint", side_effect=AssertionError("fingerprint")):
+        assert args.func(args) == 0
+    assert '"session"' in capsys.readouterr().out
@@ -0,0 +1,108 @@
+"""Tests for src/api_cache.py — API result cache and repo fingerprinting."""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import api_cache
+from src.api_cache import ResultCache, etag_for, etag_matches, repo_fingerprint
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("x = 1\n")
+    (tmp_path / "AWAKE_LOG.md").write_text("## Session 1\n")
+    return tmp_path
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestFingerprint:
+    def test_stable_when_nothing_changes(self, repo: Path):
+        assert repo_fingerprint(repo) == repo_fingerprint(repo)
+
+    def test_src_edit_changes_fingerprint(self, repo: Path):
+        before = repo_fingerprint(repo)
+        _bump_mtime(repo / "src" / "a.py")
+        assert repo_fingerprint(repo)[1] != before[1]
+
+    def test_new_src_file_changes_fingerprint(self, repo: Path):
+        before = repo_fingerprint(repo)
+        (repo / "src" / "b.py").write_text("")
+        assert repo_fingerprint(repo) != before
+
+    def test_log_mtime_changes_fingerprint(self, repo: Path):
+        before = repo_fingerprint(repo)
+        _bump_mtime(repo / "AWAKE_LOG.md")
+        assert repo_fingerprint(repo)[2] != before[2]
+
+    def test_outside_git_head_is_empty(self, repo: Path):
+        assert repo_fingerprint(repo)[0] == ""
+
+
+class TestEtag:
+    def test_quoted_and_deterministic(self):
+        assert etag_for("{}") == etag_for("{}")
+        assert etag_for("{}").startswith('"') and etag_for("{}").endswith('"')
+        assert etag_for("{}") != etag_for("[]")
+
+    @pytest.mark.parametrize("header, expected", [
+        ('"abc"', True),
+        ('"old", "abc"', True),
+        ('W/"abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+        ('"ab"', False),
+        ('"xabcx"', False),
+        ("", False),
+        (None, False),
+    ])
+    def test_matches(self, header, expected):
+        assert etag_matches(header, '"abc"') is expected
+
+
+class TestResultCache:
+    def test_hit_with_same_fingerprint(self):
+        cache = ResultCache()
+        cache.put("k", ("h", "s", 1), "body")
+        assert cache.get("k", ("h", "s", 1)) == "body"
+        assert cache.hits == 1
+
+    def test_fingerprint_change_invalidates(self):
+        cache = ResultCache()
+        cache.put("k", ("h", "s", 1), "body")
+        assert cache.get("k", ("h2", "s", 1)) is None
+        assert cache.misses == 1
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(ttl=10)
+        cache.put("k", (), "body")
+        later = time.monotonic() + 11
+        with patch.object(api_cache.time, "monotonic", return_value=later):
+            assert cache.get("k", ()) is None
+
+    def test_zero_ttl_disables(self):
+        cache = ResultCache(ttl=0)
+        cache.put("k", (), "body")
+        assert cache.get("k", ()) is None
+
+    def test_fingerprint_memoised(self, repo: Path):
+        cache = ResultCache()
+        with patch.object(api_cache, "repo_fingerprint", return_value=("x",)) as fp:
+            cache.fingerprint(repo)
+            cache.fingerprint(repo)
+        assert fp.call_count == 1
+
+    def test_clear(self):
+        cache = ResultCache()
+        cache.put("k", (), "body")
+        cache.clear()
+        assert cache.get("k", ()) is None
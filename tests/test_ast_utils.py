@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import ast
 from pathlib import Path
 
-from src._ast_utils import parse_file
+import pytest
+
+from src._ast_utils import (
+    AstPass,
+    SourceStore,
+    clear_source_cache,
+    load_source,
+    parse_file,
+    pass_result,
+    read_source,
+    register_pass,
+    walk_tree,
+)
 
 
 def test_parse_valid_file(tmp_path: Path):
@@ -26,3 +39,140 @@ def test_parse_nonascii(tmp_path: Path):
     f.write_text("# \u00e9\nx = 1\n", encoding="utf-8")
     tree = parse_file(f)
     assert tree is not None
+
+
+def test_parse_file_missing_returns_none(tmp_path: Path):
+    assert parse_file(tmp_path / "nope.py") is None
+
+
+def test_load_source_exposes_text_lines_and_tree(tmp_path: Path):
+    f = tmp_path / "mod.py"
+    f.write_text("a = 1\nb = 2\n")
+    parsed = load_source(f)
+    assert parsed is not None
+    assert parsed.text == "a = 1\nb = 2\n"
+    assert parsed.lines == ("a = 1", "b = 2")
+    assert parsed.ok
+    assert parsed.syntax_error is None
+
+
+def test_load_source_records_syntax_error(tmp_path: Path):
+    f = tmp_path / "bad.py"
+    f.write_text("def f(\n")
+    parsed = load_source(f)
+    assert parsed is not None
+    assert parsed.tree is None
+    assert isinstance(parsed.syntax_error, SyntaxError)
+    assert parsed.lines == ("def f(",)
+
+
+def test_store_reuses_tree_for_unchanged_file(tmp_path: Path):
+    f = tmp_path / "same.py"
+    f.write_text("x = 1\n")
+    first = parse_file(f)
+    second = parse_file(f)
+    assert first is second
+
+
+def test_store_reparses_after_edit(tmp_path: Path):
+    f = tmp_path / "edit.py"
+    f.write_text("x = 1\n")
+    first = load_source(f)
+    f.write_text("y = 2\n")  # same size, likely same mtime tick
+    second = load_source(f)
+    assert second.text == "y = 2\n"
+    assert second.digest != first.digest
+
+
+def test_store_counts_hits_and_clear(tmp_path: Path):
+    store = SourceStore()
+    f = tmp_path / "h.py"
+    f.write_text("x = 1\n")
+    store.load(f)
+    store.load(f)
+    assert store.misses == 1
+    assert store.hits == 1
+    assert len(store) == 1
+    store.clear()
+    assert len(store) == 0
+
+
+def test_read_source_and_clear_cache(tmp_path: Path):
+    f = tmp_path / "r.py"
+    f.write_text("z = 3\r\n")
+    assert read_source(f) == "z = 3\n"
+    clear_source_cache()
+    assert read_source(tmp_path / "missing.py") is None
+
+
+class _CountNames(AstPass):
+    def __init__(self):
+        self.names = []
+        self.depth = 0
+        self.max_depth = 0
+
+    def visit_Name(self, node):
+        self.names.append(node.id)
+
+    def visit_FunctionDef(self, node):
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def leave_FunctionDef(self, node):
+        self.depth -= 1
+
+
+class _CountCalls(AstPass):
+    def __init__(self):
+        self.calls = 0
+
+    def visit_Call(self, node):
+        self.calls += 1
+
+
+def test_walk_tree_feeds_several_passes():
+    tree = ast.parse("def f():\n    def g():\n        return a(b)\n    return c()\n")
+    names, calls = _CountNames(), _CountCalls()
+    walk_tree(tree, [names, calls])
+    assert names.names == ["a", "b", "c"]
+    assert names.max_depth == 2
+    assert names.depth == 0
+    assert calls.calls == 2
+
+
+def test_ast_pass_visit_runs_standalone():
+    p = _CountCalls()
+    p.visit(ast.parse("x(y(z))\n"))
+    assert p.calls == 2
+
+
+def test_pass_result_walks_once_for_all_registered(tmp_path: Path, monkeypatch):
+    import src._ast_utils as mod
+
+    monkeypatch.setattr(mod, "_PASS_REGISTRY", {})
+    walks = []
+    real_walk = mod.walk_tree
+    monkeypatch.setattr(
+        mod, "walk_tree", lambda tree, passes: (walks.append(1), real_walk(tree, passes))
+    )
+    register_pass("names", _CountNames)
+    register_pass("calls", _CountCalls)
+
+    f = tmp_path / "p.py"
+    f.write_text("print(x)\n")
+    clear_source_cache()
+    parsed = load_source(f)
+    assert pass_result(parsed, "names").names == ["print", "x"]
+    assert pass_result(parsed, "calls").calls == 1
+    assert len(walks) == 1
+
+
+def test_pass_result_errors(tmp_path: Path):
+    bad = tmp_path / "bad.py"
+    bad.write_text("def f(\n")
+    with pytest.raises(ValueError):
+        pass_result(load_source(bad), "complexity")
+    good = tmp_path / "good.py"
+    good.write_text("x = 1\n")
+    with pytest.raises(KeyError):
+        pass_result(load_source(good), "no-such-pass")
@@ -15,9 +15,13 @@ from src.benchmark import (
     BenchmarkReport,
     run_benchmarks,
     save_benchmark_report,
-    _load_baseline,
-    _save_history,
+    _RUNNERS,
+    _baseline_stats,
+    _load_baseline_window,
+    _percentile,
     _time_module,
+    register_runner,
+    registered_runners,
 )
 
 
@@ -175,60 +179,6 @@ class TestTimeModule:
         assert result.elapsed_ms >= 0
 
 
-class TestBaselinePersistence:
-    def test_load_baseline_missing_file(self, tmp_path):
-        baseline = _load_baseline(tmp_path / "nonexistent.json")
-        assert baseline == {}
-
-    def test_load_baseline_empty_list(self, tmp_path):
-        p = tmp_path / "history.json"
-        p.write_text("[]")
-        baseline = _load_baseline(p)
-        assert baseline == {}
-
-    def test_load_baseline_valid(self, tmp_path):
-        p = tmp_path / "history.json"
-        data = [{"results": [{"module": "health", "elapsed_ms": 100.0}]}]
-        p.write_text(json.dumps(data))
-        baseline = _load_baseline(p)
-        assert baseline["health"] == 100.0
-
-    def test_load_baseline_invalid_json(self, tmp_path):
-        p = tmp_path / "history.json"
-        p.write_text("not json!!!")
-        baseline = _load_baseline(p)
-        assert baseline == {}
-
-    def test_save_history_creates_file(self, tmp_path):
-        p = tmp_path / "history.json"
-        report = BenchmarkReport(
-            results=[BenchmarkResult(module="health", elapsed_ms=100.0, status="ok")],
-            total_ms=100.0, session=15,
-        )
-        _save_history(report, p)
-        assert p.exists()
-        data = json.loads(p.read_text())
-        assert isinstance(data, list)
-        assert len(data) == 1
-
-    def test_save_history_appends(self, tmp_path):
-        p = tmp_path / "history.json"
-        r1 = BenchmarkReport(results=[], total_ms=0.0, session=1)
-        r2 = BenchmarkReport(results=[], total_ms=0.0, session=2)
-        _save_history(r1, p)
-        _save_history(r2, p)
-        data = json.loads(p.read_text())
-        assert len(data) == 2
-
-    def test_save_history_caps_at_20(self, tmp_path):
-        p = tmp_path / "history.json"
-        for i in range(25):
-            r = BenchmarkReport(results=[], total_ms=0.0, session=i)
-            _save_history(r, p)
-        data = json.loads(p.read_text())
-        assert len(data) <= 20
-
-
 class TestRunBenchmarks:
     def test_returns_report(self, tmp_path):
         report = run_benchmarks(repo_path=tmp_path, session=15, persist=False)
@@ -242,11 +192,12 @@ class TestRunBenchmarks:
     def test_persist_creates_history(self, tmp_path):
         (tmp_path / "docs").mkdir(exist_ok=True)
         run_benchmarks(repo_path=tmp_path, session=15, persist=True)
-        assert (tmp_path / "docs" / "benchmark_history.json").exists()
+        assert (tmp_path / "docs" / "metrics.db").exists()
 
     def test_no_persist_skips_file(self, tmp_path):
         run_benchmarks(repo_path=tmp_path, session=15, persist=False)
         assert not (tmp_path / "docs" / "benchmark_history.json").exists()
+        assert not (tmp_path / "docs" / "metrics.db").exists()
 
 
 class TestSaveBenchmarkReport:
@@ -277,3 +228,135 @@ class TestSaveBenchmarkReport:
         save_benchmark_report(report, out)
         data = json.loads(out.with_suffix(".json").read_text())
         assert data["session"] == 15
+
+
+class TestRepeatedTiming:
+    def test_repeat_and_warmup_counts(self):
+        calls = []
+        result = _time_module("m", lambda: calls.append(1), warmup=2, repeat=4)
+        assert len(calls) == 6
+        assert result.runs == 4
+        assert result.min_ms <= result.elapsed_ms <= result.p95_ms
+
+    def test_memory_run_records_peak(self):
+        calls = []
+
+        def alloc():
+            calls.append(bytearray(256 * 1024))
+
+        result = _time_module("m", alloc, repeat=1, memory=True)
+        assert len(calls) == 2
+        assert result.peak_kb >= 256
+
+    def test_percentile_nearest_rank(self):
+        samples = [float(i) for i in range(1, 21)]
+        assert _percentile(samples, 95) == 19.0
+        assert _percentile(samples, 50) == 10.0
+        assert _percentile([3.0], 95) == 3.0
+
+    def test_error_keeps_completed_runs(self):
+        state = {"n": 0}
+
+        def flaky():
+            state["n"] += 1
+            if state["n"] > 2:
+                raise RuntimeError("third call fails")
+
+        result = _time_module("m", flaky, repeat=5)
+        assert result.status == "error"
+        assert result.runs == 2
+
+
+class TestRollingBaseline:
+    def _history(self, path, *medians):
+        data = [
+            {"results": [{"module": "health", "elapsed_ms": m, "status": "ok"}]}
+            for m in medians
+        ]
+        path.write_text(json.dumps(data))
+
+    def test_window_takes_most_recent_runs(self, tmp_path):
+        p = tmp_path / "history.json"
+        self._history(p, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+        assert _load_baseline_window(p, window=3) == {"health": [6.0, 5.0, 4.0]}
+
+    def test_window_skips_failed_runs(self, tmp_path):
+        p = tmp_path / "history.json"
+        p.write_text(json.dumps([{"results": [
+            {"module": "blame", "elapsed_ms": 1.0, "status": "error"},
+        ]}]))
+        assert _load_baseline_window(p) == {}
+
+    def test_baseline_stats(self):
+        assert _baseline_stats([]) == (None, None)
+        assert _baseline_stats([10.0, 12.0]) == (11.0, None)
+        centre, spread = _baseline_stats([100.0, 102.0, 98.0, 101.0, 99.0])
+        assert centre == 100.0
+        assert spread == pytest.approx(1.4826)
+
+    def test_noise_within_spread_is_not_a_regression(self):
+        r = BenchmarkResult(module="health", elapsed_ms=130.0, status="ok",
+                            baseline_ms=100.0, baseline_spread_ms=15.0)
+        assert r.regression > 20
+        assert not r.is_regression
+
+    def test_shift_beyond_spread_is_a_regression(self):
+        r = BenchmarkResult(module="health", elapsed_ms=110.0, status="ok",
+                            baseline_ms=100.0, baseline_spread_ms=1.0)
+        assert r.is_regression
+        assert "⚠" in r.regression_label
+
+    def test_tiny_change_never_flagged(self):
+        r = BenchmarkResult(module="health", elapsed_ms=100.5, status="ok",
+                            baseline_ms=100.0, baseline_spread_ms=0.0)
+        assert not r.is_regression
+
+    def test_run_benchmarks_uses_rolling_baseline(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        self._history(tmp_path / "docs" / "benchmark_history.json", 10.0, 10.0, 10.0)
+        register_runner("_test_sleep", lambda repo, session: time.sleep(0.03))
+        try:
+            report = run_benchmarks(tmp_path, persist=False, warmup=0, repeat=1,
+                                    memory=False, only=["_test_sleep"])
+        finally:
+            _RUNNERS.pop("_test_sleep")
+        [result] = report.results
+        assert result.baseline_ms is None  # other module's history only
+        assert result.runs == 1
+
+
+class TestRunnerRegistry:
+    EXPECTED = {
+        "health", "stats", "dep_graph", "todo_hunter", "doctor", "dead_code",
+        "security", "coverage_map", "blame", "maturity", "dna", "coupling",
+        "complexity",
+    }
+
+    def test_expected_runners_registered(self):
+        assert self.EXPECTED <= set(registered_runners())
+
+    def test_unknown_runner_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="nope"):
+            run_benchmarks(tmp_path, persist=False, only=["nope"])
+
+    def test_every_runner_succeeds_on_small_repo(self, tmp_path):
+        import subprocess
+        src = tmp_path / "src"
+        src.mkdir()
+        (tmp_path / "tests").mkdir()
+        (src / "__init__.py").write_text("")
+        (src / "alpha.py").write_text(
+            '"""Alpha."""\n\nimport os\n\n\ndef a():\n    """Return one."""\n    return 1  # TODO tidy\n'
+        )
+        (tmp_path / "tests" / "test_alpha.py").write_text(
+            "from src.alpha import a\n\n\ndef test_a():\n    assert a() == 1\n"
+        )
+        (tmp_path / "AWAKE_LOG.md").write_text("# Awake Log\n\n## Session 1 — Jan 1, 2026\n\nAdded `src/alpha.py`.\n")
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+        report = run_benchmarks(tmp_path, persist=False, warmup=0, repeat=1, memory=False)
+        failures = {r.module: r.error for r in report.results if r.status != "ok"}
+        assert failures == {}
+        assert self.EXPECTED <= {r.module for r in report.results}
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+import subprocess
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+import src.blame as blame_module
 from src.blame import (
     FileBlame,
     BlameReport,
@@ -295,3 +297,88 @@ class TestBlameBar:
         bar = rpt._bar(50.0, width=10)
         assert bar.count("█") == 5
         assert bar.count("░") == 5
+
+
+# ---------------------------------------------------------------------------
+# Nested packages, concurrency and the blame cache
+# ---------------------------------------------------------------------------
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+def _rev(repo: Path, rev: str) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", rev], cwd=repo, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "alice@corp.com")
+    _git(tmp_path, "config", "user.name", "Alice")
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (tmp_path / "src" / "top.py").write_text("a = 1\nb = 2\n")
+    (pkg / "__init__.py").write_text("")
+    (pkg / "inner.py").write_text("c = 3\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestBlameRunner:
+    def test_covers_nested_packages(self, git_repo):
+        report = analyze_blame(git_repo)
+        assert [f.path for f in report.files] == ["src/pkg/inner.py", "src/top.py"]
+        assert report.total_human_lines == 3
+
+    def test_parallel_matches_serial(self, git_repo):
+        serial = analyze_blame(git_repo, jobs=1).to_dict()
+        assert analyze_blame(git_repo, jobs=4).to_dict() == serial
+
+    def test_cache_only_reblames_changed_files(self, git_repo):
+        first = analyze_blame(git_repo, cache=True)
+        with patch("src.blame._run_git_blame", return_value=[]) as blame:
+            assert analyze_blame(git_repo, cache=True).to_dict() == first.to_dict()
+        assert blame.call_count == 0
+
+        (git_repo / "src" / "top.py").write_text("a = 1\nb = 2\nz = 9\n")
+        with patch("src.blame._run_git_blame", wraps=blame_module._run_git_blame) as blame:
+            dirty = analyze_blame(git_repo, cache=True)
+        assert [c.args[0].name for c in blame.call_args_list] == ["top.py"]
+        assert dirty.files[1].total_lines == 3
+
+        _git(git_repo, "commit", "-qam", "grow")
+        with patch("src.blame._run_git_blame", wraps=blame_module._run_git_blame) as blame:
+            analyze_blame(git_repo, cache=True)
+        assert [c.args[0].name for c in blame.call_args_list] == ["top.py"]
+
+    def test_last_commits_walk_only_new_history(self, git_repo):
+        import src.git_log as git_log
+
+        analyze_blame(git_repo, cache=True)
+        (git_repo / "src" / "top.py").write_text("a = 1\n")
+        _git(git_repo, "commit", "-qam", "shrink")
+        with patch.object(git_log, "iter_commits", wraps=git_log.iter_commits) as walk:
+            report = analyze_blame(git_repo, cache=True)
+        assert [c.args[1] for c in walk.call_args_list] == [
+            f"{_rev(git_repo, 'HEAD~1')}..{_rev(git_repo, 'HEAD')}"
+        ]
+        assert report.files[1].total_lines == 1
+
+        with patch.object(git_log, "iter_commits", wraps=git_log.iter_commits) as walk:
+            analyze_blame(git_repo, cache=True)
+        assert walk.call_count == 0
+
+    def test_rewritten_history_walks_from_head(self, git_repo):
+        import src.git_log as git_log
+
+        analyze_blame(git_repo, cache=True)
+        (git_repo / "src" / "top.py").write_text("a = 1\n")
+        _git(git_repo, "commit", "-q", "--amend", "-am", "rewritten")
+        with patch.object(git_log, "iter_commits", wraps=git_log.iter_commits) as walk:
+            report = analyze_blame(git_repo, cache=True)
+        assert [c.args[1] for c in walk.call_args_list] == [_rev(git_repo, "HEAD")]
+        assert report.files[1].total_lines == 1
@@ -15,13 +15,14 @@ from src.changelog import (
     Changelog,
     SUBJECT_PATTERN,
     SESSION_PATTERN,
-    _run_git,
     parse_commit_log,
     get_git_log,
     group_by_session,
+    iter_commit_records,
     generate_changelog,
     save_changelog,
 )
+from src.git_log import GitCommit
 
 
 # ---------------------------------------------------------------------------
@@ -214,30 +215,6 @@ class TestPatterns:
         assert int(m.group(1)) == 5
 
 
-# ---------------------------------------------------------------------------
-# _run_git
-# ---------------------------------------------------------------------------
-
-
-class TestRunGit:
-    def test_returns_empty_on_failure(self, tmp_path):
-        result = _run_git(["rev-list", "--count", "HEAD"], cwd=tmp_path)
-        assert result == ""
-
-    def test_returns_empty_on_missing_git(self, tmp_path):
-        with patch("src.changelog.subprocess.run", side_effect=FileNotFoundError):
-            result = _run_git(["log"], cwd=tmp_path)
-        assert result == ""
-
-    def test_returns_empty_on_timeout(self, tmp_path):
-        with patch(
-            "src.changelog.subprocess.run",
-            side_effect=subprocess.TimeoutExpired("git", 30),
-        ):
-            result = _run_git(["log"], cwd=tmp_path)
-        assert result == ""
-
-
 # ---------------------------------------------------------------------------
 # parse_commit_log
 # ---------------------------------------------------------------------------
@@ -299,6 +276,32 @@ class TestParseCommitLog:
         assert records[0].body == ""
 
 
+# ---------------------------------------------------------------------------
+# iter_commit_records
+# ---------------------------------------------------------------------------
+
+
+def _commit(sha: str, subject: str, body: str) -> GitCommit:
+    return GitCommit(
+        sha=sha, parents=(), author="", email="", date="", committer_date="",
+        subject=subject, body=body, numstat=[],
+    )
+
+
+class TestIterCommitRecords:
+    def test_matches_raw_log_parsing(self, tmp_path):
+        stream = [
+            _commit("aaa", "[awake] feat: feature A", "Session: 1\n"),
+            _commit("bbb", "chore: cleanup", ""),
+            _commit("ccc", "[awake] fix: fix B", "No session marker"),
+        ]
+        with patch("src.changelog.iter_commits", return_value=iter(stream)):
+            records = list(iter_commit_records(tmp_path))
+        raw = "".join(f"{c.sha}\x00{c.subject}\x00{c.body}\x1e" for c in stream)
+        assert records == parse_commit_log(raw)
+        assert [(r.sha, r.session) for r in records] == [("aaa", 1), ("ccc", 0)]
+
+
 # ---------------------------------------------------------------------------
 # group_by_session
 # ---------------------------------------------------------------------------
@@ -347,26 +350,28 @@ class TestGroupBySession:
 
 class TestGenerateChangelog:
     def test_returns_changelog_object(self, tmp_path):
-        with patch("src.changelog.get_git_log", return_value=""):
+        with patch("src.changelog.iter_commits", return_value=iter([])):
             cl = generate_changelog(repo_path=tmp_path)
         assert isinstance(cl, Changelog)
 
     def test_timestamp_propagated(self, tmp_path):
-        with patch("src.changelog.get_git_log", return_value=""):
+        with patch("src.changelog.iter_commits", return_value=iter([])):
             cl = generate_changelog(repo_path=tmp_path, timestamp="2026-02-27 23:00 UTC")
         assert cl.generated_at == "2026-02-27 23:00 UTC"
 
     def test_repo_name_propagated(self, tmp_path):
-        with patch("src.changelog.get_git_log", return_value=""):
+        with patch("src.changelog.iter_commits", return_value=iter([])):
             cl = generate_changelog(repo_path=tmp_path, repo_name="my-repo")
         assert cl.repo_name == "my-repo"
 
-    def test_parses_real_log(self, tmp_path):
-        raw = (
-            "abc1234\x00[awake] feat: add stats engine\x00Session: 1\x1e"
-            "def5678\x00[awake] ci: add GitHub Actions\x00Session: 1\x1e"
-        )
-        with patch("src.changelog.get_git_log", return_value=raw):
+    def test_builds_records_from_commit_stream(self, tmp_path):
+        stream = [
+            _commit("abc1234", "[awake] feat: add stats engine", "Session: 1"),
+            _commit("def5678", "[awake] ci: add GitHub Actions", "Session: 1"),
+            _commit("0123abc", "Merge [awake] work", "Session: 1"),
+        ]
+        with patch("src.changelog.iter_commits", return_value=iter(stream)), \
+             patch("src.changelog.get_git_log", side_effect=AssertionError("raw log")):
             cl = generate_changelog(repo_path=tmp_path)
         assert len(cl.sections) == 1
         assert cl.sections[0].total_commits() == 2
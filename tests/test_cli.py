@@ -527,3 +527,53 @@ class TestExportSubcommand:
         parser = build_parser()
         with pytest.raises(SystemExit):
             parser.parse_args(["export", "--format", "csv"])
+
+
+class TestLazyCommands:
+    """Command modules are imported only when a subcommand needs them."""
+
+    def test_import_does_not_load_command_modules(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, src.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('src.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True,
+            cwd=str(REPO_ROOT), check=True,
+        ).stdout
+        assert "src.commands.tools" not in out
+        assert "src.automerge" not in out
+        assert "src.docstring_gen" not in out
+
+    def test_cmd_attribute_resolves(self):
+        import src.cli
+        from src.commands.analysis import cmd_health
+        assert src.cli.cmd_health is cmd_health
+
+    def test_unknown_attribute_raises(self):
+        import src.cli
+        with pytest.raises(AttributeError):
+            src.cli.cmd_does_not_exist
+
+    def test_every_subcommand_resolves(self):
+        import src.cli
+        parser = build_parser()
+        for name in parser._subparsers._group_actions[0].choices:
+            assert src.cli._known_command([name]) == name
+
+    def test_single_command_parser(self):
+        parser = build_parser(only="status")
+        args = parser.parse_args(["status", "--brief"])
+        assert args.brief is True
+        with pytest.raises(SystemExit):
+            parser.parse_args(["health"])
+
+    def test_profile_import(self, capsys):
+        from src.import_profile import ImportTiming
+        timings = [ImportTiming("src.cli", 900, 2500, 0)]
+        with patch("src.import_profile.profile_imports", return_value=timings) as prof:
+            assert main(["--profile-import", "status"]) == 0
+        prof.assert_called_once_with(["status"])
+        assert "src.cli" in capsys.readouterr().out
@@ -53,6 +53,15 @@ class TestParserRegistration:
         args = parser.parse_args(["benchmark", "--session", "15"])
         assert args.session == 15
 
+    def test_benchmark_sampling_flags(self):
+        parser = build_parser()
+        args = parser.parse_args([
+            "benchmark", "--warmup", "0", "--repeat", "9", "--no-memory",
+            "--only", "health", "--only", "dna",
+        ])
+        assert (args.warmup, args.repeat, args.no_memory) == (0, 9, True)
+        assert args.only == ["health", "dna"]
+
     def test_gitstats_write_flag(self):
         parser = build_parser()
         args = parser.parse_args(["gitstats", "--write"])
@@ -145,6 +145,12 @@ class TestLoadConfig:
         assert cfg.thresholds.health_score_min == 80.0
         assert cfg._source is not None
 
+    def test_loads_performance_jobs(self, tmp_path):
+        (tmp_path / "awake.toml").write_text("[performance]\njobs = 4\n")
+        cfg = load_config(tmp_path)
+        assert cfg.performance.jobs == 4
+        assert load_config(tmp_path / "missing").performance.jobs == 1
+
     def test_falls_back_on_malformed_toml(self, tmp_path):
         # Write junk that our parser can't interpret but won't crash on
         (tmp_path / "awake.toml").write_text("not = valid [[toml\n")
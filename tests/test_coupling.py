@@ -15,8 +15,6 @@ from src.coupling import (
     CouplingReport,
     analyze_coupling,
     save_coupling_report,
-    _ImportCollector,
-    _parse_file,
     _rank,
     _instability,
 )
@@ -310,59 +308,6 @@ class TestCouplingReportMarkdown:
         assert "/repo" in md
 
 
-# ---------------------------------------------------------------------------
-# _ImportCollector
-# ---------------------------------------------------------------------------
-
-
-class TestImportCollector:
-    def _collect(self, source: str) -> list[str]:
-        import ast as _ast
-        tree = _ast.parse(source)
-        collector = _ImportCollector()
-        collector.visit(tree)
-        return collector.imports
-
-    def test_bare_import(self):
-        imports = self._collect("import os")
-        assert "os" in imports
-
-    def test_from_import(self):
-        imports = self._collect("from pathlib import Path")
-        assert "pathlib" in imports
-
-    def test_from_import_dotted(self):
-        imports = self._collect("from src.health import generate_health_report")
-        assert "src.health" in imports
-
-    def test_multiple_imports(self):
-        source = "import os\nimport sys\nfrom pathlib import Path\n"
-        imports = self._collect(source)
-        assert "os" in imports
-        assert "sys" in imports
-        assert "pathlib" in imports
-
-    def test_no_imports(self):
-        assert self._collect("x = 1") == []
-
-
-# ---------------------------------------------------------------------------
-# _parse_file
-# ---------------------------------------------------------------------------
-
-
-class TestParseFile:
-    def test_valid_file(self, tmp_path):
-        f = tmp_path / "ok.py"
-        f.write_text("x = 1\n")
-        assert _parse_file(f) is not None
-
-    def test_syntax_error_returns_none(self, tmp_path):
-        f = tmp_path / "bad.py"
-        f.write_text("def broken(:\n")
-        assert _parse_file(f) is None
-
-
 # ---------------------------------------------------------------------------
 # analyze_coupling — integration tests using tmp_path fake repos
 # ---------------------------------------------------------------------------
@@ -469,6 +414,23 @@ class TestAnalyzeCouplingIntegration:
         assert b.ce == 1
         assert b.instability == pytest.approx(0.5)
 
+    def test_strongly_connected_components(self, tmp_path):
+        _make_src(tmp_path, {
+            "a.py": "from src.b import f\ndef g(): pass\n",
+            "b.py": "from src.a import g\ndef f(): pass\n",
+            "c.py": "from src.a import g\n",
+        })
+        report = analyze_coupling(repo_path=tmp_path)
+        assert report.components == [["a", "b"]]
+        assert report.to_dict()["components"] == [["a", "b"]]
+        assert "## Strongly Connected Components" in report.to_markdown()
+
+    def test_acyclic_has_no_components(self, tmp_path):
+        _make_src(tmp_path, {"a.py": "from src.b import f\n", "b.py": "def f(): pass\n"})
+        report = analyze_coupling(repo_path=tmp_path)
+        assert report.components == []
+        assert "Strongly Connected" not in report.to_markdown()
+
     def test_dependents_list_populated(self, tmp_path):
         """Modules that import X should appear in X.dependents."""
         _make_src(tmp_path, {
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 
 import pytest
 
@@ -11,9 +10,6 @@ from src.dead_code import (
     DeadCodeReport,
     find_dead_code,
     save_dead_code_report,
-    _parse_file,
-    _NameCollector,
-    _DefCollector,
 )
 
 
@@ -106,108 +102,6 @@ class TestDeadCodeReport:
         assert "items" in obj
 
 
-# ---------------------------------------------------------------------------
-# AST helpers
-# ---------------------------------------------------------------------------
-
-_SAMPLE_SOURCE = """
-import os
-import sys
-from pathlib import Path
-
-def public_func():
-    pass
-
-def _private_func():
-    pass
-
-class PublicClass:
-    def method(self):
-        pass
-
-class _PrivateClass:
-    pass
-"""
-
-
-class TestDefCollector:
-    def _collect(self, source: str) -> _DefCollector:
-        import ast
-        tree = ast.parse(source)
-        dc = _DefCollector()
-        dc.visit(tree)
-        return dc
-
-    def test_finds_public_function(self):
-        dc = self._collect(_SAMPLE_SOURCE)
-        names = [n for n, _ in dc.functions]
-        assert "public_func" in names
-
-    def test_skips_private_function(self):
-        # _DefCollector collects ALL top-level; caller filters underscore
-        dc = self._collect(_SAMPLE_SOURCE)
-        names = [n for n, _ in dc.functions]
-        assert "_private_func" in names  # collected, but filtered later
-
-    def test_finds_public_class(self):
-        dc = self._collect(_SAMPLE_SOURCE)
-        names = [n for n, _ in dc.classes]
-        assert "PublicClass" in names
-
-    def test_finds_imports(self):
-        dc = self._collect(_SAMPLE_SOURCE)
-        names = [n for n, _ in dc.imports]
-        assert "os" in names
-        assert "sys" in names
-        assert "Path" in names
-
-    def test_nested_not_top_level(self):
-        source = """
-class Outer:
-    def inner_method(self):
-        pass
-"""
-        dc = self._collect(source)
-        # Only Outer should be in classes, inner_method not in top-level functions
-        assert len(dc.functions) == 0
-        assert len(dc.classes) == 1
-
-
-class TestNameCollector:
-    def _collect(self, source: str) -> set:
-        import ast
-        tree = ast.parse(source)
-        nc = _NameCollector()
-        nc.visit(tree)
-        return nc.used
-
-    def test_finds_name_usage(self):
-        used = self._collect("x = os.path.join('a', 'b')")
-        assert "os" in used
-        assert "join" in used
-
-    def test_finds_call_name(self):
-        used = self._collect("public_func()")
-        assert "public_func" in used
-
-
-# ---------------------------------------------------------------------------
-# _parse_file
-# ---------------------------------------------------------------------------
-
-class TestParseFile:
-    def test_valid_file(self, tmp_path):
-        f = tmp_path / "ok.py"
-        f.write_text("x = 1\n")
-        tree = _parse_file(f)
-        assert tree is not None
-
-    def test_syntax_error_returns_none(self, tmp_path):
-        f = tmp_path / "bad.py"
-        f.write_text("def broken(:\n")
-        assert _parse_file(f) is None
-
-
 # ---------------------------------------------------------------------------
 # find_dead_code integration
 # ---------------------------------------------------------------------------
@@ -231,6 +125,89 @@ class TestFindDeadCode:
         # `used` is referenced in other.py so should NOT be flagged
         assert "mod.used" not in names
 
+    def test_same_named_attribute_does_not_keep_alive(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("def render():\n    pass\n")
+        (src / "other.py").write_text(
+            "from src import mod\n\ndef go(page):\n    return page.render()\n"
+        )
+        report = find_dead_code(repo_path=tmp_path)
+        [item] = [i for i in report.dead_functions if i.name == "mod.render"]
+        assert item.confidence == "LOW"
+
+    def test_module_attribute_reference_keeps_alive(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("def render():\n    pass\n")
+        (src / "other.py").write_text("import src.mod as m\nm.render()\n")
+        report = find_dead_code(repo_path=tmp_path)
+        assert "mod.render" not in [i.name for i in report.dead_functions]
+
+    def test_recursion_alone_is_dead(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("def walk(n):\n    return walk(n - 1) if n else 0\n")
+        report = find_dead_code(repo_path=tmp_path)
+        [item] = report.dead_functions
+        assert (item.name, item.confidence) == ("mod.walk", "HIGH")
+
+    def test_string_reference_keeps_alive(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text(
+            "def handler():\n    pass\n\nHANDLERS = {'go': 'handler'}\n"
+        )
+        report = find_dead_code(repo_path=tmp_path)
+        assert report.dead_functions == []
+
+    @pytest.mark.parametrize("other", [
+        "LABELS = {'go': 'handler'}\n",
+        "__all__ = ['handler']\n",
+    ])
+    def test_unrelated_string_does_not_keep_alive(self, tmp_path, other):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("def handler():\n    pass\n")
+        (src / "other.py").write_text(other)
+        report = find_dead_code(repo_path=tmp_path)
+        assert [i.name for i in report.dead_functions] == ["mod.handler"]
+
+    @pytest.mark.parametrize("other", [
+        "import src.mod\n\nHANDLERS = {'go': 'handler'}\n",
+        "from src import mod\n\n__all__ = ['handler']\n",
+        "TARGET = 'src.mod.handler'\n",
+    ])
+    def test_string_reference_from_related_module_keeps_alive(self, tmp_path, other):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("def handler():\n    pass\n")
+        (src / "other.py").write_text(other)
+        report = find_dead_code(repo_path=tmp_path)
+        assert report.dead_functions == []
+
+    def test_referenced_only_from_tests_is_low(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("class Widget:\n    pass\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_mod.py").write_text(
+            "from src.mod import Widget\n\ndef test_it():\n    Widget()\n"
+        )
+        report = find_dead_code(repo_path=tmp_path)
+        [item] = report.dead_classes
+        assert item.confidence == "LOW"
+        assert "tests/" in item.reason
+
+    def test_cached_index_matches_uncached(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("import os\n\ndef unused():\n    pass\n")
+        first = find_dead_code(repo_path=tmp_path, cache=True)
+        assert (tmp_path / ".awake" / "index").is_dir()
+        second = find_dead_code(repo_path=tmp_path, cache=True)
+        assert first.to_dict() == second.to_dict() == find_dead_code(repo_path=tmp_path).to_dict()
+
     def test_unused_import_flagged(self, tmp_path):
         src = tmp_path / "src"
         src.mkdir()
@@ -135,6 +135,8 @@ class TestDepGraph:
         assert "modules" in d
         assert "fan_in" in d
         assert "cycles" in d
+        assert d["components"] == []
+        assert d["cycles_truncated"] is False
 
 
 class TestFindCycles:
@@ -150,6 +152,17 @@ class TestFindCycles:
         graph = build_dep_graph(simple_src)
         assert graph.find_cycles() == []
 
+    def test_components_in_dict(self, cyclic_src):
+        d = build_dep_graph(cyclic_src).to_dict()
+        assert d["components"] == [["a", "b"]]
+        assert d["cycles"] == [["a", "b", "a"]]
+        assert d["cycles_truncated"] is False
+
+    @pytest.mark.parametrize("limit, truncated", [(1, False), (0, True)])
+    def test_truncation_reported_by_enumeration(self, cyclic_src, limit, truncated):
+        cycles, cut = build_dep_graph(cyclic_src).find_cycles_bounded(limit)
+        assert (len(cycles), cut) == (limit, truncated)
+
 
 class TestBuildDepGraph:
     def test_finds_all_modules(self, simple_src):
@@ -194,6 +207,8 @@ class TestRenderDepGraph:
     def test_cycle_warning_appears(self, cyclic_src):
         result = render_dep_graph(build_dep_graph(cyclic_src))
         assert "circular dependency" in result.lower()
+        assert "- `a`, `b`" in result
+        assert "Enumeration stopped" not in result
 
     def test_module_names_present(self, simple_src):
         result = render_dep_graph(build_dep_graph(simple_src))
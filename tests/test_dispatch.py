@@ -0,0 +1,136 @@
+"""Tests for src/dispatch.py — in-process CLI command dispatch."""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import dispatch
+from src.dispatch import (
+    SUBPROCESS_COMMANDS,
+    CommandError,
+    _capture_stderr,
+    run_command,
+)
+from src.commands import _collect_result, _emit_json
+from src.server import AwakeHandler
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "mod.py").write_text('"""Mod."""\n\ndef f(x):\n    """F."""\n    return x\n')
+    return tmp_path
+
+
+class TestEmitJson:
+    def test_prints_outside_dispatch(self, capsys):
+        _emit_json({"a": 1})
+        assert json.loads(capsys.readouterr().out) == {"a": 1}
+
+    def test_collected_not_printed(self, capsys):
+        with _collect_result() as results:
+            _emit_json({"a": 1})
+        assert results == [{"a": 1}]
+        assert capsys.readouterr().out == ""
+
+
+class TestCaptureStderr:
+    def test_captures_and_restores(self):
+        original = sys.stderr
+        with _capture_stderr() as err:
+            print("hello", file=sys.stderr)
+        assert err.getvalue() == "hello\n"
+        assert sys.stderr is original
+
+    def test_nested_capture(self):
+        with _capture_stderr() as outer:
+            print("a", file=sys.stderr)
+            with _capture_stderr() as inner:
+                print("b", file=sys.stderr)
+            print("c", file=sys.stderr)
+        assert outer.getvalue() == "a\nc\n"
+        assert inner.getvalue() == "b\n"
+
+    def test_threads_do_not_mix(self):
+        results: dict[int, str] = {}
+        barrier = threading.Barrier(4)
+
+        def work(n: int) -> None:
+            with _capture_stderr() as err:
+                barrier.wait()
+                for _ in range(50):
+                    print(n, file=sys.stderr)
+            results[n] = err.getvalue()
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for n, text in results.items():
+            assert text == f"{n}\n" * 50
+
+
+class TestRunCommand:
+    def test_health_in_process(self, repo: Path):
+        with patch.object(dispatch, "_run_subprocess") as fork:
+            data = run_command(["health", "--json", "--no-cache"], repo)
+        fork.assert_not_called()
+        assert [f["path"] for f in data["files"]] == ["src/mod.py"]
+
+    def test_stray_output_does_not_corrupt_result(self, repo: Path, capsys):
+        from src.health import generate_health_report
+
+        def noisy(*args, **kwargs):
+            print("{ not json")
+            return generate_health_report(*args, **kwargs)
+
+        with patch("src.health.generate_health_report", side_effect=noisy):
+            data = run_command(["health", "--json", "--no-cache"], repo)
+        assert [f["path"] for f in data["files"]] == ["src/mod.py"]
+
+    def test_no_json_result_raises(self, repo: Path):
+        with patch("src.cli.cmd_health", return_value=0):
+            dispatch._parser.cache_clear()
+            try:
+                with pytest.raises(CommandError, match="no JSON result"):
+                    run_command(["health", "--json"], repo)
+            finally:
+                dispatch._parser.cache_clear()
+
+    def test_bad_arguments_raise(self, repo: Path):
+        with pytest.raises(CommandError):
+            run_command(["health", "--no-such-flag"], repo)
+
+    def test_nonzero_exit_raises(self, repo: Path):
+        with patch("src.cli.cmd_health", return_value=1):
+            dispatch._parser.cache_clear()
+            try:
+                with pytest.raises(CommandError):
+                    run_command(["health", "--json"], repo)
+            finally:
+                dispatch._parser.cache_clear()
+
+    def test_opt_out_uses_subprocess(self, repo: Path):
+        assert "benchmark" in SUBPROCESS_COMMANDS
+        fake = type("R", (), {"returncode": 0, "stdout": '{"ok": 1}', "stderr": ""})()
+        with patch.object(dispatch.subprocess, "run", return_value=fake) as mock_run:
+            assert run_command(["benchmark", "--json"], repo) == {"ok": 1}
+        assert mock_run.call_args.kwargs["cwd"] == str(repo)
+
+
+class TestServerUsesDispatch:
+    def test_run_command_goes_through_dispatch(self, repo: Path):
+        handler = AwakeHandler.__new__(AwakeHandler)
+        handler.server = type("S", (), {"repo_path": repo})()
+        with patch("src.dispatch.run_command", return_value={"ok": 1}) as mock_run:
+            assert json.loads(handler._run_command(["stats", "--json"])) == {"ok": 1}
+        mock_run.assert_called_once_with(["stats", "--json"], repo)
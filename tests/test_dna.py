@@ -478,6 +478,26 @@ def test_fingerprint_repo_deterministic(repo: Path):
     assert dna1.hex_digest == dna2.hex_digest
 
 
+def test_fingerprint_repo_parallel_matches_serial(repo: Path):
+    serial = fingerprint_repo(repo)
+    parallel = fingerprint_repo(repo, jobs=2)
+    assert parallel.hex_digest == serial.hex_digest
+    assert parallel.per_file_complexity == serial.per_file_complexity
+
+
+def test_fingerprint_repo_scans_each_file_once(repo: Path, monkeypatch):
+    import src.dna as dna_mod
+
+    scanned: list[str] = []
+    real = dna_mod._scan_src_file
+    monkeypatch.setattr(dna_mod, "_scan_src_file", lambda p: scanned.append(p.name) or real(p))
+    dna = fingerprint_repo(repo)
+    assert sorted(scanned) == ["complex.py", "simple.py"]
+    channels = {ch.label.strip(): ch.raw_value for ch in dna.channels}
+    assert channels["Coupling"] == round(_compute_coupling_ratio(repo / "src"), 3)
+    assert channels["Age Spread"] == round(_compute_age_entropy(repo / "AWAKE_LOG.md", repo / "src"), 3)
+
+
 def test_fingerprint_repo_no_src_dir(tmp_path: Path):
     dna = fingerprint_repo(tmp_path)
     assert dna.hex_digest == "00000000"
@@ -163,6 +163,14 @@ class TestIndividualChecks:
         c = _check_test_coverage(tmp_path)
         assert c.status in (STATUS_WARN, STATUS_FAIL)
 
+    def test_test_coverage_private_module_matches_unprefixed_test(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "src" / "_helpers.py").write_text("def f(): pass\n")
+        (tmp_path / "tests" / "test_helpers.py").write_text("")
+        c = _check_test_coverage(tmp_path)
+        assert c.status == STATUS_OK
+
     def test_syntax_ok(self, healthy_repo):
         c = _check_syntax(healthy_repo)
         assert c.status == STATUS_OK
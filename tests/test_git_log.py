@@ -0,0 +1,97 @@
+"""Tests for src/git_log.py — streaming git log reader."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.git_log import GitCommit, NumstatEntry, iter_commits, parse_log_stream
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    (tmp_path / "a.txt").write_text("one\ntwo\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "feat: first\n\nBody line 1\nBody line 2")
+    _git(tmp_path, "tag", "v1")
+    (tmp_path / "a.txt").write_text("one\n")
+    (tmp_path / "b.bin").write_bytes(b"\x00\x01\x02")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "fix: second")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "[awake] chore: third")
+    return tmp_path
+
+
+class TestParseLogStream:
+    def test_multiline_body_and_numstat(self):
+        lines = [
+            "\x1eabc\x1fp1\x1fAl\x1fal@x\x1f2026-01-01 10:00:00 +0000"
+            "\x1f2026-01-01 10:00:00 +0000\x1fsubj\x1fline 1",
+            "line 2\x1d",
+            "",
+            "3\t1\tsrc/a.py",
+            "-\t-\timg.png",
+            "\x1edef\x1f\x1fBo\x1fbo@x\x1fd\x1fc\x1froot\x1f\x1d",
+        ]
+        first, second = list(parse_log_stream(lines))
+        assert first.body == "line 1\nline 2"
+        assert first.numstat == [
+            NumstatEntry("src/a.py", 3, 1),
+            NumstatEntry("img.png", None, None),
+        ]
+        assert (first.insertions, first.deletions, first.files_changed) == (3, 1, 1)
+        assert second.parents == () and second.subject == "root"
+
+    def test_ignores_garbage(self):
+        assert list(parse_log_stream(["not a commit", "1\t2\tx"])) == []
+
+
+class TestIterCommits:
+    def test_newest_first_with_fields(self, repo: Path):
+        commits = list(iter_commits(repo))
+        assert [c.subject for c in commits] == [
+            "[awake] chore: third", "fix: second", "feat: first",
+        ]
+        first = commits[-1]
+        assert isinstance(first, GitCommit)
+        assert len(first.sha) == 40 and first.parents == ()
+        assert first.author == "Dev" and first.email == "dev@example.com"
+        assert first.body == "Body line 1\nBody line 2"
+        assert first.date[:4].isdigit()
+        assert not first.numstat
+
+    def test_range_and_limit(self, repo: Path):
+        assert [c.subject for c in iter_commits(repo, "v1..HEAD")] == [
+            "[awake] chore: third", "fix: second",
+        ]
+        assert len(list(iter_commits(repo, max_count=1))) == 1
+
+    def test_no_walk_revision_list(self, repo: Path):
+        found = iter_commits(repo, ["v1", "HEAD"], no_walk=True)
+        assert [c.subject for c in found] == ["feat: first", "[awake] chore: third"]
+
+    def test_grep(self, repo: Path):
+        found = list(iter_commits(repo, grep=r"^\[AWAKE\]", ignore_case=True))
+        assert [c.subject for c in found] == ["[awake] chore: third"]
+
+    def test_numstat(self, repo: Path):
+        second = list(iter_commits(repo, numstat=True))[1]
+        assert NumstatEntry("a.txt", 0, 1) in second.numstat
+        assert NumstatEntry("b.bin", None, None) in second.numstat
+        assert second.files_changed == 1
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert list(iter_commits(tmp_path)) == []
+
+    def test_early_close_stops_git(self, repo: Path):
+        it = iter_commits(repo)
+        next(it)
+        it.close()
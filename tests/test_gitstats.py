@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
+from src.git_log import GitCommit, _parse_numstat
 from src.gitstats import (
     CommitRecord,
     ContributorStats,
@@ -15,7 +16,6 @@ from src.gitstats import (
     compute_git_stats,
     save_git_stats_report,
     _parse_commits,
-    _git,
 )
 
 
@@ -164,35 +164,34 @@ class TestGitStatsReport:
         assert "2026-02-28" in md
 
 
-class TestGitHelper:
-    def test_returns_string(self, tmp_path):
-        result = _git(["--version"], tmp_path)
-        assert isinstance(result, str)
-
-    def test_returns_empty_on_failure(self, tmp_path):
-        result = _git(["log", "--format=%H", "nonexistent-branch"], tmp_path)
-        assert isinstance(result, str)
+def _log_stream(*commits: tuple[str, str, list[str]]) -> list[GitCommit]:
+    """Build fake streamed commits from (parents, ``%H|%aN|%ai|%s``, numstat rows)."""
+    out: list[GitCommit] = []
+    for parents, header, numstat in commits:
+        sha, author, date, subject = header.split("|", 3)
+        out.append(GitCommit(
+            sha=sha, parents=tuple(parents.split()), author=author, email="",
+            date=date, committer_date=date, subject=subject, body="",
+            numstat=[e for e in map(_parse_numstat, numstat) if e is not None],
+        ))
+    return out
 
 
 class TestComputeGitStats:
     def test_empty_repo_returns_report(self, tmp_path):
-        with patch("src.gitstats._git", return_value=""):
+        with patch("src.gitstats.iter_commits", return_value=iter([])):
             report = compute_git_stats(repo_path=tmp_path)
         assert isinstance(report, GitStatsReport)
         assert report.total_commits == 0
 
     def test_with_mocked_log(self, tmp_path):
         sha = "a" * 40
-        fake_log = f"{sha}|Alice|2026-02-01 23:00:00 +0000|feat: session 15"
-
-        def mock_git(cmd, cwd):
-            if "--format=%H|%aN|%ai|%s" in cmd:
-                return fake_log
-            if "--format=%s" in cmd:
-                return "Merge pull request #37 from feature"
-            return ""
+        fake_log = _log_stream(
+            ("p1 p2", f"{'d' * 40}|Bob|2026-02-02 09:00:00 +0000|Merge pull request #37 from feature", []),
+            ("p1", f"{sha}|Alice|2026-02-01 23:00:00 +0000|feat: session 15", []),
+        )
 
-        with patch("src.gitstats._git", side_effect=mock_git):
+        with patch("src.gitstats.iter_commits", return_value=iter(fake_log)):
             report = compute_git_stats(repo_path=tmp_path)
 
         assert report.total_commits == 1
@@ -201,17 +200,12 @@ class TestComputeGitStats:
 
     def test_churn_rate_calculation(self, tmp_path):
         sha = "b" * 40
-        fake_log = "\n".join([
-            f"{sha}|Alice|2026-02-01 10:00:00 +0000|feat: a",
-            f"{sha}|Alice|2026-02-02 11:00:00 +0000|feat: b",
-        ])
-
-        def mock_git(cmd, cwd):
-            if "--format=%H|%aN|%ai|%s" in cmd:
-                return fake_log
-            return ""
+        fake_log = _log_stream(
+            ("p", f"{sha}|Alice|2026-02-01 10:00:00 +0000|feat: a", []),
+            ("p", f"{sha}|Alice|2026-02-02 11:00:00 +0000|feat: b", []),
+        )
 
-        with patch("src.gitstats._git", side_effect=mock_git):
+        with patch("src.gitstats.iter_commits", return_value=iter(fake_log)):
             report = compute_git_stats(repo_path=tmp_path)
 
         assert report.active_days == 2
@@ -219,22 +213,49 @@ class TestComputeGitStats:
 
     def test_contributors_sorted_by_commits(self, tmp_path):
         sha = "c" * 40
-        fake_log = "\n".join([
-            f"{sha}|Alice|2026-01-01 10:00:00 +0000|commit",
-            f"{sha}|Bob|2026-01-02 11:00:00 +0000|commit",
-            f"{sha}|Bob|2026-01-03 12:00:00 +0000|commit",
-        ])
-
-        def mock_git(cmd, cwd):
-            if "--format=%H|%aN|%ai|%s" in cmd:
-                return fake_log
-            return ""
+        fake_log = _log_stream(
+            ("p", f"{sha}|Alice|2026-01-01 10:00:00 +0000|commit", []),
+            ("p", f"{sha}|Bob|2026-01-02 11:00:00 +0000|commit", []),
+            ("p", f"{sha}|Bob|2026-01-03 12:00:00 +0000|commit", []),
+        )
 
-        with patch("src.gitstats._git", side_effect=mock_git):
+        with patch("src.gitstats.iter_commits", return_value=iter(fake_log)):
             report = compute_git_stats(repo_path=tmp_path)
 
         assert report.contributors[0].name == "Bob"
 
+    def test_numstat_summed_per_commit(self, tmp_path):
+        fake_log = _log_stream(
+            ("p", f"{'e' * 40}|Alice|2026-01-01 10:00:00 +0000|a",
+             ["10\t2\tsrc/a.py", "-\t-\tlogo.png", "3\t0\tsrc/b.py"]),
+            ("", f"{'f' * 40}|Alice|2025-12-31 10:00:00 +0000|root",
+             ["5\t0\tREADME.md"]),
+        )
+
+        with patch("src.gitstats.iter_commits", return_value=iter(fake_log)):
+            report = compute_git_stats(repo_path=tmp_path)
+
+        assert report.total_commits == 2
+        assert report.total_insertions == 18
+        assert report.total_deletions == 2
+        assert report.total_files_changed == 3
+
+    def test_real_repository_single_pass(self, tmp_path):
+        import subprocess
+        for args in (["init", "-q"], ["config", "user.email", "t@t.com"],
+                     ["config", "user.name", "T"]):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True)
+        for i in range(3):
+            (tmp_path / f"f{i}.txt").write_text("x\n" * (i + 1))
+            subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+            subprocess.run(["git", "commit", "-qm", f"c{i}"], cwd=tmp_path, check=True)
+
+        report = compute_git_stats(repo_path=tmp_path)
+
+        assert report.total_commits == 3
+        assert report.total_insertions == 6
+        assert report.total_files_changed == 3
+
 
 class TestSaveGitStatsReport:
     def test_creates_files(self, tmp_path):
@@ -0,0 +1,179 @@
+"""Tests for src/_graph.py — shared graph core and import graph."""
+
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+import pytest
+
+from src._graph import DEFAULT_CYCLE_LIMIT, Graph, _ImportCollector, build_import_graph
+
+
+def _brute_force_cycles(graph: Graph) -> set[tuple[str, ...]]:
+    found = set()
+    for k in range(1, len(graph) + 1):
+        for perm in itertools.permutations(graph.nodes, k):
+            if perm[0] == min(perm) and all(
+                perm[(i + 1) % k] in graph.successors(perm[i]) for i in range(k)
+            ):
+                found.add(perm)
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+class TestGraph:
+    def test_adjacency(self):
+        g = Graph("abc", [("a", "c"), ("a", "b"), ("a", "b"), ("c", "a"), ("x", "a")])
+        assert g.successors("a") == ["b", "c"]
+        assert g.predecessors("a") == ["c"]
+        assert (g.out_degree("a"), g.in_degree("b")) == (2, 1)
+        assert g.edge_count == 3
+        assert list(g.edges()) == [("a", "b"), ("a", "c"), ("c", "a")]
+        assert "x" not in g
+
+    def test_subgraph(self):
+        g = Graph("abc", [("a", "b"), ("b", "c")]).subgraph(["a", "b", "zzz"])
+        assert g.nodes == ("a", "b")
+        assert list(g.edges()) == [("a", "b")]
+
+
+class TestComponents:
+    def test_sccs_dependencies_first(self):
+        g = Graph("abcd", [("a", "b"), ("b", "a"), ("b", "c"), ("d", "a")])
+        assert g.strongly_connected_components() == [["c"], ["a", "b"], ["d"]]
+
+    def test_condensation(self):
+        g = Graph("abcd", [("a", "b"), ("b", "a"), ("b", "c"), ("d", "a")])
+        dag = g.condensation()
+        ab = dag.component_of["a"]
+        assert dag.component_of["b"] == ab
+        assert dag.successors[ab] == [dag.component_of["c"]]
+        assert dag.successors[dag.component_of["d"]] == [ab]
+
+    def test_topological_layers(self):
+        g = Graph("abcde", [("a", "b"), ("b", "c"), ("c", "b"), ("d", "e")])
+        assert g.topological_layers() == [["b", "c", "e"], ["a", "d"]]
+
+    def test_deep_chain_is_iterative(self):
+        n = 5000
+        g = Graph((f"m{i:05d}" for i in range(n)),
+                  ((f"m{i:05d}", f"m{i + 1:05d}") for i in range(n - 1)))
+        assert len(g.strongly_connected_components()) == n
+        assert len(g.topological_layers()) == n
+
+
+class TestFindCycles:
+    def test_two_and_three_cycles_and_self_loop(self):
+        g = Graph("abc", [("a", "b"), ("b", "a"), ("b", "c"), ("c", "a"), ("c", "c")])
+        assert g.find_cycles() == [["a", "b", "a"], ["a", "b", "c", "a"], ["c", "c"]]
+
+    def test_acyclic(self):
+        assert Graph("abc", [("a", "b"), ("b", "c")]).find_cycles() == []
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_brute_force(self, seed):
+        import random
+        rng = random.Random(seed)
+        nodes = "abcdef"
+        edges = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(rng.randint(0, 14))]
+        g = Graph(nodes, edges)
+        cycles = g.find_cycles(limit=None)
+        assert len(cycles) == len({tuple(c) for c in cycles})
+        assert {tuple(c[:-1]) for c in cycles} == _brute_force_cycles(g)
+
+    def test_limit_caps_dense_graph(self):
+        nodes = [f"m{i:03d}" for i in range(60)]
+        g = Graph(nodes, [(a, b) for a in nodes for b in nodes if a != b])
+        assert len(g.find_cycles()) == DEFAULT_CYCLE_LIMIT
+        assert len(g.find_cycles(limit=7)) == 7
+
+    def test_bounded_reports_truncation(self):
+        g = Graph("abc", [("a", "b"), ("b", "a"), ("b", "c"), ("c", "b")])
+        assert g.find_cycles_bounded(2) == ([["a", "b", "a"], ["b", "c", "b"]], False)
+        assert g.find_cycles_bounded(1) == ([["a", "b", "a"]], True)
+        assert g.find_cycles_bounded(None)[1] is False
+
+
+# ---------------------------------------------------------------------------
+# Import graph
+# ---------------------------------------------------------------------------
+
+
+class TestImportCollector:
+    def _collect(self, source: str) -> list[str]:
+        import ast as _ast
+        tree = _ast.parse(source)
+        collector = _ImportCollector()
+        collector.visit(tree)
+        return collector.imports
+
+    def test_bare_import(self):
+        imports = self._collect("import os")
+        assert "os" in imports
+
+    def test_from_import(self):
+        imports = self._collect("from pathlib import Path")
+        assert "pathlib" in imports
+
+    def test_from_import_dotted(self):
+        imports = self._collect("from src.health import generate_health_report")
+        assert "src.health" in imports
+
+    def test_multiple_imports(self):
+        source = "import os\nimport sys\nfrom pathlib import Path\n"
+        imports = self._collect(source)
+        assert "os" in imports
+        assert "sys" in imports
+        assert "pathlib" in imports
+
+    def test_no_imports(self):
+        assert self._collect("x = 1") == []
+
+
+class TestBuildImportGraph:
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        src = tmp_path / "src"
+        (src / "commands").mkdir(parents=True)
+        (src / "__init__.py").write_text("")
+        (src / "health.py").write_text("import os\nfrom src.health import x\n")
+        (src / "cli.py").write_text("import src.health\nfrom src.commands.analysis import cmd\n")
+        (src / "commands" / "analysis.py").write_text("from src.health import generate\n")
+        (src / "broken.py").write_text("def bad(:\n")
+        return tmp_path
+
+    def test_nodes_and_edges(self, repo):
+        graph = build_import_graph(repo)
+        assert graph.nodes == ("broken", "cli", "commands.analysis", "health")
+        assert list(graph.edges()) == [
+            ("cli", "commands.analysis"), ("cli", "health"), ("commands.analysis", "health"),
+        ]
+        assert graph.paths["commands.analysis"] == repo / "src" / "commands" / "analysis.py"
+
+    def test_bare_stem_resolves_only_when_unambiguous(self, tmp_path):
+        src = tmp_path / "src"
+        for package in ("commands", "tools"):
+            (src / package).mkdir(parents=True)
+            (src / package / "base.py").write_text("")
+        (src / "commands" / "runner.py").write_text("")
+        (src / "app.py").write_text("import base\nimport runner\n")
+        assert list(build_import_graph(tmp_path).edges()) == [("app", "commands.runner")]
+
+    def test_top_level(self, repo):
+        top = build_import_graph(repo).top_level()
+        assert top.nodes == ("broken", "cli", "health")
+        assert list(top.edges()) == [("cli", "health")]
+
+    def test_missing_src(self, tmp_path):
+        assert len(build_import_graph(tmp_path)) == 0
+
+    def test_cached_matches(self, repo):
+        fresh = build_import_graph(repo)
+        build_import_graph(repo, cache=True)
+        cached = build_import_graph(repo, cache=True)
+        assert list(cached.edges()) == list(fresh.edges())
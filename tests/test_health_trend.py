@@ -227,13 +227,14 @@ class TestRecordSessionHealth:
             history = record_session_health(repo_path=tmp_path, session=4)
         assert len(history.snapshots) == 1 and history.snapshots[0].session == 4
 
-    def test_history_file_written(self, tmp_path):
+    def test_history_database_written(self, tmp_path):
         mock_report = MagicMock()
         mock_report.overall_health_score = 88.0
         mock_report.files = []
         with patch("src.health.generate_health_report", return_value=mock_report):
             record_session_health(repo_path=tmp_path, session=4)
-        assert (tmp_path / "docs" / "health_history.json").exists()
+        assert (tmp_path / "docs" / "metrics.db").exists()
+        assert not (tmp_path / "docs" / "health_history.json").exists()
 
     def test_appends_to_existing_history(self, tmp_path):
         mock_report = MagicMock()
@@ -0,0 +1,55 @@
+"""Tests for src/import_profile.py — CLI import-time profiler."""
+
+from __future__ import annotations
+
+import subprocess
+from unittest.mock import patch
+
+from src.import_profile import ImportTiming, format_import_profile, parse_importtime, profile_imports
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2300 |     src.commands
+import time:       900 |       4200 | src.cli
+not an import line
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(SAMPLE)
+    assert [t.module for t in timings] == ["_io", "src.commands", "src.cli"]
+    assert timings[1] == ImportTiming("src.commands", 1500, 2300, 2)
+    assert timings[2].depth == 0
+
+
+def test_parse_ignores_other_output():
+    assert parse_importtime("Traceback (most recent call last):\n") == []
+
+
+def test_format_sorts_by_cumulative():
+    text = format_import_profile(parse_importtime(SAMPLE), command="status")
+    assert text.startswith("IMPORT PROFILE: awake status")
+    body = text.splitlines()
+    assert body.index(next(l for l in body if "src.cli" in l)) < body.index(
+        next(l for l in body if "src.commands" in l))
+    assert "2.5 ms total" in text
+
+
+def test_format_groups_packages():
+    text = format_import_profile(parse_importtime(SAMPLE))
+    assert "src" in text.split("By top-level package")[1]
+
+
+def test_to_dict():
+    assert ImportTiming("re", 1, 2, 0).to_dict() == {
+        "module": "re", "self_us": 1, "cumulative_us": 2, "depth": 0,
+    }
+
+
+def test_profile_runs_in_caller_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with patch("src.import_profile.subprocess.run", wraps=subprocess.run) as run:
+        timings = profile_imports(["--help"])
+    assert run.call_args.kwargs["cwd"] == str(tmp_path)
+    assert "src.commands" in {t.module for t in timings}
@@ -0,0 +1,130 @@
+"""Tests for src/incremental.py — git-driven incremental analysis."""
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src._ast_utils import clear_source_cache, get_source_store
+from src.analysis_cache import AnalysisCache, open_cache
+from src.complexity import analyze_complexity
+from src.coupling import analyze_coupling
+from src.dead_code import find_dead_code
+from src.health import generate_health_report
+from src.incremental import STATE_DIR, IncrementalCache
+from src.security import audit_security
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(4):
+        (src / f"mod{i}.py").write_text(
+            f"from src.mod{(i + 1) % 4} import f{(i + 1) % 4}\n\n"
+            f"def f{i}(x):\n"
+            f"    if x:\n"
+            f"        return eval('x')\n"
+            f"    return 0\n"
+        )
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@test.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _rerun(fn, repo: Path):
+    clear_source_cache()
+    return fn(repo)
+
+
+class TestIncrementalCache:
+    def test_open_cache_returns_incremental(self, repo: Path):
+        cache = open_cache(repo, "demo", "1", enabled=False, incremental=True)
+        assert isinstance(cache, IncrementalCache)
+
+    def test_first_run_knows_nothing(self, repo: Path):
+        assert IncrementalCache(repo, "demo", "1").known == {}
+
+    def test_record_then_known(self, repo: Path):
+        files = sorted((repo / "src").glob("*.py"))
+        IncrementalCache(repo, "demo", "1").record_run(files)
+        state = json.loads((repo / STATE_DIR / "demo-v1.json").read_text())
+        assert set(state["files"]) == {f"src/mod{i}.py" for i in range(4)}
+        cache = IncrementalCache(repo, "demo", "1")
+        assert cache.known == state["files"]
+        assert cache.digest(files[0]) == AnalysisCache.digest(cache, files[0])
+
+    def test_dirty_and_untracked_not_recorded(self, repo: Path):
+        (repo / "src" / "mod0.py").write_text("x = 1\n")
+        (repo / "src" / "new.py").write_text("y = 2\n")
+        files = sorted((repo / "src").glob("*.py"))
+        IncrementalCache(repo, "demo", "1").record_run(files)
+        known = IncrementalCache(repo, "demo", "1").known
+        assert "src/mod0.py" not in known
+        assert "src/new.py" not in known
+        assert "src/mod1.py" in known
+
+    def test_commit_since_last_run_is_stale(self, repo: Path):
+        files = sorted((repo / "src").glob("*.py"))
+        IncrementalCache(repo, "demo", "1").record_run(files)
+        (repo / "src" / "mod2.py").write_text("z = 3\n")
+        _git(repo, "commit", "-q", "-am", "edit")
+        assert "src/mod2.py" not in IncrementalCache(repo, "demo", "1").known
+
+    def test_outside_git_records_nothing(self, tmp_path: Path):
+        (tmp_path / "a.py").write_text("a = 1\n")
+        IncrementalCache(tmp_path, "demo", "1").record_run([tmp_path / "a.py"])
+        assert not (tmp_path / STATE_DIR).exists()
+
+    def test_unknown_head_falls_back(self, repo: Path):
+        state = repo / STATE_DIR / "demo-v1.json"
+        state.parent.mkdir(parents=True)
+        state.write_text(json.dumps({"head": "0" * 40, "files": {"src/mod0.py": "x"}}))
+        assert IncrementalCache(repo, "demo", "1").known == {}
+
+
+class TestAnalyzersIncremental:
+    @pytest.mark.parametrize("fn, kwargs", [
+        (generate_health_report, {"timestamp": "t"}),
+        (analyze_complexity, {}),
+        (audit_security, {}),
+        (find_dead_code, {}),
+        (analyze_coupling, {}),
+    ])
+    def test_matches_full_run_after_edit(self, repo: Path, fn, kwargs):
+        fn(repo, incremental=True, **kwargs)
+        (repo / "src" / "mod1.py").write_text(
+            "def f1(x):\n    return [eval(v) for v in x if v]\n"
+        )
+        _git(repo, "commit", "-q", "-am", "edit")
+        incremental = _rerun(lambda r: fn(r, incremental=True, **kwargs), repo)
+        assert get_source_store().misses == 1
+        full = _rerun(lambda r: fn(r, **kwargs), repo)
+        assert incremental.to_dict() == full.to_dict()
+
+    def test_unchanged_tree_reads_no_sources(self, repo: Path):
+        analyze_complexity(repo, incremental=True)
+        clear_source_cache()
+        report = analyze_complexity(repo, incremental=True)
+        store = get_source_store()
+        assert store.misses == 0 and store.hits == 0
+        assert report.files_scanned == 4
+
+    def test_reverted_local_edit_is_reanalysed(self, repo: Path):
+        target = repo / "src" / "mod3.py"
+        original = target.read_text()
+        target.write_text("def f3(x):\n    return 1\n")
+        analyze_complexity(repo, incremental=True)
+        target.write_text(original)
+        report = _rerun(lambda r: analyze_complexity(r, incremental=True), repo)
+        f3 = next(r for r in report.results if r.function == "f3")
+        assert f3.complexity == 2
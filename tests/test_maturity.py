@@ -22,6 +22,7 @@ from src.maturity import (
     _analyze_src_file,
     _estimate_session_age,
     _estimate_instability,
+    _instability_index,
     _has_module_docstring,
     _score_to_tier,
     _stars,
@@ -439,6 +440,38 @@ def test_estimate_instability_range(src_dir: Path):
     assert 0.0 <= instability <= 1.0
 
 
+def test_instability_index_counts_imports(tmp_path: Path):
+    d = tmp_path / "src"
+    d.mkdir()
+    (d / "core.py").write_text("x = 1\n")
+    (d / "core_extra.py").write_text("from src.core import x\n")
+    (d / "app.py").write_text("from src import core\nfrom src.core_extra import x\n")
+    index = _instability_index(d)
+    # core: Ca=2 (core_extra, app), Ce=0; core_extra: Ca=1 (app), Ce=1
+    assert index["core"] == 0.0
+    assert index["core_extra"] == 0.5
+    assert index["app"] == 1.0
+    assert all(_estimate_instability(n, d) == v for n, v in index.items())
+
+
+def test_assess_maturity_builds_indexes_once(repo: Path, monkeypatch):
+    import src.maturity as maturity
+
+    calls = []
+    real = maturity._instability_index
+    monkeypatch.setattr(
+        maturity, "_instability_index",
+        lambda *a, **kw: calls.append(a) or real(*a, **kw),
+    )
+    (repo / "src" / "other.py").write_text("from src.sample import add\n")
+    report = assess_maturity(repo)
+    assert len(report.modules) == 2
+    assert len(calls) == 1
+    by_name = {m.name: m for m in report.modules}
+    assert by_name["sample"].instability == 0.0
+    assert by_name["other"].session_age == 2
+
+
 # ---------------------------------------------------------------------------
 # score_module_maturity
 # ---------------------------------------------------------------------------
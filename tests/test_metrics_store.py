@@ -0,0 +1,170 @@
+"""Tests for src/metrics_store.py — SQLite metric history."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.metrics_store import METRICS_DB, MetricsStore, has_metrics, open_metrics_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    with MetricsStore(tmp_path / "metrics.db") as s:
+        yield s
+
+
+def _run(*modules: tuple[str, float], status: str = "ok", session: int = 15) -> dict:
+    return {
+        "session": session,
+        "timestamp": "2026-01-01 00:00 UTC",
+        "total_ms": sum(ms for _, ms in modules),
+        "results": [{"module": m, "elapsed_ms": ms, "status": status} for m, ms in modules],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Tables
+# ---------------------------------------------------------------------------
+
+
+class TestPRScores:
+    def test_upsert_replaces_existing(self, store):
+        store.upsert_pr_score({"pr_number": 3, "title": "old", "dimensions": [{"score": 4}]})
+        store.upsert_pr_score({"pr_number": 3, "title": "new", "dimensions": [{"score": 9}]})
+        assert [s["title"] for s in store.pr_scores()] == ["new"]
+        assert store.counts()["pr_scores"] == 1
+
+    def test_ordered_by_pr_number(self, store):
+        for n in (9, 2, 5):
+            store.upsert_pr_score({"pr_number": n})
+        assert [s["pr_number"] for s in store.pr_scores()] == [2, 5, 9]
+
+    def test_pr_scorer_round_trip(self, store):
+        from src.pr_scorer import DimensionScore, PRScore, load_scores, upsert_score
+
+        score = PRScore(pr_number=7, title="t", branch="b", session=3,
+                        dimensions=[DimensionScore("Code Clarity", 16)])
+        upsert_score(score, store)
+        [loaded] = load_scores(store)
+        assert loaded.pr_number == 7
+        assert loaded.total == 16
+
+
+class TestSnapshots:
+    def test_health_range_query(self, store):
+        for session in (1, 2, 3, 4):
+            store.upsert_health_snapshot({"session": session, "overall_score": 80.0 + session})
+        assert [s["session"] for s in store.health_snapshots(since=2, until=3)] == [2, 3]
+        assert [s["session"] for s in store.health_snapshots(since=3)] == [3, 4]
+
+    def test_health_upsert_replaces_session(self, store):
+        store.upsert_health_snapshot({"session": 1, "overall_score": 50.0})
+        store.upsert_health_snapshot({"session": 1, "overall_score": 70.0})
+        assert [s["overall_score"] for s in store.health_snapshots()] == [70.0]
+
+    def test_coverage_history_loader(self, store):
+        from src.coverage_tracker import load_coverage_history
+
+        store.upsert_coverage_snapshot({"session": 2, "timestamp": "t", "total_coverage": 88.5})
+        history = load_coverage_history(store)
+        assert history.latest().total_coverage == 88.5
+
+
+class TestBenchmarkRuns:
+    def test_runs_keep_results(self, store):
+        store.add_benchmark_run(_run(("health", 10.0), ("security", 20.0)))
+        [run] = store.benchmark_runs()
+        assert run["session"] == 15
+        assert [r["module"] for r in run["results"]] == ["health", "security"]
+
+    def test_history_is_not_truncated(self, store):
+        for i in range(30):
+            store.add_benchmark_run(_run(("health", float(i))))
+        assert store.counts()["benchmark_runs"] == 30
+        assert [r["total_ms"] for r in store.benchmark_runs(limit=2)] == [28.0, 29.0]
+
+    def test_module_samples_newest_first_ok_only(self, store):
+        for ms in (1.0, 2.0, 3.0):
+            store.add_benchmark_run(_run(("health", ms)))
+        store.add_benchmark_run(_run(("health", 99.0), status="error"))
+        assert store.module_samples("health", 2) == [3.0, 2.0]
+
+
+# ---------------------------------------------------------------------------
+# Legacy JSON import
+# ---------------------------------------------------------------------------
+
+
+class TestImport:
+    @pytest.fixture
+    def repo(self, tmp_path) -> Path:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "health_history.json").write_text(json.dumps(
+            {"snapshots": [{"session": 1, "overall_score": 70.0}, {"session": 2, "overall_score": 75.0}]}
+        ))
+        (docs / "benchmark_history.json").write_text(json.dumps([_run(("health", 5.0))]))
+        (docs / "pr_scores.json").write_text(json.dumps([{"pr_number": 1}, {"title": "no number"}]))
+        (docs / "coverage_history.json").write_text("{not json")
+        return tmp_path
+
+    def test_open_imports_once(self, repo):
+        with open_metrics_store(repo) as store:
+            assert store.counts() == {
+                "pr_scores": 1, "health_snapshots": 2,
+                "coverage_snapshots": 0, "benchmark_runs": 1,
+            }
+        with open_metrics_store(repo) as store:
+            assert store.counts()["benchmark_runs"] == 1
+        assert (repo / METRICS_DB).exists()
+
+    def test_force_reimports(self, repo):
+        with open_metrics_store(repo) as store:
+            imported = store.import_json(repo, force=True)
+            assert imported == {"pr_scores": 1, "health": 2, "benchmark": 1}
+            assert store.counts()["benchmark_runs"] == 1
+            assert store.counts()["health_snapshots"] == 2
+
+    def test_repeated_force_import_is_idempotent(self, repo):
+        with open_metrics_store(repo) as store:
+            store.add_benchmark_run(_run(("health", 7.0)))
+            for _ in range(3):
+                store.import_json(repo, force=True)
+            assert store.counts()["benchmark_runs"] == 2
+            assert sorted(store.module_samples("health", 10)) == [5.0, 7.0]
+
+    def test_each_file_imports_in_one_transaction(self, repo):
+        with MetricsStore(repo / METRICS_DB) as store:
+            statements: list[str] = []
+            store._conn.set_trace_callback(statements.append)
+            imported = store.import_json(repo)
+            store._conn.set_trace_callback(None)
+        assert statements.count("COMMIT") == len(imported) == 3
+
+    def test_bad_benchmark_result_leaves_no_partial_run(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        bad = {"session": 1, "results": [{"module": "health"}, {"elapsed_ms": 1.0}]}
+        (tmp_path / "docs" / "benchmark_history.json").write_text(json.dumps([bad]))
+        with open_metrics_store(tmp_path) as store:
+            assert store.counts()["benchmark_runs"] == 0
+
+    def test_has_metrics(self, tmp_path, repo):
+        assert has_metrics(repo)
+        assert not has_metrics(tmp_path / "empty")
+
+
+class TestMetricsCommand:
+    def test_import_flag_does_not_duplicate_benchmarks(self, tmp_path):
+        from src.dispatch import run_command
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "benchmark_history.json").write_text(json.dumps([_run(("health", 5.0))]))
+        counts = [
+            run_command(["metrics", "--import", "--json"], tmp_path)["counts"]["benchmark_runs"]
+            for _ in range(3)
+        ]
+        assert counts == [1, 1, 1]
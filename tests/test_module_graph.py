@@ -13,7 +13,6 @@ from src.module_graph import (
     ModuleGraph,
     generate_module_graph,
     _discover_modules,
-    _extract_imports,
     _LAYER_MAP,
 )
 
@@ -50,39 +49,42 @@ def test_discover_modules_returns_sorted(tmp_path):
 
 
 # ---------------------------------------------------------------------------
-# _extract_imports
+# Import edges (shared import graph)
 # ---------------------------------------------------------------------------
 
 
-def test_extract_imports_simple(tmp_path):
-    src = tmp_path / "test_module.py"
-    src.write_text("from src.health import foo\nfrom src.stats import bar\n")
-    result = _extract_imports(src, {"health", "stats", "cli"})
-    assert "health" in result
-    assert "stats" in result
+def _edges(tmp_path, files: dict[str, str]) -> set:
+    src = tmp_path / "src"
+    src.mkdir()
+    for name, text in files.items():
+        (src / name).write_text(text)
+    return set(generate_module_graph(tmp_path).edges)
 
 
-def test_extract_imports_no_src_imports(tmp_path):
-    src = tmp_path / "test_module.py"
-    src.write_text("import os\nfrom pathlib import Path\n")
-    result = _extract_imports(src, {"health", "stats"})
-    assert result == []
+def test_edges_from_src_imports(tmp_path):
+    edges = _edges(tmp_path, {
+        "cli.py": "from src.health import foo\nimport src.stats\n",
+        "health.py": "", "stats.py": "",
+    })
+    assert edges == {("cli", "health"), ("cli", "stats")}
 
 
-def test_extract_imports_syntax_error(tmp_path):
-    src = tmp_path / "bad.py"
-    src.write_text("def broken(:\n    pass\n")
-    result = _extract_imports(src, {"health"})
-    assert result == []
+def test_edges_ignore_stdlib(tmp_path):
+    assert _edges(tmp_path, {"cli.py": "import os\nfrom pathlib import Path\n"}) == set()
+
 
+def test_edges_syntax_error_skipped(tmp_path):
+    assert _edges(tmp_path, {"bad.py": "def broken(:\n    pass\n", "health.py": ""}) == set()
 
-def test_extract_imports_excludes_self(tmp_path):
-    src = tmp_path / "health.py"
-    src.write_text("from src.health import HealthReport\n")
-    result = _extract_imports(src, {"health", "stats"})
-    # self-import should be included (we filter self in graph builder)
-    # just ensure no exception
-    assert isinstance(result, list)
+
+def test_imported_by_filled(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "health.py").write_text("")
+    (src / "cli.py").write_text("from src.health import run\n")
+    graph = generate_module_graph(tmp_path)
+    health = next(n for n in graph.nodes if n.name == "health")
+    assert health.imported_by == ["cli"]
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,131 @@
+"""Tests for src/_parallel.py — process-pool fan-out for per-file analysis."""
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+import pytest
+
+from src._parallel import map_files, resolve_jobs
+from src.commands import _jobs
+from src.complexity import analyze_complexity
+from src.dead_code import find_dead_code
+from src.docstring_gen import scan_missing_docstrings
+from src.health import generate_health_report
+from src.refactor import find_refactor_candidates
+from src.security import audit_security
+
+
+def _square_plus(x: int, y: int) -> int:
+    return x * x + y
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(6):
+        (src / f"mod{i}.py").write_text(
+            f"import os\n\n"
+            f"def f{i}(x):\n"
+            f"    if x > {i}:\n"
+            f"        return eval('x')\n"
+            f"    return os.sep\n\n"
+            f"class C{i}:\n"
+            f"    def method(self):\n"
+            f"        # TODO: tidy\n"
+            f"        return 42\n"
+        )
+    (src / "broken.py").write_text("def oops(:\n")
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# resolve_jobs / map_files
+# ---------------------------------------------------------------------------
+
+
+class TestResolveJobs:
+    def test_none_and_one_are_serial(self):
+        assert resolve_jobs(None) == 1
+        assert resolve_jobs(1) == 1
+
+    def test_zero_means_all_cpus(self):
+        assert resolve_jobs(0) == (os.cpu_count() or 1)
+        assert resolve_jobs(-1) == (os.cpu_count() or 1)
+
+    def test_explicit_count(self):
+        assert resolve_jobs(3) == 3
+
+
+class TestMapFiles:
+    def test_serial_matches_map(self):
+        xs, ys = range(10), range(10, 20)
+        assert map_files(_square_plus, xs, ys) == list(map(_square_plus, xs, ys))
+
+    def test_parallel_preserves_order(self):
+        xs, ys = list(range(50)), [1] * 50
+        assert map_files(_square_plus, xs, ys, jobs=3, chunksize=2) == [
+            x * x + 1 for x in xs
+        ]
+
+    def test_empty_input(self):
+        assert map_files(_square_plus, [], [], jobs=4) == []
+
+
+# ---------------------------------------------------------------------------
+# Analyzer output must not depend on the worker count
+# ---------------------------------------------------------------------------
+
+
+class TestAnalyzersParallel:
+    def test_health(self, repo: Path):
+        serial = generate_health_report(repo, timestamp="t")
+        parallel = generate_health_report(repo, timestamp="t", jobs=2)
+        assert parallel.to_dict() == serial.to_dict()
+
+    def test_complexity(self, repo: Path):
+        assert (
+            analyze_complexity(repo, jobs=2).to_dict()
+            == analyze_complexity(repo).to_dict()
+        )
+
+    def test_security(self, repo: Path):
+        assert audit_security(repo, jobs=2).to_dict() == audit_security(repo).to_dict()
+
+    def test_dead_code(self, repo: Path):
+        assert find_dead_code(repo, jobs=2).to_dict() == find_dead_code(repo).to_dict()
+
+    def test_docstrings(self, repo: Path):
+        serial = scan_missing_docstrings(repo)
+        parallel = scan_missing_docstrings(repo, jobs=2)
+        assert parallel.to_dict() == serial.to_dict()
+        assert serial.errors
+
+    def test_refactor(self, repo: Path):
+        serial = [s.to_dict() for s in find_refactor_candidates(repo)]
+        parallel = [s.to_dict() for s in find_refactor_candidates(repo, jobs=2)]
+        assert parallel == serial
+
+
+# ---------------------------------------------------------------------------
+# CLI plumbing
+# ---------------------------------------------------------------------------
+
+
+class TestJobsOption:
+    def test_flag_wins_over_config(self, tmp_path: Path):
+        (tmp_path / "awake.toml").write_text("[performance]\njobs = 4\n")
+        assert _jobs(argparse.Namespace(jobs=2), tmp_path) == 2
+
+    def test_falls_back_to_config(self, tmp_path: Path):
+        (tmp_path / "awake.toml").write_text("[performance]\njobs = 4\n")
+        assert _jobs(argparse.Namespace(jobs=None), tmp_path) == 4
+        assert _jobs(argparse.Namespace(), tmp_path / "missing") == 1
+
+    def test_parser_accepts_jobs(self):
+        from src.cli import build_parser
+
+        args = build_parser().parse_args(["complexity", "--jobs", "3"])
+        assert args.jobs == 3
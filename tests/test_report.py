@@ -3,7 +3,7 @@
 Covers:
 - Data classes: ReportSection, ExecutiveReport
 - Helper functions: _grade_colour, _score_colour, _score_to_grade,
-  _render_section, _render_html, _run_cmd, _safe_score,
+  _render_section, _render_html, _load, _gather,
   _html_table_from_list, _bar_chart_html
 - Public API: generate_report
 - Edge cases: empty data, None inputs, boundary scores
@@ -28,8 +28,8 @@ from src.report import (
     _score_colour,
     _render_section,
     _render_html,
-    _run_cmd,
-    _safe_score,
+    _gather,
+    _load,
     _score_to_grade,
     _html_table_from_list,
     _bar_chart_html,
@@ -307,39 +307,6 @@ class TestRenderHtml:
         assert "March 15, 2025" in html
 
 
-# ===========================================================================
-# _safe_score
-# ===========================================================================
-
-class TestSafeScore:
-    def test_nested_key_access(self):
-        d = {"a": {"b": 80.0}}
-        assert _safe_score(d, "a", "b") == 80.0
-
-    def test_none_dict_returns_none(self):
-        assert _safe_score(None) is None
-
-    def test_missing_key_returns_none(self):
-        d = {"x": 50.0}
-        assert _safe_score(d, "missing") is None
-
-    def test_non_numeric_returns_none(self):
-        d = {"score": "not-a-number"}
-        assert _safe_score(d, "score") is None
-
-    def test_integer_value_is_converted(self):
-        d = {"score": 75}
-        assert _safe_score(d, "score") == 75.0
-
-    def test_string_numeric_is_converted(self):
-        d = {"score": "85.5"}
-        assert _safe_score(d, "score") == 85.5
-
-    def test_deeply_nested(self):
-        d = {"a": {"b": {"c": 42.0}}}
-        assert _safe_score(d, "a", "b", "c") == 42.0
-
-
 # ===========================================================================
 # _html_table_from_list
 # ===========================================================================
@@ -412,85 +379,83 @@ class TestBarChartHtml:
 
 
 # ===========================================================================
-# _run_cmd
+# _load / _gather
 # ===========================================================================
 
-class TestRunCmd:
-    def test_returns_none_on_nonzero_exit(self, tmp_path):
-        result = MagicMock()
-        result.returncode = 1
-        result.stdout = ""
-        with patch("subprocess.run", return_value=result):
-            assert _run_cmd(["stats"], tmp_path) is None
-
-    def test_returns_none_on_invalid_json(self, tmp_path):
-        result = MagicMock()
-        result.returncode = 0
-        result.stdout = "not json"
-        with patch("subprocess.run", return_value=result):
-            assert _run_cmd(["stats"], tmp_path) is None
-
-    def test_returns_dict_on_valid_json_object(self, tmp_path):
-        result = MagicMock()
-        result.returncode = 0
-        result.stdout = '{"key": "value"}'
-        with patch("subprocess.run", return_value=result):
-            r = _run_cmd(["stats"], tmp_path)
-            assert r == {"key": "value"}
-
-    def test_returns_list_on_valid_json_array(self, tmp_path):
-        result = MagicMock()
-        result.returncode = 0
-        result.stdout = '[1, 2, 3]'
-        with patch("subprocess.run", return_value=result):
-            r = _run_cmd(["stats"], tmp_path)
-            assert r == [1, 2, 3]
-
-    def test_handles_json_with_leading_text(self, tmp_path):
-        result = MagicMock()
-        result.returncode = 0
-        result.stdout = 'INFO: startup\n{"result": 42}'
-        with patch("subprocess.run", return_value=result):
-            r = _run_cmd(["stats"], tmp_path)
-            assert r == {"result": 42}
-
-    def test_returns_none_on_exception(self, tmp_path):
-        with patch("subprocess.run", side_effect=Exception("broken")):
-            assert _run_cmd(["stats"], tmp_path) is None
+class TestLoad:
+    def test_returns_context_report(self):
+        ctx = MagicMock()
+        assert _load("health", ctx) is ctx.health
+
+    def test_returns_none_on_exception(self):
+        class _Broken:
+            @property
+            def repo_stats(self):
+                raise RuntimeError("git missing")
+        assert _load("stats", _Broken()) is None
+
+    def test_gather_preserves_order(self):
+        ctx = MagicMock()
+        data = _gather(ctx, ["stats", "health"])
+        assert list(data) == ["stats", "health"]
+        assert data["stats"] is ctx.repo_stats
+
+    def test_gather_runs_loaders_concurrently(self):
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _wait(name, ctx):
+            barrier.wait()
+            return name
+
+        with patch("src.report._load", _wait):
+            assert _gather(None, ["stats", "health"]) == {"stats": "stats", "health": "health"}
 
 
 # ===========================================================================
-# generate_report  (integration-style, mocked subprocess)
+# generate_report  (integration-style, mocked analyses)
 # ===========================================================================
 
+def _stats(**kw):
+    from src.stats import RepoStats
+    return RepoStats(**kw)
+
+
+def _health(score, files=()):
+    report = MagicMock()
+    report.overall_health_score = score
+    report.files = list(files)
+    return report
+
+
 class TestGenerateReport:
-    def _null_run_cmd(self, *args, **kwargs):
+    def _null_load(self, *args, **kwargs):
         return None
 
     def test_returns_executive_report(self, tmp_path):
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path)
         assert isinstance(report, ExecutiveReport)
 
     def test_repo_name_matches_folder(self, tmp_path):
         folder = tmp_path / "my_project"
         folder.mkdir()
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(folder)
         assert report.repo_name == "my_project"
 
     def test_overall_score_is_float(self, tmp_path):
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path)
         assert isinstance(report.overall_score, float)
 
     def test_overall_grade_is_string(self, tmp_path):
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path)
         assert isinstance(report.overall_grade, str)
 
     def test_generated_at_is_string(self, tmp_path):
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path)
         assert isinstance(report.generated_at, str)
         assert len(report.generated_at) > 0
@@ -498,70 +463,75 @@ class TestGenerateReport:
     def test_session_number_from_log(self, tmp_path):
         log = tmp_path / "AWAKE_LOG.md"
         log.write_text("## Session 7\nsome content\n## Session 8\nmore content")
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path)
         assert report.session_number == 8
 
     def test_explicit_session_number_used(self, tmp_path):
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path, session_number=42)
         assert report.session_number == 42
 
     def test_to_html_produces_valid_output(self, tmp_path):
-        with patch("src.report._run_cmd", self._null_run_cmd):
+        with patch("src.report._load", self._null_load):
             report = generate_report(tmp_path)
         html = report.to_html()
         assert "<!DOCTYPE html>" in html
         assert "</html>" in html
 
     def test_stats_section_added_when_data_present(self, tmp_path):
-        stats_data = {
-            "sessions_count": 10,
-            "total_prs": 25,
-            "total_commits": 200,
-            "total_lines_changed": 5000,
-        }
-        def mock_run_cmd(args, repo):
-            if args == ["stats"]:
-                return stats_data
-            return None
-        with patch("src.report._run_cmd", mock_run_cmd):
+        stats = _stats(nights_active=10, total_prs=25, total_commits=200, lines_changed=5000)
+        def mock_load(name, ctx):
+            return stats if name == "stats" else None
+        with patch("src.report._load", mock_load):
             report = generate_report(tmp_path)
         # Stats section should appear
         titles = [s.title for s in report.sections]
         assert any("Stats" in t for t in titles)
+        assert report.headline_metrics["Sessions"] == 10
+        assert report.headline_metrics["Lines Changed"] == "5,000"
 
     def test_health_section_added_when_data_present(self, tmp_path):
-        health_data = {
-            "overall_health_score": 82.5,
-            "files": [{"name": "cli.py", "health_score": 75}],
-        }
-        def mock_run_cmd(args, repo):
-            if args == ["health"]:
-                return health_data
-            return None
-        with patch("src.report._run_cmd", mock_run_cmd):
+        file_health = MagicMock(path="src/cli.py", health_score=75.0)
+        def mock_load(name, ctx):
+            return _health(82.5, [file_health]) if name == "health" else None
+        with patch("src.report._load", mock_load):
             report = generate_report(tmp_path)
         titles = [s.title for s in report.sections]
         assert any("Health" in t for t in titles)
+        assert "cli.py" in report.sections[0].content_html
 
-    def test_no_sections_when_all_cmds_fail(self, tmp_path):
-        with patch("src.report._run_cmd", return_value=None):
+    def test_no_sections_when_all_analyses_fail(self, tmp_path):
+        with patch("src.report._load", return_value=None):
             report = generate_report(tmp_path)
         assert report.sections == []
 
     def test_overall_score_uses_health_when_present(self, tmp_path):
-        health_data = {"overall_health_score": 55.0, "files": []}
-        def mock_run_cmd(args, repo):
-            if args == ["health"]:
-                return health_data
-            return None
-        with patch("src.report._run_cmd", mock_run_cmd):
+        def mock_load(name, ctx):
+            return _health(55.0) if name == "health" else None
+        with patch("src.report._load", mock_load):
             report = generate_report(tmp_path)
         assert report.overall_score == 55.0
 
     def test_fallback_score_is_75(self, tmp_path):
-        """When no analysis commands return data, overall_score defaults to 75."""
-        with patch("src.report._run_cmd", return_value=None):
+        """When no analyses return data, overall_score defaults to 75."""
+        with patch("src.report._load", return_value=None):
             report = generate_report(tmp_path)
         assert report.overall_score == 75.0
+
+    def test_reuses_shared_context(self, tmp_path):
+        from src.analysis_context import AnalysisContext
+        ctx = AnalysisContext(tmp_path)
+        with patch("src.health.generate_health_report", return_value=_health(90.0)) as gen, \
+             patch("src.stats.compute_stats", return_value=_stats()):
+            generate_report(tmp_path, context=ctx)
+            report = generate_report(tmp_path, context=ctx)
+        assert gen.call_count == 1
+        assert report.overall_score == 90.0
+
+    def test_does_not_spawn_subprocesses(self, tmp_path):
+        with patch("subprocess.run", side_effect=AssertionError("subprocess")), \
+             patch("src.health.generate_health_report", return_value=_health(70.0)), \
+             patch("src.stats.compute_stats", return_value=_stats(total_prs=3)):
+            report = generate_report(tmp_path)
+        assert [s.title for s in report.sections] == ["Repository Stats", "Code Health"]
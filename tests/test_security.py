@@ -12,6 +12,9 @@ from src.security import (
     audit_security,
     save_security_report,
     _SecurityVisitor,
+    _scan_secret_buffer,
+    _scan_secret_lines,
+    _scan_secrets_file,
 )
 
 
@@ -245,6 +248,63 @@ class TestHardcodedSecrets:
         assert "S010" not in rules
 
 
+    def test_one_finding_per_line(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "config.py").write_text('api_token = "sk-abc1234567890"\n')
+        report = audit_security(repo_path=tmp_path)
+        [finding] = [f for f in report.findings if f.rule == "S010"]
+        assert finding.title == "Hardcoded API key/secret"
+
+    def test_prefilter_skips_lines_without_quote(self):
+        assert _scan_secret_lines(["password = get_password()", "x = 1"], "a.py") == []
+
+    def test_literal_must_stay_on_one_line(self):
+        assert _scan_secret_buffer(b'password = "ab\ncd"\n', "a.txt") == []
+
+    def test_buffer_scan_matches_line_scan(self):
+        lines = ["x = 1", 'token = "abcdefgh1234"', "", "PWD='hunter22' # again", 'n = "short"']
+        by_line = [(f.line, f.title) for f in _scan_secret_lines(lines, "a.py")]
+        by_buffer = [(f.line, f.title) for f in _scan_secret_buffer("\n".join(lines).encode(), "a.py")]
+        assert by_line == by_buffer == [(2, "Hardcoded auth token"), (4, "Hardcoded password literal")]
+
+    def test_buffer_scan_counts_characters_not_bytes(self):
+        lines = ['token = "éééé"', 'token = "éééééééé"']
+        by_line = [f.line for f in _scan_secret_lines(lines, "a.py")]
+        by_buffer = [f.line for f in _scan_secret_buffer("\n".join(lines).encode(), "a.py")]
+        assert by_line == by_buffer == [2]
+
+
+class TestWholeRepoSecrets:
+    def _repo(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("x = 1\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_app.py").write_text('password = "hunter22"\n')
+        (tmp_path / "deploy.env").write_text('# creds\nSECRET_KEY = "0123456789abcdef"\n')
+        (tmp_path / "blob.bin").write_bytes(b'\0password = "hunter22"')
+        return tmp_path
+
+    def test_default_scans_src_only(self, tmp_path):
+        report = audit_security(repo_path=self._repo(tmp_path))
+        assert report.files_scanned == 1
+        assert report.findings == []
+
+    def test_whole_repo_scans_text_files(self, tmp_path):
+        report = audit_security(repo_path=self._repo(tmp_path), whole_repo=True)
+        found = {(f.file, f.line) for f in report.findings}
+        assert found == {(str(Path("tests") / "test_app.py"), 1), ("deploy.env", 2)}
+        assert report.files_scanned == 4
+
+    def test_large_files_use_mmap(self, tmp_path, monkeypatch):
+        import src.security as security
+        monkeypatch.setattr(security, "MMAP_THRESHOLD", 16)
+        big = tmp_path / "big.cfg"
+        big.write_text("a = 1\n" * 100 + 'access_token = "abcdefgh1234"\n')
+        [finding] = _scan_secrets_file(big, "big.cfg")
+        assert finding.line == 101
+
+
 # ---------------------------------------------------------------------------
 # audit_security integration
 # ---------------------------------------------------------------------------
@@ -277,6 +337,14 @@ class TestAuditSecurity:
         report = audit_security(repo_path=tmp_path)
         assert report.grade in ("A", "B", "C", "D", "F")
 
+    def test_findings_carry_file_and_snippet(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "risky.py").write_text("x = 1\neval(user_input)\n")
+        report = audit_security(repo_path=tmp_path)
+        [finding] = [f for f in report.findings if f.rule == "S001"]
+        assert (finding.file, finding.line, finding.snippet) == ("src/risky.py", 2, "eval(user_input)")
+
     def test_syntax_error_skipped(self, tmp_path):
         src = tmp_path / "src"
         src.mkdir()
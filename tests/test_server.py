@@ -255,3 +255,172 @@ class TestErrorHandling:
             handler.do_GET()
             mock_run.assert_called_once()
             handler.send_response.assert_called_with(200)
+
+
+class TestSingleFlight:
+    def test_sequential_calls_recompute(self):
+        from src.server import SingleFlight
+        flights = SingleFlight()
+        calls = []
+        assert flights.do("k", lambda: calls.append(1) or "a") == "a"
+        assert flights.do("k", lambda: calls.append(1) or "b") == "b"
+        assert len(calls) == 2
+        assert flights.coalesced == 0
+
+    def test_concurrent_calls_share_one_run(self):
+        import threading
+        import time
+        from src.server import SingleFlight
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        runs = []
+
+        def slow():
+            runs.append(1)
+            started.set()
+            release.wait(5)
+            return "shared"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+            for _ in range(3)
+        ]
+        for t in followers:
+            t.start()
+        deadline = time.monotonic() + 5
+        while flights.coalesced < 3 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(5)
+        assert results == ["shared"] * 4
+        assert len(runs) == 1
+
+    def test_error_propagates_to_waiters(self):
+        from src.server import SingleFlight
+        flights = SingleFlight()
+        with pytest.raises(ValueError):
+            flights.do("k", lambda: (_ for _ in ()).throw(ValueError("x")))
+        assert flights.do("k", lambda: 1) == 1
+
+
+class TestConcurrentServer:
+    def test_slow_request_does_not_block_others(self):
+        import threading
+        import time
+        import urllib.request
+        from src.server import AwakeHTTPServer
+
+        gate = threading.Event()
+
+        def fake_run(self, cli_args):
+            if cli_args[0] == "audit":
+                gate.wait(5)
+            return '{"cmd": "%s"}' % cli_args[0]
+
+        server = AwakeHTTPServer(("127.0.0.1", 0), AwakeHandler, workers=4)
+        server.repo_path = Path(".")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with patch.object(AwakeHandler, "_run_command", fake_run):
+                slow = threading.Thread(
+                    target=lambda: urllib.request.urlopen(base + "/api/audit", timeout=10).read()
+                )
+                slow.start()
+                time.sleep(0.05)
+                body = urllib.request.urlopen(base + "/api/stats", timeout=2).read()
+                assert json.loads(body) == {"cmd": "stats"}
+                gate.set()
+                slow.join(5)
+        finally:
+            gate.set()
+            server.shutdown()
+            server.server_close()
+
+
+class TestResultCaching:
+    def _handler(self, path: str, cache, headers=None):
+        handler = make_handler(path)
+        handler.server.result_cache = cache
+        handler.headers = headers or {}
+        handler.send_response = MagicMock()
+        handler.send_header = MagicMock()
+        handler.end_headers = MagicMock()
+        return handler
+
+    def test_second_request_served_from_cache(self):
+        from src.api_cache import ResultCache
+        cache = ResultCache()
+        with patch.object(ResultCache, "fingerprint", return_value=("fp",)):
+            with patch.object(AwakeHandler, "_run_command", return_value='{"n": 1}') as run:
+                self._handler("/api/stats", cache).do_GET()
+                self._handler("/api/stats", cache).do_GET()
+        assert run.call_count == 1
+
+    def test_fingerprint_change_recomputes(self):
+        from src.api_cache import ResultCache
+        cache = ResultCache()
+        with patch.object(AwakeHandler, "_run_command", return_value='{"n": 1}') as run:
+            with patch.object(ResultCache, "fingerprint", return_value=("a",)):
+                self._handler("/api/stats", cache).do_GET()
+            with patch.object(ResultCache, "fingerprint", return_value=("b",)):
+                self._handler("/api/stats", cache).do_GET()
+        assert run.call_count == 2
+
+    def test_etag_and_304(self):
+        from src.api_cache import etag_for
+        body = '{"n": 1}'
+        with patch.object(AwakeHandler, "_run_command", return_value=body):
+            first = self._handler("/api/stats", None)
+            first.do_GET()
+            first.send_header.assert_any_call("ETag", etag_for(body))
+            first.send_header.assert_any_call("Cache-Control", "no-cache")
+
+            again = self._handler("/api/stats", None, {"If-None-Match": etag_for(body)})
+            again.do_GET()
+        again.send_response.assert_called_with(304)
+        assert again.wfile.getvalue() == b""
+
+    def test_stale_etag_gets_full_body(self):
+        with patch.object(AwakeHandler, "_run_command", return_value='{"n": 2}'):
+            handler = self._handler("/api/stats", None, {"If-None-Match": '"old"'})
+            handler.do_GET()
+        handler.send_response.assert_called_with(200)
+        assert json.loads(handler.wfile.getvalue()) == {"n": 2}
+
+
+class TestQueryParams:
+    def _get(self, path: str, body: str = "{}"):
+        handler = make_handler(path)
+        handler.send_response = MagicMock()
+        handler.send_header = MagicMock()
+        handler.end_headers = MagicMock()
+        with patch.object(handler, "_run_command", return_value=body) as mock_run:
+            handler.do_GET()
+        return handler, mock_run
+
+    def test_trends_range_forwarded(self):
+        handler, mock_run = self._get("/api/trends?from=3&to=40&points=200")
+        mock_run.assert_called_once_with(
+            ["trends", "--json", "--from", "3", "--to", "40", "--points", "200"]
+        )
+        handler.send_response.assert_called_with(200)
+
+    def test_unknown_params_ignored(self):
+        _, mock_run = self._get("/api/trends?cachebust=1")
+        mock_run.assert_called_once_with(["trends", "--json"])
+
+    def test_other_routes_ignore_query(self):
+        _, mock_run = self._get("/api/stats?points=5")
+        mock_run.assert_called_once_with(["stats", "--json"])
+
+    def test_non_integer_rejected(self):
+        handler, mock_run = self._get("/api/trends?points=lots")
+        mock_run.assert_not_called()
+        handler.send_response.assert_called_with(400)
@@ -0,0 +1,130 @@
+"""Tests for src/session_index.py — shared AWAKE_LOG.md session index."""
+from __future__ import annotations
+
+import os
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import src.session_index as session_index
+from src.session_index import (
+    SessionIndex,
+    clear_session_index_cache,
+    load_session_index,
+)
+
+
+LOG = """\
+# Awake Log
+
+## Session 1 — February 27, 2026
+
+Added `src/health.py` and src/Stats.py.
+
+## Session 2 -- Coupling (2026-03-01)
+
+- Touched src/coupling.py
+- See also src/commands/infra.py
+
+## Session 3
+
+No date here. Mentions src/health.py again.
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    clear_session_index_cache()
+    yield
+    clear_session_index_cache()
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path* so it falls outside the racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestSessionIndex:
+    def test_sections_split_at_headers(self):
+        index = SessionIndex.from_text(LOG)
+        assert index.numbers() == [1, 2, 3]
+        second = index.section(index.get(2))
+        assert second.startswith("## Session 2 -- Coupling")
+        assert second.endswith("infra.py\n\n")
+
+    def test_header_dates(self):
+        index = SessionIndex.from_text(LOG)
+        assert [e.date for e in index] == ["2026-02-27", "2026-03-01", None]
+
+    def test_module_mentions(self):
+        index = SessionIndex.from_text(LOG)
+        assert [e.number for e in index.mentioning("health")] == [1, 3]
+        assert [e.number for e in index.mentioning("STATS")] == [1]
+        assert index.mentioning("infra") == []
+        assert index.first_mentions()["coupling"].number == 2
+
+    def test_between_dates(self):
+        index = SessionIndex.from_text(LOG)
+        assert [e.number for e in index.between("2026-02-28")] == [2]
+        assert [e.number for e in index.between(end=date(2026, 2, 28))] == [1]
+
+    def test_get_prefers_last_duplicate(self):
+        index = SessionIndex.from_text("## Session 1 — a\n\n## Session 1 — b\n")
+        assert index.get(1).title == "— b"
+        assert index.latest_number == 1
+
+    def test_empty_text(self):
+        index = SessionIndex.from_text("no sessions")
+        assert len(index) == 0
+        assert index.latest_number is None
+
+
+class TestLoadSessionIndex:
+    def test_missing_file_is_empty(self, tmp_path):
+        assert len(load_session_index(tmp_path / "AWAKE_LOG.md")) == 0
+
+    def test_memoised_per_process(self, tmp_path):
+        log = tmp_path / "AWAKE_LOG.md"
+        log.write_text(LOG, encoding="utf-8")
+        _age(log)
+        first = load_session_index(log)
+        assert load_session_index(log) is first
+
+    def test_disk_copy_skips_scan_and_read(self, tmp_path):
+        log = tmp_path / "AWAKE_LOG.md"
+        log.write_text(LOG, encoding="utf-8")
+        _age(log)
+        load_session_index(log)
+        clear_session_index_cache()
+        with patch.object(session_index, "_scan") as scan, \
+             patch.object(session_index, "_read_text", wraps=session_index._read_text) as read:
+            index = load_session_index(log)
+            assert index.numbers() == [1, 2, 3]
+            assert read.call_count == 0
+            assert index.section(index.get(3)).startswith("## Session 3")
+        scan.assert_not_called()
+
+    def test_rewrite_invalidates(self, tmp_path):
+        log = tmp_path / "AWAKE_LOG.md"
+        log.write_text(LOG, encoding="utf-8")
+        assert load_session_index(log).numbers() == [1, 2, 3]
+        log.write_text(LOG + "\n## Session 4 — March 2, 2026\n", encoding="utf-8")
+        assert load_session_index(log).numbers() == [1, 2, 3, 4]
+
+    def test_same_size_rewrite_in_racy_window(self, tmp_path):
+        log = tmp_path / "AWAKE_LOG.md"
+        log.write_text("## Session 1 — x\n", encoding="utf-8")
+        st = log.stat()
+        assert load_session_index(log).numbers() == [1]
+        log.write_text("## Session 2 — x\n", encoding="utf-8")
+        os.utime(log, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_session_index(log).numbers() == [2]
+
+    def test_no_persist_writes_nothing(self, tmp_path):
+        log = tmp_path / "AWAKE_LOG.md"
+        log.write_text(LOG, encoding="utf-8")
+        load_session_index(log, persist=False)
+        assert not (tmp_path / ".awake").exists()
@@ -0,0 +1,194 @@
+"""Tests for src/session_journal.py — structured JSONL session journal."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import src.session_journal as session_journal
+from src.diff_sessions import compare_sessions as diff_compare
+from src.session_journal import (
+    append_record,
+    journal_path,
+    load_records,
+    read_session,
+    rebuild_index,
+    record_metrics,
+)
+from src.session_logger import PRRecord, SessionEntry, TaskRecord, append_session_to_log
+from src.session_replay import replay, replay_all
+from src.session_scorer import score_all_sessions, session_row
+from src.trend_data import _parse_log as trend_parse_log
+
+
+def _entry(number: int, tests: int, modules: int, health: float) -> SessionEntry:
+    pr = PRRecord(number=number * 10, title=f"Session {number} work", branch=f"awake/s{number}",
+                  url=f"https://github.com/o/r/pull/{number * 10}")
+    return SessionEntry(
+        session_number=number,
+        date="March 01, 2026",
+        tasks=[TaskRecord(name=f"task-{number}", description=f"Added `src/mod{number}.py`", pr=pr)],
+        prs=[pr],
+        decisions=[f"decision {number}"],
+        stats_snapshot={"tests": f"{tests:,}", "modules": modules, "health": f"{health}/100"},
+        notes=f"notes {number}",
+    )
+
+
+@pytest.fixture
+def log(tmp_path) -> Path:
+    return tmp_path / "AWAKE_LOG.md"
+
+
+# ---------------------------------------------------------------------------
+# Journal and index
+# ---------------------------------------------------------------------------
+
+
+def test_journal_path_sits_beside_log(log):
+    assert journal_path(log) == log.parent / "AWAKE_LOG.jsonl"
+
+
+def test_append_session_writes_journal(log):
+    append_session_to_log(log, _entry(1, 100, 10, 70.0))
+    lines = journal_path(log).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["session_number"] == 1
+    assert record["journal_version"] == session_journal.JOURNAL_VERSION
+
+
+def test_dry_run_does_not_write_journal(log):
+    append_session_to_log(log, _entry(1, 100, 10, 70.0), dry_run=True)
+    assert not journal_path(log).exists()
+
+
+def test_read_session_latest_wins(log):
+    append_record(log, {"session_number": 3, "notes": "first"})
+    append_record(log, {"session_number": 4, "notes": "other"})
+    append_record(log, {"session_number": 3, "notes": "second"})
+    assert read_session(log, 3)["notes"] == "second"
+    assert read_session(log, 4)["notes"] == "other"
+    assert read_session(log, 5) is None
+    assert load_records(log)[3]["notes"] == "second"
+
+
+def test_read_session_missing_journal(log):
+    assert read_session(log, 1) is None
+    assert load_records(log) == {}
+
+
+def test_read_session_does_not_scan_journal(log, monkeypatch):
+    for n in range(1, 6):
+        append_record(log, {"session_number": n})
+    real_open = open
+    reads: list[int] = []
+
+    class _Counting:
+        def __init__(self, fh):
+            self._fh = fh
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._fh.close()
+
+        def __iter__(self):
+            raise AssertionError("journal scanned")
+
+        def read(self, n=-1):
+            data = self._fh.read(n)
+            reads.append(len(data))
+            return data
+
+        def __getattr__(self, name):
+            return getattr(self._fh, name)
+
+    def _open(path, *args, **kwargs):
+        return _Counting(real_open(path, *args, **kwargs))
+
+    monkeypatch.setattr(session_journal, "open", _open, raising=False)
+    assert read_session(log, 4)["session_number"] == 4
+    # index header, index slot, journal line
+    assert len(reads) == 3
+
+
+def test_stale_index_is_rebuilt(log):
+    append_record(log, {"session_number": 1, "notes": "a"})
+    with open(journal_path(log), "a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"session_number": 2, "notes": "hand-written"}) + "\n")
+    assert read_session(log, 2)["notes"] == "hand-written"
+
+
+def test_corrupt_lines_are_skipped(log):
+    journal_path(log).write_text('not json\n{"session_number": 7}\n', encoding="utf-8")
+    rebuild_index(log)
+    assert read_session(log, 7) == {"session_number": 7}
+    assert list(load_records(log)) == [7]
+
+
+def test_record_metrics():
+    metrics = record_metrics(_entry(2, 1234, 12, 81.5).to_dict())
+    assert metrics["prs"] == 1
+    assert metrics["tests"] == 1234
+    assert metrics["modules"] == 12
+    assert metrics["health_score"] == 81.5
+    assert metrics["tasks_completed"] == 1
+    assert metrics["task_names"] == ["task-2"]
+
+
+# ---------------------------------------------------------------------------
+# Readers prefer the journal
+# ---------------------------------------------------------------------------
+
+
+def test_replay_uses_journal(log):
+    append_session_to_log(log, _entry(1, 100, 10, 70.0))
+    log.write_text("# Awake Log\n", encoding="utf-8")  # Markdown no longer has it
+    r = replay(log, 1)
+    assert r is not None
+    assert r.pr_count == 1
+    assert r.tasks[0].pr_url.endswith("/10")
+    assert r.modules_added == ["src/mod1.py"]
+    assert r.decisions == ["decision 1"]
+
+
+def test_replay_falls_back_to_markdown(log):
+    log.write_text("# Awake Log\n\n## Session 9 — Jan 1, 2026\n\n**Notes:** legacy\n", encoding="utf-8")
+    append_record(log, {"session_number": 10})
+    assert replay(log, 9).notes == "legacy"
+    assert [r.session_number for r in replay_all(log)] == [9, 10]
+
+
+def test_journal_replay_matches_markdown_replay(log):
+    append_session_to_log(log, _entry(1, 100, 10, 70.0))
+    from_journal = replay(log, 1)
+    journal_path(log).unlink()
+    from_markdown = replay(log, 1)
+    a, b = from_journal.to_dict(), from_markdown.to_dict()
+    # The Markdown PR line parser keeps the branch suffix in the title.
+    assert a.pop("prs")[0]["title"] == "Session 1 work"
+    b.pop("prs")
+    assert a == b
+
+
+def test_diff_sessions_and_trends_use_journal(tmp_path):
+    log = tmp_path / "AWAKE_LOG.md"
+    append_session_to_log(log, _entry(30, 2000, 50, 80.0))
+    append_session_to_log(log, _entry(31, 2100, 52, 82.5))
+    report = diff_compare(tmp_path, 30, 31)
+    assert report.snapshot_b.tests == 2100
+    assert report.snapshot_b.task_names == ["task-31"]
+    trends = {m.session: m for m in trend_parse_log(log)}
+    assert trends[31].health_score == 82.5
+
+
+def test_session_score_uses_journal(log):
+    append_session_to_log(log, _entry(40, 2000, 50, 80.0))
+    append_session_to_log(log, _entry(41, 2150, 53, 83.0))
+    assert session_row(41, log) == (41, 3, 150, 0, 0, 3.0)
+    assert session_row(40, log) is None
+    assert session_row(18, log)[0] == 18
+    assert score_all_sessions(log)[-1].session == 41
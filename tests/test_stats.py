@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.git_log import GitCommit
 from src.stats import (
     RepoStats,
     _run_git,
@@ -152,22 +153,38 @@ class TestCountLinesChanged:
 # ---------------------------------------------------------------------------
 
 
+def _commits(*subjects: str) -> list[GitCommit]:
+    return [
+        GitCommit(sha=f"{i:040x}", parents=(), author="a", email="", date="",
+                  committer_date="", subject=subj, body="")
+        for i, subj in enumerate(subjects)
+    ]
+
+
 class TestGetCommitMessages:
     def test_returns_list(self, tmp_path):
-        with patch("src.stats._run_git", return_value="feat: add thing\nfix: remove bug\n"):
+        with patch("src.stats.iter_commits", return_value=iter(_commits("feat: add thing", "fix: remove bug"))):
             messages = get_commit_messages(tmp_path)
         assert messages == ["feat: add thing", "fix: remove bug"]
 
     def test_empty_repo(self, tmp_path):
-        with patch("src.stats._run_git", return_value=""):
+        with patch("src.stats.iter_commits", return_value=iter([])):
             messages = get_commit_messages(tmp_path)
         assert messages == []
 
     def test_filters_empty_lines(self, tmp_path):
-        with patch("src.stats._run_git", return_value="msg1\n\n\nmsg2\n"):
+        with patch("src.stats.iter_commits", return_value=iter(_commits("msg1", "", "msg2"))):
             messages = get_commit_messages(tmp_path)
         assert messages == ["msg1", "msg2"]
 
+    def test_reads_real_repository(self, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "config", "user.email", "t@t.com"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "config", "user.name", "T"], cwd=tmp_path, check=True)
+        for msg in ("first", "second"):
+            subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", msg], cwd=tmp_path, check=True)
+        assert get_commit_messages(tmp_path) == ["second", "first"]
+
 
 # ---------------------------------------------------------------------------
 # count_awake_sessions
@@ -189,7 +206,9 @@ class TestCountAwakeSessions:
 
             Session: 2
         """)
-        with patch("src.stats._run_git", return_value=fake_log):
+        messages = ["[awake] feat: add stats engine", "[awake] feat: add logger"]
+        with patch("src.stats.get_commit_messages", return_value=messages), \
+             patch("src.stats._run_git", return_value=fake_log):
             count = count_awake_sessions(tmp_path)
         assert count == 2
 
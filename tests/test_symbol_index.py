@@ -0,0 +1,240 @@
+"""Tests for src/symbol_index.py — symbol table and reference index."""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src._ast_utils import clear_source_cache, get_source_store
+from src.symbol_index import (
+    SymbolIndex,
+    _SymbolPass,
+    _file_symbols,
+    _index_path,
+    build_symbol_index,
+    module_name,
+)
+
+
+def _symbols(source: str, rel: str = "src/pkg/mod.py") -> dict:
+    sp = _SymbolPass()
+    sp.visit(ast.parse(source))
+    return _file_symbols(sp, rel)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "__init__.py").write_text("")
+    (src / "lib.py").write_text(
+        "class Engine:\n"
+        "    def start(self):\n"
+        "        return self.stop()\n"
+        "    def stop(self):\n"
+        "        pass\n"
+        "\n"
+        "def build():\n"
+        "    return Engine()\n"
+    )
+    (src / "app.py").write_text(
+        "from src.lib import build\n"
+        "import src.lib as lib\n"
+        "\n"
+        "def main():\n"
+        "    build().start()\n"
+        "    return lib.Engine.stop\n"
+    )
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_lib.py").write_text(
+        "from src import lib\n\ndef test_build():\n    assert lib.build()\n"
+    )
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# Per-file collection
+# ---------------------------------------------------------------------------
+
+
+class TestSymbolPass:
+    def test_definitions_are_qualified(self):
+        payload = _symbols("def f():\n    def inner(): pass\n\nclass C:\n    def m(self): pass\n")
+        assert [(q, kind) for q, kind, *_ in payload["defs"]] == [
+            ("src.pkg.mod.f", "function"),
+            ("src.pkg.mod.C", "class"),
+            ("src.pkg.mod.C.m", "method"),
+        ]
+
+    def test_definition_spans(self):
+        [(_, _, line, end)] = _symbols("\n\ndef f():\n    x = 1\n    return x\n")["defs"]
+        assert (line, end) == (3, 5)
+
+    def test_imports_keep_alias_and_line(self):
+        payload = _symbols("import os.path\nfrom pathlib import Path as P\n")
+        assert payload["imports"] == [["os", "os", 1], ["P", "pathlib.Path", 2]]
+
+    def test_relative_imports_resolved(self):
+        payload = _symbols("from . import sibling\nfrom ..top import thing\n")
+        targets = {t for _, t, _ in payload["imports"]}
+        assert targets == {"src.pkg.sibling", "src.top.thing"}
+
+    def test_attribute_chain_resolved_through_alias(self):
+        payload = _symbols("import src.health as h\nh.analyze_file()\n")
+        assert ["src.health.analyze_file", "analyze_file", 2, "attribute"] in payload["refs"]
+
+    def test_self_attribute_resolved_to_method(self):
+        payload = _symbols("class C:\n    def a(self):\n        return self.b()\n")
+        assert ["src.pkg.mod.C.b", "b", 3, "attribute"] in payload["refs"]
+
+    def test_untracked_attribute_unresolved(self):
+        payload = _symbols("def f(page):\n    return page.render()\n")
+        assert ["", "render", 2, "attribute"] in payload["refs"]
+
+    def test_string_literals(self):
+        payload = _symbols("__all__ = ['f', 'not an identifier', 'src.a.b']\n")
+        strings = [r for r in payload["refs"] if r[3] == "string"]
+        assert strings == [["", "f", 1, "string"], ["src.a.b", "b", 1, "string"]]
+
+    def test_plain_dotted_import_references_module(self):
+        payload = _symbols("import os.path\n")
+        assert ["os.path", "path", 1, "import"] in payload["refs"]
+        assert payload["imports"] == [["os", "os", 1]]
+
+    def test_names_cover_names_and_attributes(self):
+        assert {"os", "join"} <= set(_symbols("x = os.path.join('a', 'b')\n")["names"])
+
+    def test_star_import_flagged(self):
+        assert _symbols("from src.lib import *\n")["star"] is True
+
+    def test_module_name(self):
+        assert module_name("src/health.py") == "src.health"
+        assert module_name("src/commands/__init__.py") == "src.commands"
+
+
+# ---------------------------------------------------------------------------
+# Index queries
+# ---------------------------------------------------------------------------
+
+
+class TestSymbolIndex:
+    def test_definitions(self, repo):
+        index = build_symbol_index(repo, persist=False)
+        engine = index.definitions["src.lib.Engine"]
+        assert (engine.kind, engine.file, engine.line) == ("class", "src/lib.py", 1)
+        assert index.definitions["src.lib.Engine.stop"].kind == "method"
+
+    def test_references_to_function(self, repo):
+        index = build_symbol_index(repo, persist=False)
+        sites = {(r.file, r.kind) for r in index.references_to("src.lib.build")}
+        assert sites == {
+            ("src/app.py", "import"), ("src/app.py", "name"), ("tests/test_lib.py", "attribute"),
+        }
+
+    def test_member_reference_counts_for_class(self, repo):
+        index = build_symbol_index(repo, persist=False)
+        assert any(r.target == "src.lib.Engine.stop" for r in index.references_to("src.lib.Engine"))
+
+    def test_self_call_references_method(self, repo):
+        index = build_symbol_index(repo, persist=False)
+        stop = index.definitions["src.lib.Engine.stop"]
+        files = [r.file for r in index.references_to(stop.qualname) if not stop.contains(r)]
+        assert files.count("src/lib.py") == 1
+
+    def test_unresolved_by_name(self, repo):
+        index = build_symbol_index(repo, persist=False)
+        assert [r.file for r in index.unresolved("start")] == ["src/app.py"]
+
+    def test_find(self, repo):
+        index = build_symbol_index(repo, persist=False)
+        assert [d.qualname for d in index.find("stop")] == ["src.lib.Engine.stop"]
+        assert [d.qualname for d in index.find("src.lib.build")] == ["src.lib.build"]
+
+    def test_sys_path_style_import_canonicalised(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "mod.py").write_text("def f():\n    pass\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_mod.py").write_text("from mod import f\nf()\n")
+        index = build_symbol_index(tmp_path, persist=False)
+        assert {r.file for r in index.references_to("src.mod.f")} == {"tests/test_mod.py"}
+
+    def test_unparsable_file(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "bad.py").write_text("def broken(:\n")
+        index = build_symbol_index(tmp_path, persist=False)
+        assert len(index) == 1 and index.payload("src/bad.py") is None
+        assert index.definitions == {}
+
+
+# ---------------------------------------------------------------------------
+# Incremental persistence
+# ---------------------------------------------------------------------------
+
+
+class TestPersistence:
+    def test_writes_index(self, repo):
+        build_symbol_index(repo)
+        state = json.loads(_index_path(repo).read_text())
+        assert set(state["files"]) == {"src/__init__.py", "src/lib.py", "src/app.py", "tests/test_lib.py"}
+
+    def test_no_persist_writes_nothing(self, repo):
+        build_symbol_index(repo, persist=False)
+        assert not (repo / ".awake").exists()
+
+    def test_unchanged_files_not_reparsed(self, repo):
+        build_symbol_index(repo)
+        clear_source_cache()
+        index = build_symbol_index(repo)
+        assert index.reindexed == []
+        assert get_source_store().misses == 0
+
+    def test_only_edited_file_reparsed(self, repo):
+        build_symbol_index(repo)
+        (repo / "src" / "app.py").write_text("from src.lib import Engine\nEngine()\n")
+        clear_source_cache()
+        index = build_symbol_index(repo)
+        assert index.reindexed == ["src/app.py"]
+        assert get_source_store().misses == 1
+        assert [r.file for r in index.references_to("src.lib.build")] == ["tests/test_lib.py"]
+
+    def test_stale_stat_outside_racy_window_skips_digest(self, repo):
+        build_symbol_index(repo)
+        old = 1_000_000_000
+        for py_file in repo.rglob("*.py"):
+            os.utime(py_file, ns=(old, old))
+        build_symbol_index(repo)
+        clear_source_cache()
+        assert build_symbol_index(repo).reindexed == []
+
+    def test_touched_file_saved_with_new_mtime(self, repo):
+        build_symbol_index(repo)
+        old = 1_000_000_000
+        os.utime(repo / "src" / "lib.py", ns=(old, old))
+        assert build_symbol_index(repo).reindexed == []
+        state = json.loads(_index_path(repo).read_text())
+        assert state["files"]["src/lib.py"]["mtime_ns"] == old
+
+    def test_deleted_file_dropped(self, repo):
+        build_symbol_index(repo)
+        (repo / "tests" / "test_lib.py").unlink()
+        index = build_symbol_index(repo)
+        assert "tests/test_lib.py" not in index.files
+        assert "tests/test_lib.py" not in json.loads(_index_path(repo).read_text())["files"]
+
+    def test_corrupt_index_rebuilt(self, repo):
+        path = _index_path(repo)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert len(build_symbol_index(repo).reindexed) == 4
+
+    def test_matches_in_memory_build(self, repo):
+        build_symbol_index(repo)
+        (repo / "src" / "lib.py").write_text("def build():\n    return 1\n")
+        persisted = build_symbol_index(repo)
+        assert isinstance(persisted, SymbolIndex)
+        assert persisted.files == build_symbol_index(repo, persist=False).files
@@ -414,6 +414,14 @@ def test_teach_module_returns_tutorial(repo: Path):
     assert tutorial.module_name == "simple"
 
 
+def test_teach_module_lists_referencing_files(repo: Path):
+    (repo / "src" / "user.py").write_text("from src.simple import analyze\nanalyze('.')\n")
+    tutorial = teach_module("simple", repo)
+    analyze = next(f for f in tutorial.functions if f.name == "analyze")
+    assert analyze.referenced_by == ["src/user.py"]
+    assert "**Referenced by:** `src/user.py`" in tutorial.to_markdown()
+
+
 def test_teach_module_not_found(repo: Path):
     with pytest.raises(FileNotFoundError) as exc_info:
         teach_module("nonexistent_xyz", repo)
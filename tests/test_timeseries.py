@@ -0,0 +1,56 @@
+"""Tests for src/timeseries.py — columnar series, range queries and downsampling."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.timeseries import Series, SeriesFrame, bucket_bounds
+
+
+def test_bucket_bounds_cover_range():
+    bounds = bucket_bounds(10, 3)
+    assert bounds == [(0, 3), (3, 6), (6, 10)]
+    assert bucket_bounds(2, 5) == [(0, 1), (1, 2)]
+    assert bucket_bounds(0, 5) == []
+
+
+def test_series_range_is_inclusive():
+    s = Series("health", [1, 3, 5, 7], [10.0, 30.0, 50.0, 70.0])
+    assert list(s.range(3, 5).x) == [3, 5]
+    assert list(s.range(4).x) == [5, 7]
+    assert list(s.range(end=2).x) == [1]
+    assert len(s.range(8, 9)) == 0
+
+
+def test_series_missing_values():
+    s = Series("coverage", [1, 2, 3], [None, 2.0, None])
+    assert s.values() == [None, 2.0, None]
+    [bucket] = s.downsample(1)
+    assert (bucket.min, bucket.max, bucket.mean, bucket.count) == (2.0, 2.0, 2.0, 3)
+
+
+def test_series_downsample_min_max_mean():
+    s = Series("tests", range(1, 7), [1.0, 5.0, 3.0, 4.0, 8.0, 6.0])
+    first, second = s.downsample(2)
+    assert (first.start, first.end, first.min, first.max, first.mean) == (1, 3, 1.0, 5.0, 3.0)
+    assert (second.start, second.end, second.min, second.max, second.mean) == (4, 6, 4.0, 8.0, 6.0)
+
+
+def test_series_length_mismatch():
+    with pytest.raises(ValueError):
+        Series("x", [1, 2], [1.0])
+
+
+def test_frame_range_and_downsample():
+    frame = SeriesFrame(range(100), {"a": range(100), "b": [None] * 100})
+    sub = frame.range(10, 19)
+    assert len(sub) == 10
+    assert sub.series("a").values()[0] == 10.0
+    buckets = sub.downsample(2)
+    assert [b.mean for b in buckets["a"]] == [12.0, 17.0]
+    assert [b.mean for b in buckets["b"]] == [None, None]
+
+
+def test_frame_requires_sorted_x():
+    with pytest.raises(ValueError):
+        SeriesFrame([3, 1, 2], {"a": [1, 2, 3]})
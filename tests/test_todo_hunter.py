@@ -1,19 +1,24 @@
-"""Tests for src/todo_hunter.py — 37 tests."""
+"""Tests for src/todo_hunter.py."""
 
 from __future__ import annotations
 
 import json
+import subprocess
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 
+import src.todo_hunter as todo_hunter
 from src.todo_hunter import (
     TodoItem,
     hunt,
     render_todo_report,
     save_todo_report,
     TODO_PATTERN,
+    _SESSION_MEMO,
+    _blame_file,
     _blame_line,
+    _resolve_sessions,
     _session_from_commit,
     _find_repo_root,
 )
@@ -98,37 +103,50 @@ class TestTodoItem:
 
 class TestHunt:
     def test_finds_todo_in_source(self, src_with_todos):
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             items = hunt(src_with_todos, current_session=10, threshold=2)
         assert any(i.tag == "TODO" for i in items)
 
     def test_finds_fixme(self, src_with_todos):
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             items = hunt(src_with_todos, current_session=10, threshold=2)
         assert any(i.tag == "FIXME" for i in items)
 
     def test_clean_file_yields_no_items(self, src_with_todos):
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             items = hunt(src_with_todos, current_session=10, threshold=2)
         assert not any("beta" in i.file for i in items)
 
     def test_items_sorted_by_severity(self, src_with_todos):
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             items = hunt(src_with_todos, current_session=10, threshold=2)
         severities = [i.severity for i in items]
         assert severities == sorted(severities)
 
     def test_stale_flag_set_when_age_meets_threshold(self, src_with_todos):
-        with patch("src.todo_hunter._blame_line", return_value="abc123"), \
-             patch("src.todo_hunter._session_from_commit", return_value=1):
+        with patch("src.todo_hunter._blame_file", side_effect=lambda f, r: dict.fromkeys(range(1, 7), "a" * 40)), \
+             patch("src.todo_hunter._resolve_sessions", return_value={"a" * 40: 1}):
             items = hunt(src_with_todos, current_session=10, threshold=2)
         assert any(i.is_stale for i in items)
 
     def test_age_zero_when_blame_unavailable(self, src_with_todos):
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             items = hunt(src_with_todos, current_session=10, threshold=2)
         assert all(i.age_sessions == 0 for i in items)
 
+    def test_resolves_only_annotated_line_shas(self, src_with_todos):
+        def blame(py_file, repo_root):
+            lines = py_file.read_text().splitlines()
+            return {
+                n: ("t" if TODO_PATTERN.search(text) else "u") * 40
+                for n, text in enumerate(lines, start=1)
+            }
+
+        with patch("src.todo_hunter._blame_file", side_effect=blame), \
+             patch("src.todo_hunter._resolve_sessions", return_value={}) as resolve:
+            hunt(src_with_todos, current_session=10, threshold=2)
+        assert resolve.call_args.args[0] == {"t" * 40}
+
     def test_empty_src_returns_empty(self, tmp_path):
         src = tmp_path / "src"
         src.mkdir()
@@ -161,14 +179,14 @@ class TestRenderTodoReport:
 class TestSaveTodoReport:
     def test_creates_markdown_file(self, todo_items, tmp_path):
         out = tmp_path / "todo_report.md"
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             save_todo_report(todo_items, out, current_session=10)
         assert out.exists()
         assert "TODO" in out.read_text()
 
     def test_creates_json_sidecar(self, todo_items, tmp_path):
         out = tmp_path / "todo_report.md"
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             save_todo_report(todo_items, out, current_session=10)
         json_file = tmp_path / "todo_report.json"
         assert json_file.exists()
@@ -177,6 +195,62 @@ class TestSaveTodoReport:
 
     def test_creates_parent_dirs(self, todo_items, tmp_path):
         out = tmp_path / "a" / "b" / "report.md"
-        with patch("src.todo_hunter._blame_line", return_value=None):
+        with patch("src.todo_hunter._blame_file", return_value={}):
             save_todo_report(todo_items, out, current_session=10)
         assert out.exists()
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Path:
+    """A repo whose TODOs were added in sessions 3 and 5."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("# TODO: first\nx = 1\n# FIXME: second\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "[awake] feat\n\nSession: 3")
+    (src / "a.py").write_text("# TODO: first\nx = 1\n# FIXME: second\n# HACK: third\n")
+    (src / "b.py").write_text("# XXX: fourth\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Merge awake/session-5-cleanup")
+    (src / "b.py").write_text("# XXX: fourth\n# TODO: uncommitted\n")
+    _SESSION_MEMO.clear()
+    return tmp_path
+
+
+class TestBatchedBlame:
+    def test_blame_file_maps_every_committed_line(self, git_repo):
+        shas = _blame_file(git_repo / "src" / "a.py", git_repo)
+        assert sorted(shas) == [1, 2, 3, 4]
+        assert shas[1] == shas[3] != shas[4]
+
+    def test_blame_file_skips_uncommitted_lines(self, git_repo):
+        shas = _blame_file(git_repo / "src" / "b.py", git_repo)
+        assert sorted(shas) == [1]
+        assert _blame_line(git_repo / "src" / "b.py", 2, git_repo) is None
+
+    def test_resolve_sessions_in_one_git_call(self, git_repo):
+        shas = set(_blame_file(git_repo / "src" / "a.py", git_repo).values())
+        with patch("src.git_log.subprocess.Popen", wraps=subprocess.Popen) as popen:
+            sessions = _resolve_sessions(shas, git_repo)
+            assert sorted(sessions.values()) == [3, 5]
+            assert popen.call_count == 1
+            assert _session_from_commit(next(iter(shas)), git_repo) in (3, 5)
+            assert popen.call_count == 1  # memoised
+
+    def test_hunt_blames_each_file_once(self, git_repo):
+        with patch("src.todo_hunter._run_git", wraps=todo_hunter._run_git) as run_git:
+            items = hunt(git_repo / "src", current_session=6, threshold=2)
+        assert [c.args[0][0] for c in run_git.call_args_list] == ["blame", "blame"]
+        by_text = {i.text: i for i in items}
+        assert by_text["first"].introduced_session == 3
+        assert by_text["first"].is_stale
+        assert by_text["third"].introduced_session == 5
+        assert by_text["fourth"].age_sessions == 1
+        assert by_text["uncommitted"].introduced_session is None
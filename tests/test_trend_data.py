@@ -209,3 +209,45 @@ def test_seed_data_is_monotonically_increasing():
     for sd in _SEED_DATA:
         assert sd["tests"] >= prev_tests, f"Session {sd['session']} tests decreased"
         prev_tests = sd["tests"]
+
+
+# ---------------------------------------------------------------------------
+# Range queries and downsampling
+# ---------------------------------------------------------------------------
+
+
+def _long_history(n: int = 1000) -> TrendData:
+    sessions = [SessionMetrics(session=i, prs=i, tests=i * 10, health_score=float(i % 100))
+                for i in range(1, n + 1)]
+    return TrendData(sessions=sessions, total_sessions=n, latest_session=n)
+
+
+def test_to_dict_range_filters_sessions():
+    d = _long_history(50).to_dict(start=10, end=12)
+    assert [s["session"] for s in d["sessions"]] == [10, 11, 12]
+    assert d["series"]["labels"] == ["S10", "S11", "S12"]
+    assert d["range"] == {"from": 10, "to": 12, "points": None, "matched": 3, "downsampled": False}
+
+
+def test_to_dict_downsamples_to_point_budget():
+    d = _long_history(1000).to_dict(points=100)
+    series = d["series"]
+    assert d["sessions"] == []
+    assert d["range"]["downsampled"] is True
+    assert len(series["labels"]) == len(series["prs"]) == 100
+    assert series["labels"][0] == "S1-S10"
+    assert series["prs"][0] == 5.5
+    assert series["bands"]["prs"]["min"][0] == 1
+    assert series["bands"]["prs"]["max"][0] == 10
+    assert series["coverage_pct"][0] is None
+
+
+def test_to_dict_short_range_not_downsampled():
+    d = _long_history(1000).to_dict(start=1, end=5, points=100)
+    assert d["range"]["downsampled"] is False
+    assert d["series"]["prs"] == [1, 2, 3, 4, 5]
+
+
+def test_to_dict_rejects_zero_points():
+    with pytest.raises(ValueError):
+        _long_history(5).to_dict(points=0)